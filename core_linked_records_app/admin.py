@@ -8,6 +8,12 @@ from core_linked_records_app.components.local_id.admin_site import (
     CustomLocalIdAdmin,
 )
 from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.components.local_id_sequence.admin_site import (
+    CustomLocalIdSequenceAdmin,
+)
+from core_linked_records_app.components.local_id_sequence.models import (
+    LocalIdSequence,
+)
 from core_linked_records_app.components.pid_settings.admin_site import (
     CustomPidSettingsAdmin,
 )
@@ -28,6 +34,7 @@ admin_urls = [
 ]
 
 admin.site.register(LocalId, CustomLocalIdAdmin)
+admin.site.register(LocalIdSequence, CustomLocalIdSequenceAdmin)
 admin.site.register(PidSettings, CustomPidSettingsAdmin)
 admin.site.register(PidPath, CustomPidPathAdmin)
 
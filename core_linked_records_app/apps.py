@@ -24,17 +24,61 @@ class LinkedRecordsAppConfig(AppConfig):
         )
         from core_linked_records_app.components.blob import watch as blob_watch
         from core_linked_records_app.components.data import watch as data_watch
+        from core_linked_records_app.components.local_id import (
+            watch as local_id_watch,
+        )
+        from core_linked_records_app.components.pid_path import (
+            watch as pid_path_watch,
+        )
         from core_linked_records_app.components.pid_settings import (
             watch as pid_settings_watch,
         )
+        from core_linked_records_app.components.template import (
+            watch as template_watch,
+        )
+        from core_linked_records_app.system.pid_registration import (
+            api as pid_registration_system_api,
+        )
 
         if "" in settings.ID_PROVIDER_PREFIXES:
             raise CoreError(
                 "Empty string not allowed in settings.ID_PROVIDER_PREFIXES."
             )
 
+        if (
+            settings.ID_PROVIDER_SYSTEMS
+            and settings.ID_PROVIDER_SYSTEM_NAME
+            not in settings.ID_PROVIDER_SYSTEMS
+        ):
+            raise CoreError(
+                "settings.ID_PROVIDER_SYSTEM_NAME must be one of the "
+                "providers of settings.ID_PROVIDER_SYSTEMS."
+            )
+
+        for provider_config in settings.ID_PROVIDER_SYSTEMS.values():
+            if not set(
+                provider_config.get("prefixes", settings.ID_PROVIDER_PREFIXES)
+            ).issubset(settings.ID_PROVIDER_PREFIXES):
+                raise CoreError(
+                    "The prefixes of the providers of "
+                    "settings.ID_PROVIDER_SYSTEMS must be listed in "
+                    "settings.ID_PROVIDER_PREFIXES."
+                )
+
+        if (
+            settings.PID_REGISTRATION_BACKEND
+            not in pid_registration_system_api.BACKEND_LIST
+        ):
+            raise CoreError(
+                "settings.PID_REGISTRATION_BACKEND must be one of "
+                f"{', '.join(pid_registration_system_api.BACKEND_LIST)}."
+            )
+
         if "migrate" not in sys.argv:
             acl_discover.init_permissions()
             pid_settings_watch.init()
             data_watch.init()
             blob_watch.init()
+            local_id_watch.init()
+            pid_path_watch.init()
+            template_watch.init()
@@ -1,5 +1,8 @@
 """Access control for `core_linked_records_app.components.blob.api`."""
 
+from core_linked_records_app.utils.access_control import (
+    filter_readable_document_list,
+)
 from core_main_app.access_control.api import check_can_read_document
 from core_main_app.components.blob.models import Blob
 
@@ -63,3 +66,28 @@ def can_set_pid_for_blob(func, blob_id, blob_pid, user):
     if not user.is_superuser:
         check_can_read_document(Blob.get_by_id(blob_id), user)
     return func(blob_id, blob_pid, user)
+
+
+def can_get_pid_dict_for_blob_id_list(func, blob_id_list, user):
+    """Check that a user can read the blobs of a list. Only the blobs
+    readable by the user are kept.
+
+    Args:
+        func:
+        blob_id_list:
+        user:
+
+    Returns:
+        any: Runs the function specified in parameters.
+    """
+    if not user.is_superuser:
+        blob_id_list = [
+            blob.pk
+            for blob in filter_readable_document_list(
+                Blob.objects.filter(  # pylint: disable=no-member
+                    pk__in=blob_id_list
+                ).only("id", "user_id", "workspace_id"),
+                user,
+            )
+        ]
+    return func(blob_id_list, user)
@@ -5,6 +5,7 @@ from logging import getLogger
 
 from core_linked_records_app.components.blob.access_control import (
     can_get_blob_by_pid,
+    can_get_pid_dict_for_blob_id_list,
     can_get_pid_for_blob,
     can_set_pid_for_blob,
 )
@@ -89,6 +90,26 @@ def get_pid_for_blob(blob_id, user):  # noqa, pylint: disable=unused-argument
     return blob_system_api.get_pid_for_blob(blob_id)
 
 
+@access_control(can_get_pid_dict_for_blob_id_list)
+def get_pid_dict_for_blob_id_list(
+    blob_id_list, user  # noqa, pylint: disable=unused-argument
+):
+    """Retrieve the PIDs assigned to a list of blobs, in one query. Blobs not
+    readable by the user are omitted.
+
+    Args:
+        blob_id_list (list<str>): Primary keys of the Blob objects.
+        user (User): User making the request.
+
+    Returns:
+        dict - LocalId objects found, mapped by blob ID
+    """
+    if not blob_id_list:
+        return {}
+
+    return blob_system_api.get_pid_dict_for_blob_id_list(blob_id_list)
+
+
 @access_control(can_set_pid_for_blob)
 def set_pid_for_blob(
     blob_id, blob_pid, user  # noqa, pylint: disable=unused-argument
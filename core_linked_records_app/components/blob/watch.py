@@ -9,9 +9,20 @@ from django.urls import resolve, Resolver404
 from rest_framework import status
 
 from core_linked_records_app import settings
-from core_linked_records_app.components.pid_settings.models import PidSettings
 from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
+from core_linked_records_app.system.pid_settings import (
+    api as pid_settings_system_api,
+)
 from core_linked_records_app.utils import exceptions
+from core_linked_records_app.utils.metrics import (
+    WATCHER_DURATION_METRIC,
+    WATCHER_STAGE_METRIC,
+    get_metrics_registry,
+    timed,
+)
 from core_linked_records_app.utils.pid import split_prefix_from_record
 from core_linked_records_app.utils.providers import ProviderManager
 from core_main_app.commons.exceptions import CoreError, DoesNotExist
@@ -73,7 +84,7 @@ def _register_pid_for_blob_id(provider_name, pid_value, blob_id):
     # record name.
     try:
         prefix, record = split_prefix_from_record(
-            resolver_match.kwargs["record"]
+            resolver_match.kwargs["record"], provider_name
         )
     except (
         exceptions.InvalidPrefixError,
@@ -106,6 +117,7 @@ def _register_pid_for_blob_id(provider_name, pid_value, blob_id):
     return json.loads(provider_response.content)["url"]
 
 
+@timed(WATCHER_DURATION_METRIC, {"watcher": "blob"})
 def _set_blob_pid(instance: Blob):
     """Set the PID in the given Blob `instance`. If the PID
     already exists and is valid, it is not reset.
@@ -116,12 +128,18 @@ def _set_blob_pid(instance: Blob):
     Raises:
         CoreError: If any exception occur while executing the function.
     """
+    metrics_registry = get_metrics_registry()
+
     try:
-        if not PidSettings.get().auto_set_pid:
+        if not pid_settings_system_api.get().auto_set_pid:
             return
 
         try:
-            blob_system_api.get_pid_for_blob(str(instance.pk))
+            with metrics_registry.timer(
+                WATCHER_STAGE_METRIC,
+                {"watcher": "blob", "stage": "registration_state"},
+            ):
+                blob_system_api.get_pid_for_blob(str(instance.pk))
         except DoesNotExist:
             # Create default PID value.
             default_pid_value = (
@@ -130,12 +148,19 @@ def _set_blob_pid(instance: Blob):
             )
 
             # Register PID and write resulting URL in instance.
-            pid_value = _register_pid_for_blob_id(
-                settings.ID_PROVIDER_SYSTEM_NAME,
-                default_pid_value,
-                instance.pk,
-            )
-            blob_system_api.set_pid_for_blob(instance.pk, pid_value)
+            with metrics_registry.timer(
+                WATCHER_STAGE_METRIC, {"watcher": "blob", "stage": "register"}
+            ):
+                pid_value = _register_pid_for_blob_id(
+                    settings.ID_PROVIDER_SYSTEM_NAME,
+                    default_pid_value,
+                    instance.pk,
+                )
+
+            with metrics_registry.timer(
+                WATCHER_STAGE_METRIC, {"watcher": "blob", "stage": "write"}
+            ):
+                blob_system_api.set_pid_for_blob(instance.pk, pid_value)
     except Exception as exc:
         error_message = (
             f"An error occurred while setting a PID for blob '{instance.pk}'"
@@ -156,9 +181,31 @@ def set_blob_pid(
         instance:
         kwargs:
     """
+    if pid_registration_system_api.is_registration_deferred():
+        _queue_blob_pid(instance)
+        return
+
     transaction.on_commit(lambda: _set_blob_pid(instance))
 
 
+def _queue_blob_pid(instance: Blob):
+    """Queue the PID registration of a Blob in the outbox.
+
+    Args:
+        instance:
+    """
+    try:
+        if pid_settings_system_api.get().auto_set_pid:
+            pid_registration_system_api.queue_for_blob(instance.pk)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error(
+            "Trying to queue PID registration for blob %s but an error "
+            "occurred: %s",
+            str(instance.pk),
+            str(exc),
+        )
+
+
 def delete_blob_pid(
     sender, instance: Blob, **kwargs  # noqa, pylint: disable=unused-argument
 ):
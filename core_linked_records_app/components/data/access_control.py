@@ -1,5 +1,9 @@
 """Access control methods for `core_linked_records.components.data.api`."""
 
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.utils.access_control import (
+    filter_readable_document_list,
+)
 from core_main_app.access_control.api import check_can_read_document
 from core_main_app.components.data.models import Data
 
@@ -35,3 +39,27 @@ def can_get_pid_for_data(func, data_id, request):
     if not request.user.is_superuser:
         check_can_read_document(Data.get_by_id(data_id), request.user)
     return func(data_id, request)
+
+
+def can_get_pid_dict_for_data_id_list(func, data_id_list, request):
+    """Access control for the `get_pid_dict_for_data_id_list` function. Only
+    the data readable by the user are kept.
+
+    Args:
+        func:
+        data_id_list:
+        request:
+
+    Returns:
+    """
+    if not request.user.is_superuser:
+        data_id_list = [
+            data.pk
+            for data in filter_readable_document_list(
+                data_system_api.get_all_by_id_list(data_id_list).only(
+                    "id", "user_id", "workspace_id"
+                ),
+                request.user,
+            )
+        ]
+    return func(data_id_list, request)
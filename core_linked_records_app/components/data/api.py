@@ -2,18 +2,28 @@
 
 from logging import getLogger
 
+from django.db.models import Q
+
 from core_linked_records_app import settings
 from core_linked_records_app.components.data.access_control import (
     can_get_pid_for_data,
     can_get_data_by_pid,
+    can_get_pid_dict_for_data_id_list,
 )
 from core_linked_records_app.utils.exceptions import MultiplePidError
 from core_linked_records_app.components.pid_path import api as pid_path_api
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
 from core_linked_records_app.utils.dict import (
     is_dot_notation_in_dictionary,
     get_value_from_dot_notation,
 )
-from core_linked_records_app.utils.pid import is_valid_pid_value
+from core_linked_records_app.utils.pid import is_valid_routed_pid_value
 from core_main_app.access_control.decorators import access_control
 from core_main_app.commons.exceptions import ApiError, DoesNotExist
 from core_main_app.components.data import api as data_api
@@ -32,21 +42,11 @@ def get_data_by_pid(pid, request):
     Returns: data object
     """
     try:
-        pid_path_list = [
-            pid_path_object.path
-            for pid_path_object in pid_path_api.get_all(request)
-        ] + [settings.PID_PATH]
-        dot_notation_pid_paths = [
-            f"dict_content.{pid_path}" for pid_path in pid_path_list
-        ]
-        query_result = data_api.execute_json_query(
-            {
-                "$or": [
-                    {dot_notation_pid_path: pid}
-                    for dot_notation_pid_path in dot_notation_pid_paths
-                ]
-            },
-            request.user,
+        data_id_list = pid_index_system_api.get_data_id_list_by_pid(pid)
+        query_result = (
+            data_api.execute_query(Q(pk__in=data_id_list), request.user)
+            if data_id_list
+            else []
         )
         query_result_length = len(query_result)
     except Exception as exc:
@@ -82,28 +82,12 @@ def get_pid_for_data(data_id, request):
         # Iterate through all possible paths for the template and enforce exclusivity
         pid_paths = pid_path_api.get_by_template(data.template, request.user)
 
-        found_pid = None
-        dict_content = data.get_dict_content()
-
-        for pid_path_object in pid_paths:
-            pid_path = pid_path_object.path
-            if is_dot_notation_in_dictionary(dict_content, pid_path):
-                pid_value = get_value_from_dot_notation(dict_content, pid_path)
-
-                # Validate the PID value
-                if is_valid_pid_value(
-                    pid_value,
-                    settings.ID_PROVIDER_SYSTEM_NAME,
-                    settings.PID_FORMAT,
-                ):
-                    if found_pid is not None:
-                        raise MultiplePidError(
-                            f"Data record '{data_id}' contains multiple valid PIDs "
-                            f"across defined paths for template {data.template.pk}"
-                        )
-                    found_pid = pid_value
-
-        return found_pid
+        return _get_pid_from_dict_content(
+            data.get_dict_content(),
+            [pid_path_object.path for pid_path_object in pid_paths],
+            data_id,
+            data.template.pk,
+        )
     except MultiplePidError:
         raise
     except Exception as exc:
@@ -114,3 +98,81 @@ def get_pid_for_data(data_id, request):
 
         logger.error("%s: %s", error_message, str(exc))
         raise ApiError(f"{error_message}.") from exc
+
+
+@access_control(can_get_pid_dict_for_data_id_list)
+def get_pid_dict_for_data_id_list(data_id_list, request):
+    """Retrieve the PIDs of a list of documents. The PID paths of all the
+    templates are retrieved at once, and the data with multiple valid PIDs
+    have no PID in the result.
+
+    Args:
+        data_id_list:
+        request: HttpRequest
+
+    Returns:
+        dict - IDs of the data found, mapped to their PID or None
+    """
+    try:
+        data_list = list(
+            data_system_api.get_all_by_id_list(data_id_list).only(
+                "id", "template", "dict_content"
+            )
+        )
+        path_list_dict = (
+            pid_path_system_api.get_path_list_dict_by_template_id_list(
+                list({data.template_id for data in data_list})
+            )
+        )
+    except Exception as exc:
+        error_message = "An error occurred while looking up PIDs assigned to a list of data"
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+    pid_dict = {}
+
+    for data in data_list:
+        try:
+            pid_dict[str(data.pk)] = _get_pid_from_dict_content(
+                data.get_dict_content(),
+                path_list_dict[data.template_id],
+                data.pk,
+                data.template_id,
+            )
+        except MultiplePidError as exc:
+            logger.warning(str(exc))
+            pid_dict[str(data.pk)] = None
+
+    return pid_dict
+
+
+def _get_pid_from_dict_content(dict_content, path_list, data_id, template_id):
+    """Retrieve the PID of a document, enforcing its unicity across the PID
+    paths of the template.
+
+    Args:
+        dict_content: dict - Content of the document
+        path_list: list<str> - PID paths of the template
+        data_id:
+        template_id:
+
+    Returns:
+        str|None - Valid PID found in the document, if any
+    """
+    found_pid = None
+
+    for pid_path in path_list:
+        if is_dot_notation_in_dictionary(dict_content, pid_path):
+            pid_value = get_value_from_dot_notation(dict_content, pid_path)
+
+            # Validate the PID value
+            if is_valid_routed_pid_value(pid_value, settings.PID_FORMAT):
+                if found_pid is not None:
+                    raise MultiplePidError(
+                        f"Data record '{data_id}' contains multiple valid PIDs "
+                        f"across defined paths for template {template_id}"
+                    )
+                found_pid = pid_value
+
+    return found_pid
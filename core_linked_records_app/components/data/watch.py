@@ -4,18 +4,32 @@ import json
 import logging
 
 from django.db import transaction
-from django.db.models.signals import pre_save, post_delete
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.urls import resolve
 from rest_framework import status
 
 from core_linked_records_app import settings
-from core_linked_records_app.components.pid_settings.models import PidSettings
 from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
 from core_linked_records_app.system.pid_path import (
     api as pid_path_system_api,
 )
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
+from core_linked_records_app.system.pid_settings import (
+    api as pid_settings_system_api,
+)
 from core_linked_records_app.utils import data as data_utils
 from core_linked_records_app.utils import exceptions
+from core_linked_records_app.utils.metrics import (
+    WATCHER_DURATION_METRIC,
+    WATCHER_STAGE_METRIC,
+    get_metrics_registry,
+    timed,
+)
 from core_linked_records_app.utils.pid import split_prefix_from_record
 from core_linked_records_app.utils.providers import (
     ProviderManager,
@@ -25,10 +39,17 @@ from core_main_app.components.data.models import Data
 
 logger = logging.getLogger(__name__)
 
+# Attribute keeping the digest of a Data whose PID has been registered before
+# the save, read when indexing its PIDs after the save.
+REGISTRATION_DIGEST_ATTRIBUTE = "_pid_registration_digest"
+UNCHANGED_REGISTRATION_ATTRIBUTE = "_pid_registration_unchanged"
+
 
 def init():
     """Connect to Data object events."""
     pre_save.connect(set_data_pid, sender=Data)
+    post_save.connect(index_data_pid, sender=Data)
+    post_save.connect(queue_data_pid, sender=Data)
     post_delete.connect(delete_data_pid, sender=Data)
 
 
@@ -67,7 +88,7 @@ def _register_pid_for_data_id(provider_name, pid_value, data_id):
         # Before asking the provider to create a record, separate prefix from
         # record name.
         prefix, record = split_prefix_from_record(
-            resolver_match.kwargs["record"]
+            resolver_match.kwargs["record"], provider_name
         )
     except Exception as exc:
         error_message = (
@@ -100,6 +121,69 @@ def _register_pid_for_data_id(provider_name, pid_value, data_id):
     return json.loads(provider_response.content)["url"]
 
 
+def _get_registered_pid_dict(instance: Data, pid_path_list):
+    """Retrieve the PIDs registered by the last save of a Data, unless its
+    content did not change since then.
+
+    Args:
+        instance:
+        pid_path_list: list<str> - PID paths of the template of the Data
+
+    Returns:
+        dict - PIDs registered by the last save, mapped by path, or None if
+            the content did not change since then.
+    """
+    if instance.pk is None:
+        return {}
+
+    try:
+        registration_digest, pid_dict = (
+            pid_index_system_api.get_registration_state(instance.pk)
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning(
+            "Cannot retrieve the PID registration state of data %s: %s",
+            instance.pk,
+            str(exc),
+        )
+        return {}
+
+    # A Data saved without registering its PID has no digest, and its PIDs
+    # may not have been registered.
+    if not registration_digest:
+        return {}
+
+    if (
+        registration_digest
+        == pid_index_system_api.compute_registration_digest(
+            instance, pid_path_list
+        )
+    ):
+        # The PidIndex objects of the Data are up-to-date.
+        setattr(instance, UNCHANGED_REGISTRATION_ATTRIBUTE, True)
+        return None
+
+    return pid_dict
+
+
+def _set_registration_digest(instance: Data, pid_path_list):
+    """Keep the digest of a Data whose PID is registered, until its PIDs are
+    indexed after the save.
+
+    Args:
+        instance:
+        pid_path_list: list<str> - PID paths of the template of the Data
+    """
+    setattr(
+        instance,
+        REGISTRATION_DIGEST_ATTRIBUTE,
+        pid_index_system_api.compute_registration_digest(
+            instance, pid_path_list
+        ),
+    )
+
+
+@timed(WATCHER_DURATION_METRIC, {"watcher": "data"})
 def _set_data_pid(instance: Data):
     """Set the PID in the field specified in the settings. If the PID
     already exists and is valid, it is not reset.
@@ -111,89 +195,148 @@ def _set_data_pid(instance: Data):
 
     Returns:
     """
-    try:
-        if not PidSettings.get().auto_set_pid:
-            return
+    metrics_registry = get_metrics_registry()
 
-        # Determine which path to use for PID assignment.
-        all_paths = pid_path_system_api.get_all_pid_paths_by_template(
-            instance.template
-        )
-        if len(all_paths) > 1:
-            pid_path = None
-            candidate = None
-            for pid_path_object in all_paths:
-                new_candidate = None
-                try:
-                    new_candidate = data_utils.get_pid_value_for_data(
-                        instance, pid_path_object.path
-                    )
-                    # If candidate is not None, the path exists in document
-                    if new_candidate is not None:
-                        candidate = new_candidate
-                        if (
-                            pid_path is not None
-                        ):  # a pid path has already been found
-                            pid_path = None
-                            break
-                        pid_path = pid_path_object.path
-                except Exception:  # pylint: disable=broad-except
-                    continue
-
-            if pid_path is None:
-                if candidate is not None:
-                    raise exceptions.PidCreateError(
-                        f"Cannot automatically assign PID: template {instance.template.pk} "
-                        f"has multiple defined paths ({len(all_paths)}) but record has "
-                        f"values set in more than one."
-                    )
+    try:
+        with metrics_registry.timer(
+            WATCHER_STAGE_METRIC, {"watcher": "data", "stage": "config"}
+        ):
+            if not pid_settings_system_api.get().auto_set_pid:
                 return
-        else:
-            pid_path = all_paths[0].path
-
-        try:  # Retrieve the PID located at predefined dot notation path.
-            pid_value = data_utils.get_pid_value_for_data(instance, pid_path)
-        except Exception as exc:  # pylint: disable=broad-except
-            # PID path is not valid for current instance.
-            logger.warning(
-                "Cannot create PID at %s for data %s: %s",
-                pid_path,
-                instance.pk,
-                str(exc),
+
+            # Determine which path to use for PID assignment.
+            all_paths = pid_path_system_api.get_all_pid_paths_by_template(
+                instance.template
             )
-            return
+            pid_path_list = [
+                pid_path_object.path for pid_path_object in all_paths
+            ]
 
-        # Remove previous instance PID from DB.
-        if instance.pk is not None:
-            transaction.on_commit(
-                lambda: data_system_api.delete_pid_for_data(instance)
+        with metrics_registry.timer(
+            WATCHER_STAGE_METRIC,
+            {"watcher": "data", "stage": "registration_state"},
+        ):
+            registered_pid_dict = _get_registered_pid_dict(
+                instance, pid_path_list
             )
 
-        provider_name = retrieve_provider_name(pid_value)
+        # The content is the same as when the PID was last registered.
+        if registered_pid_dict is None:
+            data_utils.record_pid_save("skipped_unchanged_content")
+            return
 
-        # Assign default value for undefined PID and check that the PID is not
-        # defined for a instance other than the current instance.
-        if pid_value is None or pid_value == "":
-            pid_value = (
-                f"{ProviderManager().get(provider_name).provider_lookup_url}/"
-                f"{settings.ID_PROVIDER_PREFIX_DEFAULT}"
-            )
+        with metrics_registry.timer(
+            WATCHER_STAGE_METRIC, {"watcher": "data", "stage": "parse"}
+        ):
+            # Parse the document once for all the PID operations of this save.
+            parsed_content = data_utils.ParsedContent(instance)
+
+            if len(all_paths) > 1:
+                pid_path = None
+                candidate = None
+                for pid_path_object in all_paths:
+                    new_candidate = None
+                    try:
+                        new_candidate = data_utils.get_pid_value_for_data(
+                            instance, pid_path_object.path, parsed_content
+                        )
+                        # If candidate is not None, the path exists in document
+                        if new_candidate is not None:
+                            candidate = new_candidate
+                            if (
+                                pid_path is not None
+                            ):  # a pid path has already been found
+                                pid_path = None
+                                break
+                            pid_path = pid_path_object.path
+                    except Exception:  # pylint: disable=broad-except
+                        continue
+
+                if pid_path is None:
+                    if candidate is not None:
+                        raise exceptions.PidCreateError(
+                            f"Cannot automatically assign PID: template {instance.template.pk} "
+                            f"has multiple defined paths ({len(all_paths)}) but record has "
+                            f"values set in more than one."
+                        )
+                    return
+            else:
+                pid_path = all_paths[0].path
+
+            try:  # Retrieve the PID located at predefined dot notation path.
+                pid_value = data_utils.get_pid_value_for_data(
+                    instance, pid_path, parsed_content
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                # PID path is not valid for current instance.
+                logger.warning(
+                    "Cannot create PID at %s for data %s: %s",
+                    pid_path,
+                    instance.pk,
+                    str(exc),
+                )
+                return
+
+        # The PID is the one registered by the last save, so it does not
+        # need to be registered again.
+        if pid_value and registered_pid_dict.get(pid_path) == pid_value:
+            _set_registration_digest(instance, pid_path_list)
+            data_utils.record_pid_save("skipped_unchanged_pid")
+            return
 
-        if data_system_api.is_pid_defined(pid_value) and (
-            instance.pk is None
-            or not data_system_api.is_pid_defined_for_data(
-                pid_value, instance.pk
+        with metrics_registry.timer(
+            WATCHER_STAGE_METRIC, {"watcher": "data", "stage": "register"}
+        ):
+            # Remove previous instance PID from DB.
+            if instance.pk is not None:
+                transaction.on_commit(
+                    lambda: data_system_api.delete_pid_for_data(instance)
+                )
+
+            provider_name = retrieve_provider_name(pid_value)
+
+            # Assign default value for undefined PID and check that the PID is
+            # not defined for a instance other than the current instance.
+            if pid_value is None or pid_value == "":
+                pid_value = (
+                    f"{ProviderManager().get(provider_name).provider_lookup_url}/"
+                    f"{settings.ID_PROVIDER_PREFIX_DEFAULT}"
+                )
+
+            if data_system_api.is_pid_defined(pid_value) and (
+                instance.pk is None
+                or not data_system_api.is_pid_defined_for_data(
+                    pid_value, instance.pk
+                )
+            ):
+                raise exceptions.PidCreateError(
+                    "PID already defined for another instance"
+                )
+
+            # Register PID and write resulting URL in instance
+            pid_value = _register_pid_for_data_id(
+                provider_name, pid_value, instance.pk
             )
+
+        with metrics_registry.timer(
+            WATCHER_STAGE_METRIC, {"watcher": "data", "stage": "write"}
         ):
-            raise exceptions.PidCreateError(
-                "PID already defined for another instance"
+            data_utils.set_pid_value_for_data(
+                instance, pid_path, pid_value, parsed_content
             )
+            _set_registration_digest(instance, pid_path_list)
 
-        # Register PID and write resulting URL in instance
-        pid_value = _register_pid_for_data_id(
-            provider_name, pid_value, instance.pk
+        data_utils.record_pid_save("registered")
+
+        parsed_content.record_stats()
+        logger.debug(
+            "PID assigned to data %s: %d parse(s), %d parse(s) and %d "
+            "serialization(s) avoided",
+            instance.pk,
+            parsed_content.parse_count,
+            parsed_content.avoided_parse_count,
+            parsed_content.avoided_serialization_count,
         )
-        data_utils.set_pid_value_for_data(instance, pid_path, pid_value)
     except exceptions.PidCreateError as pid_create_error:
         logger.error(
             "An error occurred while assigning PID: %s", str(pid_create_error)
@@ -226,9 +369,70 @@ def set_data_pid(
 
     Returns:
     """
+    # Forget the registration state left by a previous save of the instance.
+    vars(instance).pop(REGISTRATION_DIGEST_ATTRIBUTE, None)
+    vars(instance).pop(UNCHANGED_REGISTRATION_ATTRIBUTE, None)
+
+    if pid_registration_system_api.is_registration_deferred():
+        return
+
     transaction.on_commit(lambda: _set_data_pid(instance))
 
 
+def queue_data_pid(
+    sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Queue the PID registration of a saved Data when registrations are
+    deferred to the outbox. The registration is stored in the same
+    transaction as the Data.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    if not pid_registration_system_api.is_registration_deferred():
+        return
+
+    try:
+        if pid_settings_system_api.get().auto_set_pid:
+            pid_registration_system_api.queue_for_data(instance.pk)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error(
+            "Trying to queue PID registration for data %s but an error "
+            "occurred: %s",
+            str(instance.pk),
+            str(exc),
+        )
+
+
+@timed(WATCHER_DURATION_METRIC, {"watcher": "data_index"})
+def index_data_pid(
+    sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Update the PID index with the PIDs found in a saved Data. The index is
+    left alone if the content did not change since the PID was registered.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    if vars(instance).pop(UNCHANGED_REGISTRATION_ATTRIBUTE, False):
+        return
+
+    try:
+        pid_index_system_api.index_data(
+            instance, vars(instance).pop(REGISTRATION_DIGEST_ATTRIBUTE, "")
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning(
+            "Trying to index PID for data %s but an error occurred: %s",
+            str(instance.pk),
+            str(exc),
+        )
+
+
 def delete_data_pid(
     sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
 ):
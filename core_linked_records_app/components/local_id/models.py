@@ -2,7 +2,7 @@
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import RegexValidator
-from django.db import models, IntegrityError
+from django.db import models, transaction, IntegrityError
 
 from core_main_app.commons import exceptions
 from core_main_app.commons.regex import NOT_EMPTY_OR_WHITESPACES
@@ -26,6 +26,16 @@ class LocalId(models.Model):
     record_object_class = models.CharField(blank=True, max_length=255)
     record_object_id = models.CharField(blank=True, max_length=255)
 
+    class Meta:
+        """Meta"""
+
+        indexes = [
+            models.Index(
+                fields=["record_object_class", "record_object_id"],
+                name="local_id_record_object_idx",
+            ),
+        ]
+
     @staticmethod
     def get_by_name(record_name):
         """Retrieve LocalId object with the given record_name.
@@ -66,6 +76,129 @@ class LocalId(models.Model):
         except Exception as exc:
             raise exceptions.ModelError(str(exc))
 
+    @staticmethod
+    def get_all_by_class_and_id_list(
+        record_object_class, record_object_id_list
+    ):
+        """Retrieve the LocalId objects of a list of objects of the same
+        class, using a single query.
+
+        Args:
+            record_object_class:
+            record_object_id_list:
+
+        Returns:
+            QuerySet - LocalId objects found.
+        """
+        try:
+            return LocalId.objects.filter(  # pylint: disable=no-member
+                record_object_class=record_object_class,
+                record_object_id__in=[
+                    str(record_object_id)
+                    for record_object_id in record_object_id_list
+                ],
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc))
+
+    @staticmethod
+    def get_all_by_name_list(record_name_list):
+        """Retrieve the LocalId objects matching a list of record names, using
+        a single query.
+
+        Args:
+            record_name_list:
+
+        Returns:
+            QuerySet - LocalId objects found.
+        """
+        try:
+            return LocalId.objects.filter(  # pylint: disable=no-member
+                record_name__in=record_name_list
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc))
+
+    @staticmethod
+    def get_record_name_list_by_name_list(record_name_list):
+        """Retrieve the record names of LocalId objects existing in the given
+        list, using a single query.
+
+        Args:
+            record_name_list:
+
+        Returns:
+            list<str> - Record names already in use.
+        """
+        try:
+            return list(
+                LocalId.objects.filter(  # pylint: disable=no-member
+                    record_name__in=record_name_list
+                ).values_list("record_name", flat=True)
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc))
+
+    @staticmethod
+    def insert_many(local_id_list):
+        """Insert several LocalId objects in a single query. Objects whose
+        record name is already in use are not inserted: if the query fails
+        because of them, the objects are inserted one by one to find them.
+
+        Args:
+            local_id_list:
+
+        Returns:
+            list<LocalId> - List of the LocalId objects inserted.
+        """
+        try:
+            try:
+                with transaction.atomic():
+                    return LocalId.objects.bulk_create(  # pylint: disable=no-member
+                        local_id_list
+                    )
+            except IntegrityError:
+                pass
+
+            inserted_local_id_list = []
+
+            for local_id_object in local_id_list:
+                # The primary key may have been set by the failed query.
+                local_id_object.pk = None
+
+                try:
+                    with transaction.atomic():
+                        LocalId.objects.bulk_create(  # pylint: disable=no-member
+                            [local_id_object]
+                        )
+                except IntegrityError:
+                    continue
+
+                inserted_local_id_list.append(local_id_object)
+
+            return inserted_local_id_list
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc))
+
+    @staticmethod
+    def update_many(local_id_list, field_list):
+        """Update the given fields of several LocalId objects in a single
+        query.
+
+        Args:
+            local_id_list:
+            field_list: list<str> - Names of the fields to update.
+
+        Returns:
+            int - Number of objects updated.
+        """
+        try:
+            return LocalId.objects.bulk_update(  # pylint: disable=no-member
+                local_id_list, field_list
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc))
+
     @staticmethod
     def upsert(local_id_object):
         """Insert a new LocalId object
@@ -0,0 +1,59 @@
+"""Signals to trigger on LocalId changes"""
+
+from django.db.models.signals import post_save, post_delete
+
+from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.system.local_id import (
+    api as local_id_system_api,
+)
+
+
+def init():
+    """Connect to LocalId object events."""
+    post_save.connect(invalidate_local_id_cache_on_save, sender=LocalId)
+    post_delete.connect(invalidate_local_id_cache_on_delete, sender=LocalId)
+
+
+def invalidate_local_id_cache_on_save(
+    sender,
+    instance: LocalId,
+    created,
+    **kwargs,  # noqa, pylint: disable=unused-argument
+):
+    """Remove the cached reverse lookups made stale by a saved LocalId. An
+    updated LocalId may have been linked to another object before, so the
+    whole cache is cleared.
+
+    Args:
+        sender:
+        instance:
+        created:
+        kwargs:
+
+    Returns:
+    """
+    if created:
+        local_id_system_api.invalidate_local_id_cache(
+            instance.record_object_class, instance.record_object_id
+        )
+    else:
+        local_id_system_api.local_id_cache.clear()
+
+
+def invalidate_local_id_cache_on_delete(
+    sender,
+    instance: LocalId,
+    **kwargs,  # noqa, pylint: disable=unused-argument
+):
+    """Remove the cached reverse lookup of a deleted LocalId.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+
+    Returns:
+    """
+    local_id_system_api.invalidate_local_id_cache(
+        instance.record_object_class, instance.record_object_id
+    )
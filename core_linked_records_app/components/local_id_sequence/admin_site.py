@@ -0,0 +1,19 @@
+"""Custom admin site for the LocalIdSequence model"""
+
+from django.contrib import admin
+
+
+class CustomLocalIdSequenceAdmin(admin.ModelAdmin):
+    """CustomLocalIdSequenceAdmin"""
+
+    def has_add_permission(
+        self, request, obj=None
+    ):  # pylint: disable=unused-argument
+        """Prevent from manually adding LocalIdSequence objects"""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Prevent from manually editing LocalIdSequence objects, which could
+        make blocks overlap.
+        """
+        return False
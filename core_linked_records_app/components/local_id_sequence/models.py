@@ -0,0 +1,56 @@
+"""Local ID sequence model"""
+
+from django.db import models, transaction
+from django.db.models import F
+
+from core_main_app.commons import exceptions
+
+
+class LocalIdSequence(models.Model):
+    """Named counter from which blocks of local IDs are reserved"""
+
+    name = models.CharField(blank=False, max_length=255, unique=True)
+    next_value = models.BigIntegerField(default=0)
+
+    @staticmethod
+    def reserve_block(name, block_size):
+        """Reserve a block of consecutive values of a sequence, creating the
+        sequence if needed. Concurrent reservations never overlap.
+
+        Args:
+            name:
+            block_size:
+
+        Returns:
+            int - First value of the reserved block.
+        """
+        try:
+            with transaction.atomic():
+                LocalIdSequence.objects.get_or_create(  # pylint: disable=no-member
+                    name=name
+                )
+                # The row stays locked by the update until the end of the
+                # transaction, so that no other block starts at the same
+                # value.
+                LocalIdSequence.objects.filter(  # pylint: disable=no-member
+                    name=name
+                ).update(next_value=F("next_value") + block_size)
+
+                return (
+                    LocalIdSequence.objects.filter(  # pylint: disable=no-member
+                        name=name
+                    )
+                    .values_list("next_value", flat=True)
+                    .get()
+                    - block_size
+                )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    def __str__(self):
+        """LocalIdSequence object as string.
+
+        Returns:
+            str - String representation of LocalIdSequence object.
+        """
+        return f"LocalIdSequence {self.name} ({self.next_value})"
@@ -15,3 +15,17 @@ def can_get_pid_for_data(func, oai_record_id, request):
     """
     check_anonymous_access(request.user)
     return func(oai_record_id, request)
+
+
+def can_get_pid_dict_for_data_id_list(func, oai_record_id_list, request):
+    """Access control for the `get_pid_dict_for_data_id_list` function.
+
+    Args:
+        func:
+        oai_record_id_list:
+        request:
+
+    Returns:
+    """
+    check_anonymous_access(request.user)
+    return func(oai_record_id_list, request)
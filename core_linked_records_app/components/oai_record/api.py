@@ -4,15 +4,20 @@ import logging
 
 from core_linked_records_app.components.oai_record.access_control import (
     can_get_pid_for_data,
+    can_get_pid_dict_for_data_id_list,
 )
 from core_linked_records_app.utils.exceptions import MultiplePidError
 from core_linked_records_app.components.pid_path import api as pid_path_api
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
 from core_linked_records_app.utils.dict import get_value_from_dot_notation
 from core_main_app.access_control.decorators import access_control
 from core_main_app.commons.exceptions import ApiError
 from core_oaipmh_harvester_app.components.oai_record import (
     api as oai_record_data,
 )
+from core_oaipmh_harvester_app.components.oai_record.models import OaiRecord
 
 logger = logging.getLogger(__name__)
 
@@ -36,22 +41,12 @@ def get_pid_for_data(oai_record_id, request):
             data.harvester_metadata_format.template, request.user
         )
 
-        found_pid = None
-        dict_content = data.get_dict_content()
-
-        for pid_path_object in pid_paths:
-            pid_path = pid_path_object.path
-            pid_value = get_value_from_dot_notation(dict_content, pid_path)
-
-            if pid_value:
-                if found_pid is not None:
-                    raise MultiplePidError(
-                        f"OAI record '{oai_record_id}' contains multiple valid PIDs "
-                        f"across defined paths for template {data.harvester_metadata_format.template.pk}"
-                    )
-                found_pid = pid_value
-
-        return found_pid
+        return _get_pid_from_dict_content(
+            data.get_dict_content(),
+            [pid_path_object.path for pid_path_object in pid_paths],
+            oai_record_id,
+            data.harvester_metadata_format.template_id,
+        )
     except MultiplePidError:
         raise
     except Exception as exc:
@@ -61,3 +56,93 @@ def get_pid_for_data(oai_record_id, request):
 
         logger.error("%s: %s", error_message, str(exc))
         raise ApiError(f"{error_message}.") from exc
+
+
+@access_control(can_get_pid_dict_for_data_id_list)
+def get_pid_dict_for_data_id_list(oai_record_id_list, request):
+    """Retrieve the PIDs of a list of OAI records. The PID paths of all the
+    templates are retrieved at once, and the records with multiple PIDs have
+    no PID in the result.
+
+    Args:
+        oai_record_id_list:
+        request: HttpRequest
+
+    Returns:
+        dict - IDs of the OAI records found, mapped to their PID or None
+    """
+    try:
+        oai_record_list = list(
+            OaiRecord.objects.filter(  # pylint: disable=no-member
+                pk__in=oai_record_id_list
+            )
+            .select_related("harvester_metadata_format")
+            .only("id", "dict_content", "harvester_metadata_format__template")
+        )
+        path_list_dict = (
+            pid_path_system_api.get_path_list_dict_by_template_id_list(
+                list(
+                    {
+                        oai_record.harvester_metadata_format.template_id
+                        for oai_record in oai_record_list
+                    }
+                )
+            )
+        )
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving PIDs for a list of "
+            "OAI data"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+    pid_dict = {}
+
+    for oai_record in oai_record_list:
+        template_id = oai_record.harvester_metadata_format.template_id
+
+        try:
+            pid_dict[str(oai_record.pk)] = _get_pid_from_dict_content(
+                oai_record.get_dict_content(),
+                path_list_dict[template_id],
+                oai_record.pk,
+                template_id,
+            )
+        except MultiplePidError as exc:
+            logger.warning(str(exc))
+            pid_dict[str(oai_record.pk)] = None
+
+    return pid_dict
+
+
+def _get_pid_from_dict_content(
+    dict_content, path_list, oai_record_id, template_id
+):
+    """Retrieve the PID of an OAI record, enforcing its unicity across the PID
+    paths of the template.
+
+    Args:
+        dict_content: dict - Content of the OAI record
+        path_list: list<str> - PID paths of the template
+        oai_record_id:
+        template_id:
+
+    Returns:
+        str|None - PID found in the OAI record, if any
+    """
+    found_pid = None
+
+    for pid_path in path_list:
+        pid_value = get_value_from_dot_notation(dict_content, pid_path)
+
+        if pid_value:
+            if found_pid is not None:
+                raise MultiplePidError(
+                    f"OAI record '{oai_record_id}' contains multiple valid PIDs "
+                    f"across defined paths for template {template_id}"
+                )
+            found_pid = pid_value
+
+    return found_pid
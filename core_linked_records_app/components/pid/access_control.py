@@ -0,0 +1,43 @@
+"""Access control methods for `core_linked_records.components.pid.api`."""
+
+from core_linked_records_app.utils.access_control import (
+    filter_readable_document_list,
+)
+from core_linked_records_app.utils.pid import (
+    PID_RESOLUTION_FORBIDDEN,
+    PID_RESOLUTION_FOUND,
+)
+
+
+def can_resolve_pid_list(func, pid_list, user):
+    """Access control for the `resolve_pid_list` function. The documents the
+    user cannot read are reported as forbidden.
+
+    Args:
+        func:
+        pid_list:
+        user:
+
+    Returns:
+    """
+    resolution_list = func(pid_list, user)
+    found_resolution_list = [
+        resolution
+        for resolution in resolution_list
+        if resolution["status"] == PID_RESOLUTION_FOUND
+    ]
+    readable_document_id_set = {
+        id(document)
+        for document in filter_readable_document_list(
+            [resolution["document"] for resolution in found_resolution_list],
+            user,
+        )
+    }
+
+    for resolution in found_resolution_list:
+        if id(resolution["document"]) not in readable_document_id_set:
+            resolution["status"] = PID_RESOLUTION_FORBIDDEN
+            resolution["id"] = None
+            resolution["document"] = None
+
+    return resolution_list
@@ -0,0 +1,97 @@
+"""Batch PID resolution API"""
+
+from logging import getLogger
+
+from core_linked_records_app.components.pid.access_control import (
+    can_resolve_pid_list,
+)
+from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.utils.pid import (
+    PID_RESOLUTION_FOUND,
+    PID_RESOLUTION_INVALID,
+    PID_RESOLUTION_NOT_FOUND,
+    PID_RESOLUTION_NOT_UNIQUE,
+    normalize_pid,
+)
+from core_main_app.access_control.decorators import access_control
+from core_main_app.commons.exceptions import ApiError
+
+logger = getLogger(__name__)
+
+
+@access_control(can_resolve_pid_list)
+def resolve_pid_list(pid_list, user):  # noqa, pylint: disable=unused-argument
+    """Resolve a list of PIDs to the data or blobs they are assigned to. The
+    data are looked up in a single query on the PID index, and the remaining
+    PIDs in a single query on the local IDs of the blobs.
+
+    Args:
+        pid_list (list<str>): PIDs to resolve.
+        user (User): User making the request.
+
+    Raises:
+        ApiError: An error occured while trying to resolve the PIDs.
+
+    Returns:
+        list<dict>: Resolution of each PID, in the order of the input list,
+            with keys "pid", "status", "type", "id" and "document".
+    """
+    try:
+        normalized_pid_list = [normalize_pid(pid) for pid in pid_list]
+        valid_pid_set = {
+            normalized_pid
+            for normalized_pid in normalized_pid_list
+            if normalized_pid is not None
+        }
+
+        data_dict = (
+            data_system_api.get_data_dict_by_pid_list(list(valid_pid_set))
+            if valid_pid_set
+            else {}
+        )
+        unresolved_pid_list = [
+            pid for pid in valid_pid_set if pid not in data_dict
+        ]
+        blob_dict = (
+            blob_system_api.get_blob_dict_by_pid_list(unresolved_pid_list)
+            if unresolved_pid_list
+            else {}
+        )
+    except Exception as exc:
+        error_message = "An error occurred while resolving a list of PIDs"
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+    resolution_list = []
+
+    for pid, normalized_pid in zip(pid_list, normalized_pid_list):
+        resolution = {
+            "pid": pid,
+            "status": PID_RESOLUTION_NOT_FOUND,
+            "type": None,
+            "id": None,
+            "document": None,
+        }
+
+        if normalized_pid is None:
+            resolution["status"] = PID_RESOLUTION_INVALID
+        elif normalized_pid in data_dict:
+            resolution["type"] = "data"
+
+            if len(data_dict[normalized_pid]) == 1:
+                resolution["status"] = PID_RESOLUTION_FOUND
+                resolution["document"] = data_dict[normalized_pid][0]
+                resolution["id"] = resolution["document"].pk
+            else:
+                resolution["status"] = PID_RESOLUTION_NOT_UNIQUE
+        elif normalized_pid in blob_dict:
+            resolution["type"] = "blob"
+            resolution["status"] = PID_RESOLUTION_FOUND
+            resolution["document"] = blob_dict[normalized_pid]
+            resolution["id"] = resolution["document"].pk
+
+        resolution_list.append(resolution)
+
+    return resolution_list
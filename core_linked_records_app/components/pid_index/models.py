@@ -0,0 +1,121 @@
+"""PID index model"""
+
+from django.db import models, transaction
+
+from core_main_app.commons import exceptions
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+
+
+class PidIndex(models.Model):
+    """Index linking a PID value to the Data containing it"""
+
+    pid = models.CharField(blank=False, max_length=512, db_index=True)
+    path = models.CharField(blank=False, max_length=255)
+    data = models.ForeignKey(
+        Data, blank=False, on_delete=models.CASCADE, related_name="+"
+    )
+    template = models.ForeignKey(
+        Template, blank=False, on_delete=models.CASCADE, related_name="+"
+    )
+    # Digest of the Data when its PID was last registered, empty if the
+    # Data was saved without registering its PID.
+    registration_digest = models.CharField(
+        blank=True, default="", max_length=64
+    )
+
+    class Meta:
+        """Meta"""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["data", "path"], name="unique_pid_index_data_path"
+            ),
+        ]
+
+    @staticmethod
+    def get_data_id_list_by_pid(pid):
+        """Retrieve the distinct IDs of Data containing a given PID.
+
+        Args:
+            pid:
+
+        Returns:
+            list - List of Data IDs
+        """
+        try:
+            return list(
+                PidIndex.objects.filter(pid=pid)  # pylint: disable=no-member
+                .values_list("data_id", flat=True)
+                .distinct()
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def get_pid_and_data_id_list_by_pid_list(pid_list):
+        """Retrieve the distinct (PID, Data ID) pairs for a list of PIDs, using
+        a single query.
+
+        Args:
+            pid_list:
+
+        Returns:
+            list<tuple> - List of (PID, Data ID) pairs
+        """
+        try:
+            return list(
+                PidIndex.objects.filter(  # pylint: disable=no-member
+                    pid__in=pid_list
+                )
+                .values_list("pid", "data_id")
+                .distinct()
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def get_all_by_data_id_list(data_id_list):
+        """Retrieve all PidIndex objects for a list of Data IDs.
+
+        Args:
+            data_id_list:
+
+        Returns:
+            QuerySet - PidIndex objects for the given Data IDs
+        """
+        try:
+            return PidIndex.objects.filter(  # pylint: disable=no-member
+                data_id__in=data_id_list
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def replace_by_data_id(data_id, pid_index_list):
+        """Replace all PidIndex objects of a Data by the ones provided.
+
+        Args:
+            data_id:
+            pid_index_list:
+
+        Returns:
+        """
+        try:
+            with transaction.atomic():
+                PidIndex.objects.filter(  # pylint: disable=no-member
+                    data_id=data_id
+                ).delete()
+                PidIndex.objects.bulk_create(  # pylint: disable=no-member
+                    pid_index_list
+                )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    def __str__(self):
+        """PidIndex object as string.
+
+        Returns:
+            str - String representation of PidIndex object.
+        """
+        return f"PidIndex {self.pid} -> data {self.data_id} ({self.path})"
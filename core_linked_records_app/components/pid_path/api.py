@@ -7,6 +7,9 @@ from core_linked_records_app.components.pid_path.access_control import (
     can_get_by_template,
 )
 from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
 from core_main_app.access_control.decorators import access_control
 from core_main_app.commons.exceptions import ApiError
 from core_main_app.components.template import (
@@ -60,6 +63,22 @@ def get_all(request):
         list<str>: List of PID path.
     """
     try:
+        if settings.PID_CONFIG_CACHE_ENABLED:
+            pid_path_list_dict = pid_path_system_api.get_pid_path_list_dict()
+            # Only the IDs of the readable templates having paths are loaded.
+            readable_template_id_set = set(
+                template_api.get_all(request=request)
+                .filter(pk__in=list(pid_path_list_dict))
+                .values_list("pk", flat=True)
+            )
+
+            return [
+                pid_path
+                for template_id, pid_path_list in pid_path_list_dict.items()
+                if template_id in readable_template_id_set
+                for pid_path in pid_path_list
+            ]
+
         return PidPath.get_all_by_template_list(
             [template.pk for template in template_api.get_all(request=request)]
         )
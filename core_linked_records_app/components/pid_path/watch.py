@@ -0,0 +1,110 @@
+"""Signals to trigger on PidPath changes"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+from django.db.models.signals import post_save, post_delete
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.utils import xml as pid_xml_utils
+from core_linked_records_app.utils.cache import invalidate_pid_config
+
+logger = logging.getLogger(__name__)
+
+# Thread indexing the Data of the templates whose PidPaths changed, so that
+# the requests saving a PidPath do not wait for the indexing.
+reindex_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="pid_path_reindex"
+)
+
+
+def init():
+    """Connect to PidPath object events."""
+    post_save.connect(invalidate_template_xsd_cache, sender=PidPath)
+    post_delete.connect(invalidate_template_xsd_cache, sender=PidPath)
+    post_save.connect(reindex_template_data, sender=PidPath)
+    post_delete.connect(reindex_template_data, sender=PidPath)
+
+
+def invalidate_template_xsd_cache(
+    sender,
+    instance: PidPath,
+    **kwargs,  # noqa, pylint: disable=unused-argument
+):
+    """Remove the cached PID XPaths of the template of a modified PidPath,
+    and the cached PID configuration.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+
+    Returns:
+    """
+    pid_xml_utils.invalidate_template_xsd_cache(instance.template_id)
+    invalidate_pid_config()
+
+
+def reindex_template_data(
+    sender,
+    instance: PidPath,
+    **kwargs,  # noqa, pylint: disable=unused-argument
+):
+    """Index again the Data of the template of a modified PidPath in the
+    background, once the change is committed.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+
+    Returns:
+    """
+    template_id = instance.template_id
+
+    if not settings.PID_PATH_REINDEX_ENABLED:
+        logger.info(
+            "PID paths of template %s modified, run `pidindex --template %s` "
+            "to index its data again.",
+            template_id,
+            template_id,
+        )
+        return
+
+    transaction.on_commit(
+        lambda: reindex_executor.submit(index_template_data, template_id)
+    )
+
+
+def index_template_data(template_id):
+    """Index again the Data of a template. Runs in the thread of
+    `reindex_executor`, which closes its database connection afterwards.
+
+    Args:
+        template_id: int - ID of the template.
+    """
+    try:
+        indexed_count, error_count = pid_index_system_api.index_all_data(
+            template_id
+        )
+
+        if error_count:
+            logger.warning(
+                "%d data of template %s indexed, %d errors.",
+                indexed_count,
+                template_id,
+                error_count,
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error(
+            "An error occurred while indexing the data of template %s: %s",
+            template_id,
+            str(exc),
+        )
+    finally:
+        connection.close()
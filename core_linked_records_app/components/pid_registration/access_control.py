@@ -0,0 +1,37 @@
+"""Access control methods for
+`core_linked_records_app.components.pid_registration.api`.
+"""
+
+from core_main_app.access_control.api import check_can_read_document
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+
+
+def can_get_registration_for_data(func, data_id, user):
+    """Access control for the `get_by_data_id` function.
+
+    Args:
+        func:
+        data_id:
+        user:
+
+    Returns:
+    """
+    if not user.is_superuser:
+        check_can_read_document(Data.get_by_id(data_id), user)
+    return func(data_id, user)
+
+
+def can_get_registration_for_blob(func, blob_id, user):
+    """Access control for the `get_by_blob_id` function.
+
+    Args:
+        func:
+        blob_id:
+        user:
+
+    Returns:
+    """
+    if not user.is_superuser:
+        check_can_read_document(Blob.get_by_id(blob_id), user)
+    return func(blob_id, user)
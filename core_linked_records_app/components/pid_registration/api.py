@@ -0,0 +1,38 @@
+"""PID registration API"""
+
+from core_linked_records_app.components.pid_registration.access_control import (
+    can_get_registration_for_blob,
+    can_get_registration_for_data,
+)
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
+from core_main_app.access_control.decorators import access_control
+
+
+@access_control(can_get_registration_for_data)
+def get_by_data_id(data_id, user):  # noqa, pylint: disable=unused-argument
+    """Retrieve the PID registration of a Data.
+
+    Args:
+        data_id:
+        user:
+
+    Returns:
+        PidRegistration - The registration of the Data.
+    """
+    return pid_registration_system_api.get_by_data_id(data_id)
+
+
+@access_control(can_get_registration_for_blob)
+def get_by_blob_id(blob_id, user):  # noqa, pylint: disable=unused-argument
+    """Retrieve the PID registration of a Blob.
+
+    Args:
+        blob_id:
+        user:
+
+    Returns:
+        PidRegistration - The registration of the Blob.
+    """
+    return pid_registration_system_api.get_by_blob_id(blob_id)
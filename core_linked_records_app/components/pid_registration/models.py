@@ -0,0 +1,246 @@
+"""PID registration model"""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from core_main_app.commons import exceptions
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+
+
+class PidRegistration(models.Model):
+    """Pending PID registration of a Data or a Blob, stored in an outbox
+    drained by the `pidregistration` command.
+    """
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSING, "Processing"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    data = models.ForeignKey(
+        Data,
+        blank=True,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    blob = models.ForeignKey(
+        Blob,
+        blank=True,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    message = models.TextField(blank=True, default="")
+    creation_date = models.DateTimeField(auto_now_add=True)
+    last_modification_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta"""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["data"], name="unique_pid_registration_data"
+            ),
+            models.UniqueConstraint(
+                fields=["blob"], name="unique_pid_registration_blob"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["status", "attempt_count"],
+                name="pid_registration_status_idx",
+            ),
+        ]
+
+    @staticmethod
+    def queue(data_id=None, blob_id=None):
+        """Queue the PID registration of a Data or a Blob. An existing
+        registration for the same object is reset to pending.
+
+        Args:
+            data_id:
+            blob_id:
+
+        Returns:
+            PidRegistration - The queued registration.
+        """
+        try:
+            pid_registration, _ = (
+                PidRegistration.objects.update_or_create(  # pylint: disable=no-member
+                    data_id=data_id,
+                    blob_id=blob_id,
+                    defaults={
+                        "status": PidRegistration.PENDING,
+                        "attempt_count": 0,
+                        "message": "",
+                    },
+                )
+            )
+            return pid_registration
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def get_by_data_id(data_id):
+        """Retrieve the PID registration of a Data.
+
+        Args:
+            data_id:
+
+        Returns:
+            PidRegistration - PidRegistration object if found.
+        """
+        try:
+            return PidRegistration.objects.get(  # pylint: disable=no-member
+                data_id=data_id
+            )
+        except ObjectDoesNotExist as dne:
+            raise exceptions.DoesNotExist(str(dne))
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def get_by_blob_id(blob_id):
+        """Retrieve the PID registration of a Blob.
+
+        Args:
+            blob_id:
+
+        Returns:
+            PidRegistration - PidRegistration object if found.
+        """
+        try:
+            return PidRegistration.objects.get(  # pylint: disable=no-member
+                blob_id=blob_id
+            )
+        except ObjectDoesNotExist as dne:
+            raise exceptions.DoesNotExist(str(dne))
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def get_batch_to_process(batch_size, max_attempts, last_pk=None):
+        """Retrieve a batch of pending or failed registrations which have not
+        reached the maximum number of attempts, ordered by primary key.
+
+        Args:
+            batch_size:
+            max_attempts:
+            last_pk: Only return registrations after this primary key.
+
+        Returns:
+            list<PidRegistration> - Registrations to process.
+        """
+        try:
+            queryset = (
+                PidRegistration.objects.filter(  # pylint: disable=no-member
+                    status__in=[
+                        PidRegistration.PENDING,
+                        PidRegistration.FAILED,
+                    ],
+                    attempt_count__lt=max_attempts,
+                )
+            )
+
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+
+            return list(
+                queryset.select_related("data", "blob").order_by("pk")[
+                    :batch_size
+                ]
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def claim(pid_registration):
+        """Mark a registration as being processed, unless it has been modified
+        since it was retrieved, e.g. claimed by another worker.
+
+        Args:
+            pid_registration:
+
+        Returns:
+            bool - Whether the registration has been claimed.
+        """
+        try:
+            return bool(
+                PidRegistration.objects.filter(  # pylint: disable=no-member
+                    pk=pid_registration.pk,
+                    status=pid_registration.status,
+                    attempt_count=pid_registration.attempt_count,
+                ).update(
+                    status=PidRegistration.PROCESSING,
+                    attempt_count=F("attempt_count") + 1,
+                    last_modification_date=timezone.now(),
+                )
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def complete(pid_registration, status, message=""):
+        """Set the final status of a claimed registration. A registration
+        queued again while being processed stays pending.
+
+        Args:
+            pid_registration:
+            status:
+            message:
+
+        Returns:
+        """
+        try:
+            PidRegistration.objects.filter(  # pylint: disable=no-member
+                pk=pid_registration.pk, status=PidRegistration.PROCESSING
+            ).update(
+                status=status,
+                message=message,
+                last_modification_date=timezone.now(),
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    @staticmethod
+    def requeue_processing():
+        """Set back to pending the registrations left in processing, e.g. by
+        an interrupted worker.
+
+        Returns:
+            int - Number of registrations queued again.
+        """
+        try:
+            return PidRegistration.objects.filter(  # pylint: disable=no-member
+                status=PidRegistration.PROCESSING
+            ).update(
+                status=PidRegistration.PENDING,
+                last_modification_date=timezone.now(),
+            )
+        except Exception as exc:
+            raise exceptions.ModelError(str(exc)) from exc
+
+    def __str__(self):
+        """PidRegistration object as string.
+
+        Returns:
+            str - String representation of PidRegistration object.
+        """
+        if self.data_id is not None:
+            return f"PidRegistration data {self.data_id} ({self.status})"
+
+        return f"PidRegistration blob {self.blob_id} ({self.status})"
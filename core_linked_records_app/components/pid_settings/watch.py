@@ -2,20 +2,40 @@
 
 import logging
 
+from django.db.models.signals import post_save, post_delete
+
 from core_linked_records_app import settings
 from core_linked_records_app.components.pid_settings.models import PidSettings
 from core_linked_records_app.system.pid_settings import (
     api as pid_settings_system_api,
 )
+from core_linked_records_app.utils.cache import invalidate_pid_config
 
 logger = logging.getLogger(__name__)
 
 
 def init():
     """Main initialization function"""
+    post_save.connect(invalidate_pid_config_cache, sender=PidSettings)
+    post_delete.connect(invalidate_pid_config_cache, sender=PidSettings)
+
     try:
         if not PidSettings.get():
             pid_settings = PidSettings(auto_set_pid=settings.AUTO_SET_PID)
             pid_settings_system_api.upsert(pid_settings)
     except Exception as exc:  # pylint: disable=broad-except
         logger.error("Impossible to initialize PidSettings: %s", str(exc))
+
+
+def invalidate_pid_config_cache(
+    sender, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Invalidate the cached PID configuration when PidSettings change.
+
+    Args:
+        sender:
+        kwargs:
+
+    Returns:
+    """
+    invalidate_pid_config()
@@ -0,0 +1,32 @@
+"""Signals to trigger on Template changes"""
+
+from django.db.models.signals import post_save, post_delete
+
+from core_linked_records_app.utils import xml as pid_xml_utils
+from core_linked_records_app.utils.cache import invalidate_pid_config
+from core_main_app.components.template.models import Template
+
+
+def init():
+    """Connect to Template object events."""
+    post_save.connect(invalidate_template_xsd_cache, sender=Template)
+    post_delete.connect(invalidate_template_xsd_cache, sender=Template)
+
+
+def invalidate_template_xsd_cache(
+    sender,
+    instance: Template,
+    **kwargs,  # noqa, pylint: disable=unused-argument
+):
+    """Remove the cached target namespace and PID XPaths of a modified
+    template, and the cached PID configuration.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+
+    Returns:
+    """
+    pid_xml_utils.invalidate_template_xsd_cache(instance.pk)
+    invalidate_pid_config()
@@ -0,0 +1,174 @@
+"""PID audit command"""
+
+import logging
+from argparse import BooleanOptionalAction
+from collections import Counter
+
+from django.core.management import BaseCommand, CommandError
+from django.utils import timezone
+
+from core_linked_records_app.utils import audit as audit_utils
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Audit and repair the consistency of the PIDs command"""
+
+    help = (
+        "Report orphan records, missing records, duplicate PIDs and dangling "
+        "blob PIDs, and optionally repair them"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            type=int,
+            help="Size of the batch",
+        )
+        parser.add_argument(
+            "--repair",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Delete orphan and dangling records, and create missing "
+            "records",
+        )
+
+    def handle(self, *args, **options):
+        """Compare the local records with the PID index and the blobs.
+
+        The following inconsistencies are reported:
+            - orphan records: local records linked to no blob and contained
+              in no data,
+            - missing records: PIDs of a local provider contained in a data
+              without local record,
+            - duplicate PIDs: PIDs contained in several data, which cannot be
+              resolved,
+            - dangling blob PIDs: local records linked to a deleted blob.
+
+        Data PIDs are read from the PID index, which should be rebuilt with
+        the `pidindex` command first if it is not up-to-date. The repair
+        checks the index of all the data first, and refuses to delete any
+        record if a data has an outdated index. Orphan records are checked
+        again before their deletion against the content of the data changed
+        during the audit or with a pending PID registration. Duplicate PIDs
+        are not repaired, as the data keeping the PID must be chosen.
+
+        Parameters:
+            "batch-size": integer,
+            "repair": boolean
+
+        Examples:
+            pidaudit
+            pidaudit --batch-size 5000
+            pidaudit --repair
+
+        Args:
+            args:
+            options:
+
+        """
+        batch_size = options["batch_size"]
+        repair = options["repair"]
+
+        if batch_size < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        audit_date = timezone.now()
+
+        if repair:
+            for data_id_list in audit_utils.iter_unindexed_data_id_batches(
+                batch_size
+            ):
+                raise CommandError(
+                    "The PID index is not up-to-date (data "
+                    f"{', '.join(str(data_id) for data_id in data_id_list)}"
+                    "): run the `pidindex` command before repairing."
+                )
+
+        url_list = audit_utils.get_local_pid_url_list()
+        counter = Counter()
+        repaired_count = 0
+
+        for local_id_list in audit_utils.iter_local_id_batches(batch_size):
+            counter["records"] += len(local_id_list)
+            orphan_local_id_list = audit_utils.find_orphan_local_id_list(
+                local_id_list, url_list
+            )
+            dangling_local_id_list = (
+                audit_utils.find_dangling_blob_local_id_list(local_id_list)
+            )
+
+            for local_id_object in orphan_local_id_list:
+                self.stdout.write(
+                    f"Orphan record: {local_id_object.record_name}."
+                )
+
+            for local_id_object in dangling_local_id_list:
+                self.stdout.write(
+                    f"Dangling blob PID: {local_id_object.record_name} "
+                    f"(blob {local_id_object.record_object_id})."
+                )
+
+            counter["orphan"] += len(orphan_local_id_list)
+            counter["dangling"] += len(dangling_local_id_list)
+
+            if not repair:
+                continue
+
+            repaired_count += audit_utils.delete_orphan_local_id_list(
+                orphan_local_id_list, url_list, audit_date
+            )
+            repaired_count += audit_utils.delete_dangling_blob_local_id_list(
+                dangling_local_id_list
+            )
+
+        for pid_index_list in audit_utils.iter_local_pid_index_batches(
+            url_list, batch_size
+        ):
+            missing_record_name_list = (
+                audit_utils.find_missing_record_name_list(
+                    pid_index_list, url_list
+                )
+            )
+
+            for record_name in missing_record_name_list:
+                self.stdout.write(f"Missing record: {record_name}.")
+
+            counter["missing"] += len(missing_record_name_list)
+
+            if repair:
+                repaired_count += audit_utils.insert_missing_local_id_list(
+                    missing_record_name_list
+                )
+
+        for data_id_list_by_pid in audit_utils.iter_duplicate_pid_batches(
+            batch_size
+        ):
+            for pid, data_id_list in data_id_list_by_pid.items():
+                self.stdout.write(
+                    f"Duplicate PID: {pid} (data "
+                    f"{', '.join(str(data_id) for data_id in data_id_list)})."
+                )
+
+            counter["duplicate"] += len(data_id_list_by_pid)
+
+        self.stdout.write(
+            f"{counter['records']} records processed, {counter['orphan']} "
+            f"orphan, {counter['missing']} missing, {counter['duplicate']} "
+            f"duplicate PIDs, {counter['dangling']} dangling blob PIDs."
+        )
+
+        if repair:
+            self.stdout.write(f"{repaired_count} records repaired.")
+
+        if counter["duplicate"] or (
+            not repair
+            and (
+                counter["orphan"] or counter["missing"] or counter["dangling"]
+            )
+        ):
+            raise CommandError("The PIDs are not consistent.")
+
+        self.stdout.write(self.style.SUCCESS("Command completed."))
@@ -0,0 +1,311 @@
+"""PID backfill command"""
+
+import json
+import logging
+import os
+import time
+from argparse import BooleanOptionalAction
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
+
+from core_linked_records_app.utils import backfill as backfill_utils
+from core_linked_records_app.utils import worker as worker_utils
+from core_main_app.settings import MONGODB_INDEXING
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Backfill the PIDs of existing data and blobs command"""
+
+    help = "Assign PIDs to the existing data and blobs which do not have any"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--template",
+            default=None,
+            type=int,
+            help="Id of the template to restrict the data to",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=100,
+            type=int,
+            help="Size of the batch",
+        )
+        parser.add_argument(
+            "--workers",
+            default=1,
+            type=int,
+            help="Number of worker processes",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            type=str,
+            help="Path of the file recording the progress of the command",
+        )
+        parser.add_argument(
+            "--resume",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Start from the progress recorded in the checkpoint file",
+        )
+        parser.add_argument(
+            "--data",
+            default=True,
+            action=BooleanOptionalAction,
+            help="Assign PIDs to the data",
+        )
+        parser.add_argument(
+            "--blobs",
+            default=True,
+            action=BooleanOptionalAction,
+            help="Assign PIDs to the blobs",
+        )
+
+    def handle(self, *args, **options):
+        """Walk through the data and blobs without PID and assign them one.
+
+        Data and blobs are retrieved by batches ordered by primary key. The
+        records of a batch are created with a single call to the provider,
+        and data are written with a single query, without running their save
+        signals. Batches are processed by a pool of worker processes if
+        `workers` is greater than 1. The last primary key of each successful
+        batch is written to the checkpoint file, so that an interrupted run
+        can be resumed. The checkpoint is not advanced past a failed batch,
+        which is processed again by a resumed run.
+
+        Parameters:
+            "template": integer,
+            "batch-size": integer,
+            "workers": integer,
+            "checkpoint": string,
+            "resume": boolean,
+            "data": boolean,
+            "blobs": boolean
+
+        Examples:
+            pidbackfill
+            pidbackfill --template 1 --no-blobs
+            pidbackfill --batch-size 500 --workers 4 --checkpoint pid.json
+            pidbackfill --checkpoint pid.json --resume
+
+        Args:
+            args:
+            options:
+
+        """
+        batch_size = options["batch_size"]
+        workers = options["workers"]
+        checkpoint_path = options["checkpoint"]
+
+        if batch_size < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        if workers < 1:
+            raise CommandError(
+                "The number of workers must be a positive integer."
+            )
+
+        if options["resume"] and not checkpoint_path:
+            raise CommandError("Resuming requires a checkpoint file.")
+
+        # Data written in bulk would not be synchronized with MongoDB.
+        if options["data"] and MONGODB_INDEXING:
+            raise CommandError(
+                "Data cannot be backfilled when MONGODB_INDEXING is enabled, "
+                "use --no-data."
+            )
+
+        checkpoint = {"data": None, "blobs": None}
+
+        if options["resume"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+                checkpoint.update(json.load(checkpoint_file))
+
+        executor = None
+
+        if workers > 1:
+            # Forked workers must not share the connections of this process.
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=worker_utils.init_worker
+            )
+
+        try:
+            if options["data"]:
+                self._backfill(
+                    "data",
+                    partial(
+                        backfill_utils.get_data_id_batch,
+                        template_id=options["template"],
+                    ),
+                    backfill_utils.backfill_data_batch,
+                    checkpoint,
+                    checkpoint_path,
+                    batch_size,
+                    executor,
+                    workers,
+                )
+
+            if options["blobs"]:
+                self._backfill(
+                    "blobs",
+                    backfill_utils.get_blob_id_batch,
+                    backfill_utils.backfill_blob_batch,
+                    checkpoint,
+                    checkpoint_path,
+                    batch_size,
+                    executor,
+                    workers,
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS("Command completed."))
+
+    def _backfill(
+        self,
+        name,
+        get_id_batch,
+        backfill_batch,
+        checkpoint,
+        checkpoint_path,
+        batch_size,
+        executor,
+        workers,
+    ):
+        """Backfill the PIDs of one type of objects. Batches are submitted in
+        order, and their results are collected in the same order, so that
+        the checkpoint never skips a batch which is not processed yet. Once a
+        batch fails, the checkpoint stays before it for the rest of the run.
+
+        Args:
+            name: str - Name of the objects, and key of the checkpoint.
+            get_id_batch: Function retrieving a batch of IDs.
+            backfill_batch: Function processing a batch of IDs.
+            checkpoint: dict - Last processed primary key, by object name.
+            checkpoint_path: str - Path of the checkpoint file, or None.
+            batch_size: int
+            executor: Executor processing the batches, or None to process
+                them in the current process.
+            workers: int - Number of batches processed concurrently.
+        """
+        counter = Counter()
+        pending_batch_list = deque()
+        last_pk = checkpoint[name]
+        is_checkpoint_blocked = False
+        start_time = time.monotonic()
+
+        while True:
+            id_list = get_id_batch(last_pk, batch_size)
+
+            if id_list:
+                last_pk = id_list[-1]
+                pending_batch_list.append(
+                    (
+                        last_pk,
+                        len(id_list),
+                        self._submit(executor, backfill_batch, id_list),
+                    )
+                )
+
+            # Keep one batch per worker in flight, and wait for all of them
+            # once the last batch is submitted.
+            while pending_batch_list and (
+                not id_list or len(pending_batch_list) > workers
+            ):
+                batch_last_pk, batch_count, future = (
+                    pending_batch_list.popleft()
+                )
+                counter["processed"] += batch_count
+
+                try:
+                    result = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    result = {
+                        "errors": [f"Batch ending at {batch_last_pk}: {exc}"]
+                    }
+                    counter["errors"] += batch_count - 1
+
+                counter["assigned"] += result.get("assigned", 0)
+                counter["skipped"] += result.get("skipped", 0)
+                counter["errors"] += len(result["errors"])
+
+                for error in result["errors"]:
+                    self.stderr.write(f"ERROR: {error}")
+
+                # Objects of a failed batch may still need a PID.
+                if result["errors"]:
+                    is_checkpoint_blocked = True
+
+                if not is_checkpoint_blocked:
+                    checkpoint[name] = batch_last_pk
+                    self._write_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed_time = time.monotonic() - start_time
+                self.stdout.write(
+                    f"{counter['processed']} {name} processed, "
+                    f"{counter['assigned']} assigned "
+                    f"({counter['processed'] / max(elapsed_time, 1e-6):.1f} "
+                    f"{name}/s)."
+                )
+
+            if not id_list:
+                break
+
+        self.stdout.write(
+            f"{counter['processed']} {name} processed, "
+            f"{counter['assigned']} assigned, {counter['skipped']} skipped, "
+            f"{counter['errors']} errors in "
+            f"{time.monotonic() - start_time:.1f}s."
+        )
+
+    @staticmethod
+    def _submit(executor, function, id_list):
+        """Submit the processing of a batch.
+
+        Args:
+            executor: Executor processing the batch, or None to process it in
+                the current process.
+            function: Function processing the batch.
+            id_list: list - IDs of the batch.
+
+        Returns:
+            Future - Result of the batch.
+        """
+        if executor is not None:
+            return executor.submit(function, id_list)
+
+        future = Future()
+
+        try:
+            future.set_result(function(id_list))
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+
+        return future
+
+    @staticmethod
+    def _write_checkpoint(checkpoint_path, checkpoint):
+        """Write the checkpoint file, replacing it atomically.
+
+        Args:
+            checkpoint_path: str - Path of the checkpoint file, or None.
+            checkpoint: dict - Last processed primary key, by object name.
+        """
+        if not checkpoint_path:
+            return
+
+        temporary_path = f"{checkpoint_path}.tmp"
+
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+
+        os.replace(temporary_path, checkpoint_path)
@@ -0,0 +1,123 @@
+"""PID index command"""
+
+import logging
+from argparse import BooleanOptionalAction
+
+from django.core.management import BaseCommand, CommandError
+
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_main_app.components.data.models import Data
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Backfill and check the PID index command"""
+
+    help = "Backfill the PID index from existing data, or check its content"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--template",
+            default=None,
+            type=int,
+            help="Id of the template to restrict the data to",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=100,
+            type=int,
+            help="Size of the batch",
+        )
+        parser.add_argument(
+            "--check",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Only report data with an outdated index",
+        )
+
+    def handle(self, *args, **options):
+        """Walk through all data and index the PIDs they contain.
+
+        Data are retrieved by batches ordered by primary key, so the command
+        can be run on large collections. The index should be rebuilt after
+        adding or changing a PidPath.
+
+        Parameters:
+            "template": integer,
+            "batch-size": integer,
+            "check": boolean
+
+        Examples:
+            pidindex
+            pidindex --template 1 --batch-size 500
+            pidindex --check
+
+        Args:
+            args:
+            options:
+
+        """
+        template_id = options["template"]
+        batch_size = options["batch_size"]
+        check = options["check"]
+
+        if batch_size < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        data_queryset = Data.objects.order_by("pk")
+
+        if template_id is not None:
+            data_queryset = data_queryset.filter(template_id=template_id)
+
+        processed_count = 0
+        outdated_count = 0
+        error_count = 0
+        last_pk = None
+
+        while True:
+            batch_queryset = data_queryset
+            if last_pk is not None:
+                batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+
+            data_list = list(
+                batch_queryset.select_related("template")[:batch_size]
+            )
+
+            if not data_list:
+                break
+
+            for data in data_list:
+                processed_count += 1
+
+                try:
+                    if pid_index_system_api.is_data_indexed(data):
+                        continue
+
+                    outdated_count += 1
+
+                    if check:
+                        self.stdout.write(
+                            f"Data {data.pk} has an outdated PID index."
+                        )
+                    else:
+                        pid_index_system_api.index_data(data)
+                except Exception as exc:  # pylint: disable=broad-except
+                    error_count += 1
+                    self.stderr.write(
+                        f"ERROR: Unable to index data {data.pk}: {str(exc)}"
+                    )
+
+            last_pk = data_list[-1].pk
+
+        self.stdout.write(
+            f"{processed_count} data processed, {outdated_count} "
+            f"{'outdated' if check else 'reindexed'}, {error_count} errors."
+        )
+
+        if check and (outdated_count or error_count):
+            raise CommandError("The PID index is not up-to-date.")
+
+        self.stdout.write(self.style.SUCCESS("Command completed."))
@@ -0,0 +1,123 @@
+"""PID registration command"""
+
+import logging
+from argparse import BooleanOptionalAction
+
+from django.core.management import BaseCommand, CommandError
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Process the queued PID registrations command"""
+
+    help = "Register the PIDs of the data and blobs queued in the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=100,
+            type=int,
+            help="Size of the batch",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            default=settings.PID_REGISTRATION_MAX_ATTEMPTS,
+            type=int,
+            help="Number of attempts before a registration is abandoned",
+        )
+        parser.add_argument(
+            "--requeue",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Queue again the registrations left in processing by an "
+            "interrupted worker",
+        )
+
+    def handle(self, *args, **options):
+        """Drain the PID registration outbox by batches.
+
+        Each queued data or blob is saved again with inline registration,
+        running the same PID assignment as the inline backend. Failed
+        registrations are retried by the next runs until the maximum number
+        of attempts is reached.
+
+        Parameters:
+            "batch-size": integer,
+            "max-attempts": integer,
+            "requeue": boolean
+
+        Examples:
+            pidregistration
+            pidregistration --batch-size 500 --max-attempts 3
+            pidregistration --requeue
+
+        Args:
+            args:
+            options:
+
+        """
+        batch_size = options["batch_size"]
+        max_attempts = options["max_attempts"]
+
+        if batch_size < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        if options["requeue"]:
+            requeued_count = pid_registration_system_api.requeue_processing()
+            self.stdout.write(f"{requeued_count} registrations queued again.")
+
+        processed_count = 0
+        error_count = 0
+        last_pk = None
+
+        while True:
+            pid_registration_list = (
+                pid_registration_system_api.get_batch_to_process(
+                    batch_size, max_attempts, last_pk
+                )
+            )
+
+            if not pid_registration_list:
+                break
+
+            for pid_registration in pid_registration_list:
+                if not pid_registration_system_api.claim(pid_registration):
+                    continue
+
+                processed_count += 1
+
+                try:
+                    with pid_registration_system_api.inline_registration():
+                        if pid_registration.data is not None:
+                            pid_registration.data.save()
+                        else:
+                            pid_registration.blob.save()
+
+                    pid_registration_system_api.complete(
+                        pid_registration, PidRegistration.DONE
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    error_count += 1
+                    self.stderr.write(
+                        f"ERROR: Unable to process {str(pid_registration)}: "
+                        f"{str(exc)}"
+                    )
+                    pid_registration_system_api.complete(
+                        pid_registration, PidRegistration.FAILED, str(exc)
+                    )
+
+            last_pk = pid_registration_list[-1].pk
+
+        self.stdout.write(
+            f"{processed_count} registrations processed, {error_count} errors."
+        )
+        self.stdout.write(self.style.SUCCESS("Command completed."))
@@ -0,0 +1,59 @@
+"""Migration to create the PidIndex model.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0005_alter_pidpath_template"),
+        ("core_main_app", "0014_data_processing_module"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PidIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("pid", models.CharField(db_index=True, max_length=512)),
+                ("path", models.CharField(max_length=255)),
+                (
+                    "data",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.data",
+                    ),
+                ),
+                (
+                    "template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.template",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("data", "path"),
+                        name="unique_pid_index_data_path",
+                    )
+                ],
+            },
+        ),
+    ]
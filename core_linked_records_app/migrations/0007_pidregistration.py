@@ -0,0 +1,89 @@
+"""Migration to create the PidRegistration model.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0006_pidindex"),
+        ("core_main_app", "0014_data_processing_module"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PidRegistration",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("message", models.TextField(blank=True, default="")),
+                ("creation_date", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_modification_date",
+                    models.DateTimeField(auto_now=True),
+                ),
+                (
+                    "blob",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.blob",
+                    ),
+                ),
+                (
+                    "data",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.data",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "attempt_count"],
+                        name="pid_registration_status_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("data",), name="unique_pid_registration_data"
+                    ),
+                    models.UniqueConstraint(
+                        fields=("blob",), name="unique_pid_registration_blob"
+                    ),
+                ],
+            },
+        ),
+    ]
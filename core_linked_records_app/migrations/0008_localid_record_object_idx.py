@@ -0,0 +1,24 @@
+"""Migration to index LocalId objects by linked object class and ID.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0007_pidregistration"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="localid",
+            index=models.Index(
+                fields=["record_object_class", "record_object_id"],
+                name="local_id_record_object_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+"""Migration to create the LocalIdSequence model.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0008_localid_record_object_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocalIdSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("next_value", models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
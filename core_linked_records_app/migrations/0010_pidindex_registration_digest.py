@@ -0,0 +1,22 @@
+"""Migration to add the registration digest to the PidIndex model.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0009_localidsequence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pidindex",
+            name="registration_digest",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
@@ -0,0 +1,49 @@
+"""Migration recording that the PIDs of the existing Data must be indexed.
+
+Generated by Django 5.2 on 2026-10-17
+"""
+
+import logging
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+
+def report_unindexed_data(apps, schema_editor):
+    """Report the Data created before the PID index. Indexing the whole
+    collection can take hours, it is left to the `pidindex` command.
+
+    Args:
+        apps:
+        schema_editor:
+    """
+    data_model = apps.get_model("core_main_app", "Data")
+    pid_index_model = apps.get_model("core_linked_records_app", "PidIndex")
+    database_alias = schema_editor.connection.alias
+
+    if (
+        not data_model.objects.using(database_alias).exists()
+        or pid_index_model.objects.using(database_alias).exists()
+    ):
+        return
+
+    logger.warning(
+        "The PIDs of the existing data are not indexed, run "
+        "`python manage.py pidindex` to index them."
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_linked_records_app", "0010_pidindex_registration_digest"),
+        ("core_main_app", "0014_data_processing_module"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            report_unindexed_data, reverse_code=migrations.RunPython.noop
+        ),
+    ]
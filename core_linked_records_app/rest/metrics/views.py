@@ -0,0 +1,44 @@
+"""REST views for the metrics of the PID operations"""
+
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from core_linked_records_app.utils.metrics import get_metrics_registry
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@extend_schema(
+    tags=["PID"],
+    description="Metrics of the PID operations",
+)
+class MetricsView(APIView):
+    """Metrics of the PID operations, in the Prometheus text format"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="Retrieve the metrics of the PID operations",
+        description="Retrieve the latencies, counters and cache statistics "
+        "of the PID operations of the process, in the Prometheus text "
+        "exposition format. Available only for superusers.",
+        responses={
+            200: OpenApiResponse(description="Metrics retrieved"),
+            403: OpenApiResponse(description="Access Forbidden"),
+        },
+    )
+    def get(self, request):
+        """Render the metrics of the registry of the process.
+
+        Args:
+            request:
+
+        Returns:
+            HttpResponse - Metrics, in the text exposition format.
+        """
+        return HttpResponse(
+            get_metrics_registry().render(),
+            content_type=METRICS_CONTENT_TYPE,
+        )
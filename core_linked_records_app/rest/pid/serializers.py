@@ -1,5 +1,6 @@
 """Serializer classes for LocalID object"""
 
+from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
 from core_linked_records_app.components.local_id.models import LocalId
@@ -18,3 +19,12 @@ class LocalIdSerializer(ModelSerializer):
             "record_object_class",
             "record_object_id",
         ]
+
+
+class PidResolutionSerializer(serializers.Serializer):
+    """Serializer for the resolution of a PID"""
+
+    pid = serializers.CharField()
+    status = serializers.CharField()
+    type = serializers.CharField(allow_null=True)
+    id = serializers.IntegerField(allow_null=True)
@@ -5,6 +5,7 @@ from urllib.parse import urljoin
 
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     extend_schema,
@@ -27,7 +28,30 @@ from core_explore_common_app.utils.query import query as query_utils
 from core_linked_records_app import settings
 from core_linked_records_app.components.blob import api as blob_api
 from core_linked_records_app.components.data import api as data_api
-from core_linked_records_app.utils.query import execute_local_pid_query
+from core_linked_records_app.components.pid import api as pid_api
+from core_linked_records_app.rest.pid.serializers import (
+    PidResolutionSerializer,
+)
+from core_linked_records_app.utils import http as http_utils
+from core_linked_records_app.utils.data_source import (
+    build_data_source_json_query,
+    execute_query_pid_fan_out,
+)
+from core_linked_records_app.utils.exceptions import InvalidCursorError
+from core_linked_records_app.utils.query import (
+    execute_local_pid_query,
+    get_local_pid_query_page,
+    iterate_local_pid_query,
+)
+from core_linked_records_app.utils.response import (
+    build_ndjson_streaming_response,
+    get_page_parameters,
+    is_id_list_valid,
+    is_streaming_requested,
+)
+from core_main_app.components.template_html_rendering import (
+    api as template_html_rendering_api,
+)
 from core_main_app.rest.template_html_rendering.views import BaseDataHtmlRender
 
 if (
@@ -36,6 +60,8 @@ if (
 ):  # Import OAI-PMH pid views if packages are present.
     from core_linked_records_app.utils.query import (
         execute_oaipmh_pid_query,
+        get_oaipmh_pid_query_page,
+        iterate_oaipmh_pid_query,
     )
 
 
@@ -155,6 +181,116 @@ class RetrieveDataPIDView(APIView):
             )
 
 
+@extend_schema(
+    tags=["PID"],
+    description="Retrieve PIDs for a given list of data IDs",
+)
+class RetrieveDataListPIDView(APIView):
+    """Retrieve PIDs for a given list of data IDs"""
+
+    @extend_schema(
+        summary="Retrieve PIDs for a list of data IDs",
+        description="Retrieve the PIDs of a list of local and OAI-PMH data, "
+        "mapped by data ID. Data not found or not readable are omitted.",
+        request=OpenApiTypes.OBJECT,
+        responses={
+            200: OpenApiResponse(description="PIDs for the data"),
+            400: OpenApiResponse(description="Invalid list of data IDs"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+        examples=[
+            OpenApiExample(
+                "Example request",
+                summary="Example request body",
+                description="Example request body for retrieving PIDs",
+                value={
+                    "data_ids": ["1", "2"],
+                    "oai_data_ids": ["3"],
+                },
+            ),
+        ],
+    )
+    def post(self, request):
+        """Retrieve PIDs
+        Args:
+            request:
+        Returns:
+        """
+        data_id_list = request.data.get("data_ids", [])
+        oai_data_id_list = request.data.get("oai_data_ids", [])
+
+        if not isinstance(data_id_list, list) or not isinstance(
+            oai_data_id_list, list
+        ):
+            return Response(
+                {
+                    "message": "Parameters 'data_ids' and 'oai_data_ids' "
+                    "must be lists."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not is_id_list_valid(data_id_list) or not is_id_list_valid(
+            oai_data_id_list
+        ):
+            return Response(
+                {
+                    "message": "Parameters 'data_ids' and 'oai_data_ids' "
+                    "must only contain integer IDs."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if (
+            len(data_id_list) + len(oai_data_id_list)
+            > settings.PID_BULK_RETRIEVE_LIMIT
+        ):
+            return Response(
+                {
+                    "message": f"At most {settings.PID_BULK_RETRIEVE_LIMIT} "
+                    f"data IDs can be provided."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            response_content = {
+                "data_pids": (
+                    data_api.get_pid_dict_for_data_id_list(
+                        data_id_list, request
+                    )
+                    if data_id_list
+                    else {}
+                ),
+                "oai_data_pids": {},
+            }
+
+            if (
+                "core_oaipmh_harvester_app" in settings.INSTALLED_APPS
+                and "core_explore_oaipmh_app" in settings.INSTALLED_APPS
+                and oai_data_id_list
+            ):  # OAI-PMH data
+                from core_linked_records_app.components.oai_record import (
+                    api as oai_record_api,
+                )
+
+                response_content["oai_data_pids"] = (
+                    oai_record_api.get_pid_dict_for_data_id_list(
+                        oai_data_id_list, request
+                    )
+                )
+
+            return Response(response_content, status=status.HTTP_200_OK)
+        except Exception as exc:  # pylint: disable=broad-except
+            return Response(
+                {
+                    "message": f"An unexpected exception occurred while "
+                    f"retrieving data PIDs: {str(exc)}"
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
 @extend_schema(
     tags=["PID"],
     description="Retrieve PIDs for a given blob ID",
@@ -217,6 +353,100 @@ class RetrieveBlobPIDView(APIView):
             )
 
 
+@extend_schema(
+    tags=["PID"],
+    description="Retrieve PIDs for a given list of blob IDs",
+)
+class RetrieveBlobListPIDView(APIView):
+    """Retrieve PIDs for a given list of blob IDs"""
+
+    @extend_schema(
+        summary="Retrieve PIDs for a list of blob IDs",
+        description="Retrieve the PIDs of a list of blobs, mapped by blob ID. "
+        "Blobs not found or not readable are omitted.",
+        request=OpenApiTypes.OBJECT,
+        responses={
+            200: OpenApiResponse(description="PIDs for the blobs"),
+            400: OpenApiResponse(description="Invalid list of blob IDs"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+        examples=[
+            OpenApiExample(
+                "Example request",
+                summary="Example request body",
+                description="Example request body for retrieving PIDs",
+                value={"blob_ids": ["1", "2"]},
+            ),
+        ],
+    )
+    def post(self, request):
+        """Retrieve PIDs
+        Args:
+            request:
+        Returns:
+        """
+        blob_id_list = request.data.get("blob_ids", [])
+
+        if not isinstance(blob_id_list, list):
+            return Response(
+                {"message": "Parameter 'blob_ids' must be a list."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not is_id_list_valid(blob_id_list):
+            return Response(
+                {
+                    "message": "Parameter 'blob_ids' must only contain "
+                    "integer IDs."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(blob_id_list) > settings.PID_BULK_RETRIEVE_LIMIT:
+            return Response(
+                {
+                    "message": f"At most {settings.PID_BULK_RETRIEVE_LIMIT} "
+                    f"blob IDs can be provided."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            local_id_by_blob_id = blob_api.get_pid_dict_for_blob_id_list(
+                blob_id_list, request.user
+            )
+            sub_url = reverse(
+                "core_linked_records_provider_record",
+                kwargs={
+                    "provider": settings.ID_PROVIDER_SYSTEM_NAME,
+                    "record": "",
+                },
+            )
+
+            return Response(
+                {
+                    "blob_pids": {
+                        str(blob_id): (
+                            f"{settings.SERVER_URI}{sub_url}"
+                            f"{local_id_by_blob_id[str(blob_id)].record_name}"
+                            if str(blob_id) in local_id_by_blob_id
+                            else None
+                        )
+                        for blob_id in blob_id_list
+                    }
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return Response(
+                {
+                    "message": f"An unexpected exception occurred while "
+                    f"retrieving blob PIDs: {str(exc)}"
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
 @extend_schema(
     tags=["PID"],
     description="Retrieve PIDs for a given list of data IDs",
@@ -226,12 +456,37 @@ class RetrieveListPIDView(APIView):
 
     @extend_schema(
         summary="Retrieve PIDs for a list of data IDs",
-        description="Retrieve PIDs for a given list of data IDs",
+        description="Retrieve PIDs for a given list of data IDs. The PIDs "
+        "are streamed as newline delimited JSON if `stream` is true, or "
+        "returned by pages if `cursor` or `page_size` is set. If "
+        "`all_data_sources` is true, all the data sources of the query are "
+        "queried concurrently and the status of each one is returned.",
+        parameters=[
+            OpenApiParameter(
+                name="stream",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Stream the PIDs as newline delimited JSON",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Cursor of the page, empty for the first page",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of documents covered by the page",
+            ),
+        ],
         request=OpenApiTypes.OBJECT,
         responses={
             200: OpenApiResponse(description="PIDs for the data"),
             400: OpenApiResponse(
-                description="Validation error or unknown authentication type"
+                description="Validation error, unknown authentication type "
+                "or invalid pagination parameters"
             ),
             500: OpenApiResponse(description="Internal server error"),
         },
@@ -245,6 +500,16 @@ class RetrieveListPIDView(APIView):
                     "data_source_index": 0,
                 },
             ),
+            OpenApiExample(
+                "Example request for all data sources",
+                summary="Example request body for all data sources",
+                description="Example request body for retrieving PIDs from "
+                "all the data sources of a query",
+                value={
+                    "query_id": "query_id",
+                    "all_data_sources": True,
+                },
+            ),
         ],
     )
     def post(self, request):
@@ -253,40 +518,83 @@ class RetrieveListPIDView(APIView):
             request:
         Returns:
         """
+        try:
+            page_parameters = get_page_parameters(request)
+            is_stream = is_streaming_requested(request)
+            is_all_data_sources = bool(
+                request.data.get("all_data_sources", False)
+            )
+
+            if page_parameters is not None and is_stream:
+                raise InvalidCursorError(
+                    "Streaming and pagination cannot be combined."
+                )
+
+            if is_all_data_sources and (
+                page_parameters is not None or is_stream
+            ):
+                raise InvalidCursorError(
+                    "Streaming and pagination are not supported when "
+                    "querying all data sources."
+                )
+        except InvalidCursorError as exc:
+            return Response(
+                {"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
             query = query_api.get_by_id(
                 request.data.get("query_id", None),
                 request.user,
             )
+
+            if is_all_data_sources:
+                return Response(
+                    execute_query_pid_fan_out(query, request),
+                    status=status.HTTP_200_OK,
+                )
+
             data_source = query.data_sources[
                 int(request.data.get("data_source_index", 0))
             ]
             # Build serialized query to send to data source
-            json_query = {
-                "query": query.content,
-                "templates": json.dumps(
-                    [
-                        {"id": template.id, "hash": template.hash}
-                        for template in query.templates.all()
-                    ]
-                ),
-                "options": json.dumps(data_source["query_options"]),
-                "order_by_field": data_source["order_by_field"],
-            }
+            json_query = build_data_source_json_query(query, data_source)
             if data_source["authentication"]["auth_type"] == "session":
                 # Local and OAI-PMH data sources
                 if query_utils.is_local_data_source(data_source):
-                    json_response = execute_local_pid_query(
-                        json_query, request
-                    )
+                    execute_fn = execute_local_pid_query
+                    iterate_fn = iterate_local_pid_query
+                    get_page_fn = get_local_pid_query_page
                 elif oaipmh_utils.is_oai_data_source(data_source):
-                    json_response = execute_oaipmh_pid_query(
-                        json_query, request
-                    )
+                    execute_fn = execute_oaipmh_pid_query
+                    iterate_fn = iterate_oaipmh_pid_query
+                    get_page_fn = get_oaipmh_pid_query_page
                 else:
                     raise ExploreRequestError("Unknown data source type.")
+
+                if page_parameters is not None:
+                    return Response(
+                        get_page_fn(json_query, request, *page_parameters),
+                        status=status.HTTP_200_OK,
+                    )
+
+                if is_stream:
+                    return build_ndjson_streaming_response(
+                        iterate_fn(json_query, request)
+                    )
+
+                json_response = execute_fn(json_query, request)
             elif data_source["authentication"]["auth_type"] == "oauth2":
-                # Federated data sources
+                # Federated data sources only return complete lists.
+                if page_parameters is not None:
+                    return Response(
+                        {
+                            "error": "Pagination is not supported by "
+                            "federated data sources."
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
                 response = oauth2_post_request(
                     data_source["capabilities"]["query_pid"],
                     json_query,
@@ -307,8 +615,14 @@ class RetrieveListPIDView(APIView):
                     {"error": "Unknown authentication type."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+
+            pid_list = [pid for pid in json_response if pid is not None]
+
+            if is_stream:
+                return build_ndjson_streaming_response(pid_list)
+
             return Response(
-                {"pids": [pid for pid in json_response if pid is not None]},
+                {"pids": pid_list},
                 status=status.HTTP_200_OK,
             )
         except Exception as exception:
@@ -318,6 +632,82 @@ class RetrieveListPIDView(APIView):
             )
 
 
+@extend_schema(
+    tags=["PID"],
+    description="Resolve a list of PIDs",
+)
+class ResolveListPIDView(APIView):
+    """Resolve a list of PIDs to the data or blobs they are assigned to"""
+
+    @extend_schema(
+        summary="Resolve a list of PIDs",
+        description="Resolve a list of PIDs to the type, ID and access status "
+        "of the data or blobs they are assigned to",
+        request=OpenApiTypes.OBJECT,
+        responses={
+            200: PidResolutionSerializer(many=True),
+            400: OpenApiResponse(
+                description="Missing or invalid list of PIDs"
+            ),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+        examples=[
+            OpenApiExample(
+                "Example request",
+                summary="Example request body",
+                description="Example request body for resolving PIDs",
+                value={
+                    "pids": [
+                        "https://pid-system.org/prefix/record1",
+                        "https://pid-system.org/prefix/record2",
+                    ],
+                },
+            ),
+        ],
+    )
+    def post(self, request):
+        """Resolve PIDs
+        Args:
+            request:
+        Returns:
+        """
+        pid_list = request.data.get("pids", None)
+
+        if not isinstance(pid_list, list):
+            return Response(
+                {"message": "Parameter 'pids' must be a list."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(pid_list) > settings.PID_BULK_RESOLVE_LIMIT:
+            return Response(
+                {
+                    "message": f"Parameter 'pids' must contain at most "
+                    f"{settings.PID_BULK_RESOLVE_LIMIT} PIDs."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            return Response(
+                {
+                    "results": PidResolutionSerializer(
+                        pid_api.resolve_pid_list(pid_list, request.user),
+                        many=True,
+                    ).data
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return Response(
+                {
+                    "message": f"An unexpected exception occurred while "
+                    f"resolving PIDs: {str(exc)}"
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
 @extend_schema(
     tags=["PID"],
     description="DataHtmlRenderByPID",
@@ -326,8 +716,55 @@ class DataHtmlRenderByPID(BaseDataHtmlRender):
     """DataHtmlRenderByPID"""
 
     def get_object(self, pid, request):
-        """get data object by PID."""
-        return data_api.get_data_by_pid(pid, request)
+        """get data object by PID. The data is kept for the request, so that
+        it is only retrieved once to check the cache validators and to render
+        it.
+        """
+        data_by_pid = self.__dict__.setdefault("data_by_pid", {})
+
+        if pid not in data_by_pid:
+            data_by_pid[pid] = data_api.get_data_by_pid(pid, request)
+
+        return data_by_pid[pid]
+
+    def get_cache_validators(self, request, pid):
+        """Retrieve the validators of the HTML rendering of a data, derived
+        from the data and from the rendering template.
+
+        Args:
+            request: HTTP request
+            pid: data pid
+
+        Returns:
+            tuple - Entity tag, last modification timestamp and public status,
+                or None if the rendering cannot be retrieved.
+        """
+        rendering_type = request.GET.get("rendering", "detail").lower()
+
+        if rendering_type not in ["list", "detail"]:
+            return None
+
+        try:
+            data = self.get_object(pid, request)
+            template_html_rendering = (
+                template_html_rendering_api.get_by_template_id(
+                    data.template.id
+                )
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Errors are reported by the rendering.
+            return None
+
+        is_public = http_utils.is_public_object(data)
+        variant_list = http_utils.get_variant_list(request, is_public) + [
+            rendering_type,
+            getattr(template_html_rendering, f"{rendering_type}_rendering"),
+        ]
+
+        return (
+            *http_utils.get_data_validators(data, variant_list),
+            is_public,
+        )
 
     @extend_schema(
         summary="Get HTML rendering for a data PID",
@@ -359,5 +796,26 @@ class DataHtmlRenderByPID(BaseDataHtmlRender):
                 {"message": "Missing parameter 'pid'."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        cache_validators = self.get_cache_validators(
+            request, request.GET["pid"]
+        )
+
+        if cache_validators is not None:
+            not_modified_response = http_utils.get_not_modified_response(
+                request, *cache_validators
+            )
+
+            if not_modified_response is not None:
+                return not_modified_response
+
         # Get rendering content
-        return self.get_rendering_content(request, request.GET["pid"])
+        response = self.get_rendering_content(request, request.GET["pid"])
+
+        if (
+            cache_validators is not None
+            and response.status_code == status.HTTP_200_OK
+        ):
+            http_utils.set_cache_headers(response, *cache_validators)
+            patch_vary_headers(response, ("Accept",))
+
+        return response
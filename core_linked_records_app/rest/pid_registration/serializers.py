@@ -0,0 +1,17 @@
+"""Serializers for calls related to `PidRegistration` model."""
+
+from rest_framework import serializers
+
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+
+
+class PidRegistrationSerializer(serializers.ModelSerializer):
+    """Serializer for the `PidRegistration` model."""
+
+    class Meta:
+        """Meta"""
+
+        model = PidRegistration
+        fields = "__all__"
@@ -0,0 +1,97 @@
+"""REST views for the PID registrations"""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiResponse,
+)
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_linked_records_app.components.pid_registration import (
+    api as pid_registration_api,
+)
+from core_linked_records_app.rest.pid_registration.serializers import (
+    PidRegistrationSerializer,
+)
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
+
+
+@extend_schema(
+    tags=["PID"],
+    description="Retrieve the PID registration status of a data or a blob",
+)
+class RetrieveRegistrationStatusView(APIView):
+    """Retrieve the PID registration status of a data or a blob"""
+
+    @extend_schema(
+        summary="Retrieve the PID registration status",
+        description="Retrieve the status of the queued PID registration of a "
+        "data or a blob",
+        parameters=[
+            OpenApiParameter(
+                name="data_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Data ID",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="blob_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Blob ID",
+                required=False,
+            ),
+        ],
+        responses={
+            200: PidRegistrationSerializer,
+            400: OpenApiResponse(description="Missing required parameters"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request):
+        """Retrieve the PID registration status of a data or a blob
+
+        Args:
+            request:
+
+        Returns:
+        """
+        try:
+            if "data_id" in request.GET:
+                pid_registration = pid_registration_api.get_by_data_id(
+                    request.GET["data_id"], request.user
+                )
+            elif "blob_id" in request.GET:
+                pid_registration = pid_registration_api.get_by_blob_id(
+                    request.GET["blob_id"], request.user
+                )
+            else:
+                return Response(
+                    {"message": "Missing data_id or blob_id parameter."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            return Response(
+                PidRegistrationSerializer(pid_registration).data,
+                status=status.HTTP_200_OK,
+            )
+        except AccessControlError as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_403_FORBIDDEN
+            )
+        except DoesNotExist as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return Response(
+                {"message": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -3,6 +3,7 @@
 import json
 import logging
 
+from django.utils.cache import patch_vary_headers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -11,10 +12,12 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status
 from rest_framework.parsers import JSONParser
+from rest_framework.permissions import IsAdminUser
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core_linked_records_app import settings
 from core_linked_records_app.components.blob.api import get_blob_by_pid
 from core_linked_records_app.components.data.api import get_data_by_pid
 from core_linked_records_app.rest.data.renderers.data_html_user_renderer import (
@@ -23,16 +26,31 @@ from core_linked_records_app.rest.data.renderers.data_html_user_renderer import
 from core_linked_records_app.rest.data.renderers.data_xml_renderer import (
     DataXmlRenderer,
 )
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.utils import http as http_utils
+from core_linked_records_app.utils.cache import unknown_pid_cache
 from core_linked_records_app.utils.exceptions import (
     InvalidPrefixError,
+    InvalidProviderError,
     InvalidRecordError,
 )
-from core_linked_records_app.utils.pid import split_prefix_from_record
+from core_linked_records_app.utils.file import get_blob_file_response
+from core_linked_records_app.utils.metrics import (
+    RESOLVER_DURATION_METRIC,
+    RESOLVER_REQUESTS_METRIC,
+    get_metrics_registry,
+    timed,
+)
+from core_linked_records_app.utils.pid import (
+    normalize_pid,
+    split_prefix_from_record,
+)
 from core_linked_records_app.utils.providers import ProviderManager
 from core_main_app.access_control.exceptions import AccessControlError
-from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.commons.exceptions import CoreError, DoesNotExist
 from core_main_app.rest.data.serializers import DataSerializer
-from core_main_app.utils.file import get_file_http_response
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +89,7 @@ class ProviderRecordView(APIView):
         request=OpenApiTypes.OBJECT,
         responses={
             201: OpenApiResponse(description="Handle record created"),
+            404: OpenApiResponse(description="Provider not configured"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
@@ -84,7 +103,7 @@ class ProviderRecordView(APIView):
         """
         try:
             try:
-                prefix, record = split_prefix_from_record(record)
+                prefix, record = split_prefix_from_record(record, provider)
             except InvalidPrefixError as invalid_prefix_error:
                 return Response(
                     {
@@ -109,6 +128,15 @@ class ProviderRecordView(APIView):
             return Response(
                 provider_content, status=provider_response.status_code
             )
+        except InvalidProviderError as exc:
+            return Response(
+                {
+                    "record": record,
+                    "url": request.build_absolute_uri("?"),
+                    "message": str(exc),
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
         except Exception as exc:  # pylint: disable=broad-except
             return Response(
                 {
@@ -139,6 +167,7 @@ class ProviderRecordView(APIView):
         request=OpenApiTypes.OBJECT,
         responses={
             200: OpenApiResponse(description="Handle record updated"),
+            404: OpenApiResponse(description="Provider not configured"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
@@ -162,6 +191,10 @@ class ProviderRecordView(APIView):
             return Response(
                 provider_content, status=provider_response.status_code
             )
+        except InvalidProviderError as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_404_NOT_FOUND
+            )
         except Exception as exc:  # pylint: disable=broad-except
             return Response(
                 {
@@ -194,6 +227,7 @@ class ProviderRecordView(APIView):
             500: OpenApiResponse(description="Internal server error"),
         },
     )
+    @timed(RESOLVER_DURATION_METRIC)
     def get(self, request, provider, record):
         """Retrieve the local data of a given handle record
         Args:
@@ -202,38 +236,108 @@ class ProviderRecordView(APIView):
             record:
         Returns:
         """
+        metrics_registry = get_metrics_registry()
+        not_found_content = {
+            "status": "error",
+            "code": status.HTTP_404_NOT_FOUND,
+            "message": "No document with specified handle found",
+        }
+
         try:
             id_provider = self.provider_manager.get(provider)
+            pid = normalize_pid(f"{id_provider.provider_lookup_url}/{record}")
+
+            # The PID was assigned to no data and no blob on a recent request.
+            if unknown_pid_cache.get(pid):
+                metrics_registry.increment(
+                    RESOLVER_REQUESTS_METRIC, {"outcome": "not_found_cached"}
+                )
+                return Response(
+                    not_found_content, status=status.HTTP_404_NOT_FOUND
+                )
+
+            unknown_pid_generation = unknown_pid_cache.get_generation(pid)
             provider_response = id_provider.get(record)
+            pid_url = json.loads(provider_response.content)["url"]
             try:
-                query_result = get_data_by_pid(
-                    json.loads(provider_response.content)["url"], request
+                query_result = get_data_by_pid(pid_url, request)
+                metrics_registry.increment(
+                    RESOLVER_REQUESTS_METRIC, {"outcome": "data"}
                 )
-                return Response(
+                is_public = http_utils.is_public_object(query_result)
+                etag, last_modified = http_utils.get_data_validators(
+                    query_result,
+                    http_utils.get_variant_list(request, is_public),
+                )
+                response = http_utils.get_not_modified_response(
+                    request, etag, last_modified, is_public
+                ) or Response(
                     DataSerializer(query_result).data,
                     status=status.HTTP_200_OK,
                 )
+                patch_vary_headers(response, ("Accept",))
+
+                return http_utils.set_cache_headers(
+                    response, etag, last_modified, is_public
+                )
             except DoesNotExist:
                 # Try to find PID in blobs
                 try:
-                    query_result = get_blob_by_pid(
-                        json.loads(provider_response.content)["url"],
-                        request.user,
+                    query_result = get_blob_by_pid(pid_url, request.user)
+                    metrics_registry.increment(
+                        RESOLVER_REQUESTS_METRIC, {"outcome": "blob"}
+                    )
+                    is_public = http_utils.is_public_object(query_result)
+                    etag, last_modified = http_utils.get_blob_validators(
+                        query_result
                     )
-                    return get_file_http_response(
-                        query_result.blob.read(), query_result.filename
+                    response = http_utils.get_not_modified_response(
+                        request, etag, last_modified, is_public
+                    ) or get_blob_file_response(
+                        request, query_result, etag, last_modified
+                    )
+
+                    return http_utils.set_cache_headers(
+                        response, etag, last_modified, is_public
                     )
                 except AccessControlError as exception:
+                    metrics_registry.increment(
+                        RESOLVER_REQUESTS_METRIC, {"outcome": "forbidden"}
+                    )
                     content = {"message": str(exception)}
                     return Response(content, status=status.HTTP_403_FORBIDDEN)
                 except DoesNotExist:
-                    content = {
-                        "status": "error",
-                        "code": status.HTTP_404_NOT_FOUND,
-                        "message": "No document with specified handle found",
-                    }
-                    return Response(content, status=status.HTTP_404_NOT_FOUND)
+                    metrics_registry.increment(
+                        RESOLVER_REQUESTS_METRIC, {"outcome": "not_found"}
+                    )
+                    # Data the user cannot read is not found either, so the
+                    # PID is only cached if it is assigned to no data at all.
+                    if (
+                        unknown_pid_cache.maxsize > 0
+                        and normalize_pid(pid_url) == pid
+                        and not pid_index_system_api.get_data_id_list_by_pid(
+                            pid
+                        )
+                    ):
+                        unknown_pid_cache.set(
+                            pid, True, unknown_pid_generation
+                        )
+
+                    return Response(
+                        not_found_content, status=status.HTTP_404_NOT_FOUND
+                    )
+        except InvalidProviderError as exc:
+            metrics_registry.increment(
+                RESOLVER_REQUESTS_METRIC, {"outcome": "not_found"}
+            )
+            return Response(
+                {**not_found_content, "message": str(exc)},
+                status=status.HTTP_404_NOT_FOUND,
+            )
         except Exception as exc:  # pylint: disable=broad-except
+            metrics_registry.increment(
+                RESOLVER_REQUESTS_METRIC, {"outcome": "error"}
+            )
             content = {
                 "status": "error",
                 "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -262,6 +366,7 @@ class ProviderRecordView(APIView):
         ],
         responses={
             204: None,
+            404: OpenApiResponse(description="Provider not configured"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
@@ -285,6 +390,10 @@ class ProviderRecordView(APIView):
             return Response(
                 provider_content, status=provider_response.status_code
             )
+        except InvalidProviderError as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_404_NOT_FOUND
+            )
         except Exception as exc:  # pylint: disable=broad-except
             return Response(
                 {
@@ -292,3 +401,141 @@ class ProviderRecordView(APIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+@extend_schema(
+    tags=["PID"],
+    description="Provider Record List View",
+)
+class ProviderRecordListView(APIView):
+    """Provider Record List View"""
+
+    permission_classes = (IsAdminUser,)
+
+    def __init__(self, **kwargs):
+        self.provider_manager = ProviderManager()
+        super().__init__(**kwargs)
+
+    @extend_schema(
+        summary="Create handle records in bulk",
+        description="Create a number of randomly generated handle records, or "
+        "the list of given handle records. Available only for admins.",
+        parameters=[
+            OpenApiParameter(
+                name="provider",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Provider name",
+            ),
+        ],
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {
+                    "prefix": {"type": "string"},
+                    "count": {"type": "integer"},
+                    "records": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                },
+            }
+        },
+        responses={
+            201: OpenApiResponse(description="Handle records created"),
+            207: OpenApiResponse(
+                description="Some handle records already exist"
+            ),
+            400: OpenApiResponse(description="Validation error"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Provider not configured"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def post(self, request, provider):
+        """Create handle records in bulk
+
+        Args:
+            request:
+            provider:
+
+        Returns:
+            - code: 201
+              content: Created records
+            - code: 207
+              content: Created and already existing records
+            - code: 400
+              content: Validation error
+            - code: 403
+              content: Forbidden
+            - code: 404
+              content: Provider not configured
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            prefix = request.data.get(
+                "prefix", settings.ID_PROVIDER_PREFIX_DEFAULT
+            )
+            count = request.data.get("count", None)
+            records = request.data.get("records", None)
+
+            try:
+                split_prefix_from_record(f"{prefix}/", provider)
+
+                if records is not None:
+                    if not isinstance(records, list) or not all(
+                        isinstance(record, str) and record
+                        for record in records
+                    ):
+                        raise InvalidRecordError(
+                            "Records must be a list of record names."
+                        )
+
+                    for record in records:
+                        split_prefix_from_record(
+                            f"{prefix}/{record}", provider
+                        )
+
+                    record_count = len(records)
+                else:
+                    record_count = count if isinstance(count, int) else 0
+            except (InvalidPrefixError, InvalidRecordError) as exc:
+                return Response(
+                    {"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            if record_count > settings.ID_PROVIDER_BULK_CREATE_LIMIT:
+                return Response(
+                    {
+                        "message": "Cannot create more than "
+                        f"{settings.ID_PROVIDER_BULK_CREATE_LIMIT} records "
+                        "at once."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            id_provider = self.provider_manager.get(provider)
+
+            try:
+                provider_response = id_provider.create_many(
+                    prefix, count=count, records=records
+                )
+            except CoreError as exc:
+                return Response(
+                    {"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            return Response(
+                json.loads(provider_response.content),
+                status=provider_response.status_code,
+            )
+        except InvalidProviderError as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return Response(
+                {"message": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -1,12 +1,26 @@
 """REST views for the query API"""
 
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+)
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core_linked_records_app.utils.query import execute_local_pid_query
+from core_linked_records_app.utils.exceptions import InvalidCursorError
+from core_linked_records_app.utils.query import (
+    execute_local_pid_query,
+    get_local_pid_query_page,
+    iterate_local_pid_query,
+)
+from core_linked_records_app.utils.response import (
+    build_ndjson_streaming_response,
+    get_page_parameters,
+    is_streaming_requested,
+)
 
 
 @extend_schema(
@@ -18,15 +32,63 @@ class RetrieveQueryPidListView(APIView):
 
     @extend_schema(
         summary="Retrieve PIDs for a query",
-        description="Retrieve list of PIDs given a query",
+        description="Retrieve list of PIDs given a query. The PIDs are "
+        "streamed as newline delimited JSON if `stream` is true, or returned "
+        "by pages if `cursor` or `page_size` is set.",
+        parameters=[
+            OpenApiParameter(
+                name="stream",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Stream the PIDs as newline delimited JSON",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Cursor of the page, empty for the first page",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of documents covered by the page",
+            ),
+        ],
         request=OpenApiTypes.OBJECT,
         responses={
             200: OpenApiResponse(description="List of PIDs"),
+            400: OpenApiResponse(description="Invalid pagination parameters"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
     def post(self, request):
         try:
+            page_parameters = get_page_parameters(request)
+
+            if page_parameters is not None and is_streaming_requested(request):
+                raise InvalidCursorError(
+                    "Streaming and pagination cannot be combined."
+                )
+        except InvalidCursorError as exc:
+            return Response(
+                {"message": str(exc)}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            if page_parameters is not None:
+                return Response(
+                    get_local_pid_query_page(
+                        request.data, request, *page_parameters
+                    ),
+                    status=status.HTTP_200_OK,
+                )
+
+            if is_streaming_requested(request):
+                return build_ndjson_streaming_response(
+                    iterate_local_pid_query(request.data, request)
+                )
+
             return Response(
                 execute_local_pid_query(request.data, request),
                 status=status.HTTP_200_OK,
@@ -3,9 +3,13 @@
 from django.urls import re_path
 
 from core_linked_records_app.rest.blob import views as blob_views
+from core_linked_records_app.rest.metrics import views as metrics_views
 from core_linked_records_app.rest.pid import views as pid_views
 from core_linked_records_app.rest.pid_settings import views as settings_views
 from core_linked_records_app.rest.pid_path import views as pid_path_views
+from core_linked_records_app.rest.pid_registration import (
+    views as pid_registration_views,
+)
 from core_linked_records_app.rest.providers import views as providers_views
 from core_linked_records_app.rest.query import views as query_views
 
@@ -43,21 +47,51 @@ urlpatterns += [
         pid_views.RetrieveListPIDView.as_view(),
         name="core_linked_records_retrieve_list_pid",
     ),
+    re_path(
+        r"^resolve-list-pid$",
+        pid_views.ResolveListPIDView.as_view(),
+        name="core_linked_records_resolve_list_pid",
+    ),
+    re_path(
+        r"^retrieve-data-pid-list$",
+        pid_views.RetrieveDataListPIDView.as_view(),
+        name="core_linked_records_retrieve_data_pid_list",
+    ),
     re_path(
         r"^retrieve-data-pid",
         pid_views.RetrieveDataPIDView.as_view(),
         name="core_linked_records_retrieve_data_pid",
     ),
+    re_path(
+        r"^retrieve-blob-pid-list$",
+        pid_views.RetrieveBlobListPIDView.as_view(),
+        name="core_linked_records_retrieve_blob_pid_list",
+    ),
     re_path(
         r"^retrieve-blob-pid",
         pid_views.RetrieveBlobPIDView.as_view(),
         name="core_linked_records_retrieve_blob_pid",
     ),
+    re_path(
+        r"^retrieve-registration-status",
+        pid_registration_views.RetrieveRegistrationStatusView.as_view(),
+        name="core_linked_records_retrieve_registration_status",
+    ),
     re_path(
         r"^upload-blob-pid",
         blob_views.BlobUploadWithPIDView.as_view(),
         name="core_linked_records_upload_blob_pid",
     ),
+    re_path(
+        r"^metrics$",
+        metrics_views.MetricsView.as_view(),
+        name="core_linked_records_metrics",
+    ),
+    re_path(
+        r"^create-list-pid/(?P<provider>[^/]+)$",
+        providers_views.ProviderRecordListView.as_view(),
+        name="core_linked_records_create_list_pid",
+    ),
     re_path(
         r"^(?P<provider>[^/]+)/(?P<record>.*)$",
         providers_views.ProviderRecordView.as_view(),
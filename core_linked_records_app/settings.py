@@ -28,6 +28,25 @@ PID_PATH = getattr_from_deprecated_var(
 
 PID_FORMAT = getattr(settings, "PID_FORMAT", r"[a-zA-Z0-9_\-]+")
 
+PID_XSD_CACHE_SIZE = getattr(settings, "PID_XSD_CACHE_SIZE", 128)
+
+LOCAL_ID_CACHE_SIZE = getattr(settings, "LOCAL_ID_CACHE_SIZE", 0)
+
+PID_CONFIG_CACHE_ENABLED = getattr(settings, "PID_CONFIG_CACHE_ENABLED", True)
+
+PID_CONFIG_CACHE_ALIAS = getattr(settings, "PID_CONFIG_CACHE_ALIAS", None)
+
+PID_PATH_REINDEX_ENABLED = getattr(settings, "PID_PATH_REINDEX_ENABLED", True)
+
+LOCAL_ID_GENERATOR = getattr(
+    settings,
+    "LOCAL_ID_GENERATOR",
+    {
+        "class": "core_linked_records_app.utils.id_generator.RandomIdGenerator",
+        "args": [],
+    },
+)
+
 ID_PROVIDER_SYSTEM_NAME = getattr(settings, "ID_PROVIDER_SYSTEM_NAME", "local")
 
 ID_PROVIDER_SYSTEM_CONFIG = getattr(
@@ -39,6 +58,8 @@ ID_PROVIDER_SYSTEM_CONFIG = getattr(
     },
 )
 
+ID_PROVIDER_SYSTEMS = getattr(settings, "ID_PROVIDER_SYSTEMS", {})
+
 ID_PROVIDER_PREFIXES = getattr(settings, "ID_PROVIDER_PREFIXES", ["cdcs"])
 
 ID_PROVIDER_PREFIX_DEFAULT = getattr(
@@ -49,6 +70,10 @@ ID_PROVIDER_PREFIX_BLOB = getattr(
     settings, "ID_PROVIDER_PREFIX_BLOB", ID_PROVIDER_PREFIXES[0]
 )
 
+ID_PROVIDER_BULK_CREATE_LIMIT = getattr(
+    settings, "ID_PROVIDER_BULK_CREATE_LIMIT", 1000
+)
+
 HANDLE_NET_RECORD_INDEX = getattr(settings, "HANDLE_NET_RECORD_INDEX", 1)
 
 HANDLE_NET_ADMIN_DATA = getattr(
@@ -68,8 +93,75 @@ HANDLE_NET_ADMIN_DATA = getattr(
     },
 )
 
+HANDLE_NET_POOL_SIZE = getattr(settings, "HANDLE_NET_POOL_SIZE", 10)
+
+HANDLE_NET_TIMEOUT = getattr(settings, "HANDLE_NET_TIMEOUT", 10)
+
+HANDLE_NET_MAX_RETRIES = getattr(settings, "HANDLE_NET_MAX_RETRIES", 3)
+
+HANDLE_NET_RETRY_BACKOFF_FACTOR = getattr(
+    settings, "HANDLE_NET_RETRY_BACKOFF_FACTOR", 0.5
+)
+
+HANDLE_NET_MAX_CONCURRENT_REQUESTS = getattr(
+    settings, "HANDLE_NET_MAX_CONCURRENT_REQUESTS", HANDLE_NET_POOL_SIZE
+)
+
 AUTO_SET_PID = getattr(settings, "AUTO_SET_PID", False)
 
+PID_BULK_RESOLVE_LIMIT = getattr(settings, "PID_BULK_RESOLVE_LIMIT", 10000)
+
+PID_BULK_RETRIEVE_LIMIT = getattr(settings, "PID_BULK_RETRIEVE_LIMIT", 1000)
+
+PID_QUERY_CHUNK_SIZE = getattr(settings, "PID_QUERY_CHUNK_SIZE", 2000)
+
+PID_QUERY_PAGE_SIZE = getattr(settings, "PID_QUERY_PAGE_SIZE", 1000)
+
+PID_QUERY_MAX_PAGE_SIZE = getattr(settings, "PID_QUERY_MAX_PAGE_SIZE", 10000)
+
+PID_QUERY_FAN_OUT_TIMEOUT = getattr(settings, "PID_QUERY_FAN_OUT_TIMEOUT", 30)
+
+PID_QUERY_FAN_OUT_MAX_WORKERS = getattr(
+    settings, "PID_QUERY_FAN_OUT_MAX_WORKERS", 8
+)
+
+PID_REGISTRATION_BACKEND = getattr(
+    settings, "PID_REGISTRATION_BACKEND", "inline"
+)
+
+PID_REGISTRATION_MAX_ATTEMPTS = getattr(
+    settings, "PID_REGISTRATION_MAX_ATTEMPTS", 5
+)
+
+PID_NEGATIVE_CACHE_SIZE = getattr(settings, "PID_NEGATIVE_CACHE_SIZE", 0)
+
+PID_NEGATIVE_CACHE_TTL = getattr(settings, "PID_NEGATIVE_CACHE_TTL", 60)
+
+PID_PUBLIC_CACHE_CONTROL = getattr(
+    settings, "PID_PUBLIC_CACHE_CONTROL", "public, max-age=300"
+)
+
+PID_PRIVATE_CACHE_CONTROL = getattr(
+    settings, "PID_PRIVATE_CACHE_CONTROL", "private, no-cache"
+)
+
+PID_BLOB_CHUNK_SIZE = getattr(settings, "PID_BLOB_CHUNK_SIZE", 64 * 1024)
+
+PID_BLOB_OFFLOAD_MODE = getattr(settings, "PID_BLOB_OFFLOAD_MODE", None)
+
+PID_BLOB_OFFLOAD_PREFIX = getattr(
+    settings, "PID_BLOB_OFFLOAD_PREFIX", "/protected_media/"
+)
+
+PID_METRICS_REGISTRY = getattr(
+    settings,
+    "PID_METRICS_REGISTRY",
+    {
+        "class": "core_linked_records_app.utils.metrics.InMemoryMetricsRegistry",
+        "args": [],
+    },
+)
+
 BACKWARD_COMPATIBILITY_DATA_XML_CONTENT = getattr(
     settings, "BACKWARD_COMPATIBILITY_DATA_XML_CONTENT", True
 )
@@ -1,12 +1,17 @@
 /**
  * Load controllers for the PID list sharing button
  */
+let blobPidDict = {};
+
 $(document).ready(function() {
     initSharingModal(
         configurePIDDataSharingModal, "#pid-sharing",
         "#pid-sharing-modal", "#pid-sharing-link",
         "#pid-sharing-submit"
     );
+    retrieveListRowsPIDs(
+        retrieveBlobPidListUrl, "blob_ids", "blob_pids", blobPidDict
+    );
 });
 
 let configurePIDDataSharingModal = function(button_clicked) {
@@ -14,6 +19,7 @@ let configurePIDDataSharingModal = function(button_clicked) {
         retrieveBlobPidUrl,
         {
             "blob_id": $(button_clicked).closest("tr").attr("objectid")
-        }
+        },
+        blobPidDict
     )
 };
\ No newline at end of file
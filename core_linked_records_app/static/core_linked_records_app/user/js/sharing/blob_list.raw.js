@@ -1 +1,2 @@
 var retrieveBlobPidUrl = "{% url 'core_linked_records_retrieve_blob_pid' %}";
+var retrieveBlobPidListUrl = "{% url 'core_linked_records_retrieve_blob_pid_list' %}";
@@ -1,27 +1,59 @@
-let configureGenericPIDSharingModal = function(retrievPidUrl, pidData) {
+let setPIDSharingLink = function(pid) {
+    $("#pid-sharing-link").val(
+        pid===null?"PID not available":pid
+    );
+    $("#pid-sharing-submit").attr("disabled", pid===null)
+};
+
+let configureGenericPIDSharingModal = function(retrievPidUrl, pidData, pidDict) {
     $("#pid-sharing-submit").attr("disabled", false)
 
+    // PID already retrieved with the other rows of the list.
+    let objectId = Object.values(pidData)[0];
+    if(pidDict !== undefined && pidDict.hasOwnProperty(objectId)) {
+        setPIDSharingLink(pidDict[objectId]);
+        return true;
+    }
+
     $.ajax({
         url: retrievPidUrl,
         data: pidData,
         type: "GET",
         dataType: 'json',
         success: function(data){
-            $("#pid-sharing-link").val(
-                data["pid"]===null?"PID not available":data["pid"]
-            );
-
-            if(data["pid"]===null) {
-                $("#pid-sharing-submit").attr("disabled", true)
-            }
+            setPIDSharingLink(data["pid"]);
         },
         error:function(){
-            $("#pid-sharing-link").val(
-                "PID not available"
-            );
-            $("#pid-sharing-submit").attr("disabled", true)
+            setPIDSharingLink(null);
         }
     });
 
     return true;
-};
\ No newline at end of file
+};
+
+/**
+ * Retrieve in a single request the PIDs of all the rows of the list.
+ */
+let retrieveListRowsPIDs = function(retrieveListPidUrl, idKey, pidKey, pidDict) {
+    let objectIdList = $("tr[objectid]").map(function() {
+        return $(this).attr("objectid");
+    }).get();
+
+    if(objectIdList.length === 0) {
+        return;
+    }
+
+    let requestData = {};
+    requestData[idKey] = objectIdList;
+
+    $.ajax({
+        url: retrieveListPidUrl,
+        data: JSON.stringify(requestData),
+        contentType: "application/json",
+        type: "POST",
+        dataType: 'json',
+        success: function(data){
+            Object.assign(pidDict, data[pidKey]);
+        }
+    });
+};
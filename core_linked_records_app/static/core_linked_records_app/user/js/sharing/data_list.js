@@ -1,12 +1,17 @@
 /**
  * Load controllers for the PID list sharing button
  */
+let dataPidDict = {};
+
 $(document).ready(function() {
     initSharingModal(
         configurePIDDataSharingModal, "#pid-sharing",
         "#pid-sharing-modal", "#pid-sharing-link",
         "#pid-sharing-submit"
     );
+    retrieveListRowsPIDs(
+        retrieveDataPidListUrl, "data_ids", "data_pids", dataPidDict
+    );
 });
 
 let configurePIDDataSharingModal = function(button_clicked) {
@@ -14,6 +19,7 @@ let configurePIDDataSharingModal = function(button_clicked) {
         retrieveDataPidUrl,
         {
             "data_id": $(button_clicked).closest("tr").attr("objectid")
-        }
+        },
+        dataPidDict
     )
-};
\ No newline at end of file
+};
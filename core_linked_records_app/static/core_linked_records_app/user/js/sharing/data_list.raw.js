@@ -1 +1,2 @@
 var retrieveDataPidUrl = "{% url 'core_linked_records_retrieve_data_pid' %}";
+var retrieveDataPidListUrl = "{% url 'core_linked_records_retrieve_data_pid_list' %}";
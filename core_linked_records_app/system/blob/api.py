@@ -5,8 +5,13 @@ import logging
 from core_linked_records_app import settings
 from core_linked_records_app.components.local_id.models import LocalId
 from core_linked_records_app.system.local_id import api as local_id_system_api
+from core_linked_records_app.utils.cache import invalidate_unknown_pid_list
 from core_linked_records_app.utils.path import get_api_path_from_object
-from core_linked_records_app.utils.providers import delete_record_from_provider
+from core_linked_records_app.utils.providers import (
+    ProviderManager,
+    delete_record_from_provider,
+    get_provider_lookup_url_list,
+)
 from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.components.blob.models import Blob
@@ -15,6 +20,21 @@ from core_main_app.system.blob import api as blob_system_api
 logger = logging.getLogger(__name__)
 
 
+def _invalidate_unknown_blob_pid_list(record_name_list):
+    """Remove the PIDs of newly assigned blob records from the unknown PID
+    cache. Blobs are resolved by record name, so the PIDs of the records
+    are removed for all the providers.
+
+    Args:
+        record_name_list: list<str> - Names of the records.
+    """
+    invalidate_unknown_pid_list(
+        f"{provider_lookup_url}/{record_name}"
+        for record_name in record_name_list
+        for provider_lookup_url in get_provider_lookup_url_list()
+    )
+
+
 def get_pid_for_blob(blob_id):
     """Retrieve PID matching the blob ID provided.
 
@@ -41,6 +61,86 @@ def get_pid_for_blob(blob_id):
         raise exceptions.ApiError(error_message)
 
 
+def get_pid_dict_for_blob_id_list(blob_id_list):
+    """Retrieve the PIDs assigned to a list of blobs, using one indexed
+    query.
+
+    Args:
+        blob_id_list:
+
+    Returns:
+        dict - LocalId objects found, mapped by blob ID
+    """
+    try:
+        return {
+            local_id_object.record_object_id: local_id_object
+            for local_id_object in local_id_system_api.get_all_by_class_and_id_list(
+                get_api_path_from_object(Blob()), blob_id_list
+            )
+        }
+    except Exception as exc:
+        error_message = (
+            "An error occurred while looking up PIDs assigned to a list of "
+            "blobs"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(error_message) from exc
+
+
+def get_blob_dict_by_pid_list(pid_list):
+    """Retrieve the blobs assigned to each PID of a list, using one query on
+    the local IDs and one query on the blobs.
+
+    Args:
+        pid_list:
+
+    Returns:
+        dict - PIDs found, mapped to their blob
+    """
+    try:
+        # From the PID url (e.g. https://pid-system.org/prefix/record), retrieve
+        # only the prefix and record (e.g. prefix/record) stored in DB.
+        pid_by_internal_name = {
+            "/".join(pid.split("/")[-2:]): pid for pid in pid_list
+        }
+        blob_class = get_api_path_from_object(Blob())
+        blob_id_by_pid = {
+            pid_by_internal_name[local_id_object.record_name]: (
+                local_id_object.record_object_id
+            )
+            for local_id_object in local_id_system_api.get_all_by_name_list(
+                list(pid_by_internal_name.keys())
+            )
+            if local_id_object.record_object_class == blob_class
+            and local_id_object.record_object_id
+        }
+
+        if not blob_id_by_pid:
+            return {}
+
+        blob_by_id = {
+            str(blob.pk): blob
+            for blob in Blob.objects.filter(  # pylint: disable=no-member
+                pk__in=set(blob_id_by_pid.values())
+            ).only("id", "user_id", "workspace_id")
+        }
+
+        return {
+            pid: blob_by_id[blob_id]
+            for pid, blob_id in blob_id_by_pid.items()
+            if blob_id in blob_by_id
+        }
+    except Exception as exc:
+        error_message = (
+            "An error occurred while looking up blobs assigned to a list of "
+            "PIDs"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(error_message) from exc
+
+
 def set_pid_for_blob(blob_id, blob_pid):
     """Retrieve PID matching the blob ID provided.
 
@@ -74,7 +174,10 @@ def set_pid_for_blob(blob_id, blob_pid):
                 record_object_id=str(blob_id),
             )
 
-        return local_id_system_api.insert(local_id_object)
+        local_id_object = local_id_system_api.insert(local_id_object)
+        _invalidate_unknown_blob_pid_list([record_name])
+
+        return local_id_object
     except Exception as exc:
         error_message = f"An error occurred while assigning PID '{blob_pid}' to blob '{blob_id}'"
 
@@ -82,6 +185,59 @@ def set_pid_for_blob(blob_id, blob_pid):
         raise exceptions.ApiError(error_message)
 
 
+def set_pid_for_blob_dict(blob_pid_dict):
+    """Assign PIDs to several blobs which do not have any, using one query to
+    retrieve the existing records and one query per write.
+
+    Args:
+        blob_pid_dict: dict - PIDs to assign, mapped by blob ID.
+    """
+    try:
+        blob_class = get_api_path_from_object(Blob())
+        blob_id_by_record_name = {
+            f"{settings.ID_PROVIDER_PREFIX_BLOB}/{blob_pid.split('/')[-1]}": str(
+                blob_id
+            )
+            for blob_id, blob_pid in blob_pid_dict.items()
+        }
+        # Records created by the local provider already exist, but are not
+        # linked to their blob yet.
+        local_id_list = list(
+            local_id_system_api.get_all_by_name_list(
+                list(blob_id_by_record_name.keys())
+            )
+        )
+
+        for local_id_object in local_id_list:
+            local_id_object.record_object_class = blob_class
+            local_id_object.record_object_id = blob_id_by_record_name.pop(
+                local_id_object.record_name
+            )
+
+        local_id_system_api.update_many(
+            local_id_list, ["record_object_class", "record_object_id"]
+        )
+        local_id_system_api.insert_many(
+            [
+                LocalId(
+                    record_name=record_name,
+                    record_object_class=blob_class,
+                    record_object_id=blob_id,
+                )
+                for record_name, blob_id in blob_id_by_record_name.items()
+            ]
+        )
+        _invalidate_unknown_blob_pid_list(
+            [local_id_object.record_name for local_id_object in local_id_list]
+            + list(blob_id_by_record_name.keys())
+        )
+    except Exception as exc:
+        error_message = "An error occurred while assigning PIDs to blobs"
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(error_message) from exc
+
+
 def delete_pid_for_blob(blob: Blob):
     """Deletes the PID assigned to the blob passed in parameter. If no PID has
     been assigned, the function simply exits.
@@ -94,8 +250,11 @@ def delete_pid_for_blob(blob: Blob):
             get_api_path_from_object(Blob()), blob.pk
         )
 
-        # Delete the PID using the internal name.
-        delete_record_from_provider(local_id_obj.record_name)
+        # Blob PIDs are registered with the default provider.
+        delete_record_from_provider(
+            f"{ProviderManager().get().provider_lookup_url}/"
+            f"{local_id_obj.record_name}"
+        )
     except DoesNotExist:  # If there is no previous PID assigned.
         logger.info(
             "No PID assigned to the blob %s (%s). Skipping deletion.",
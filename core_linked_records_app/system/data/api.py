@@ -2,10 +2,9 @@
 
 import logging
 
-from django.conf import settings as conf_settings
-
-from core_linked_records_app import settings
-from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
 from core_linked_records_app.system.pid_path.api import (
     get_pid_path_by_template,
 )
@@ -14,7 +13,6 @@ from core_linked_records_app.utils.providers import delete_record_from_provider
 from core_main_app.commons.exceptions import DoesNotExist, ApiError
 from core_main_app.components.data.models import Data
 from core_main_app.utils import xml as xml_utils
-from core_main_app.utils.query.mongo.prepare import sanitize_value
 
 logger = logging.getLogger(__name__)
 
@@ -28,36 +26,9 @@ def is_pid_defined_for_data(pid, document_id):
 
     Returns:
     """
-    data = Data.get_by_id(document_id)
-
-    pid_path_object = get_pid_path_by_template(data.template)
-    pid_path = pid_path_object.path
-    query = {
-        f"dict_content__{pid_path.replace('.', '__')}__exact": sanitize_value(
-            pid
-        )
-    }
-
-    # pylint: disable=import-outside-toplevel
-    if conf_settings.MONGODB_INDEXING:
-        from mongoengine.queryset.visitor import Q  # noqa
-        from core_main_app.components.mongo.models import MongoData
-
-        query_result = MongoData.execute_query(
-            Q(**query),
-            order_by_field=[],
-        )
-    else:
-        from django.db.models import (
-            Q,
-        )
+    data_id_list = pid_index_system_api.get_data_id_list_by_pid(pid)
 
-        query_result = Data.execute_query(
-            Q(**query),
-            order_by_field=[],
-        )
-
-    return len(query_result) == 1 and query_result[0].pk == document_id
+    return len(data_id_list) == 1 and str(data_id_list[0]) == str(document_id)
 
 
 def is_pid_defined(pid):
@@ -69,9 +40,8 @@ def is_pid_defined(pid):
     Returns:
     """
     try:
-        get_data_by_pid(pid)
-        return True
-    except (DoesNotExist, ApiError):
+        return len(pid_index_system_api.get_data_id_list_by_pid(pid)) == 1
+    except ApiError:
         return False
 
 
@@ -110,12 +80,8 @@ def delete_pid_for_data(data: Data):
         logger.info("No PID assigned to the data %s", str(data.pk))
         return
 
-    # From the PID url (e.g. https://pid-system.org/prefix/record), retrieve
-    # only the prefix and record (e.g. prefix/record) stored in DB.
-    pid_internal_name = "/".join(current_pid.split("/")[-2:])
-
-    # Delete the PID using the internal name.
-    delete_record_from_provider(pid_internal_name)
+    # Delete the PID from the provider owning it.
+    delete_record_from_provider(current_pid)
 
 
 def get_data_by_pid(pid):
@@ -126,48 +92,64 @@ def get_data_by_pid(pid):
 
     Returns: data object
     """
-    # pylint: disable=import-outside-toplevel
-    if conf_settings.MONGODB_INDEXING:
-        from mongoengine.queryset.visitor import Q  # noqa
-    else:
-        from django.db.models import Q
-
-    pid_path_query = Q(
-        **{
-            f"dict_content__{settings.PID_PATH.replace('.', '__')}__exact": sanitize_value(
-                pid
-            )
-        }
-    )
+    data_id_list = pid_index_system_api.get_data_id_list_by_pid(pid)
 
-    # Create the or query with all the different PID path available.
-    for pid_path_object in PidPath.get_all():
-        pid_path_query |= Q(
-            **{
-                f"dict_content__{pid_path_object.path.replace('.', '__')}__exact": sanitize_value(
-                    pid
-                )
-            }
-        )
-    # Execute built query and retrieve number of items returned.
-    if conf_settings.MONGODB_INDEXING:
-        from core_main_app.components.mongo.models import MongoData
-
-        query_result = MongoData.execute_query(
-            pid_path_query,
-            order_by_field=[],
-        )
-    else:
-        query_result = Data.execute_query(
-            pid_path_query,
-            order_by_field=[],
-        )
-
-    query_result_length = query_result.count()
-
-    if query_result_length == 0:
+    if len(data_id_list) == 0:
         raise DoesNotExist("PID is not attached to any data.")
-    if query_result_length != 1:
+    if len(data_id_list) != 1:
         raise ApiError("PID must be unique.")
 
-    return query_result[0]
+    return Data.get_by_id(data_id_list[0])
+
+
+def get_all_by_id_list(data_id_list):
+    """Return the data objects with the given IDs.
+
+    Parameters:
+        data_id_list:
+
+    Returns: QuerySet - Data objects found
+    """
+    return Data.objects.filter(  # pylint: disable=no-member
+        pk__in=data_id_list
+    )
+
+
+def get_data_dict_by_pid_list(pid_list):
+    """Return the data objects assigned to each PID of a list, using one query
+    on the PID index and one query on the data.
+
+    Parameters:
+        pid_list:
+
+    Returns: dict - Normalized PIDs found, mapped to their list of data
+    """
+    data_id_dict = pid_index_system_api.get_data_id_dict_by_pid_list(pid_list)
+
+    if not data_id_dict:
+        return {}
+
+    data_by_id = {
+        data.pk: data
+        for data in Data.objects.filter(  # pylint: disable=no-member
+            pk__in={
+                data_id
+                for data_id_list in data_id_dict.values()
+                for data_id in data_id_list
+            }
+        ).only("id", "user_id", "workspace_id")
+    }
+
+    data_dict = {}
+
+    for pid, data_id_list in data_id_dict.items():
+        data_list = [
+            data_by_id[data_id]
+            for data_id in data_id_list
+            if data_id in data_by_id
+        ]
+
+        if data_list:
+            data_dict[pid] = data_list
+
+    return data_dict
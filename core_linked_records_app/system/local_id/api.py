@@ -2,11 +2,16 @@
 
 import logging
 
+from core_linked_records_app import settings
 from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.utils.cache import LRUCache
 from core_main_app.commons import exceptions
 
 logger = logging.getLogger(__name__)
 
+# Reverse lookups of LocalId objects, by linked object class and ID.
+local_id_cache = LRUCache(settings.LOCAL_ID_CACHE_SIZE)
+
 
 def get_by_name(record_name):
     """Retrieve the record by name.
@@ -38,8 +43,20 @@ def get_by_class_and_id(record_object_class, record_object_id):
 
     Returns:
     """
+    cache_key = (record_object_class, str(record_object_id))
+    cached_local_id = local_id_cache.get(cache_key)
+
+    # Cached values are copied so that callers cannot alter the cache.
+    if cached_local_id is not None:
+        return LocalId(
+            pk=cached_local_id[0],
+            record_name=cached_local_id[1],
+            record_object_class=record_object_class,
+            record_object_id=str(record_object_id),
+        )
+
     try:
-        return LocalId.get_by_class_and_id(
+        local_id_object = LocalId.get_by_class_and_id(
             record_object_class, record_object_id
         )
     except exceptions.DoesNotExist as dne:
@@ -50,6 +67,47 @@ def get_by_class_and_id(record_object_class, record_object_id):
         logger.error("%s: %s", error_message, str(exc))
         raise exceptions.ApiError(f"{error_message}.")
 
+    if local_id_cache.maxsize > 0:
+        local_id_cache.set(
+            cache_key, (local_id_object.pk, local_id_object.record_name)
+        )
+
+    return local_id_object
+
+
+def get_all_by_class_and_id_list(record_object_class, record_object_id_list):
+    """Retrieve the LocalID objects of a list of objects of the same class.
+
+    Args:
+        record_object_class:
+        record_object_id_list:
+
+    Returns:
+        QuerySet - LocalId objects found.
+    """
+    try:
+        return LocalId.get_all_by_class_and_id_list(
+            record_object_class, record_object_id_list
+        )
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving LocalId by class "
+            "and ids"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(f"{error_message}.")
+
+
+def invalidate_local_id_cache(record_object_class, record_object_id):
+    """Remove the cached reverse lookup of a linked object.
+
+    Args:
+        record_object_class:
+        record_object_id:
+    """
+    local_id_cache.invalidate((record_object_class, str(record_object_id)))
+
 
 def insert(local_id_object):
     """Insert the record in the collection.
@@ -69,6 +127,88 @@ def insert(local_id_object):
         raise exceptions.ApiError(f"{error_message}.")
 
 
+def get_all_by_name_list(record_name_list):
+    """Retrieve the records matching a list of names.
+
+    Args:
+        record_name_list:
+
+    Returns:
+        QuerySet - LocalId objects found.
+    """
+    try:
+        return LocalId.get_all_by_name_list(record_name_list)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving LocalId by names"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(f"{error_message}.")
+
+
+def get_record_name_list_by_name_list(record_name_list):
+    """Retrieve the record names already in use among the given list.
+
+    Args:
+        record_name_list:
+
+    Returns:
+        list<str> - Record names already in use.
+    """
+    try:
+        return LocalId.get_record_name_list_by_name_list(record_name_list)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving LocalId names"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(f"{error_message}.")
+
+
+def insert_many(local_id_list):
+    """Insert several records in the collection, ignoring records whose name
+    is already in use.
+
+    Args:
+        local_id_list:
+
+    Returns:
+        list<LocalId> - Records inserted, without the ones whose name is
+            already in use.
+    """
+    try:
+        return LocalId.insert_many(local_id_list)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while inserting LocalId list"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(f"{error_message}.")
+
+
+def update_many(local_id_list, field_list):
+    """Update the given fields of several records.
+
+    Args:
+        local_id_list:
+        field_list: list<str> - Names of the fields to update.
+
+    Returns:
+    """
+    try:
+        return LocalId.update_many(local_id_list, field_list)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while updating LocalId list"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise exceptions.ApiError(f"{error_message}.")
+
+
 def delete(local_id_object):
     """Delete the record.
 
@@ -0,0 +1,32 @@
+"""System API to manage LocalIdSequence objects."""
+
+import logging
+
+from core_linked_records_app.components.local_id_sequence.models import (
+    LocalIdSequence,
+)
+from core_main_app.commons.exceptions import ApiError
+
+logger = logging.getLogger(__name__)
+
+
+def reserve_block(name, block_size):
+    """Reserve a block of consecutive values of a sequence.
+
+    Args:
+        name:
+        block_size:
+
+    Returns:
+        int - First value of the reserved block.
+    """
+    try:
+        return LocalIdSequence.reserve_block(name, block_size)
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while reserving a block of the "
+            f"'{name}' sequence"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
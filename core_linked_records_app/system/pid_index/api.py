@@ -0,0 +1,261 @@
+"""System API to manage PidIndex objects."""
+
+import hashlib
+import logging
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
+from core_linked_records_app.utils.data import get_dict_content_for_data
+from core_linked_records_app.utils.dict import get_value_from_dot_notation
+from core_linked_records_app.utils.cache import invalidate_unknown_pid_list
+from core_linked_records_app.utils.pid import normalize_pid
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.components.data.models import Data
+
+logger = logging.getLogger(__name__)
+
+
+def get_data_id_list_by_pid(pid):
+    """Retrieve the IDs of all Data containing the given PID.
+
+    Args:
+        pid:
+
+    Returns:
+        list - List of Data IDs
+    """
+    try:
+        normalized_pid = normalize_pid(pid)
+
+        if normalized_pid is None:
+            return []
+
+        return PidIndex.get_data_id_list_by_pid(normalized_pid)
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while looking up PID '{pid}' in "
+            "the index"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def get_data_id_dict_by_pid_list(pid_list):
+    """Retrieve the IDs of the Data containing each PID of a list, using a
+    single query.
+
+    Args:
+        pid_list:
+
+    Returns:
+        dict - Normalized PIDs found, mapped to their list of Data IDs
+    """
+    try:
+        normalized_pid_list = [
+            normalized_pid
+            for normalized_pid in map(normalize_pid, pid_list)
+            if normalized_pid is not None
+        ]
+        data_id_dict = {}
+
+        if not normalized_pid_list:
+            return data_id_dict
+
+        for pid, data_id in PidIndex.get_pid_and_data_id_list_by_pid_list(
+            list(set(normalized_pid_list))
+        ):
+            data_id_dict.setdefault(pid, []).append(data_id)
+
+        return data_id_dict
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while looking up a list of PIDs in "
+            "the index"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def compute_registration_digest(data, pid_path_list):
+    """Compute the digest of the content of a Data and of the PID paths of its
+    template, which changes whenever the PID to register may change.
+
+    Args:
+        data:
+        pid_path_list: list<str> - PID paths of the template of the Data
+
+    Returns:
+        str - Hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{data.template.pk}\n".encode())
+
+    for pid_path in pid_path_list:
+        digest.update(f"{pid_path}\n".encode())
+
+    digest.update(str(data.content).encode())
+    return digest.hexdigest()
+
+
+def get_registration_state(data_id):
+    """Retrieve the digest stored at the last PID registration of a Data, and
+    the PIDs indexed for it, using a single query.
+
+    Args:
+        data_id:
+
+    Returns:
+        tuple - Registration digest, empty if the PID of the Data was not
+            registered by its last save, and indexed PIDs mapped by path.
+    """
+    try:
+        registration_digest = ""
+        pid_dict = {}
+
+        for pid_index in PidIndex.get_all_by_data_id_list([data_id]):
+            registration_digest = pid_index.registration_digest
+            pid_dict[pid_index.path] = pid_index.pid
+
+        return registration_digest, pid_dict
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while retrieving the registration "
+            f"state of data '{data_id}'"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def get_pid_index_list_for_data(data, registration_digest=""):
+    """Build the list of PidIndex objects matching the PIDs found in a Data.
+
+    Args:
+        data:
+        registration_digest: str - Digest of the Data if its PID has just been
+            registered.
+
+    Returns:
+        list<PidIndex> - Unsaved PidIndex objects for the given Data
+    """
+    dict_content = get_dict_content_for_data(data)
+    pid_path_list = [
+        pid_path_object.path
+        for pid_path_object in pid_path_system_api.get_all_pid_paths_by_template(
+            data.template
+        )
+    ] + [settings.PID_PATH]
+
+    pid_index_list = []
+    # Use a dict to remove duplicate paths while preserving their order.
+    for pid_path in dict.fromkeys(pid_path_list):
+        pid_value = normalize_pid(
+            get_value_from_dot_notation(dict_content, pid_path)
+        )
+
+        if pid_value is None:
+            continue
+
+        pid_index_list.append(
+            PidIndex(
+                pid=pid_value,
+                path=pid_path,
+                data_id=data.pk,
+                template_id=data.template.pk,
+                registration_digest=registration_digest,
+            )
+        )
+
+    return pid_index_list
+
+
+def is_data_indexed(data):
+    """Check that the PidIndex objects stored for a Data match its content.
+
+    Args:
+        data:
+
+    Returns:
+        bool - True if the index is up-to-date, False otherwise.
+    """
+    expected_entries = {
+        (pid_index.path, pid_index.pid)
+        for pid_index in get_pid_index_list_for_data(data)
+    }
+    stored_entries = {
+        (pid_index.path, pid_index.pid)
+        for pid_index in PidIndex.get_all_by_data_id_list([data.pk])
+    }
+
+    return expected_entries == stored_entries
+
+
+def index_data(data, registration_digest=""):
+    """Replace the PidIndex objects of a Data with the PIDs in its content.
+
+    Args:
+        data:
+        registration_digest: str - Digest of the Data if its PID has just been
+            registered.
+    """
+    try:
+        pid_index_list = get_pid_index_list_for_data(data, registration_digest)
+        PidIndex.replace_by_data_id(data.pk, pid_index_list)
+        invalidate_unknown_pid_list(
+            pid_index.pid for pid_index in pid_index_list
+        )
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while indexing PIDs for data "
+            f"'{data.pk}'"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def index_all_data(template_id=None, batch_size=100):
+    """Index the PIDs of all Data, or of the Data of a template, by batches
+    ordered by primary key. Data which cannot be indexed are skipped.
+
+    Args:
+        template_id: int - ID of the template to restrict the Data to.
+        batch_size: int - Number of Data loaded at once.
+
+    Returns:
+        tuple - Number of Data indexed and number of errors.
+    """
+    data_queryset = Data.objects.order_by("pk").select_related("template")
+
+    if template_id is not None:
+        data_queryset = data_queryset.filter(template_id=template_id)
+
+    indexed_count = 0
+    error_count = 0
+    last_pk = None
+
+    while True:
+        batch_queryset = data_queryset
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+
+        data_list = list(batch_queryset[:batch_size])
+
+        if not data_list:
+            break
+
+        for data in data_list:
+            try:
+                index_data(data)
+                indexed_count += 1
+            except ApiError:  # The error is logged by `index_data`.
+                error_count += 1
+
+        last_pk = data_list[-1].pk
+
+    return indexed_count, error_count
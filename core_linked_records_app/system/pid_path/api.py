@@ -4,6 +4,7 @@ import logging
 
 from core_linked_records_app import settings
 from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.utils.cache import pid_config_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,14 @@ def get_pid_path_by_template(template):
     Returns:
         PidPath - PidPath object, linking template ID and path
     """
+    if settings.PID_CONFIG_CACHE_ENABLED:
+        pid_path_list = get_pid_path_list_dict().get(template.pk)
+
+        if not pid_path_list:
+            return PidPath(template=template, path=settings.PID_PATH)
+
+        return pid_path_list[0]
+
     pid_path_queryset = PidPath.get_by_template(template)
 
     if not pid_path_queryset.exists():
@@ -39,9 +48,78 @@ def get_all_pid_paths_by_template(template):
     Returns:
         list[PidPath] - All PidPath objects for the template, or [default] if none exist
     """
+    if settings.PID_CONFIG_CACHE_ENABLED:
+        pid_path_list = get_pid_path_list_dict().get(template.pk)
+
+        if not pid_path_list:
+            return [PidPath(template=template, path=settings.PID_PATH)]
+
+        return list(pid_path_list)
+
     pid_path_queryset = PidPath.get_by_template(template)
 
     if not pid_path_queryset.exists():
         return [PidPath(template=template, path=settings.PID_PATH)]
 
     return list(pid_path_queryset)
+
+
+def get_path_list_dict_by_template_id_list(template_id_list):
+    """Retrieve the paths associated with each template of a list, using a
+    single query.
+
+    Args:
+        template_id_list: list - IDs of the templates
+
+    Returns:
+        dict - Template IDs mapped to their list of paths, or to the default
+            path if none exist
+    """
+    if settings.PID_CONFIG_CACHE_ENABLED:
+        pid_path_list_dict = get_pid_path_list_dict()
+        path_list_dict = {
+            template_id: [
+                pid_path.path
+                for pid_path in pid_path_list_dict.get(template_id, [])
+            ]
+            for template_id in template_id_list
+        }
+    else:
+        path_list_dict = {template_id: [] for template_id in template_id_list}
+
+        for pid_path in PidPath.get_all_by_template_list(template_id_list):
+            path_list_dict[pid_path.template_id].append(pid_path.path)
+
+    return {
+        template_id: path_list if path_list else [settings.PID_PATH]
+        for template_id, path_list in path_list_dict.items()
+    }
+
+
+def get_pid_path_list_dict():
+    """Retrieve all the PidPath objects, mapped by template ID, from the PID
+    configuration cache. The returned dict must not be modified.
+
+    Returns:
+        dict - Template IDs mapped to their list of PidPath objects, ordered
+            by primary key.
+    """
+    return pid_config_cache.get_or_load(
+        "pid_path_list_dict", _load_pid_path_list_dict
+    )
+
+
+def _load_pid_path_list_dict():
+    """Load all the PidPath objects, mapped by template ID.
+
+    Returns:
+        dict - Template IDs mapped to their list of PidPath objects.
+    """
+    pid_path_list_dict = {}
+
+    for pid_path in PidPath.get_all().order_by("pk"):
+        pid_path_list_dict.setdefault(pid_path.template_id, []).append(
+            pid_path
+        )
+
+    return pid_path_list_dict
@@ -0,0 +1,216 @@
+"""System API to manage PidRegistration objects."""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_main_app.commons.exceptions import ApiError, DoesNotExist
+
+logger = logging.getLogger(__name__)
+
+INLINE_BACKEND = "inline"
+OUTBOX_BACKEND = "outbox"
+BACKEND_LIST = [INLINE_BACKEND, OUTBOX_BACKEND]
+
+_registration_context = threading.local()
+
+
+def is_registration_deferred():
+    """Check if PID registrations are queued in the outbox rather than run
+    inline when an object is saved.
+
+    Returns:
+        bool - Whether the PID registrations are deferred.
+    """
+    return settings.PID_REGISTRATION_BACKEND == OUTBOX_BACKEND and not getattr(
+        _registration_context, "inline", False
+    )
+
+
+@contextmanager
+def inline_registration():
+    """Context manager running PID registrations inline, whatever the
+    configured backend. Used by the worker to register queued objects.
+    """
+    previous_inline = getattr(_registration_context, "inline", False)
+    _registration_context.inline = True
+
+    try:
+        yield
+    finally:
+        _registration_context.inline = previous_inline
+
+
+def queue_for_data(data_id):
+    """Queue the PID registration of a Data.
+
+    Args:
+        data_id:
+
+    Returns:
+        PidRegistration - The queued registration.
+    """
+    try:
+        return PidRegistration.queue(data_id=data_id)
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while queuing the PID "
+            f"registration of data '{data_id}'"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def queue_for_blob(blob_id):
+    """Queue the PID registration of a Blob.
+
+    Args:
+        blob_id:
+
+    Returns:
+        PidRegistration - The queued registration.
+    """
+    try:
+        return PidRegistration.queue(blob_id=blob_id)
+    except Exception as exc:
+        error_message = (
+            f"An unexpected error occurred while queuing the PID "
+            f"registration of blob '{blob_id}'"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def get_by_data_id(data_id):
+    """Retrieve the PID registration of a Data.
+
+    Args:
+        data_id:
+
+    Returns:
+        PidRegistration - The registration of the Data.
+    """
+    try:
+        return PidRegistration.get_by_data_id(data_id)
+    except DoesNotExist as dne:
+        raise DoesNotExist(str(dne))
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving PidRegistration "
+            "by data id"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def get_by_blob_id(blob_id):
+    """Retrieve the PID registration of a Blob.
+
+    Args:
+        blob_id:
+
+    Returns:
+        PidRegistration - The registration of the Blob.
+    """
+    try:
+        return PidRegistration.get_by_blob_id(blob_id)
+    except DoesNotExist as dne:
+        raise DoesNotExist(str(dne))
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving PidRegistration "
+            "by blob id"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def get_batch_to_process(batch_size, max_attempts, last_pk=None):
+    """Retrieve a batch of registrations to process.
+
+    Args:
+        batch_size:
+        max_attempts:
+        last_pk:
+
+    Returns:
+        list<PidRegistration> - Registrations to process.
+    """
+    try:
+        return PidRegistration.get_batch_to_process(
+            batch_size, max_attempts, last_pk
+        )
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while retrieving PidRegistration "
+            "to process"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def claim(pid_registration):
+    """Mark a registration as being processed.
+
+    Args:
+        pid_registration:
+
+    Returns:
+        bool - Whether the registration has been claimed.
+    """
+    try:
+        return PidRegistration.claim(pid_registration)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while claiming PidRegistration"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def complete(pid_registration, status, message=""):
+    """Set the final status of a claimed registration.
+
+    Args:
+        pid_registration:
+        status:
+        message:
+
+    Returns:
+    """
+    try:
+        PidRegistration.complete(pid_registration, status, message)
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while completing PidRegistration"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
+
+
+def requeue_processing():
+    """Set back to pending the registrations left in processing.
+
+    Returns:
+        int - Number of registrations queued again.
+    """
+    try:
+        return PidRegistration.requeue_processing()
+    except Exception as exc:
+        error_message = (
+            "An unexpected error occurred while queuing PidRegistration again"
+        )
+
+        logger.error("%s: %s", error_message, str(exc))
+        raise ApiError(f"{error_message}.") from exc
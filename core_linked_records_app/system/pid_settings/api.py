@@ -1,8 +1,10 @@
 """System API to manage PidSettings objects."""
 
+import copy
 import logging
 
 from core_linked_records_app.components.pid_settings.models import PidSettings
+from core_linked_records_app.utils.cache import pid_config_cache
 from core_main_app.commons.exceptions import ApiError
 
 logger = logging.getLogger(__name__)
@@ -28,13 +30,16 @@ def upsert(pid_settings_object):
 
 
 def get():
-    """Retrieve the PidSettings object from DB.
+    """Retrieve the PidSettings object from the PID configuration cache, or
+    from DB.
 
     Returns:
         PidSettings object
     """
     try:
-        return PidSettings.get()
+        return pid_config_cache.get_or_load(
+            "pid_settings", PidSettings.get, copy_value=copy.copy
+        )
     except Exception as exc:
         error_message = (
             "An unexpected error occurred while retrieving PidSettings"
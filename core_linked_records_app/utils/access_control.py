@@ -0,0 +1,50 @@
+"""Access control utilities"""
+
+from core_main_app.access_control.api import check_anonymous_access
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.components.workspace import api as workspace_api
+
+
+def filter_readable_document_list(document_list, user):
+    """Filter a list of documents to keep the ones readable by the user, with
+    the same rules as `check_can_read_document`. The readable workspaces are
+    retrieved once for the whole list.
+
+    Args:
+        document_list: list - Documents with `user_id` and `workspace_id`.
+        user: User
+
+    Returns:
+        list - Documents readable by the user.
+    """
+    if user.is_superuser:
+        return list(document_list)
+
+    try:
+        check_anonymous_access(user)
+    except AccessControlError:
+        return []
+
+    accessible_workspace_id_set = None
+    readable_document_list = []
+
+    for document in document_list:
+        if str(document.user_id) == str(user.id):
+            readable_document_list.append(document)
+            continue
+
+        if document.workspace_id is None:
+            continue
+
+        if accessible_workspace_id_set is None:
+            accessible_workspace_id_set = {
+                workspace.pk
+                for workspace in workspace_api.get_all_workspaces_with_read_access_by_user(
+                    user
+                )
+            }
+
+        if document.workspace_id in accessible_workspace_id_set:
+            readable_document_list.append(document)
+
+    return readable_document_list
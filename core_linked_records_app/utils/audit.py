@@ -0,0 +1,442 @@
+"""PID audit utilities, detecting the drift between the local records, the
+PIDs of the data and the blobs.
+
+Each side is read by batches ordered by primary key, and each batch is
+compared to the other side with a single indexed query, so that the memory
+used does not depend on the number of records.
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.utils.path import get_api_path_from_object
+from core_linked_records_app.utils.providers import (
+    ProviderManager,
+    get_provider_config_dict,
+)
+from core_linked_records_app.utils.providers.local import LocalIdProvider
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+
+
+def get_local_pid_url_list():
+    """Retrieve the URLs prefixing the PIDs stored as local records, for all
+    the configured local providers.
+
+    Returns:
+        list<str> - URLs of the local providers, without final slash.
+    """
+    provider_manager = ProviderManager()
+    url_set = set()
+
+    for provider_name in get_provider_config_dict():
+        provider = provider_manager.get(provider_name)
+
+        if isinstance(provider, LocalIdProvider):
+            url_set.update([provider.provider_lookup_url, provider.local_url])
+
+    return sorted(url_set)
+
+
+def iter_local_id_batches(batch_size):
+    """Iterate over all the local records, by batches ordered by primary key.
+
+    Args:
+        batch_size: int - Maximum number of records per batch.
+
+    Yields:
+        list<LocalId> - Batch of records.
+    """
+    last_pk = None
+
+    while True:
+        local_id_queryset = LocalId.objects.order_by("pk")
+
+        if last_pk is not None:
+            local_id_queryset = local_id_queryset.filter(pk__gt=last_pk)
+
+        local_id_list = list(local_id_queryset[:batch_size])
+
+        if not local_id_list:
+            return
+
+        yield local_id_list
+        last_pk = local_id_list[-1].pk
+
+
+def iter_local_pid_index_batches(url_list, batch_size):
+    """Iterate over the indexed PIDs of the local providers, by batches
+    ordered by primary key.
+
+    Args:
+        url_list: list<str> - URLs of the local providers.
+        batch_size: int - Maximum number of PIDs per batch.
+
+    Yields:
+        list<PidIndex> - Batch of indexed PIDs.
+    """
+    if not url_list:
+        return
+
+    pid_index_queryset = PidIndex.objects.filter(
+        reduce(or_, [Q(pid__startswith=f"{url}/") for url in url_list])
+    ).order_by("pk")
+    last_pk = None
+
+    while True:
+        batch_queryset = pid_index_queryset
+
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+
+        pid_index_list = list(
+            batch_queryset.only("pk", "pid", "data_id")[:batch_size]
+        )
+
+        if not pid_index_list:
+            return
+
+        yield pid_index_list
+        last_pk = pid_index_list[-1].pk
+
+
+def get_record_name(pid, url_list):
+    """Retrieve the name of the local record of a PID.
+
+    Args:
+        pid: str - PID of a local provider.
+        url_list: list<str> - URLs of the local providers.
+
+    Returns:
+        str - Name of the record, or None if the PID is not local.
+    """
+    for url in url_list:
+        if pid.startswith(f"{url}/"):
+            return pid[len(url) + 1 :]
+
+    return None
+
+
+def find_orphan_local_id_list(local_id_list, url_list):
+    """Find the records of a batch linked to no blob and contained in no
+    data.
+
+    Args:
+        local_id_list: list<LocalId> - Batch of records.
+        url_list: list<str> - URLs of the local providers.
+
+    Returns:
+        list<LocalId> - Orphan records.
+    """
+    unlinked_local_id_list = [
+        local_id_object
+        for local_id_object in local_id_list
+        if not local_id_object.record_object_class
+    ]
+
+    if not unlinked_local_id_list:
+        return []
+
+    indexed_pid_set = set(
+        PidIndex.objects.filter(
+            pid__in=[
+                f"{url}/{local_id_object.record_name}"
+                for local_id_object in unlinked_local_id_list
+                for url in url_list
+            ]
+        ).values_list("pid", flat=True)
+    )
+    indexed_record_name_set = {
+        get_record_name(pid, url_list) for pid in indexed_pid_set
+    }
+
+    return [
+        local_id_object
+        for local_id_object in unlinked_local_id_list
+        if local_id_object.record_name not in indexed_record_name_set
+    ]
+
+
+def iter_unindexed_data_id_batches(batch_size):
+    """Iterate over the data whose PID index does not match their content,
+    reading the data by batches ordered by primary key.
+
+    Args:
+        batch_size: int - Maximum number of data read per batch.
+
+    Yields:
+        list<int> - IDs of the data of a batch with an outdated index.
+    """
+    last_pk = None
+
+    while True:
+        data_queryset = Data.objects.order_by("pk")
+
+        if last_pk is not None:
+            data_queryset = data_queryset.filter(pk__gt=last_pk)
+
+        data_list = list(data_queryset.select_related("template")[:batch_size])
+
+        if not data_list:
+            return
+
+        unindexed_data_id_list = [
+            data.pk
+            for data in data_list
+            if not pid_index_system_api.is_data_indexed(data)
+        ]
+
+        if unindexed_data_id_list:
+            yield unindexed_data_id_list
+
+        last_pk = data_list[-1].pk
+
+
+def get_data_record_name_set(data_queryset, url_list):
+    """Retrieve the names of the local records of the PIDs contained in the
+    content of data, whether they are indexed or not.
+
+    Args:
+        data_queryset: QuerySet - Data to read.
+        url_list: list<str> - URLs of the local providers.
+
+    Returns:
+        set<str> - Names of the records.
+    """
+    record_name_set = set()
+
+    for data in data_queryset.select_related("template").iterator():
+        record_name_set.update(
+            get_record_name(pid_index.pid, url_list)
+            for pid_index in pid_index_system_api.get_pid_index_list_for_data(
+                data
+            )
+        )
+
+    record_name_set.discard(None)
+    return record_name_set
+
+
+def find_dangling_blob_local_id_list(local_id_list):
+    """Find the records of a batch linked to a blob which does not exist.
+
+    Args:
+        local_id_list: list<LocalId> - Batch of records.
+
+    Returns:
+        list<LocalId> - Records of deleted blobs.
+    """
+    blob_class = get_api_path_from_object(Blob())
+    blob_local_id_list = [
+        local_id_object
+        for local_id_object in local_id_list
+        if local_id_object.record_object_class == blob_class
+    ]
+
+    if not blob_local_id_list:
+        return []
+
+    blob_id_list = [
+        int(local_id_object.record_object_id)
+        for local_id_object in blob_local_id_list
+        if str(local_id_object.record_object_id).isdigit()
+    ]
+    blob_id_set = {
+        str(blob_id)
+        for blob_id in Blob.objects.filter(pk__in=blob_id_list).values_list(
+            "pk", flat=True
+        )
+    }
+
+    return [
+        local_id_object
+        for local_id_object in blob_local_id_list
+        if str(local_id_object.record_object_id) not in blob_id_set
+    ]
+
+
+def find_missing_record_name_list(pid_index_list, url_list):
+    """Find the local records missing for a batch of indexed PIDs.
+
+    Args:
+        pid_index_list: list<PidIndex> - Batch of indexed PIDs.
+        url_list: list<str> - URLs of the local providers.
+
+    Returns:
+        list<str> - Names of the missing records, sorted.
+    """
+    record_name_set = {
+        get_record_name(pid_index.pid, url_list)
+        for pid_index in pid_index_list
+    }
+    record_name_set.discard(None)
+    existing_record_name_set = set(
+        LocalId.objects.filter(
+            record_name__in=list(record_name_set)
+        ).values_list("record_name", flat=True)
+    )
+
+    return sorted(record_name_set - existing_record_name_set)
+
+
+def iter_duplicate_pid_batches(batch_size):
+    """Iterate over the PIDs contained in several data, by batches ordered by
+    PID. The aggregation is done by the database.
+
+    Args:
+        batch_size: int - Maximum number of PIDs per batch.
+
+    Yields:
+        dict - Batch of duplicate PIDs, mapped to the IDs of their data.
+    """
+    duplicate_pid_queryset = (
+        PidIndex.objects.values("pid")
+        .annotate(data_count=Count("data_id", distinct=True))
+        .filter(data_count__gt=1)
+        .order_by("pid")
+    )
+    last_pid = None
+
+    while True:
+        batch_queryset = duplicate_pid_queryset
+
+        if last_pid is not None:
+            batch_queryset = batch_queryset.filter(pid__gt=last_pid)
+
+        pid_list = [
+            duplicate_pid["pid"]
+            for duplicate_pid in batch_queryset[:batch_size]
+        ]
+
+        if not pid_list:
+            return
+
+        data_id_list_by_pid = {pid: set() for pid in pid_list}
+
+        for pid, data_id in PidIndex.objects.filter(
+            pid__in=pid_list
+        ).values_list("pid", "data_id"):
+            data_id_list_by_pid[pid].add(data_id)
+
+        yield {
+            pid: sorted(data_id_set)
+            for pid, data_id_set in data_id_list_by_pid.items()
+        }
+        last_pid = pid_list[-1]
+
+
+def delete_orphan_local_id_list(local_id_list, url_list, audit_date):
+    """Delete the records of a list which are still orphans. The records are
+    checked again in the transaction deleting them, against the index and
+    against the content of the data the index may not cover yet: data
+    changed since the start of the audit, and data with a pending PID
+    registration.
+
+    Args:
+        local_id_list: list<LocalId> - Orphan records found by the audit.
+        url_list: list<str> - URLs of the local providers.
+        audit_date: datetime - Date of the start of the audit, when the index
+            was checked.
+
+    Returns:
+        int - Number of records deleted.
+    """
+    if not local_id_list:
+        return 0
+
+    with transaction.atomic():
+        orphan_local_id_list = find_orphan_local_id_list(
+            LocalId.objects.select_for_update().filter(
+                pk__in=[
+                    local_id_object.pk for local_id_object in local_id_list
+                ]
+            ),
+            url_list,
+        )
+
+        if not orphan_local_id_list:
+            return 0
+
+        pending_data_id_list = PidRegistration.objects.filter(
+            data__isnull=False,
+            status__in=[PidRegistration.PENDING, PidRegistration.PROCESSING],
+        ).values_list("data_id", flat=True)
+        used_record_name_set = get_data_record_name_set(
+            Data.objects.filter(
+                Q(last_change_date__gte=audit_date)
+                | Q(pk__in=pending_data_id_list)
+            ),
+            url_list,
+        )
+
+        return LocalId.objects.filter(
+            pk__in=[
+                local_id_object.pk
+                for local_id_object in orphan_local_id_list
+                if local_id_object.record_name not in used_record_name_set
+            ]
+        ).delete()[0]
+
+
+def delete_dangling_blob_local_id_list(local_id_list):
+    """Delete the records of a list which are still linked to a deleted
+    blob.
+
+    Args:
+        local_id_list: list<LocalId> - Dangling records found by the audit.
+
+    Returns:
+        int - Number of records deleted.
+    """
+    if not local_id_list:
+        return 0
+
+    with transaction.atomic():
+        dangling_local_id_list = find_dangling_blob_local_id_list(
+            LocalId.objects.select_for_update().filter(
+                pk__in=[
+                    local_id_object.pk for local_id_object in local_id_list
+                ]
+            )
+        )
+
+        return LocalId.objects.filter(
+            pk__in=[
+                local_id_object.pk
+                for local_id_object in dangling_local_id_list
+            ]
+        ).delete()[0]
+
+
+def insert_missing_local_id_list(record_name_list):
+    """Create the missing records of indexed PIDs.
+
+    Args:
+        record_name_list: list<str> - Names of the missing records.
+
+    Returns:
+        int - Number of records created.
+    """
+    if not record_name_list:
+        return 0
+
+    return len(
+        LocalId.objects.bulk_create(
+            [
+                LocalId(record_name=record_name)
+                for record_name in record_name_list
+            ],
+            ignore_conflicts=True,
+        )
+    )
@@ -0,0 +1,320 @@
+"""PID backfill utilities, assigning PIDs to existing data and blobs in bulk.
+
+The batch functions only receive and return picklable values, so that they
+can run in worker processes.
+"""
+
+import json
+import logging
+
+from django.db import transaction
+from django.db.models import CharField, Exists, OuterRef
+from django.db.models.functions import Cast
+from rest_framework import status
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
+from core_linked_records_app.utils import data as data_utils
+from core_linked_records_app.utils import exceptions
+from core_linked_records_app.utils.path import get_api_path_from_object
+from core_linked_records_app.utils.providers import ProviderManager
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+from core_main_app.settings import CHECKSUM_ALGORITHM
+from core_main_app.utils.checksum import compute_checksum
+from core_main_app.utils.datetime import datetime_now
+
+logger = logging.getLogger(__name__)
+
+# Fields of a Data written when its PID is backfilled.
+DATA_BACKFILL_FIELD_LIST = [
+    "file",
+    "file_history",
+    "dict_content",
+    "checksum",
+    "last_change_date",
+]
+
+
+def get_data_id_batch(last_pk, batch_size, template_id=None):
+    """Retrieve the next IDs of data without any indexed PID, ordered by
+    primary key.
+
+    Args:
+        last_pk: Primary key after which the batch starts, or None.
+        batch_size: int - Maximum number of IDs.
+        template_id: ID of the template to restrict the data to, or None.
+
+    Returns:
+        list - IDs of the data.
+    """
+    data_queryset = Data.objects.filter(
+        ~Exists(PidIndex.objects.filter(data_id=OuterRef("pk")))
+    ).order_by("pk")
+
+    if template_id is not None:
+        data_queryset = data_queryset.filter(template_id=template_id)
+
+    if last_pk is not None:
+        data_queryset = data_queryset.filter(pk__gt=last_pk)
+
+    return list(data_queryset.values_list("pk", flat=True)[:batch_size])
+
+
+def get_blob_id_batch(last_pk, batch_size):
+    """Retrieve the next IDs of blobs without PID, ordered by primary key.
+
+    Args:
+        last_pk: Primary key after which the batch starts, or None.
+        batch_size: int - Maximum number of IDs.
+
+    Returns:
+        list - IDs of the blobs.
+    """
+    blob_queryset = Blob.objects.filter(
+        ~Exists(
+            LocalId.objects.filter(
+                record_object_class=get_api_path_from_object(Blob()),
+                record_object_id=Cast(OuterRef("pk"), CharField()),
+            )
+        )
+    ).order_by("pk")
+
+    if last_pk is not None:
+        blob_queryset = blob_queryset.filter(pk__gt=last_pk)
+
+    return list(blob_queryset.values_list("pk", flat=True)[:batch_size])
+
+
+def create_pid_list(provider_name, prefix, count):
+    """Create records in bulk with a provider, by chunks of
+    `ID_PROVIDER_BULK_CREATE_LIMIT` records.
+
+    Args:
+        provider_name: str - Name of the provider.
+        prefix: str - Prefix of the records.
+        count: int - Number of records to create.
+
+    Raises:
+        PidCreateError: The provider did not create the records.
+
+    Returns:
+        list<str> - URLs of the created records.
+    """
+    provider = ProviderManager().get(provider_name)
+    pid_list = []
+
+    while len(pid_list) < count:
+        provider_response = provider.create_many(
+            prefix,
+            count=min(
+                count - len(pid_list), settings.ID_PROVIDER_BULK_CREATE_LIMIT
+            ),
+        )
+
+        if provider_response.status_code != status.HTTP_201_CREATED:
+            raise exceptions.PidCreateError(
+                f"Provider returned HTTP {provider_response.status_code} "
+                "while creating records."
+            )
+
+        pid_list += [
+            record_content["url"]
+            for record_content in json.loads(provider_response.content)[
+                "records"
+            ]
+        ]
+
+    return pid_list
+
+
+def _get_missing_pid_path(data, parsed_content):
+    """Retrieve the path where the PID of a data is missing, following the
+    path selection of the data watcher.
+
+    Args:
+        data:
+        parsed_content: Parsed content of the data.
+
+    Raises:
+        PidCreateError: Values are set at several PID paths.
+
+    Returns:
+        str - Path of the missing PID, or None if the data has a PID or no
+            path can hold one.
+    """
+    all_paths = pid_path_system_api.get_all_pid_paths_by_template(
+        data.template
+    )
+
+    if len(all_paths) == 1:
+        pid_path = all_paths[0].path
+
+        try:
+            pid_value = data_utils.get_pid_value_for_data(
+                data, pid_path, parsed_content
+            )
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        return None if pid_value else pid_path
+
+    # With several paths, the PID path is the only one existing in the data.
+    pid_value_by_path = {}
+
+    for pid_path_object in all_paths:
+        try:
+            pid_value = data_utils.get_pid_value_for_data(
+                data, pid_path_object.path, parsed_content
+            )
+        except Exception:  # pylint: disable=broad-except
+            continue
+
+        if pid_value is not None:
+            pid_value_by_path[pid_path_object.path] = pid_value
+
+    if len(pid_value_by_path) > 1:
+        raise exceptions.PidCreateError(
+            f"Template {data.template.pk} has multiple defined paths but "
+            "record has values set in more than one."
+        )
+
+    for pid_path, pid_value in pid_value_by_path.items():
+        return None if pid_value else pid_path
+
+    return None
+
+
+def backfill_data_batch(data_id_list):
+    """Assign a PID to the data of a batch which do not have one. Records are
+    created in bulk, and the data are written and indexed without running
+    their save signals. The data skipped, such as data with a PID which is not
+    indexed, are indexed.
+
+    Args:
+        data_id_list: list - IDs of the data.
+
+    Returns:
+        dict - Number of data assigned a PID, data skipped, and error
+            messages.
+    """
+    result = {"assigned": 0, "skipped": 0, "errors": []}
+    missing_pid_list = []
+
+    for data in Data.objects.filter(pk__in=data_id_list).select_related(
+        "template"
+    ):
+        try:
+            parsed_content = data_utils.ParsedContent(data)
+            pid_path = _get_missing_pid_path(data, parsed_content)
+        except Exception as exc:  # pylint: disable=broad-except
+            result["errors"].append(f"Data {data.pk}: {str(exc)}")
+            continue
+
+        if pid_path is None:
+            # The data is not selected again if its PIDs are indexed.
+            try:
+                pid_index_system_api.index_data(data)
+            except Exception as exc:  # pylint: disable=broad-except
+                result["errors"].append(f"Data {data.pk}: {str(exc)}")
+                continue
+
+            result["skipped"] += 1
+        else:
+            missing_pid_list.append((data, pid_path, parsed_content))
+
+    if not missing_pid_list:
+        return result
+
+    try:
+        pid_list = create_pid_list(
+            settings.ID_PROVIDER_SYSTEM_NAME,
+            settings.ID_PROVIDER_PREFIX_DEFAULT,
+            len(missing_pid_list),
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        result["errors"] += [
+            f"Data {data.pk}: {str(exc)}" for data, _, _ in missing_pid_list
+        ]
+        return result
+
+    now = datetime_now()
+    updated_data_list = []
+
+    for (data, pid_path, parsed_content), pid_value in zip(
+        missing_pid_list, pid_list
+    ):
+        try:
+            data_utils.set_pid_value_for_data(
+                data, pid_path, pid_value, parsed_content
+            )
+            # Store the new file, as done by the field when saving the data.
+            Data._meta.get_field("file").pre_save(data, False)
+
+            if CHECKSUM_ALGORITHM:
+                data.checksum = compute_checksum(
+                    str(data.content).encode(), CHECKSUM_ALGORITHM
+                )
+
+            data.last_change_date = now
+            updated_data_list.append(data)
+        except Exception as exc:  # pylint: disable=broad-except
+            result["errors"].append(f"Data {data.pk}: {str(exc)}")
+
+    with transaction.atomic():
+        Data.objects.bulk_update(updated_data_list, DATA_BACKFILL_FIELD_LIST)
+
+        for data in updated_data_list:
+            pid_index_system_api.index_data(data)
+
+    result["assigned"] = len(updated_data_list)
+    return result
+
+
+def backfill_blob_batch(blob_id_list):
+    """Assign a PID to the blobs of a batch which do not have one. Records are
+    created in bulk, and linked to their blob with bulk queries.
+
+    Args:
+        blob_id_list: list - IDs of the blobs.
+
+    Returns:
+        dict - Number of blobs assigned a PID, blobs skipped, and error
+            messages.
+    """
+    result = {"assigned": 0, "skipped": 0, "errors": []}
+    blob_id_list = [str(blob_id) for blob_id in blob_id_list]
+    pid_dict = blob_system_api.get_pid_dict_for_blob_id_list(blob_id_list)
+    missing_pid_list = [
+        blob_id for blob_id in blob_id_list if blob_id not in pid_dict
+    ]
+    result["skipped"] = len(blob_id_list) - len(missing_pid_list)
+
+    if not missing_pid_list:
+        return result
+
+    try:
+        pid_list = create_pid_list(
+            settings.ID_PROVIDER_SYSTEM_NAME,
+            settings.ID_PROVIDER_PREFIX_BLOB,
+            len(missing_pid_list),
+        )
+        blob_system_api.set_pid_for_blob_dict(
+            dict(zip(missing_pid_list, pid_list))
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        result["errors"] += [
+            f"Blob {blob_id}: {str(exc)}" for blob_id in missing_pid_list
+        ]
+        return result
+
+    result["assigned"] = len(missing_pid_list)
+    return result
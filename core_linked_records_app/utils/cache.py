@@ -0,0 +1,462 @@
+"""Cache utilities."""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.db import transaction
+
+from core_linked_records_app import settings
+
+
+def get_shared_cache():
+    """Retrieve the Django cache named by `PID_CONFIG_CACHE_ALIAS`, sharing
+    the versions of the caches and of their keys between processes.
+
+    Returns:
+        BaseCache - Django cache, or None to only use the process memory.
+    """
+    if not settings.PID_CONFIG_CACHE_ALIAS:
+        return None
+
+    return caches[settings.PID_CONFIG_CACHE_ALIAS]
+
+
+class LRUCache:
+    """Bounded, thread-safe, least recently used cache counting its hits and
+    misses. A cache with a maximum size lower than 1 never stores anything.
+    """
+
+    def __init__(self, maxsize):
+        """Initialize the cache.
+
+        Args:
+            maxsize: int - Maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Retrieve an entry and mark it as the most recently used.
+
+        Args:
+            key:
+            default: Value returned if the key is not cached.
+
+        Returns:
+            Cached value, or `default` if the key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Store an entry, evicting the least recently used ones if the cache
+        is full.
+
+        Args:
+            key:
+            value:
+        """
+        if self.maxsize < 1:
+            return
+
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key, value):
+        """Store an entry while holding the lock, evicting the least recently
+        used ones if the cache is full.
+
+        Args:
+            key:
+            value:
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Remove an entry from the cache, if present.
+
+        Args:
+            key:
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Retrieve the statistics of the cache.
+
+        Returns:
+            dict - Hits, misses, current and maximum size of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self):
+        """Number of entries in the cache.
+
+        Returns:
+            int - Number of entries.
+        """
+        return len(self._entries)
+
+
+class TTLCache(LRUCache):
+    """Bounded, thread-safe, least recently used cache whose entries expire
+    after a time to live. Each invalidation bumps the generation of the
+    cache, and an entry computed before an invalidation is not stored, so
+    that an invalidation cannot be overwritten by a stale value.
+
+    If the cache is named, each invalidated key is also given a new version
+    in the Django cache named by `PID_CONFIG_CACHE_ALIAS`, if set. An
+    invalidation in a process then drops the entries of these keys in all
+    the processes sharing that cache, and keeps the other entries.
+    """
+
+    def __init__(self, maxsize, ttl, name=None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: int - Maximum number of entries.
+            ttl: float - Lifetime of the entries, in seconds.
+            name: str - Name of the cache, used to build the shared version
+                keys.
+        """
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.generation = 0
+        self.version_key_prefix = (
+            f"core_linked_records_app:{name}:version:" if name else None
+        )
+
+    def _get_version_key(self, key):
+        """Build the key of the version of an entry in the shared cache. The
+        entry key is hashed, so that any key, e.g. a PID URL, is valid for
+        all cache backends.
+
+        Args:
+            key:
+
+        Returns:
+            str - Key of the version in the shared cache.
+        """
+        return (
+            self.version_key_prefix
+            + hashlib.sha256(str(key).encode()).hexdigest()
+        )
+
+    def _get_shared_cache(self):
+        """Retrieve the cache sharing the versions of the keys between
+        processes.
+
+        Returns:
+            BaseCache - Django cache, or None if the versions are not shared.
+        """
+        if self.maxsize < 1 or self.version_key_prefix is None:
+            return None
+
+        return get_shared_cache()
+
+    def _get_shared_version(self, key):
+        """Retrieve the version of a key shared between processes.
+
+        Args:
+            key:
+
+        Returns:
+            int - Time of the last invalidation of the key, or None if the
+                key was not invalidated within the time to live or the
+                version is not shared.
+        """
+        shared_cache = self._get_shared_cache()
+
+        if shared_cache is None:
+            return None
+
+        return shared_cache.get(self._get_version_key(key))
+
+    def get(self, key, default=None):
+        """Retrieve an entry which has not expired, and mark it as the most
+        recently used.
+
+        Args:
+            key:
+            default: Value returned if the key is not cached.
+
+        Returns:
+            Cached value, or `default` if the key is not cached.
+        """
+        shared_version = self._get_shared_version(key)
+
+        with self._lock:
+            try:
+                expiry_time, entry_shared_version, value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            # A version missing from the shared cache, e.g. evicted, also
+            # drops the entries stored with that version.
+            if (
+                expiry_time <= time.monotonic()
+                or entry_shared_version != shared_version
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_generation(self, key):
+        """Retrieve the generation of an entry, to read before computing the
+        value passed to `set`.
+
+        Args:
+            key:
+
+        Returns:
+            tuple - Number of invalidations since the creation of the cache
+                in the process, and shared version of the key.
+        """
+        shared_version = self._get_shared_version(key)
+
+        with self._lock:
+            return self.generation, shared_version
+
+    def set(self, key, value, generation=None):
+        """Store an entry, unless the cache was invalidated since the given
+        generation was read.
+
+        Args:
+            key:
+            value:
+            generation: tuple - Generation of the key read before computing
+                the value.
+        """
+        if self.maxsize < 1 or self.ttl <= 0:
+            return
+
+        if generation is None:
+            generation = self.get_generation(key)
+
+        local_generation, shared_version = generation
+
+        with self._lock:
+            if local_generation != self.generation:
+                return
+
+            self._store(
+                key, (time.monotonic() + self.ttl, shared_version, value)
+            )
+
+    def invalidate(self, key):
+        """Remove an entry from the cache, if present.
+
+        Args:
+            key:
+        """
+        self.invalidate_many([key])
+
+    def invalidate_many(self, key_list):
+        """Remove entries from the cache, if present.
+
+        Args:
+            key_list: list - Keys to remove.
+        """
+        with self._lock:
+            self.generation += 1
+
+            for key in key_list:
+                self._entries.pop(key, None)
+
+        shared_cache = self._get_shared_cache()
+
+        if shared_cache is None or self.ttl <= 0:
+            return
+
+        # The versions only need to outlive the entries stored before them.
+        version = time.time_ns()
+        shared_cache.set_many(
+            {self._get_version_key(key): version for key in key_list},
+            timeout=math.ceil(self.ttl),
+        )
+
+
+class VersionedCache:
+    """Cache of values loaded from the database, stamped with the version of
+    the cache when they were loaded. Invalidating the cache bumps its
+    version, so that stale values are reloaded on their next access.
+
+    The version is kept in the Django cache named by
+    `PID_CONFIG_CACHE_ALIAS`, if set, so that an invalidation in a process is
+    seen by all the processes sharing that cache. The values are always kept
+    in the memory of the process.
+    """
+
+    def __init__(self, name):
+        """Initialize the cache.
+
+        Args:
+            name: str - Name of the cache, used to build the version key.
+        """
+        self.version_key = f"core_linked_records_app:{name}:version"
+        self.hits = 0
+        self.misses = 0
+        self._local_version = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_version(self):
+        """Retrieve the current version of the cache.
+
+        Returns:
+            Version of the cache.
+        """
+        shared_cache = get_shared_cache()
+
+        if shared_cache is None:
+            return self._local_version
+
+        # A version missing from the shared cache, e.g. evicted, is replaced
+        # by a value which was never used before.
+        return shared_cache.get_or_set(
+            self.version_key, time.time_ns, timeout=None
+        )
+
+    def get_or_load(self, key, loader, copy_value=None):
+        """Retrieve a value, loading it if it is not cached for the current
+        version. Nothing is cached if `PID_CONFIG_CACHE_ENABLED` is False.
+
+        Args:
+            key:
+            loader: Function without arguments loading the value.
+            copy_value: Function copying a value, so that callers modifying
+                the value they received do not alter the cache.
+
+        Returns:
+            Value for the key.
+        """
+        if not settings.PID_CONFIG_CACHE_ENABLED:
+            return loader()
+
+        version = self.get_version()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return copy_value(entry[1]) if copy_value else entry[1]
+
+            self.misses += 1
+
+        value = loader()
+
+        with self._lock:
+            self._entries[key] = (
+                version,
+                copy_value(value) if copy_value else value,
+            )
+
+        return value
+
+    def invalidate(self):
+        """Bump the version of the cache, so that all values are reloaded."""
+        with self._lock:
+            self._local_version += 1
+            self._entries.clear()
+
+        shared_cache = get_shared_cache()
+
+        if shared_cache is None:
+            return
+
+        try:
+            shared_cache.incr(self.version_key)
+        except ValueError:  # The version is not in the shared cache.
+            shared_cache.set(self.version_key, time.time_ns(), timeout=None)
+
+    def info(self):
+        """Retrieve the statistics of the cache.
+
+        Returns:
+            dict - Hits, misses, number of entries and version of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "version": self.get_version(),
+            }
+
+
+# Configuration of the PIDs: PidSettings and PidPath objects.
+pid_config_cache = VersionedCache("pid_config")
+
+
+def invalidate_pid_config():
+    """Invalidate the PID configuration cache now, so that the current
+    transaction reads its own changes, and again once it is committed, so
+    that values loaded by other connections before the commit are dropped.
+    """
+    pid_config_cache.invalidate()
+    transaction.on_commit(pid_config_cache.invalidate)
+
+
+# Normalized PIDs assigned to no data and no blob, for the resolver.
+unknown_pid_cache = TTLCache(
+    settings.PID_NEGATIVE_CACHE_SIZE,
+    settings.PID_NEGATIVE_CACHE_TTL,
+    "unknown_pid",
+)
+
+
+def invalidate_unknown_pid_list(pid_list):
+    """Remove PIDs from the unknown PID cache once the current transaction
+    is committed, when they can be resolved by the other connections.
+
+    Args:
+        pid_list: iterable<str> - Normalized PIDs, only read if the cache is
+            enabled.
+    """
+    if unknown_pid_cache.maxsize < 1:
+        return
+
+    pid_list = list(pid_list)
+
+    if pid_list:
+        transaction.on_commit(
+            lambda: unknown_pid_cache.invalidate_many(pid_list)
+        )
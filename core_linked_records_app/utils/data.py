@@ -1,7 +1,10 @@
 """PID utilities related to data objects."""
 
+import copy
 import json
 import logging
+import threading
+from collections import Counter
 
 from core_linked_records_app.utils import exceptions
 from core_linked_records_app.utils import (
@@ -10,6 +13,13 @@ from core_linked_records_app.utils import (
     dict as pid_dict_utils,
 )
 from core_main_app.components.template.models import Template
+from core_main_app.settings import (
+    MONGODB_INDEXING,
+    SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+    XML_POST_PROCESSOR,
+    XML_FORCE_LIST,
+)
+from core_main_app.utils import xml as main_xml_utils
 from core_main_app.utils.json_utils import load_json_string
 from xml_utils.commons.exceptions import XPathError
 from xml_utils.xpath import create_tree_from_xpath
@@ -18,96 +28,247 @@ from xml_utils.xsd_tree.xsd_tree import XSDTree
 logger = logging.getLogger(__name__)
 
 
-def set_pid_value_for_data(data, pid_path, pid_value):
-    """Set the document PID into XML data and update `content` in place.
+class ParsedContent:
+    """Content of a data parsed once and shared by the PID functions, so that
+    probing, validating and writing the PID during a save do not parse the
+    document again. Counts the parses and serializations done and avoided.
+    """
+
+    def __init__(self, data):
+        """Initialize the parsed content.
+
+        Args:
+            data:
+        """
+        self.data = data
+        self.parse_count = 0
+        self.avoided_parse_count = 0
+        self.avoided_serialization_count = 0
+        self._xml_tree = None
+        self._json_content = None
+
+    @property
+    def xml_tree(self):
+        """Parsed XML content, parsed on first access."""
+        if self._xml_tree is None:
+            self._xml_tree = XSDTree.build_tree(self.data.content)
+            self.parse_count += 1
+        else:
+            self.avoided_parse_count += 1
+
+        return self._xml_tree
+
+    @xml_tree.setter
+    def xml_tree(self, value):
+        """Replace the parsed XML content after the data has been modified."""
+        self._xml_tree = value
+
+    @property
+    def json_content(self):
+        """Parsed JSON content, parsed on first access."""
+        if self._json_content is None:
+            self._json_content = load_json_string(self.data.content)
+            self.parse_count += 1
+        else:
+            self.avoided_parse_count += 1
+
+        return self._json_content
+
+    @json_content.setter
+    def json_content(self, value):
+        """Replace the parsed JSON content after the data has been modified."""
+        self._json_content = value
+
+    def record_stats(self):
+        """Add the counters of this content to the process-wide totals."""
+        with _parsed_content_stats_lock:
+            _parsed_content_stats["parses"] += self.parse_count
+            _parsed_content_stats["avoided_parses"] += self.avoided_parse_count
+            _parsed_content_stats[
+                "avoided_serializations"
+            ] += self.avoided_serialization_count
+
+
+_parsed_content_stats = Counter(
+    parses=0, avoided_parses=0, avoided_serializations=0
+)
+_parsed_content_stats_lock = threading.Lock()
+
+
+def get_parsed_content_stats():
+    """Retrieve the number of document parses done and avoided, and of
+    serializations avoided, while assigning PIDs in this process.
+
+    Returns:
+        dict - Parses, avoided parses and avoided serializations.
+    """
+    with _parsed_content_stats_lock:
+        return dict(_parsed_content_stats)
+
+
+_pid_save_stats = Counter(
+    registered=0, skipped_unchanged_content=0, skipped_unchanged_pid=0
+)
+_pid_save_stats_lock = threading.Lock()
+
+
+def record_pid_save(outcome):
+    """Count a save of a Data for which the PID was assigned, in the
+    process-wide totals.
+
+    Args:
+        outcome: str - `registered`, `skipped_unchanged_content` or
+            `skipped_unchanged_pid`.
+    """
+    with _pid_save_stats_lock:
+        _pid_save_stats[outcome] += 1
+
+
+def get_pid_save_stats():
+    """Retrieve the number of Data saves for which the PID was registered, and
+    of saves short-circuited because the content or the PID did not change
+    since the last registration, in this process.
+
+    Returns:
+        dict - Registered and short-circuited saves.
+    """
+    with _pid_save_stats_lock:
+        return dict(_pid_save_stats)
+
+
+def set_pid_value_for_data(data, pid_path, pid_value, parsed_content=None):
+    """Set the document PID into XML data and update `content` in place. The
+    content is not serialized again if it already contains the PID.
 
     Args:
         data:
         pid_path:
         pid_value:
+        parsed_content: Parsed content of the data, parsed if not provided.
     """
+    if parsed_content is None:
+        parsed_content = ParsedContent(data)
+
     if data.template.format == Template.XSD:
-        pid_xpath = pid_xml_utils.get_xpath_with_target_namespace(
-            pid_xml_utils.get_xpath_from_dot_notation(pid_path),
-            data.template.content,
+        pid_xpath, target_namespace, compiled_pid_xpath = (
+            pid_xml_utils.get_pid_xpath_for_template(data.template, pid_path)
         )
+        xml_tree = parsed_content.xml_tree
 
-        target_namespace = pid_xml_utils.get_target_namespace_for_xsd_string(
-            data.template.content
-        )
-        xml_tree = XSDTree.build_tree(data.content)
+        try:
+            current_pid_value = pid_xml_utils.get_value_at_xpath(
+                xml_tree,
+                pid_xpath,
+                target_namespace,
+                compiled_xpath=compiled_pid_xpath,
+            )
+        except XPathError:
+            current_pid_value = None
 
-        xml_tree = create_tree_from_xpath(
-            pid_xpath, xml_tree, target_namespace
-        )
-        pid_xml_utils.set_value_at_xpath(
-            xml_tree, pid_xpath, pid_value, target_namespace
-        )
-        data.content = XSDTree.tostring(xml_tree)
+        if current_pid_value == pid_value:
+            parsed_content.avoided_serialization_count += 1
+        else:
+            xml_tree = create_tree_from_xpath(
+                pid_xpath, xml_tree, target_namespace
+            )
+            pid_xml_utils.set_value_at_xpath(
+                xml_tree,
+                pid_xpath,
+                pid_value,
+                target_namespace,
+                compiled_xpath=compiled_pid_xpath,
+            )
+            parsed_content.xml_tree = xml_tree
+            data.content = XSDTree.tostring(xml_tree)
     elif data.template.format == Template.JSON:
-        json_content = load_json_string(data.content)
-        json_content = pid_json_utils.set_value_at_dict_path(
-            json_content, pid_path, pid_value
-        )
-        data.content = json.dumps(json_content)
+        json_content = parsed_content.json_content
+
+        if (
+            pid_dict_utils.get_value_from_dot_notation(json_content, pid_path)
+            == pid_value
+        ):
+            parsed_content.avoided_serialization_count += 1
+        else:
+            json_content = pid_json_utils.set_value_at_dict_path(
+                json_content, pid_path, pid_value
+            )
+            parsed_content.json_content = json_content
+            data.content = json.dumps(json_content)
     else:
         error_message = "Cannot create PID. Invalid template format."
         logger.error(error_message)
         raise exceptions.PidCreateError(error_message)
 
-    # Update the whole document with the updated XML content
+    # Update the whole document with the updated content. Also required when
+    # the PID is unchanged, as the content may have been modified since the
+    # file and dict were last generated.
     data.convert_to_file()
-    data.convert_to_dict()
+
+    if MONGODB_INDEXING:  # The dict content is not stored.
+        return
+
+    if data.template.format == Template.JSON:
+        # The dict content is a copy of the parsed content.
+        data.dict_content = copy.deepcopy(parsed_content.json_content)
+    else:
+        # The dict content of XML documents can only be built from their
+        # serialized content, which is parsed again.
+        data.convert_to_dict()
+        parsed_content.parse_count += 1
 
 
-def get_pid_value_for_data(data, pid_path):
+def get_pid_value_for_data(data, pid_path, parsed_content=None):
     """Retrieve value located at `pid_path` of the data passed in parameter.
 
     Args:
         data:
         pid_path:
+        parsed_content: Parsed content of the data, parsed if not provided.
 
     Returns:
         str - Persitstent identifier
     """
+    if parsed_content is None:
+        parsed_content = ParsedContent(data)
+
     if data.template.format == Template.XSD:
         # Transform the dot notation path into an XML XPath.
-        pid_path = pid_xml_utils.get_xpath_with_target_namespace(
-            pid_xml_utils.get_xpath_from_dot_notation(pid_path),
-            data.template.content,
+        pid_path, target_namespace, compiled_pid_xpath = (
+            pid_xml_utils.get_pid_xpath_for_template(data.template, pid_path)
         )
-
-        target_namespace = pid_xml_utils.get_target_namespace_for_xsd_string(
-            data.template.content
-        )
-        xml_tree = XSDTree.build_tree(data.content)
+        xml_tree = parsed_content.xml_tree
 
         try:  # Get the PID from the `pid_path` value
             pid_value = pid_xml_utils.get_value_at_xpath(
-                xml_tree, pid_path, target_namespace
+                xml_tree,
+                pid_path,
+                target_namespace,
+                compiled_xpath=compiled_pid_xpath,
             )
         except XPathError as xpath_error_exc:  # PID path not found in document
-            if not pid_xml_utils.can_create_value_at_xpath(
-                data.content,
-                data.template.content,
+            if not pid_xml_utils.can_create_value_at_xpath_in_tree(
+                xml_tree,
+                pid_xml_utils.get_xsd_tree_for_template(data.template),
                 pid_path,
                 "http://sample_pid.org",
+                target_namespace,
             ):
                 raise exceptions.PidCreateError(
                     f"Cannot create pid value at {pid_path}"
                 ) from xpath_error_exc
             pid_value = None
     elif data.template.format == Template.JSON:
-        json_content = load_json_string(data.content)
+        json_content = parsed_content.json_content
         pid_value = pid_dict_utils.get_value_from_dot_notation(
             json_content, pid_path
         )
 
-        # PID path has not been found in document and cannot be created.
+        # PID path has not been found in document and cannot be created. The
+        # check modifies the content it is given, so it works on a new copy.
         if (
             pid_value is None
             and not pid_json_utils.can_create_value_at_dict_path(
-                json_content,
+                load_json_string(data.content),
                 data.template.content,
                 pid_path,
                 "http://sample_pid.org",
@@ -127,3 +288,33 @@ def get_pid_value_for_data(data, pid_path):
         if isinstance(pid_value, str) and pid_value.endswith("/")
         else pid_value
     )
+
+
+def get_dict_content_for_data(data):
+    """Retrieve the dict content of a data. If the dict content is not stored
+    in the data object (e.g. when using MongoDB indexing), it is computed from
+    the data content.
+
+    Args:
+        data:
+
+    Returns:
+        dict - Dict content of the data
+    """
+    if data.dict_content is not None:
+        return data.dict_content
+
+    if data.template.format == Template.XSD:
+        return main_xml_utils.raw_xml_to_dict(
+            data.content,
+            postprocessor=XML_POST_PROCESSOR,
+            force_list=XML_FORCE_LIST,
+            list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+        )
+
+    if data.template.format == Template.JSON:
+        return load_json_string(data.content)
+
+    error_message = "Cannot retrieve dict content. Invalid template format."
+    logger.error(error_message)
+    raise exceptions.InvalidPidError(error_message)
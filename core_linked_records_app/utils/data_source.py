@@ -0,0 +1,290 @@
+"""Data source utilities functions."""
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.db import connection
+from django.utils import timezone
+from rest_framework import status
+
+from core_explore_common_app.commons.exceptions import ExploreRequestError
+from core_explore_common_app.utils.oaipmh import oaipmh as oaipmh_utils
+from core_explore_common_app.utils.query import query as query_utils
+from core_linked_records_app import settings
+from core_linked_records_app.utils.query import (
+    execute_local_pid_query,
+    execute_oaipmh_pid_query,
+)
+from core_main_app.utils.requests_utils import requests_utils
+
+logger = logging.getLogger(__name__)
+
+DATA_SOURCE_STATUS_OK = "ok"
+DATA_SOURCE_STATUS_ERROR = "error"
+DATA_SOURCE_STATUS_TIMEOUT = "timeout"
+
+# Threads querying the data sources, shared by all the requests of the process
+# so that the number of threads stays bounded.
+fan_out_executor = ThreadPoolExecutor(
+    max_workers=settings.PID_QUERY_FAN_OUT_MAX_WORKERS,
+    thread_name_prefix="pid_query_fan_out",
+)
+
+
+def build_data_source_json_query(query, data_source):
+    """Build the serialized query to send to a data source.
+
+    Args:
+        query: Query
+        data_source: dict - Data source of the query
+
+    Returns:
+        dict - Serialized query
+    """
+    return {
+        "query": query.content,
+        "templates": json.dumps(
+            [
+                {"id": template.id, "hash": template.hash}
+                for template in query.templates.all()
+            ]
+        ),
+        "options": json.dumps(data_source["query_options"]),
+        "order_by_field": data_source["order_by_field"],
+    }
+
+
+def send_oauth2_post_request(
+    url, data, access_token, session_time_zone=None, timeout=None
+):
+    """Send a POST request to an OAuth2 endpoint.
+
+    Args:
+        url:
+        data:
+        access_token:
+        session_time_zone:
+        timeout: float - Timeout of the request, in seconds.
+
+    Returns:
+        Response - Response of the request.
+    """
+    headers = {"TZ": str(session_time_zone)}
+
+    if access_token:
+        headers["Authorization"] = f"Bearer {access_token}"
+
+    return requests_utils.send_post_request(
+        url, data=data, headers=headers, timeout=timeout
+    )
+
+
+def execute_federated_pid_query(
+    json_query, data_source, session_time_zone, deadline
+):
+    """Retrieve the PIDs of the results of a query on a federated data
+    source.
+
+    Args:
+        json_query: dict - Serialized query
+        data_source: dict - Data source of the query
+        session_time_zone: Time zone of the session
+        deadline: float - Monotonic time after which the data source is not
+            waited for anymore.
+
+    Raises:
+        ExploreRequestError: The data source returned an error, or the
+            deadline passed before the request was sent.
+
+    Returns:
+        list<str> - PIDs of the results
+    """
+    timeout = deadline - time.monotonic()
+
+    if timeout <= 0:
+        raise ExploreRequestError("Data source was not queried in time.")
+
+    response = send_oauth2_post_request(
+        data_source["capabilities"]["query_pid"],
+        json_query,
+        data_source["authentication"]["params"]["access_token"],
+        session_time_zone=session_time_zone,
+        timeout=timeout,
+    )
+
+    if response.status_code != status.HTTP_200_OK:
+        raise ExploreRequestError(
+            f"Data source returned HTTP {response.status_code}."
+        )
+
+    json_response = response.json()
+
+    # Data sources answering like `RetrieveListPIDView` wrap their PIDs.
+    if isinstance(json_response, dict):
+        return json_response.get("pids", [])
+
+    return json_response
+
+
+def execute_session_pid_query(
+    json_query, data_source, request, session_time_zone, deadline
+):
+    """Retrieve the PIDs of the results of a query on a local or OAI-PMH data
+    source. Runs in a thread of `fan_out_executor`, whose database
+    connection is closed afterwards.
+
+    Args:
+        json_query: dict - Serialized query
+        data_source: dict - Data source of the query
+        request:
+        session_time_zone: Time zone of the session
+        deadline: float - Monotonic time after which the data source is not
+            waited for anymore.
+
+    Raises:
+        ExploreRequestError: The data source type is unknown, or the deadline
+            passed before the query was executed.
+
+    Returns:
+        list<str> - PIDs of the results
+    """
+    try:
+        if deadline <= time.monotonic():
+            raise ExploreRequestError("Data source was not queried in time.")
+
+        with timezone.override(session_time_zone):
+            if query_utils.is_local_data_source(data_source):
+                return execute_local_pid_query(json_query, request)
+
+            if oaipmh_utils.is_oai_data_source(data_source):
+                return execute_oaipmh_pid_query(json_query, request)
+
+        raise ExploreRequestError("Unknown data source type.")
+    finally:
+        connection.close()
+
+
+def execute_query_pid_fan_out(query, request):
+    """Retrieve the PIDs of the results of a query on all its data sources.
+
+    All the data sources, federated, local and OAI-PMH, are queried
+    concurrently by the shared executor, and waited for until
+    `PID_QUERY_FAN_OUT_TIMEOUT` seconds have passed. The PIDs are merged
+    without duplicates, and the failure or timeout of a data source is
+    reported in its status rather than failing the whole query. A database
+    query still running at the deadline is not interrupted, but its result
+    is not waited for.
+
+    Args:
+        query: Query
+        request:
+
+    Returns:
+        dict - PIDs of the results and status of each data source
+    """
+    session_time_zone = timezone.get_current_timezone()
+    deadline = time.monotonic() + settings.PID_QUERY_FAN_OUT_TIMEOUT
+    data_source_report_list = [
+        {
+            "index": index,
+            "name": data_source.get("name", ""),
+            "status": DATA_SOURCE_STATUS_OK,
+            "count": 0,
+        }
+        for index, data_source in enumerate(query.data_sources)
+    ]
+    pid_list_by_index = dict()
+    future_by_index = dict()
+
+    try:
+        for index, data_source in enumerate(query.data_sources):
+            try:
+                json_query = build_data_source_json_query(query, data_source)
+                auth_type = data_source["authentication"]["auth_type"]
+
+                if auth_type == "oauth2":
+                    future_by_index[index] = fan_out_executor.submit(
+                        execute_federated_pid_query,
+                        json_query,
+                        data_source,
+                        session_time_zone,
+                        deadline,
+                    )
+                elif auth_type == "session":
+                    future_by_index[index] = fan_out_executor.submit(
+                        execute_session_pid_query,
+                        json_query,
+                        data_source,
+                        request,
+                        session_time_zone,
+                        deadline,
+                    )
+                else:
+                    raise ExploreRequestError("Unknown authentication type.")
+            except Exception as exc:  # pylint: disable=broad-except
+                _set_data_source_error(
+                    data_source_report_list[index],
+                    DATA_SOURCE_STATUS_ERROR,
+                    exc,
+                )
+
+        wait(
+            future_by_index.values(),
+            timeout=max(deadline - time.monotonic(), 0),
+        )
+
+        for index, future in future_by_index.items():
+            if not future.done():
+                _set_data_source_error(
+                    data_source_report_list[index],
+                    DATA_SOURCE_STATUS_TIMEOUT,
+                    "Data source did not respond in time.",
+                )
+            elif future.exception() is not None:
+                _set_data_source_error(
+                    data_source_report_list[index],
+                    DATA_SOURCE_STATUS_ERROR,
+                    future.exception(),
+                )
+            else:
+                pid_list_by_index[index] = future.result()
+    finally:
+        # The queries which did not start yet are not executed, and the
+        # running requests end with their own timeout.
+        for future in future_by_index.values():
+            future.cancel()
+
+    pid_set = set()
+    pid_list = list()
+
+    for index in sorted(pid_list_by_index):
+        data_source_pid_list = [
+            pid for pid in pid_list_by_index[index] if pid is not None
+        ]
+        data_source_report_list[index]["count"] = len(data_source_pid_list)
+
+        for pid in data_source_pid_list:
+            if pid not in pid_set:
+                pid_set.add(pid)
+                pid_list.append(pid)
+
+    return {"pids": pid_list, "data_sources": data_source_report_list}
+
+
+def _set_data_source_error(data_source_report, data_source_status, error):
+    """Set the failure status of a data source.
+
+    Args:
+        data_source_report: dict - Status of the data source
+        data_source_status: str - Failure status
+        error: Exception or error message
+    """
+    logger.warning(
+        "PID query failed on data source %s: %s",
+        data_source_report["index"],
+        str(error),
+    )
+    data_source_report["status"] = data_source_status
+    data_source_report["error"] = str(error)
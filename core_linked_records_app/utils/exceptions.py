@@ -85,3 +85,27 @@ class MultiplePidError(CoreError):
             message (str): Error message
         """
         super().__init__(message)
+
+
+class InvalidCursorError(CoreError):
+    """Exception raised when a pagination cursor is not valid."""
+
+    def __init__(self, message):
+        """Initialize exception
+
+        Args:
+            message (str): Error message
+        """
+        super().__init__(message)
+
+
+class RangeNotSatisfiableError(CoreError):
+    """Exception raised when a byte range is outside of a file."""
+
+    def __init__(self, message):
+        """Initialize exception
+
+        Args:
+            message (str): Error message
+        """
+        super().__init__(message)
@@ -0,0 +1,229 @@
+"""File utilities for the responses resolving PIDs to blobs.
+
+Files are streamed from the storage in chunks instead of being loaded in
+memory, single byte ranges are answered with a partial content response so
+that downloads can be resumed, and the transfer can be delegated to the web
+server with the `X-Accel-Redirect` or `X-Sendfile` header.
+"""
+
+import logging
+import re
+from mimetypes import guess_type
+from urllib.parse import quote
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header, http_date
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils.exceptions import RangeNotSatisfiableError
+
+logger = logging.getLogger(__name__)
+
+X_ACCEL_REDIRECT_MODE = "x-accel-redirect"
+X_SENDFILE_MODE = "x-sendfile"
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+BYTE_RANGE_REGEX = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def get_byte_range(range_header, file_size):
+    """Parse the `Range` header of a request. Only single byte ranges are
+    supported: other ranges are ignored, and the whole file is sent.
+
+    Args:
+        range_header: str - Value of the `Range` header, or None.
+        file_size: int - Size of the file, in bytes.
+
+    Returns:
+        tuple - First and last positions of the range, inclusive, or None if
+            the whole file has to be sent.
+
+    Raises:
+        RangeNotSatisfiableError: If the range is outside the file.
+    """
+    if not range_header:
+        return None
+
+    range_match = BYTE_RANGE_REGEX.match(range_header.strip())
+
+    if range_match is None:
+        return None
+
+    first_position, last_position = range_match.groups()
+
+    if not first_position:
+        # Suffix range: last bytes of the file.
+        if not last_position:
+            return None
+
+        suffix_length = int(last_position)
+
+        if suffix_length == 0 or file_size == 0:
+            raise RangeNotSatisfiableError(range_header)
+
+        return max(file_size - suffix_length, 0), file_size - 1
+
+    first_position = int(first_position)
+    last_position = (
+        min(int(last_position), file_size - 1)
+        if last_position
+        else file_size - 1
+    )
+
+    if first_position >= file_size:
+        raise RangeNotSatisfiableError(range_header)
+
+    if last_position < first_position:
+        return None
+
+    return first_position, last_position
+
+
+def _is_range_valid(request, etag, last_modified):
+    """Check the `If-Range` header of a request: the range is only sent if
+    the file still matches the validator of the client.
+
+    Args:
+        request: HttpRequest - Request with a `Range` header.
+        etag: str - Quoted entity tag of the file, or None.
+        last_modified: int - Last modification timestamp, or None.
+
+    Returns:
+        bool - Whether the range can be sent.
+    """
+    if_range = request.META.get("HTTP_IF_RANGE")
+
+    if not if_range:
+        return True
+
+    if etag is not None and if_range == etag:
+        return True
+
+    return last_modified is not None and if_range == http_date(last_modified)
+
+
+def iter_file_range(file, first_position, length, chunk_size):
+    """Read a range of a file in chunks, then close the file.
+
+    Args:
+        file: File object opened in binary mode.
+        first_position: int - First position of the range.
+        length: int - Length of the range, in bytes.
+        chunk_size: int - Maximum size of the chunks, in bytes.
+
+    Yields:
+        bytes - Chunks of the range.
+    """
+    try:
+        file.seek(first_position)
+
+        while length > 0:
+            chunk = file.read(min(chunk_size, length))
+
+            if not chunk:
+                break
+
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def _get_offload_response(blob, content_type):
+    """Build a response delegating the transfer of the file of a blob to the
+    web server, which also answers the range requests.
+
+    Args:
+        blob: Blob object.
+        content_type: str - Content type of the file.
+
+    Returns:
+        HttpResponse - Empty response with the offload header, or None if the
+            file cannot be offloaded.
+    """
+    offload_mode = settings.PID_BLOB_OFFLOAD_MODE
+
+    if offload_mode == X_ACCEL_REDIRECT_MODE:
+        header = "X-Accel-Redirect"
+        header_value = (
+            f"{settings.PID_BLOB_OFFLOAD_PREFIX.rstrip('/')}/"
+            f"{quote(blob.blob.name)}"
+        )
+    elif offload_mode == X_SENDFILE_MODE:
+        header = "X-Sendfile"
+
+        try:
+            header_value = blob.blob.path
+        except NotImplementedError:
+            # The storage has no local path, the file is streamed.
+            return None
+    else:
+        logger.warning("Unknown blob offload mode: %s.", offload_mode)
+        return None
+
+    response = HttpResponse(content_type=content_type)
+    response[header] = header_value
+
+    return response
+
+
+def get_blob_file_response(request, blob, etag=None, last_modified=None):
+    """Build the response sending the file of a blob.
+
+    Args:
+        request: HttpRequest - Request downloading the file.
+        blob: Blob object.
+        etag: str - Quoted entity tag of the file, or None.
+        last_modified: int - Last modification timestamp, or None.
+
+    Returns:
+        HttpResponse - Response sending the file, or a part of it.
+    """
+    content_type = guess_type(blob.filename)[0] or DEFAULT_CONTENT_TYPE
+    content_disposition = content_disposition_header(True, blob.filename)
+
+    if settings.PID_BLOB_OFFLOAD_MODE:
+        response = _get_offload_response(blob, content_type)
+
+        if response is not None:
+            response["Content-Disposition"] = content_disposition
+            return response
+
+    file_size = blob.blob.size
+
+    try:
+        byte_range = (
+            get_byte_range(request.META.get("HTTP_RANGE"), file_size)
+            if _is_range_valid(request, etag, last_modified)
+            else None
+        )
+    except RangeNotSatisfiableError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{file_size}"
+        response["Accept-Ranges"] = "bytes"
+        return response
+
+    file = blob.blob.open("rb")
+
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+        response.block_size = settings.PID_BLOB_CHUNK_SIZE
+    else:
+        first_position, last_position = byte_range
+        length = last_position - first_position + 1
+        response = StreamingHttpResponse(
+            iter_file_range(
+                file, first_position, length, settings.PID_BLOB_CHUNK_SIZE
+            ),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = (
+            f"bytes {first_position}-{last_position}/{file_size}"
+        )
+
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = content_disposition
+
+    return response
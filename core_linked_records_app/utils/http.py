@@ -0,0 +1,179 @@
+"""HTTP caching utilities for the responses resolving PIDs.
+
+Responses carry an `ETag` and a `Last-Modified` header derived from the
+resolved object, so that conditional requests are answered with a 304
+before the object is serialized or rendered.
+"""
+
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from core_linked_records_app import settings
+from core_main_app.settings import CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT
+
+
+def build_etag(*part_list):
+    """Build a strong entity tag from the parts identifying a
+    representation.
+
+    Args:
+        part_list: Parts of the representation, converted to strings.
+
+    Returns:
+        str - Quoted entity tag.
+    """
+    return quote_etag(
+        hashlib.sha256(
+            "\0".join(str(part) for part in part_list).encode("utf-8")
+        ).hexdigest()[:32]
+    )
+
+
+def _get_timestamp(date):
+    """Convert a date to a timestamp.
+
+    Args:
+        date: datetime - Date, or None.
+
+    Returns:
+        int - Timestamp in seconds, or None if the date is not set.
+    """
+    if not isinstance(date, datetime):
+        return None
+
+    return int(date.timestamp())
+
+
+def is_public_object(document):
+    """Check whether a data or a blob can be stored by shared caches: its
+    workspace is public and can be read anonymously.
+
+    Args:
+        document: Data or Blob.
+
+    Returns:
+        bool - Whether the object is public.
+    """
+    workspace = getattr(document, "workspace", None)
+
+    return bool(
+        CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT
+        and workspace is not None
+        and workspace.is_public is True
+    )
+
+
+def get_variant_list(request, is_public):
+    """Retrieve the parts identifying the representation of a document sent
+    to a request: its format, and its user if the document is not public.
+
+    Args:
+        request: HttpRequest - Request resolving the document.
+        is_public: bool - Whether the document is public.
+
+    Returns:
+        list - Parts of the representation.
+    """
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    variant_list = [getattr(accepted_renderer, "format", "")]
+
+    if not is_public:
+        variant_list.append(getattr(request.user, "pk", None))
+
+    return variant_list
+
+
+def get_data_validators(data, variant_list=()):
+    """Retrieve the validators of a representation of a data. The last
+    change date is updated by every save of the data, including the changes
+    of its metadata, and the checksum identifies its content.
+
+    Args:
+        data: Data object.
+        variant_list: list - Parts identifying the representation, such as
+            its format.
+
+    Returns:
+        tuple - Entity tag and last modification timestamp, or None.
+    """
+    return (
+        build_etag(
+            "data",
+            data.pk,
+            data.checksum,
+            data.last_change_date,
+            *variant_list,
+        ),
+        _get_timestamp(data.last_change_date),
+    )
+
+
+def get_blob_validators(blob):
+    """Retrieve the validators of the file of a blob, which does not change
+    once uploaded.
+
+    Args:
+        blob: Blob object.
+
+    Returns:
+        tuple - Entity tag and last modification timestamp, or None.
+    """
+    return (
+        build_etag("blob", blob.pk, blob.checksum, blob.creation_date),
+        _get_timestamp(blob.creation_date),
+    )
+
+
+def set_cache_headers(response, etag, last_modified, is_public):
+    """Set the validators and the cache policy of a response.
+
+    Args:
+        response: HttpResponse - Response to update.
+        etag: str - Quoted entity tag.
+        last_modified: int - Last modification timestamp, or None.
+        is_public: bool - Whether shared caches can store the response.
+
+    Returns:
+        HttpResponse - Updated response.
+    """
+    response["ETag"] = etag
+
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+
+    response["Cache-Control"] = (
+        settings.PID_PUBLIC_CACHE_CONTROL
+        if is_public
+        else settings.PID_PRIVATE_CACHE_CONTROL
+    )
+
+    return response
+
+
+def get_not_modified_response(request, etag, last_modified, is_public):
+    """Evaluate the conditional headers of a request against the validators
+    of the requested representation.
+
+    Args:
+        request: HttpRequest - Request with conditional headers.
+        etag: str - Quoted entity tag.
+        last_modified: int - Last modification timestamp, or None.
+        is_public: bool - Whether shared caches can store the response.
+
+    Returns:
+        HttpResponse - 304 or 412 response, or None if the representation has
+            to be sent.
+    """
+    conditional_response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+
+    if conditional_response is None:
+        return None
+
+    return set_cache_headers(
+        conditional_response, etag, last_modified, is_public
+    )
@@ -0,0 +1,304 @@
+"""Generators of the record names of the local PID provider.
+
+The sortable generators encode their values with the Crockford base32
+alphabet, in fixed width, so that the lexicographic order of the records is
+their generation order and new records are appended at the end of the
+`record_name` index.
+"""
+
+import os
+import random
+import string
+import threading
+import time
+from abc import ABC, abstractmethod
+from importlib import import_module
+
+from core_linked_records_app.system.local_id_sequence import (
+    api as local_id_sequence_system_api,
+)
+from core_main_app.commons import exceptions
+
+CROCKFORD_BASE32_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def encode_base32(value, length):
+    """Encode a positive integer with the Crockford base32 alphabet, padded
+    to a fixed length.
+
+    Args:
+        value: int - Value to encode.
+        length: int - Number of characters of the output.
+
+    Returns:
+        str - Encoded value.
+    """
+    character_list = [CROCKFORD_BASE32_ALPHABET[0]] * length
+
+    for index in range(length - 1, -1, -1):
+        character_list[index] = CROCKFORD_BASE32_ALPHABET[value & 31]
+        value >>= 5
+
+    if value:
+        raise exceptions.CoreError(
+            f"Value too large to be encoded in {length} characters."
+        )
+
+    return "".join(character_list)
+
+
+def build_id_generator(id_generator_config):
+    """Import the class of an ID generator and instantiate it.
+
+    Args:
+        id_generator_config: dict - Class path and arguments of the generator.
+
+    Returns:
+        AbstractIdGenerator - New generator instance.
+    """
+    id_generator_classpath = id_generator_config["class"].split(".")
+    id_generator_module = import_module(".".join(id_generator_classpath[:-1]))
+    id_generator_class = getattr(
+        id_generator_module, id_generator_classpath[-1]
+    )
+
+    return id_generator_class(*id_generator_config.get("args", []))
+
+
+class AbstractIdGenerator(ABC):
+    """Generator of record names"""
+
+    # Whether two generated IDs can never be equal, so that they do not need
+    # to be checked against the database.
+    collision_free = False
+
+    @abstractmethod
+    def generate(self):
+        """Generate a record name.
+
+        Returns:
+            str - New record name.
+        """
+        raise NotImplementedError()
+
+
+class RandomIdGenerator(AbstractIdGenerator):
+    """Random uppercase alphanumeric record names. Collisions are unlikely
+    but possible, and must be checked against the database.
+    """
+
+    def __init__(self, length=16):
+        """Initialize the generator.
+
+        Args:
+            length: int - Number of characters of the record names.
+        """
+        self.length = length
+        self._alphabet = string.ascii_uppercase + string.digits
+
+    def generate(self):
+        """Generate a random record name.
+
+        Returns:
+            str - New record name.
+        """
+        return "".join(random.choices(self._alphabet, k=self.length))
+
+
+class UlidIdGenerator(AbstractIdGenerator):
+    """Time-ordered record names following the ULID layout: a 48 bits
+    millisecond timestamp followed by 80 random bits, encoded in 26
+    characters. Names generated by the same process within a millisecond
+    increment the random part, so that they stay ordered.
+    """
+
+    RANDOM_BITS = 80
+
+    def __init__(self):
+        """Initialize the generator."""
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._last_random_value = 0
+        self._random = random.SystemRandom()
+
+    def generate(self):
+        """Generate a ULID.
+
+        Returns:
+            str - New record name.
+        """
+        with self._lock:
+            timestamp = max(time.time_ns() // 1000000, self._last_timestamp)
+
+            if timestamp == self._last_timestamp:
+                random_value = self._last_random_value + 1
+
+                # Move on to the next millisecond once the random part of the
+                # current one is exhausted.
+                if random_value >> self.RANDOM_BITS:
+                    timestamp += 1
+                    random_value = self._random.getrandbits(self.RANDOM_BITS)
+            else:
+                random_value = self._random.getrandbits(self.RANDOM_BITS)
+
+            self._last_timestamp = timestamp
+            self._last_random_value = random_value
+
+        return encode_base32(
+            (timestamp << self.RANDOM_BITS) | random_value, 26
+        )
+
+
+class SnowflakeIdGenerator(AbstractIdGenerator):
+    """Time-ordered record names made of a 41 bits millisecond timestamp, a
+    10 bits node ID and a 12 bits sequence number, encoded in 13 characters.
+    Names are collision-free as long as each process generating them uses a
+    distinct node ID. Unless a node ID is given, each process leases one
+    from a database sequence the first time it generates a name, so that
+    the workers of a server, forked from the same parent, get distinct node
+    IDs. Leases are never released and wrap around after 1024 processes, so
+    that leased node IDs may be shared by live processes and the names they
+    generate are checked against the database.
+    """
+
+    NODE_BITS = 10
+    SEQUENCE_BITS = 12
+    DEFAULT_EPOCH = 1577836800000  # 2020-01-01T00:00:00Z, in milliseconds.
+
+    def __init__(
+        self, node_id=None, epoch=DEFAULT_EPOCH, sequence_name="snowflake_node"
+    ):
+        """Initialize the generator.
+
+        Args:
+            node_id: int - ID of the process, between 0 and 1023, which must
+                not be shared with another process. Leased from the database
+                by each process if not set.
+            epoch: int - Origin of the timestamps, in milliseconds.
+            sequence_name: str - Name of the database sequence the node IDs
+                are leased from.
+        """
+        if node_id is not None:
+            try:
+                node_id = int(node_id)
+            except (TypeError, ValueError) as exc:
+                raise exceptions.CoreError(
+                    "SnowflakeIdGenerator requires an integer node ID."
+                ) from exc
+
+            if not 0 <= node_id < 1 << self.NODE_BITS:
+                raise exceptions.CoreError(
+                    "Node ID must be between 0 and "
+                    f"{(1 << self.NODE_BITS) - 1}."
+                )
+
+        self.node_id = node_id
+        self.collision_free = node_id is not None
+        self.epoch = epoch
+        self.sequence_name = sequence_name
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._sequence = 0
+        self._leased_node_id = None
+        self._lease_process_id = None
+
+    def _get_node_id(self):
+        """Retrieve the node ID of the current process, leasing it if the
+        generator has no node ID and the process has not leased one yet. Must
+        be called with the lock held.
+
+        Returns:
+            int - Node ID.
+        """
+        if self.node_id is not None:
+            return self.node_id
+
+        # A forked process inherits the lease of its parent, and leases its
+        # own node ID.
+        if self._lease_process_id != os.getpid():
+            self._leased_node_id = local_id_sequence_system_api.reserve_block(
+                self.sequence_name, 1
+            ) % (1 << self.NODE_BITS)
+            self._lease_process_id = os.getpid()
+
+        return self._leased_node_id
+
+    def generate(self):
+        """Generate a Snowflake ID.
+
+        Returns:
+            str - New record name.
+        """
+        with self._lock:
+            node_id = self._get_node_id()
+            # The timestamp never goes back, even if the clock does, so that
+            # a name is never generated twice.
+            timestamp = max(
+                time.time_ns() // 1000000 - self.epoch, self._last_timestamp
+            )
+
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & (
+                    (1 << self.SEQUENCE_BITS) - 1
+                )
+
+                if self._sequence == 0:
+                    timestamp += 1
+            else:
+                self._sequence = 0
+
+            self._last_timestamp = timestamp
+            sequence = self._sequence
+
+        return encode_base32(
+            (
+                (timestamp << (self.NODE_BITS + self.SEQUENCE_BITS))
+                | (node_id << self.SEQUENCE_BITS)
+                | sequence
+            ),
+            13,
+        )
+
+
+class SequenceBlockIdGenerator(AbstractIdGenerator):
+    """Sequential record names allocated from a database sequence, encoded
+    in 13 characters. Each process reserves a block of values at once, so
+    that the database is only queried once per block.
+    """
+
+    collision_free = True
+
+    def __init__(self, sequence_name="local_id", block_size=1000):
+        """Initialize the generator.
+
+        Args:
+            sequence_name: str - Name of the database sequence.
+            block_size: int - Number of values reserved at once.
+        """
+        if block_size < 1:
+            raise exceptions.CoreError("Block size must be positive.")
+
+        self.sequence_name = sequence_name
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next_value = 0
+        self._block_end = 0
+
+    def generate(self):
+        """Generate the next record name of the current block, reserving a
+        new block if needed.
+
+        Returns:
+            str - New record name.
+        """
+        with self._lock:
+            if self._next_value >= self._block_end:
+                self._next_value = local_id_sequence_system_api.reserve_block(
+                    self.sequence_name, self.block_size
+                )
+                self._block_end = self._next_value + self.block_size
+
+            value = self._next_value
+            self._next_value += 1
+
+        return encode_base32(value, 13)
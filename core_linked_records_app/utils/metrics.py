@@ -0,0 +1,555 @@
+"""Metrics of the PID operations.
+
+Counters and latency histograms are recorded in a registry built from the
+`PID_METRICS_REGISTRY` setting, shared by the threads of the process, and
+exposed in the Prometheus text format. Statistics kept elsewhere in the app,
+such as the hits of the caches, are read by collectors when the metrics are
+rendered, so that they cost nothing on the hot paths.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from importlib import import_module
+
+from core_linked_records_app import settings
+
+logger = logging.getLogger(__name__)
+
+WATCHER_DURATION_METRIC = "pid_watcher_duration_seconds"
+WATCHER_STAGE_METRIC = "pid_watcher_stage_duration_seconds"
+PROVIDER_DURATION_METRIC = "pid_provider_request_duration_seconds"
+PROVIDER_REQUESTS_METRIC = "pid_provider_requests_total"
+RESOLVER_DURATION_METRIC = "pid_resolver_request_duration_seconds"
+RESOLVER_REQUESTS_METRIC = "pid_resolver_requests_total"
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _get_label_key(labels):
+    """Build a hashable key from the labels of a metric.
+
+    Args:
+        labels: dict - Label names mapped to their values, or None.
+
+    Returns:
+        tuple - Label names and values, sorted by name.
+    """
+    if not labels:
+        return ()
+
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape_label_value(value):
+    """Escape a label value for the text exposition format.
+
+    Args:
+        value: str - Label value.
+
+    Returns:
+        str - Escaped value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name, label_key, value):
+    """Format a sample line of the text exposition format.
+
+    Args:
+        name: str - Name of the sample.
+        label_key: tuple - Label names and values.
+        value: int|float - Value of the sample.
+
+    Returns:
+        str - Sample line.
+    """
+    if label_key:
+        label_string = ",".join(
+            f'{label_name}="{_escape_label_value(label_value)}"'
+            for label_name, label_value in label_key
+        )
+        name = f"{name}{{{label_string}}}"
+
+    return f"{name} {value!r}"
+
+
+class AbstractMetricsRegistry(ABC):
+    """Registry of the metrics of the PID operations"""
+
+    @abstractmethod
+    def increment(self, name, labels=None, value=1):
+        """Increment a counter.
+
+        Args:
+            name: str - Name of the counter.
+            labels: dict - Labels of the counter.
+            value: int|float - Increment.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def observe(self, name, value, labels=None):
+        """Record a value in a histogram.
+
+        Args:
+            name: str - Name of the histogram.
+            value: float - Observed value, in seconds for durations.
+            labels: dict - Labels of the histogram.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def register_collector(self, collector):
+        """Register a function called when the metrics are rendered.
+
+        Args:
+            collector: Function returning an iterable of (name, type, labels,
+                value) tuples, the type being "counter" or "gauge".
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def render(self):
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str - Metrics.
+        """
+        raise NotImplementedError()
+
+    @contextmanager
+    def timer(self, name, labels=None):
+        """Record the duration of a block in a histogram, including when it
+        raises an exception.
+
+        Args:
+            name: str - Name of the histogram.
+            labels: dict - Labels of the histogram.
+        """
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time, labels)
+
+
+class NullMetricsRegistry(AbstractMetricsRegistry):
+    """Registry discarding all the metrics"""
+
+    def increment(self, name, labels=None, value=1):
+        """Discard the increment.
+
+        Args:
+            name:
+            labels:
+            value:
+        """
+
+    def observe(self, name, value, labels=None):
+        """Discard the value.
+
+        Args:
+            name:
+            value:
+            labels:
+        """
+
+    def register_collector(self, collector):
+        """Discard the collector.
+
+        Args:
+            collector:
+        """
+
+    def render(self):
+        """Render no metrics.
+
+        Returns:
+            str - Empty string.
+        """
+        return ""
+
+    @contextmanager
+    def timer(self, name, labels=None):
+        """Run the block without timing it.
+
+        Args:
+            name:
+            labels:
+        """
+        yield
+
+
+class _Histogram:
+    """Counts by bucket, sum and count of the values of a histogram"""
+
+    __slots__ = ("bucket_count_list", "total", "count")
+
+    def __init__(self, bucket_number):
+        # The last bucket counts the values greater than all the bounds.
+        self.bucket_count_list = [0] * (bucket_number + 1)
+        self.total = 0.0
+        self.count = 0
+
+
+class InMemoryMetricsRegistry(AbstractMetricsRegistry):
+    """Thread-safe registry keeping the metrics of the process in memory.
+    Recording a value is a dictionary lookup and an addition under a lock.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """Initialize the registry.
+
+        Args:
+            buckets: list<float> - Upper bounds of the histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def increment(self, name, labels=None, value=1):
+        """Increment a counter.
+
+        Args:
+            name: str - Name of the counter.
+            labels: dict - Labels of the counter.
+            value: int|float - Increment.
+        """
+        key = (name, _get_label_key(labels))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        """Record a value in a histogram.
+
+        Args:
+            name: str - Name of the histogram.
+            value: float - Observed value, in seconds for durations.
+            labels: dict - Labels of the histogram.
+        """
+        key = (name, _get_label_key(labels))
+        bucket_index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(
+                    len(self.buckets)
+                )
+
+            histogram.bucket_count_list[bucket_index] += 1
+            histogram.total += value
+            histogram.count += 1
+
+    def register_collector(self, collector):
+        """Register a function called when the metrics are rendered.
+
+        Args:
+            collector: Function returning an iterable of (name, type, labels,
+                value) tuples, the type being "counter" or "gauge".
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def clear(self):
+        """Reset the counters and the histograms, keeping the collectors."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def get_counter(self, name, labels=None):
+        """Retrieve the value of a counter.
+
+        Args:
+            name: str - Name of the counter.
+            labels: dict - Labels of the counter.
+
+        Returns:
+            int|float - Value of the counter, 0 if never incremented.
+        """
+        with self._lock:
+            return self._counters.get((name, _get_label_key(labels)), 0)
+
+    def get_histogram_count(self, name, labels=None):
+        """Retrieve the number of values recorded in a histogram.
+
+        Args:
+            name: str - Name of the histogram.
+            labels: dict - Labels of the histogram.
+
+        Returns:
+            int - Number of values, 0 if none were recorded.
+        """
+        with self._lock:
+            histogram = self._histograms.get((name, _get_label_key(labels)))
+
+            return histogram.count if histogram else 0
+
+    def _collect(self):
+        """Call the collectors, skipping the ones failing.
+
+        Returns:
+            dict - Samples by (name, type), as (label key, value) tuples.
+        """
+        with self._lock:
+            collector_list = list(self._collectors)
+
+        sample_dict = {}
+
+        for collector in collector_list:
+            try:
+                for name, metric_type, labels, value in collector():
+                    sample_dict.setdefault((name, metric_type), []).append(
+                        (_get_label_key(labels), value)
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning(
+                    "Metrics collector %s failed: %s", collector, str(exc)
+                )
+
+        return sample_dict
+
+    def render(self):
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str - Metrics.
+        """
+        # The values are copied under the lock and formatted outside of it,
+        # so that rendering does not block the recording threads.
+        with self._lock:
+            counter_list = list(self._counters.items())
+            histogram_list = [
+                (
+                    key,
+                    list(histogram.bucket_count_list),
+                    histogram.total,
+                    histogram.count,
+                )
+                for key, histogram in self._histograms.items()
+            ]
+
+        sample_dict = self._collect()
+
+        for (name, label_key), value in counter_list:
+            sample_dict.setdefault((name, "counter"), []).append(
+                (label_key, value)
+            )
+
+        line_list = []
+
+        for (name, metric_type), sample_list in sorted(sample_dict.items()):
+            line_list.append(f"# TYPE {name} {metric_type}")
+            line_list += [
+                _format_sample(name, label_key, value)
+                for label_key, value in sorted(sample_list)
+            ]
+
+        histogram_name = None
+        bound_list = [repr(bound) for bound in self.buckets] + ["+Inf"]
+
+        for (name, label_key), bucket_count_list, total, count in sorted(
+            histogram_list
+        ):
+            if name != histogram_name:
+                line_list.append(f"# TYPE {name} histogram")
+                histogram_name = name
+
+            cumulative_count = 0
+
+            for bound, bucket_count in zip(bound_list, bucket_count_list):
+                cumulative_count += bucket_count
+                line_list.append(
+                    _format_sample(
+                        f"{name}_bucket",
+                        label_key + (("le", bound),),
+                        cumulative_count,
+                    )
+                )
+
+            line_list.append(_format_sample(f"{name}_sum", label_key, total))
+            line_list.append(_format_sample(f"{name}_count", label_key, count))
+
+        return "\n".join(line_list) + "\n" if line_list else ""
+
+
+def collect_pid_stats():
+    """Read the statistics of the caches and of the PID assignments kept by
+    the app.
+
+    Returns:
+        list<tuple> - Samples, as (name, type, labels, value) tuples.
+    """
+    # Imported here, as the instrumented modules import this module.
+    from core_linked_records_app.system.local_id.api import local_id_cache
+    from core_linked_records_app.utils.cache import (
+        pid_config_cache,
+        unknown_pid_cache,
+    )
+    from core_linked_records_app.utils.data import (
+        get_parsed_content_stats,
+        get_pid_save_stats,
+    )
+    from core_linked_records_app.utils.xml import get_template_xsd_cache_info
+
+    sample_list = []
+
+    for cache_name, cache_info in (
+        ("template_xsd", get_template_xsd_cache_info()),
+        ("pid_config", pid_config_cache.info()),
+        ("local_id", local_id_cache.info()),
+        ("unknown_pid", unknown_pid_cache.info()),
+    ):
+        labels = {"cache": cache_name}
+        sample_list += [
+            ("pid_cache_hits_total", "counter", labels, cache_info["hits"]),
+            (
+                "pid_cache_misses_total",
+                "counter",
+                labels,
+                cache_info["misses"],
+            ),
+            ("pid_cache_entries", "gauge", labels, cache_info["size"]),
+        ]
+
+    sample_list += [
+        ("pid_data_saves_total", "counter", {"outcome": outcome}, count)
+        for outcome, count in get_pid_save_stats().items()
+    ]
+    sample_list += [
+        (
+            "pid_parsed_content_total",
+            "counter",
+            {"operation": operation},
+            count,
+        )
+        for operation, count in get_parsed_content_stats().items()
+    ]
+
+    return sample_list
+
+
+def build_metrics_registry(metrics_registry_config):
+    """Import the class of a metrics registry, instantiate it and register
+    the collector of the statistics of the app.
+
+    Args:
+        metrics_registry_config: dict - Class path and arguments of the
+            registry, or None to discard the metrics.
+
+    Returns:
+        AbstractMetricsRegistry - New registry instance.
+    """
+    if not metrics_registry_config:
+        return NullMetricsRegistry()
+
+    registry_classpath = metrics_registry_config["class"].split(".")
+    registry_module = import_module(".".join(registry_classpath[:-1]))
+    registry_class = getattr(registry_module, registry_classpath[-1])
+
+    metrics_registry = registry_class(*metrics_registry_config.get("args", []))
+    metrics_registry.register_collector(collect_pid_stats)
+
+    return metrics_registry
+
+
+@lru_cache(maxsize=1)
+def get_metrics_registry():
+    """Retrieve the metrics registry of the process, built from the
+    `PID_METRICS_REGISTRY` setting on first use.
+
+    Returns:
+        AbstractMetricsRegistry - Registry of the process.
+    """
+    return build_metrics_registry(settings.PID_METRICS_REGISTRY)
+
+
+def timed(name, labels=None):
+    """Decorate a function to record its duration in a histogram.
+
+    Args:
+        name: str - Name of the histogram.
+        labels: dict - Labels of the histogram.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with get_metrics_registry().timer(name, labels):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_provider_operation(operation):
+    """Decorate a method of a PID provider to record its latency, and count
+    its calls by status code. Calls raising an exception are counted with
+    the "error" status.
+
+    Args:
+        operation: str - Name of the operation.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(provider, *args, **kwargs):
+            metrics_registry = get_metrics_registry()
+            labels = {
+                "provider": provider.provider_name,
+                "operation": operation,
+            }
+            response_status = "error"
+            start_time = time.perf_counter()
+
+            try:
+                response = method(provider, *args, **kwargs)
+                response_status = (
+                    getattr(response, "status_code", None) or "unknown"
+                )
+                return response
+            finally:
+                metrics_registry.observe(
+                    PROVIDER_DURATION_METRIC,
+                    time.perf_counter() - start_time,
+                    labels,
+                )
+                metrics_registry.increment(
+                    PROVIDER_REQUESTS_METRIC,
+                    {**labels, "status": response_status},
+                )
+
+        return wrapper
+
+    return decorator
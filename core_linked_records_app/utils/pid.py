@@ -1,13 +1,23 @@
 """Utilities related to PID"""
 
 import re
+from functools import lru_cache
 
 from core_linked_records_app import settings
 from core_linked_records_app.utils.exceptions import (
     InvalidPrefixError,
     InvalidRecordError,
 )
-from core_linked_records_app.utils.providers import ProviderManager
+from core_linked_records_app.utils.providers import (
+    ProviderManager,
+    get_provider_prefix_list,
+)
+
+PID_RESOLUTION_FOUND = "found"
+PID_RESOLUTION_FORBIDDEN = "forbidden"
+PID_RESOLUTION_INVALID = "invalid"
+PID_RESOLUTION_NOT_FOUND = "not_found"
+PID_RESOLUTION_NOT_UNIQUE = "not_unique"
 
 
 def is_valid_pid_value(pid_value, pid_provider_name, pid_format):
@@ -27,11 +37,90 @@ def is_valid_pid_value(pid_value, pid_provider_name, pid_format):
     # Retrieve the active provider
     provider = ProviderManager().get(pid_provider_name)
 
-    # Build regexp and test if it matches the pid_value
-    pid_prefixes_regexp = "|".join(settings.ID_PROVIDER_PREFIXES)
-    pid_regexp_match = f"{provider.provider_lookup_url}/(?:{pid_prefixes_regexp})/{pid_format}"
+    pid_value_regex = get_pid_value_regex(
+        provider.provider_lookup_url,
+        tuple(get_provider_prefix_list(pid_provider_name)),
+        pid_format,
+    )
+
+    return pid_value_regex.match(pid_value) is not None
+
+
+def is_valid_routed_pid_value(pid_value, pid_format):
+    """Check if a provided PID has a valid URL for the provider owning its
+    lookup URL and prefix, found with the provider router.
+
+    Args:
+        pid_value: str - Value of the PID
+        pid_format: str - Regexp format of the record
 
-    return re.match(pid_regexp_match, pid_value) is not None
+    Returns:
+        bool - True if a provider owns the PID and the PID matches its
+            regexp, False otherwise.
+    """
+    if not pid_value or not isinstance(pid_value, str):
+        return False
+
+    provider_name = ProviderManager().find_provider_from_pid(pid_value)
+
+    if provider_name is None:
+        return False
+
+    return is_valid_pid_value(pid_value, provider_name, pid_format)
+
+
+@lru_cache(maxsize=32)
+def get_pid_value_regex(provider_lookup_url, prefix_tuple, pid_format):
+    """Build and compile the regexp matching the PIDs of a provider. Compiled
+    regexps are cached by parameters, so settings changes are picked up.
+
+    Args:
+        provider_lookup_url: str - Lookup URL of the provider
+        prefix_tuple: tuple<str> - Allowed prefixes
+        pid_format: str - Regexp format of the record
+
+    Returns:
+        re.Pattern - Compiled regexp
+    """
+    pid_prefixes_regexp = "|".join(prefix_tuple)
+
+    return re.compile(
+        f"{provider_lookup_url}/(?:{pid_prefixes_regexp})/{pid_format}"
+    )
+
+
+@lru_cache(maxsize=32)
+def get_record_regex(pid_format):
+    """Compile the regexp matching a record name, empty names included.
+
+    Args:
+        pid_format: str - Regexp format of the record
+
+    Returns:
+        re.Pattern - Compiled regexp
+    """
+    return re.compile(f"^({pid_format}|)$")
+
+
+def normalize_pid(pid_value):
+    """Normalize a PID value so it can be used as a lookup key.
+
+    Args:
+        pid_value: str - Value of the PID
+
+    Returns:
+        str|None - Normalized PID, None if the value is not a valid string.
+    """
+    if not isinstance(pid_value, str):
+        return None
+
+    pid_value = pid_value.strip()
+
+    # Clean up the PID if it ends with a '/'.
+    if pid_value.endswith("/"):
+        pid_value = pid_value[:-1]
+
+    return pid_value if pid_value else None
 
 
 def get_pid_settings_dict(pid_setting) -> dict:
@@ -53,11 +142,13 @@ def get_pid_settings_dict(pid_setting) -> dict:
     }
 
 
-def split_prefix_from_record(record):
+def split_prefix_from_record(record, provider_name=None):
     """Split prefix from record if the record is in prefix/record format.
 
     Args:
         record (str): The full prefix/record_name to be split
+        provider_name (str): Provider of the record, whose prefixes are
+            allowed. All the `ID_PROVIDER_PREFIXES` are allowed if None.
 
     Raises:
         InvalidPrefixError: If an undefined prefix is detected.
@@ -80,13 +171,19 @@ def split_prefix_from_record(record):
 
     # Assign default prefix if the prefix is undefined or not in the
     # list of authorized ones.
-    if prefix == "" or prefix not in settings.ID_PROVIDER_PREFIXES:
+    prefix_list = (
+        settings.ID_PROVIDER_PREFIXES
+        if provider_name is None
+        else get_provider_prefix_list(provider_name)
+    )
+
+    if prefix == "" or prefix not in prefix_list:
         raise InvalidPrefixError(f"Prefix {prefix} is not valid.")
 
     if (
         record is not None
         and record != ""
-        and re.match(f"^({settings.PID_FORMAT}|)$", record) is None
+        and get_record_regex(settings.PID_FORMAT).match(record) is None
     ):
         raise InvalidRecordError(f"Record {record} is not valid.")
 
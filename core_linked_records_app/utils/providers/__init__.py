@@ -1,23 +1,47 @@
 """Handle system abstract class"""
 
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
 from importlib import import_module
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.urls import reverse
+from requests import Response
 from rest_framework import status
 
 from core_linked_records_app import settings
+from core_linked_records_app.utils.exceptions import InvalidProviderError
+from core_linked_records_app.utils.trie import PrefixTrie
 from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import CoreError
 
 logger = logging.getLogger(__name__)
 
+# Provider instances shared by the whole process, by name and configuration.
+_provider_registry = dict()
+_provider_registry_lock = threading.Lock()
+_provider_router_cache = dict()
+
+PROVIDER_REGISTRY_SETTING_LIST = [
+    "ID_PROVIDER_SYSTEMS",
+    "ID_PROVIDER_SYSTEM_NAME",
+    "ID_PROVIDER_SYSTEM_CONFIG",
+    "ID_PROVIDER_PREFIXES",
+    "LOCAL_ID_GENERATOR",
+    "PID_FORMAT",
+    "ROOT_URLCONF",
+    "SERVER_URI",
+]
+
 
 class AbstractIdProvider(ABC):
     """Abstract Id Provider"""
 
     def __init__(self, provider_name, provider_lookup_url):
+        self.provider_name = provider_name
         core_linked_records_provider_records = reverse(
             "core_linked_records_provider_record",
             kwargs={"provider": provider_name, "record": ""},
@@ -48,6 +72,31 @@ class AbstractIdProvider(ABC):
         """
         raise NotImplementedError()
 
+    def create_many(self, prefix, count=None, records=None):
+        """Create several records at once, either `count` randomly generated
+        records or the records listed in `records`. Providers able to mint
+        records in bulk should override this method, the default
+        implementation calls `create` once per record.
+
+        Args:
+            prefix:
+            count:
+            records:
+
+        Returns:
+            Response - 201 if all records were created, 207 otherwise.
+        """
+        record_list = get_record_list_for_bulk_create(count, records)
+        record_content_list = []
+        all_created = True
+
+        for record in record_list:
+            provider_response = self.create(prefix, record)
+            record_content_list.append(json.loads(provider_response.content))
+            all_created &= status.is_success(provider_response.status_code)
+
+        return build_bulk_create_response(record_content_list, all_created)
+
     @abstractmethod
     def update(self, record):
         """update
@@ -69,7 +118,7 @@ class ProviderManager:
     """Manage provider instances from a given provider name"""
 
     def __init__(self):
-        self._provider_instance = None
+        self._provider_instance_dict = dict()
 
         self.provider_name = settings.ID_PROVIDER_SYSTEM_NAME
         self.provider_config = settings.ID_PROVIDER_SYSTEM_CONFIG
@@ -77,49 +126,292 @@ class ProviderManager:
     def get(self, provider_name=None) -> AbstractIdProvider:
         """get provider
         Args:
-            provider_name:
+            provider_name: Name of the provider, the default provider if None.
+
+        Raises:
+            InvalidProviderError: if the provider is not configured.
 
         Returns:
 
         """
-        if self._provider_instance is None:
-            # Retrieve class name and module path
-            id_provider_classpath = self.provider_config["class"].split(".")
-            id_provider_classname = id_provider_classpath[-1]
-            id_provider_modpath = ".".join(id_provider_classpath[:-1])
-
-            # Import module and class
-            id_provider_module = import_module(id_provider_modpath)
-            id_provider_class = getattr(
-                id_provider_module, id_provider_classname
-            )
-
-            # Initialize handle system instance, default to the system specified in
-            # settings.
-            if provider_name is None:
-                provider_name = settings.ID_PROVIDER_SYSTEM_NAME
-
-            self._provider_instance = id_provider_class(
-                provider_name, *settings.ID_PROVIDER_SYSTEM_CONFIG["args"]
+        # Default to the system specified in settings.
+        if provider_name is None:
+            provider_name = settings.ID_PROVIDER_SYSTEM_NAME
+
+        if provider_name not in self._provider_instance_dict:
+            self._provider_instance_dict[provider_name] = (
+                get_provider_instance(
+                    provider_name, get_provider_config(provider_name)
+                )
             )
 
-        return self._provider_instance
+        return self._provider_instance_dict[provider_name]
 
     def find_provider_from_pid(self, pid):
-        """find_provider_from_pid
+        """Find the provider of a PID, by longest match of the lookup URL
+        and prefix of the configured providers.
+
         Args:
             pid:
 
         Returns:
-
+            str - Name of the provider, None if no provider matches.
         """
-        provider = self.get(settings.ID_PROVIDER_SYSTEM_NAME)
+        return get_provider_router().find_longest_prefix(pid)
 
-        return (
-            settings.ID_PROVIDER_SYSTEM_NAME
-            if pid.startswith(provider.provider_lookup_url)
-            else None
-        )
+
+def get_provider_config_dict():
+    """Retrieve the configuration of all the providers, by name. Without
+    `ID_PROVIDER_SYSTEMS`, the only provider is the one configured by
+    `ID_PROVIDER_SYSTEM_NAME` and `ID_PROVIDER_SYSTEM_CONFIG`.
+
+    Returns:
+        dict - Configuration of the providers, by name.
+    """
+    if settings.ID_PROVIDER_SYSTEMS:
+        return settings.ID_PROVIDER_SYSTEMS
+
+    return {
+        settings.ID_PROVIDER_SYSTEM_NAME: settings.ID_PROVIDER_SYSTEM_CONFIG
+    }
+
+
+def get_provider_config(provider_name):
+    """Retrieve the configuration of a provider.
+
+    Args:
+        provider_name: str - Name of the provider.
+
+    Raises:
+        InvalidProviderError: if the provider is not configured.
+
+    Returns:
+        dict - Class path, arguments and prefixes of the provider.
+    """
+    try:
+        return get_provider_config_dict()[provider_name]
+    except KeyError as exc:
+        raise InvalidProviderError(
+            f"Provider {provider_name} is not configured."
+        ) from exc
+
+
+def get_provider_lookup_url_list():
+    """Retrieve the lookup URLs of all the providers.
+
+    Returns:
+        list<str> - Lookup URLs, without final slash.
+    """
+    return [
+        get_provider_instance(
+            provider_name, provider_config
+        ).provider_lookup_url
+        for provider_name, provider_config in get_provider_config_dict().items()
+    ]
+
+
+def get_provider_prefix_list(provider_name):
+    """Retrieve the prefixes allowed for a provider: the prefixes listed in
+    its configuration, all the `ID_PROVIDER_PREFIXES` otherwise.
+
+    Args:
+        provider_name: str - Name of the provider.
+
+    Returns:
+        list<str> - Prefixes of the provider.
+    """
+    return (
+        get_provider_config_dict()
+        .get(provider_name, {})
+        .get("prefixes", settings.ID_PROVIDER_PREFIXES)
+    )
+
+
+def build_provider_router():
+    """Build the trie routing PIDs to the name of their provider. The
+    lookup URL followed by a prefix routes to the provider of this prefix,
+    and the lookup URL alone routes to the first provider using it, the
+    default provider first.
+
+    Returns:
+        PrefixTrie - Provider names by PID prefix.
+    """
+    provider_config_dict = get_provider_config_dict()
+    provider_name_list = sorted(
+        provider_config_dict,
+        key=lambda name: name != settings.ID_PROVIDER_SYSTEM_NAME,
+    )
+    provider_router = PrefixTrie()
+
+    for provider_name in provider_name_list:
+        provider_config = provider_config_dict[provider_name]
+        provider = get_provider_instance(provider_name, provider_config)
+
+        provider_router.setdefault(provider.provider_lookup_url, provider_name)
+
+        for prefix in provider_config.get(
+            "prefixes", settings.ID_PROVIDER_PREFIXES
+        ):
+            provider_router.setdefault(
+                f"{provider.provider_lookup_url}/{prefix}/", provider_name
+            )
+
+    return provider_router
+
+
+def get_provider_router():
+    """Retrieve the provider router shared by the process, built again if the
+    provider settings have been replaced.
+
+    Returns:
+        PrefixTrie - Provider names by PID prefix.
+    """
+    # Settings objects are kept in the key so their identity stays unique.
+    router_key = (
+        settings.ID_PROVIDER_SYSTEMS,
+        settings.ID_PROVIDER_SYSTEM_NAME,
+        settings.ID_PROVIDER_SYSTEM_CONFIG,
+        settings.ID_PROVIDER_PREFIXES,
+        settings.SERVER_URI,
+    )
+    cached_router = _provider_router_cache.get("router")
+
+    if cached_router is not None and all(
+        cached_item is item
+        for cached_item, item in zip(cached_router[0], router_key)
+    ):
+        return cached_router[1]
+
+    provider_router = build_provider_router()
+    _provider_router_cache["router"] = (router_key, provider_router)
+
+    return provider_router
+
+
+def build_provider_instance(
+    provider_name, provider_config
+) -> AbstractIdProvider:
+    """Import the class of a provider and instantiate it.
+
+    Args:
+        provider_name: str - Name of the provider.
+        provider_config: dict - Class path and arguments of the provider.
+
+    Returns:
+        AbstractIdProvider - New provider instance.
+    """
+    # Retrieve class name and module path
+    id_provider_classpath = provider_config["class"].split(".")
+    id_provider_classname = id_provider_classpath[-1]
+    id_provider_modpath = ".".join(id_provider_classpath[:-1])
+
+    # Import module and class
+    id_provider_module = import_module(id_provider_modpath)
+    id_provider_class = getattr(id_provider_module, id_provider_classname)
+
+    return id_provider_class(provider_name, *provider_config["args"])
+
+
+def get_provider_instance(
+    provider_name, provider_config
+) -> AbstractIdProvider:
+    """Retrieve the provider instance shared by the process for a name and
+    a configuration, instantiating it on first use.
+
+    Args:
+        provider_name: str - Name of the provider.
+        provider_config: dict - Class path and arguments of the provider.
+
+    Returns:
+        AbstractIdProvider - Provider instance.
+    """
+    registry_key = (
+        provider_name,
+        provider_config["class"],
+        repr(provider_config["args"]),
+        settings.SERVER_URI,
+    )
+    provider_instance = _provider_registry.get(registry_key)
+
+    if provider_instance is None:
+        with _provider_registry_lock:
+            provider_instance = _provider_registry.get(registry_key)
+
+            if provider_instance is None:
+                provider_instance = build_provider_instance(
+                    provider_name, provider_config
+                )
+                _provider_registry[registry_key] = provider_instance
+
+    return provider_instance
+
+
+def clear_provider_registry():
+    """Remove all the provider instances shared by the process, so they are
+    instantiated again on next use.
+    """
+    with _provider_registry_lock:
+        _provider_registry.clear()
+        _provider_router_cache.clear()
+
+
+@receiver(setting_changed)
+def clear_provider_registry_on_setting_changed(setting, **kwargs):
+    """Clear the provider registry when a setting it depends on is changed.
+
+    Args:
+        setting: str - Name of the changed setting.
+        kwargs:
+    """
+    if setting in PROVIDER_REGISTRY_SETTING_LIST:
+        clear_provider_registry()
+
+
+def get_record_list_for_bulk_create(count=None, records=None):
+    """Build the list of records to create in bulk. A `None` record means the
+    record name has to be generated by the provider.
+
+    Args:
+        count: int - Number of records to generate.
+        records: list<str> - Record names to create.
+
+    Raises:
+        CoreError: if the parameters are invalid.
+
+    Returns:
+        list<str|None> - List of records to create.
+    """
+    if (count is None) == (records is None):
+        raise CoreError("Exactly one of count or records must be provided.")
+
+    if records is not None:
+        return list(records)
+
+    if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+        raise CoreError("Count must be a positive integer.")
+
+    return [None] * count
+
+
+def build_bulk_create_response(record_content_list, all_created):
+    """Build the provider response of a bulk record creation.
+
+    Args:
+        record_content_list: list<dict> - Content for each record.
+        all_created: bool - Whether all records have been created.
+
+    Returns:
+        Response - 201 if all records were created, 207 otherwise.
+    """
+    response = Response()
+    response.status_code = (
+        status.HTTP_201_CREATED
+        if all_created
+        else status.HTTP_207_MULTI_STATUS
+    )
+    response._content = json.dumps({"records": record_content_list})
+
+    return response
 
 
 def retrieve_provider_name(pid_value):
@@ -148,18 +440,28 @@ def retrieve_provider_name(pid_value):
     return provider_name
 
 
-def delete_record_from_provider(record_name: str):
-    """Delete a PID from the provider using the record name as stored in the
-    LocalId table.
+def delete_record_from_provider(pid: str):
+    """Delete a PID from its provider, found from the lookup URL and prefix
+    of the PID.
 
     Args:
-        record_name: str - Formatted as prefix/record.
+        pid: str - PID URL (e.g. https://pid-system.org/prefix/record).
 
     Raises:
-        ApiError: if the HTTP status is not 200 or 404.
+        CoreError: if no provider matches the PID, or if the HTTP status is
+            not 200 or 404.
     """
-    # Delete the given LocalID fron the default PID provider.
-    provider = ProviderManager().get()
+    provider_manager = ProviderManager()
+    provider_name = provider_manager.find_provider_from_pid(pid)
+
+    if provider_name is None:
+        error_message = f"No provider found for PID {pid}"
+        logger.error(error_message)
+        raise CoreError(error_message)
+
+    # Delete the prefix and record (e.g. prefix/record) from the provider.
+    provider = provider_manager.get(provider_name)
+    record_name = pid[len(provider.provider_lookup_url) :].strip("/")
     previous_pid_delete_response = provider.delete(record_name)
 
     if previous_pid_delete_response.status_code == status.HTTP_200_OK:
@@ -168,7 +470,7 @@ def delete_record_from_provider(record_name: str):
     # At this point, there was some problem deleting the LocalID needed to be logged.
     error_message = (
         f"Deletion of LocalID {record_name} from provider "
-        f"{ProviderManager().provider_name} returned "
+        f"{provider_name} returned "
         f"{previous_pid_delete_response.status_code}"
     )
 
@@ -1,15 +1,23 @@
 """Handle.net implementation class"""
 
+import asyncio
 import json
 import logging
 from base64 import b64encode
 
+from rest_framework import status
+
 from core_linked_records_app import settings
-from core_linked_records_app.utils.providers import AbstractIdProvider
-from core_main_app.utils.requests_utils.requests_utils import (
-    send_put_request,
-    send_delete_request,
-    send_get_request,
+from core_linked_records_app.utils.metrics import (
+    instrument_provider_operation,
+)
+from core_linked_records_app.utils.providers import (
+    AbstractIdProvider,
+    build_bulk_create_response,
+    get_record_list_for_bulk_create,
+)
+from core_linked_records_app.utils.providers.session import (
+    build_provider_session,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,6 +52,12 @@ class HandleNetSystem(AbstractIdProvider):
         self.auth_token = b64encode(
             f"{username}:{password}".encode("utf-8")
         ).decode("utf-8")
+        self.session = build_provider_session(
+            settings.HANDLE_NET_POOL_SIZE,
+            timeout=settings.HANDLE_NET_TIMEOUT,
+            max_retries=settings.HANDLE_NET_MAX_RETRIES,
+            backoff_factor=settings.HANDLE_NET_RETRY_BACKOFF_FACTOR,
+        )
         super().__init__(provider_name, provider_lookup_url)
 
     def _get_message_for_response_code(self, return_code):
@@ -85,6 +99,7 @@ class HandleNetSystem(AbstractIdProvider):
 
         return json.dumps(record_data)
 
+    @instrument_provider_operation("get")
     def get(self, record):
         """Retrieve an existring handle.net handle.
 
@@ -93,7 +108,7 @@ class HandleNetSystem(AbstractIdProvider):
 
         Returns:
         """
-        response = send_get_request(
+        response = self.session.get(
             f"{self.provider_lookup_url}/{self.registration_api}/{record}",
             headers={
                 "Content-Type": "application/json",
@@ -103,6 +118,7 @@ class HandleNetSystem(AbstractIdProvider):
         response._content = self._update_response_content(response)
         return response
 
+    @instrument_provider_operation("create")
     def create(self, prefix, record=None):
         """Create a new handle for a handle.net system.
 
@@ -119,21 +135,23 @@ class HandleNetSystem(AbstractIdProvider):
         else:
             request_url = f"{self.provider_registration_url}/{self.registration_api}/{prefix}/?overwrite=false&mintNewSuffix=true"
 
-        response = send_put_request(
+        response = self.session.put(
             request_url,
-            self._generate_record_data(f"{prefix}/{record}"),
+            data=self._generate_record_data(f"{prefix}/{record}"),
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Basic {str(self.auth_token)}",
             },
         )
 
-        if record is None:
+        # Only a minted handle is updated with its URL.
+        if record is None and response.ok:
             return self.update(response.json()["handle"])
 
         response._content = self._update_response_content(response)
         return response
 
+    @instrument_provider_operation("update")
     def update(self, record):
         """Update a handle for a handle.net system.
 
@@ -142,10 +160,10 @@ class HandleNetSystem(AbstractIdProvider):
 
         Returns:
         """
-        response = send_put_request(
+        response = self.session.put(
             f"{self.provider_registration_url}/{self.registration_api}/"
             f"{record}?overwrite=true",
-            self._generate_record_data(record, include_handle=True),
+            data=self._generate_record_data(record, include_handle=True),
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Basic {str(self.auth_token)}",
@@ -155,8 +173,84 @@ class HandleNetSystem(AbstractIdProvider):
         response._content = self._update_response_content(response)
         return response
 
+    @instrument_provider_operation("create_many")
+    def create_many(self, prefix, count=None, records=None):
+        """Create several handles, sending the requests concurrently when no
+        event loop is running in the current thread.
+
+        Args:
+            prefix:
+            count:
+            records:
+
+        Returns:
+            Response - 201 if all records were created, 207 otherwise.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.acreate_many(prefix, count, records))
+
+        return super().create_many(prefix, count, records)
+
+    async def acreate(self, prefix, record=None):
+        """Create a new handle without blocking the event loop.
+
+        Args:
+            prefix:
+            record:
+
+        Returns:
+        """
+        return await asyncio.to_thread(self.create, prefix, record)
+
+    async def aupdate(self, record):
+        """Update a handle without blocking the event loop.
+
+        Args:
+            record:
+
+        Returns:
+        """
+        return await asyncio.to_thread(self.update, record)
+
+    async def acreate_many(self, prefix, count=None, records=None):
+        """Create several handles, with at most
+        `HANDLE_NET_MAX_CONCURRENT_REQUESTS` creations in progress at the same
+        time over the session connection pool.
+
+        Args:
+            prefix:
+            count:
+            records:
+
+        Returns:
+            Response - 201 if all records were created, 207 otherwise.
+        """
+        record_list = get_record_list_for_bulk_create(count, records)
+        semaphore = asyncio.Semaphore(
+            settings.HANDLE_NET_MAX_CONCURRENT_REQUESTS
+        )
+
+        async def _create(record):
+            async with semaphore:
+                return await self.acreate(prefix, record)
+
+        response_list = await asyncio.gather(
+            *[_create(record) for record in record_list]
+        )
+
+        return build_bulk_create_response(
+            [json.loads(response.content) for response in response_list],
+            all(
+                status.is_success(response.status_code)
+                for response in response_list
+            ),
+        )
+
+    @instrument_provider_operation("delete")
     def delete(self, record):
-        response = send_delete_request(
+        response = self.session.delete(
             f"{self.provider_registration_url}/{self.registration_api}/{record}",
             headers={"Authorization": f"Basic {str(self.auth_token)}"},
         )
@@ -1,15 +1,23 @@
 """Local record system implementation"""
 
 import json
-import random
-import string
 
 from requests import Response
 from rest_framework import status
 
+from core_linked_records_app import settings
 from core_linked_records_app.components.local_id.models import LocalId
 from core_linked_records_app.system.local_id import api as local_id_system_api
-from core_linked_records_app.utils.providers import AbstractIdProvider
+from core_linked_records_app.utils.id_generator import build_id_generator
+from core_linked_records_app.utils.pid import get_record_regex
+from core_linked_records_app.utils.metrics import (
+    instrument_provider_operation,
+)
+from core_linked_records_app.utils.providers import (
+    AbstractIdProvider,
+    build_bulk_create_response,
+    get_record_list_for_bulk_create,
+)
 from core_main_app.commons import exceptions
 
 
@@ -22,16 +30,35 @@ class LocalIdProvider(AbstractIdProvider):
         "already_exist": "Record already exists",
     }
 
-    def __init__(self, provider_name):
+    def __init__(self, provider_name, id_generator_config=None):
+        """Initialize the provider.
+
+        Args:
+            provider_name: str - Name of the provider.
+            id_generator_config: dict - Class path and arguments of the
+                generator of record names, `LOCAL_ID_GENERATOR` if not set.
+        """
         super().__init__(provider_name, None)
 
-    @staticmethod
-    def _generate_id(length_id=16):
-        return "".join(
-            random.choice(string.ascii_uppercase + string.digits)
-            for _ in range(length_id)
+        self.id_generator = build_id_generator(
+            id_generator_config or settings.LOCAL_ID_GENERATOR
         )
 
+    def _generate_id(self):
+        """Generate a record name, checking that it matches `PID_FORMAT`.
+
+        Returns:
+            str - New record name.
+        """
+        record = self.id_generator.generate()
+
+        if not get_record_regex(settings.PID_FORMAT).match(record):
+            raise exceptions.CoreError(
+                f"Generated record '{record}' does not match PID_FORMAT."
+            )
+
+        return record
+
     def is_id_already_used(self, record):
         """is_id_already_used
         Args:
@@ -44,6 +71,7 @@ class LocalIdProvider(AbstractIdProvider):
             == self.messages["success"]
         )
 
+    @instrument_provider_operation("get")
     def get(self, record):
         """get
 
@@ -79,6 +107,7 @@ class LocalIdProvider(AbstractIdProvider):
 
         return response
 
+    @instrument_provider_operation("create")
     def create(self, prefix, record=None):
         """create
 
@@ -89,38 +118,150 @@ class LocalIdProvider(AbstractIdProvider):
         Returns:
         """
 
-        if record is None:
-            # FIXME: duplicate code with core_main_registry_app
-            # Create new record randomly
-            record = self._generate_id()
+        is_generated = record is None
 
-            # While the record exists, retry creation of record
-            while self.is_id_already_used(f"{prefix}/{record}"):
+        while True:
+            if is_generated:
+                # FIXME: duplicate code with core_main_registry_app
+                # Create new record randomly
                 record = self._generate_id()
 
-        record = f"{prefix}/{record}"
-        record_url = f"{self.provider_lookup_url}/{record}"
+                # While the record exists, retry creation of record
+                while (
+                    not self.id_generator.collision_free
+                    and self.is_id_already_used(f"{prefix}/{record}")
+                ):
+                    record = self._generate_id()
+
+            record_name = f"{prefix}/{record}"
+            response = Response()
+            response_content = {
+                "record": record_name,
+                "url": f"{self.provider_lookup_url}/{record_name}",
+            }
 
-        response = Response()
-        response_content = {
-            "record": record,
-            "url": record_url,
-        }
+            try:
+                local_id_system_api.insert(LocalId(record_name=record_name))
 
-        try:
-            record_object = LocalId(record_name=record)
+                response.status_code = status.HTTP_201_CREATED
+                response_content["message"] = self.messages["success"]
+            except exceptions.NotUniqueError:
+                # A generated record inserted by another writer since it was
+                # checked, or by another process sharing the node of a
+                # collision-free generator, is generated again.
+                if is_generated:
+                    continue
 
-            local_id_system_api.insert(record_object)
+                response.status_code = status.HTTP_409_CONFLICT
+                response_content["message"] = self.messages["already_exist"]
 
-            response.status_code = status.HTTP_201_CREATED
-            response_content["message"] = self.messages["success"]
-        except exceptions.NotUniqueError:
-            response.status_code = status.HTTP_409_CONFLICT
-            response_content["message"] = self.messages["already_exist"]
+            response._content = json.dumps(response_content)
+            return response
 
-        response._content = json.dumps(response_content)
-        return response
+    @instrument_provider_operation("create_many")
+    def create_many(self, prefix, count=None, records=None):
+        """Create several records using one query to detect collisions and one
+        query to insert the records. When generating records, only the
+        colliding candidates are regenerated.
+
+        Args:
+            prefix:
+            count:
+            records:
+
+        Returns:
+            Response - 201 if all records were created, 207 otherwise.
+        """
+        record_list = get_record_list_for_bulk_create(count, records)
+
+        if records is not None:
+            # Remove duplicates while keeping the order of the records.
+            record_name_list = list(
+                dict.fromkeys(f"{prefix}/{record}" for record in record_list)
+            )
+            existing_record_name_set = set(
+                local_id_system_api.get_record_name_list_by_name_list(
+                    record_name_list
+                )
+            )
+            new_record_name_list = [
+                record_name
+                for record_name in record_name_list
+                if record_name not in existing_record_name_set
+            ]
+            # Records inserted by a concurrent writer since the check
+            # already exist as well.
+            existing_record_name_set.update(
+                set(new_record_name_list).difference(
+                    self._insert_record_names(new_record_name_list)
+                )
+            )
+        else:
+            record_name_list = []
+            existing_record_name_set = set()
+
+            while len(record_name_list) < len(record_list):
+                candidate_set = {
+                    f"{prefix}/{self._generate_id()}"
+                    for _ in range(len(record_list) - len(record_name_list))
+                }.difference(record_name_list)
+
+                if not self.id_generator.collision_free:
+                    candidate_set.difference_update(
+                        local_id_system_api.get_record_name_list_by_name_list(
+                            list(candidate_set)
+                        )
+                    )
+
+                # Candidates inserted by a concurrent writer since the check,
+                # or colliding despite a collision-free generator, are not
+                # returned, and are regenerated.
+                record_name_list += self._insert_record_names(
+                    sorted(candidate_set)
+                )
+
+        record_content_list = [
+            {
+                "record": record_name,
+                "url": f"{self.provider_lookup_url}/{record_name}",
+                "message": (
+                    self.messages["already_exist"]
+                    if record_name in existing_record_name_set
+                    else self.messages["success"]
+                ),
+            }
+            for record_name in record_name_list
+        ]
+
+        return build_bulk_create_response(
+            record_content_list, not existing_record_name_set
+        )
+
+    @staticmethod
+    def _insert_record_names(record_name_list):
+        """Insert LocalId objects for the given record names.
+
+        Args:
+            record_name_list:
+
+        Returns:
+            list<str> - Record names inserted, without the ones already in
+                use.
+        """
+        if not record_name_list:
+            return []
+
+        return [
+            local_id_object.record_name
+            for local_id_object in local_id_system_api.insert_many(
+                [
+                    LocalId(record_name=record_name)
+                    for record_name in record_name_list
+                ]
+            )
+        ]
 
+    @instrument_provider_operation("update")
     def update(self, record):
         """update
 
@@ -144,6 +285,7 @@ class LocalIdProvider(AbstractIdProvider):
 
         return response
 
+    @instrument_provider_operation("delete")
     def delete(self, record):
         """delete
 
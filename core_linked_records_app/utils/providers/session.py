@@ -0,0 +1,70 @@
+"""HTTP session used by the remote ID providers"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core_main_app.settings import SSL_CERTIFICATES_DIR
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+# PUT requests are not retried: a handle minted by a request whose response
+# is lost would be minted again.
+RETRY_METHODS = frozenset(["GET", "DELETE"])
+
+
+class ProviderSession(requests.Session):
+    """Requests session applying a default timeout to every request"""
+
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+        self.verify = SSL_CERTIFICATES_DIR
+
+    def request(self, method, url, **kwargs):
+        """Send a request, using the session timeout if none is provided.
+
+        Args:
+            method:
+            url:
+            **kwargs:
+
+        Returns:
+            Response - Response of the request.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def build_provider_session(
+    pool_size, timeout=None, max_retries=0, backoff_factor=0
+):
+    """Build a session keeping up to `pool_size` connections alive per host
+    and retrying the idempotent requests on connection errors and 5xx
+    responses.
+
+    Args:
+        pool_size: int - Number of connections kept alive per host.
+        timeout: float|tuple - Default timeout of the requests, in seconds.
+        max_retries: int - Number of retries of a failed request.
+        backoff_factor: float - Factor of the exponential backoff between
+            retries, in seconds.
+
+    Returns:
+        ProviderSession - The configured session.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = ProviderSession(timeout=timeout)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
@@ -1,15 +1,43 @@
 """REST views for the query API"""
 
+import base64
+import binascii
+import json
+
+from django.db.models import QuerySet
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+
 from core_explore_common_app.rest.query.views import build_local_query
 from core_linked_records_app import settings
 from core_linked_records_app.components.pid_path import api as pid_path_api
 from core_linked_records_app.utils.dict import get_value_from_dot_notation
-from core_linked_records_app.utils.pid import is_valid_pid_value
+from core_linked_records_app.utils.exceptions import InvalidCursorError
+from core_linked_records_app.utils.pid import is_valid_routed_pid_value
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.exceptions import ApiError, CoreError
 from core_main_app.components.data import api as data_api
 
 
+def get_pid_path_list(request):
+    """Retrieve the PID paths of all the templates, and the default PID path.
+
+    Args:
+        request:
+
+    Returns:
+        list<str> - Distinct PID paths
+    """
+    return list(
+        dict.fromkeys(
+            [
+                pid_path_object.path
+                for pid_path_object in pid_path_api.get_all(request)
+            ]
+            + [settings.PID_PATH]
+        )
+    )
+
+
 def build_pid_query(query, build_fn, request):
     """Build the query by adding an extra filter to limit to document with
     PID fields.
@@ -26,10 +54,7 @@ def build_pid_query(query, build_fn, request):
     query = query["$and"] if "$and" in query.keys() else [query]
 
     # build PID query and append the raw query to it
-    pid_path_list = [
-        pid_path_object.path
-        for pid_path_object in pid_path_api.get_all(request)
-    ] + [settings.PID_PATH]
+    pid_path_list = get_pid_path_list(request)
     pid_query = {
         "$and": [
             {
@@ -74,42 +99,285 @@ def execute_pid_query(json_query, build_fn, execute_fn, request):
         raise ApiError(str(api_exception))
 
 
-def execute_local_query(raw_query, request):
-    """Execute the raw query in database
+def get_dict_content_value_expression(dot_notation):
+    """Build the database expression extracting, as text, the value at a dot
+    notation path of the `dict_content` JSON field.
 
     Args:
+        dot_notation: str - Path of the value
 
-        raw_query: Query to execute
+    Returns:
+        KeyTextTransform - Expression of the value
+    """
+    key_list = dot_notation.split(".")
+    expression = "dict_content"
+
+    for key in key_list[:-1]:
+        expression = KeyTransform(key, expression)
+
+    return KeyTextTransform(key_list[-1], expression)
+
+
+def iterate_query_result(
+    query_result,
+    select_related,
+    field_list,
+    mongo_field_list,
+    request,
+    after_pk=None,
+    limit=None,
+):
+    """Iterate over the results of a query, streaming them by chunks. Only the
+    given fields and the values at the PID paths are loaded, instead of the
+    whole content of the documents.
+
+    When a limit is given, the documents are ordered by primary key, and only
+    the ones after `after_pk` are returned, so that pages stay consistent
+    while documents are inserted.
+
+    With a Django queryset, the PID values are annotated on the documents,
+    under the aliases returned with the iterator. With a MongoDB queryset,
+    `dict_content` is projected on the PID paths.
+
+    Args:
+        query_result: QuerySet or iterable of documents
+        select_related: str - Relation loaded with the documents
+        field_list: list<str> - Fields to load from the database
+        mongo_field_list: list<str> - Fields to load from MongoDB
         request:
+        after_pk: Primary key of the last document of the previous page, None
+            for the first page
+        limit: int - Maximum number of documents, all the documents if None
 
     Returns:
-        Results of the query
+        tuple - Iterator over the documents, and aliases of the annotated PID
+            values by PID path
     """
-    pid_list = list()
-    data_list = data_api.execute_json_query(raw_query, request.user)
+    if isinstance(query_result, QuerySet):
+        pid_value_alias_dict = {
+            pid_path: f"pid_value_{index}"
+            for index, pid_path in enumerate(get_pid_path_list(request))
+        }
+        query_result = (
+            query_result.select_related(select_related)
+            .only(*field_list)
+            .annotate(
+                **{
+                    alias: get_dict_content_value_expression(pid_path)
+                    for pid_path, alias in pid_value_alias_dict.items()
+                }
+            )
+        )
 
-    for data in data_list:
-        pid_paths = pid_path_api.get_by_template(data.template, request.user)
+        if limit is not None:
+            query_result = _get_query_result_page(
+                query_result, after_pk, limit
+            )
+
+        return (
+            query_result.iterator(chunk_size=settings.PID_QUERY_CHUNK_SIZE),
+            pid_value_alias_dict,
+        )
 
-        for pid_path_object in pid_paths:
-            pid_path = pid_path_object.path
+    if hasattr(query_result, "only"):  # MongoDB queryset
+        query_result = query_result.only(
+            *mongo_field_list,
+            *[
+                f"dict_content.{pid_path}"
+                for pid_path in get_pid_path_list(request)
+            ],
+        )
 
-            data_pid = get_value_from_dot_notation(
-                data.get_dict_content(),
-                pid_path,
+        if limit is not None:
+            query_result = _get_query_result_page(
+                query_result, after_pk, limit
             )
 
-            if not is_valid_pid_value(
-                data_pid, settings.ID_PROVIDER_SYSTEM_NAME, settings.PID_FORMAT
-            ):
-                continue
+        return iter(query_result), dict()
 
-            pid_list.append(data_pid)
-            # Since only one PID is allowed per record across all paths,
-            # we stop searching once we find a valid one.
-            break
+    if limit is not None:
+        query_result = sorted(
+            (
+                document
+                for document in query_result
+                if after_pk is None or document.pk > after_pk
+            ),
+            key=lambda document: document.pk,
+        )[:limit]
+
+    return iter(query_result), dict()
+
+
+def _get_query_result_page(query_result, after_pk, limit):
+    """Restrict a Django or MongoDB queryset to a page of documents, ordered
+    by primary key.
+
+    Args:
+        query_result: QuerySet
+        after_pk: Primary key of the last document of the previous page, None
+            for the first page
+        limit: int - Maximum number of documents
+
+    Returns:
+        QuerySet - Documents of the page
+    """
+    query_result = query_result.order_by("pk")
+
+    if after_pk is not None:
+        query_result = query_result.filter(pk__gt=after_pk)
 
-    return pid_list
+    return query_result[:limit]
+
+
+def get_pid_value(document, pid_path, pid_value_alias_dict):
+    """Retrieve the value at a PID path of a document, from its annotations if
+    the value has been extracted by the database.
+
+    Args:
+        document:
+        pid_path: str - PID path
+        pid_value_alias_dict: dict - Aliases of the annotated PID values
+
+    Returns:
+        Value at the PID path
+    """
+    if pid_path in pid_value_alias_dict:
+        return getattr(document, pid_value_alias_dict[pid_path])
+
+    return get_value_from_dot_notation(document.get_dict_content(), pid_path)
+
+
+def get_template_pid_path_list(
+    template_key, load_template, pid_path_list_dict, user
+):
+    """Retrieve the PID paths of a template, only loading the template and
+    querying its paths the first time its key is seen.
+
+    Args:
+        template_key: ID of the template, or of the object it is read from
+        load_template: Function without arguments loading the template
+        pid_path_list_dict: dict - PID paths already retrieved, by key
+        user:
+
+    Returns:
+        list<str> - PID paths of the template
+    """
+    if template_key is None:
+        return [settings.PID_PATH]
+
+    if template_key not in pid_path_list_dict:
+        template = load_template()
+        pid_path_list_dict[template_key] = (
+            [settings.PID_PATH]
+            if template is None
+            else [
+                pid_path_object.path
+                for pid_path_object in pid_path_api.get_by_template(
+                    template, user
+                )
+            ]
+        )
+
+    return pid_path_list_dict[template_key]
+
+
+def _get_harvester_metadata_format_id(oai_record):
+    """Retrieve the ID of the metadata format of an OAI record, without
+    loading the metadata format.
+
+    Args:
+        oai_record: OaiRecord from the database or from MongoDB
+
+    Returns:
+        int - ID of the metadata format
+    """
+    # MongoDB documents only have the raw field.
+    if hasattr(oai_record, "_harvester_metadata_format_id"):
+        return oai_record._harvester_metadata_format_id
+
+    return oai_record.harvester_metadata_format_id
+
+
+def iterate_local_query_document_pids(
+    raw_query, request, after_pk=None, limit=None
+):
+    """Execute the raw query in database and iterate over the results,
+    yielding the primary key and the valid PID of each document, or None if
+    it has none.
+
+    Args:
+        raw_query: Query to execute
+        request:
+        after_pk: Primary key of the last document of the previous page
+        limit: int - Maximum number of documents, ordered by primary key
+
+    Returns:
+        Iterator over the primary keys and PIDs of the documents
+    """
+    pid_path_list_dict = dict()
+    data_iterator, pid_value_alias_dict = iterate_query_result(
+        data_api.execute_json_query(raw_query, request.user),
+        "template",
+        ["id", "template__user"],
+        ["_template_id"],
+        request,
+        after_pk,
+        limit,
+    )
+
+    for data in data_iterator:
+        found_pid = None
+
+        # The template is only loaded for the first document using it.
+        for pid_path in get_template_pid_path_list(
+            data.template_id,
+            lambda: data.template,
+            pid_path_list_dict,
+            request.user,
+        ):
+            data_pid = get_pid_value(data, pid_path, pid_value_alias_dict)
+
+            if is_valid_routed_pid_value(data_pid, settings.PID_FORMAT):
+                # Since only one PID is allowed per record across all paths,
+                # we stop searching once we find a valid one.
+                found_pid = data_pid
+                break
+
+        yield data.pk, found_pid
+
+
+def iterate_local_query_pids(raw_query, request):
+    """Execute the raw query in database and iterate over the valid PIDs of
+    the results.
+
+    Args:
+        raw_query: Query to execute
+        request:
+
+    Returns:
+        Iterator over the PIDs
+    """
+    return (
+        data_pid
+        for _, data_pid in iterate_local_query_document_pids(
+            raw_query, request
+        )
+        if data_pid is not None
+    )
+
+
+def execute_local_query(raw_query, request):
+    """Execute the raw query in database
+
+    Args:
+
+        raw_query: Query to execute
+        request:
+
+    Returns:
+        Results of the query
+    """
+    return list(iterate_local_query_pids(raw_query, request))
 
 
 def execute_local_pid_query(json_query, request):
@@ -127,15 +395,21 @@ def execute_local_pid_query(json_query, request):
     )
 
 
-def execute_oaipmh_query(raw_query, request):
-    """Execute the raw query in database
+def iterate_oaipmh_query_document_pids(
+    raw_query, request, after_pk=None, limit=None
+):
+    """Execute the raw query in database and iterate over the results,
+    yielding the primary key and the PID of each document, or None if it has
+    none.
 
     Args:
         raw_query: Query to execute
         request:
+        after_pk: Primary key of the last document of the previous page
+        limit: int - Maximum number of documents, ordered by primary key
 
     Returns:
-        Results of the query
+        Iterator over the primary keys and PIDs of the documents
     """
     if "core_oaipmh_harvester_app" not in settings.INSTALLED_APPS:
         raise CoreError(
@@ -146,31 +420,69 @@ def execute_oaipmh_query(raw_query, request):
         api as oai_record_api,
     )
 
-    pid_list = list()
-    data_list = oai_record_api.execute_json_query(raw_query, request.user)
+    pid_path_list_dict = dict()
+    data_iterator, pid_value_alias_dict = iterate_query_result(
+        oai_record_api.execute_json_query(raw_query, request.user),
+        "harvester_metadata_format__template",
+        ["id", "harvester_metadata_format__template__user"],
+        ["_harvester_metadata_format_id"],
+        request,
+        after_pk,
+        limit,
+    )
 
-    for data in data_list:
-        pid_paths = pid_path_api.get_by_template(
-            data.harvester_metadata_format.template, request.user
-        )
+    for data in data_iterator:
+        found_pid = None
 
-        for pid_path_object in pid_paths:
-            pid_path = pid_path_object.path
+        # The metadata format is only loaded for the first record using it.
+        for pid_path in get_template_pid_path_list(
+            _get_harvester_metadata_format_id(data),
+            lambda: data.harvester_metadata_format.template,
+            pid_path_list_dict,
+            request.user,
+        ):
+            data_pid = get_pid_value(data, pid_path, pid_value_alias_dict)
 
-            data_pid = get_value_from_dot_notation(
-                data.get_dict_content(),
-                pid_path,
-            )
+            if data_pid:
+                # Since only one PID is allowed per record across all paths,
+                # we stop searching once we find a valid one.
+                found_pid = data_pid
+                break
 
-            if not data_pid:
-                continue
+        yield data.pk, found_pid
 
-            pid_list.append(data_pid)
-            # Since only one PID is allowed per record across all paths,
-            # we stop searching once we find a valid one.
-            break
 
-    return pid_list
+def iterate_oaipmh_query_pids(raw_query, request):
+    """Execute the raw query in database and iterate over the PIDs of the
+    results.
+
+    Args:
+        raw_query: Query to execute
+        request:
+
+    Returns:
+        Iterator over the PIDs
+    """
+    return (
+        data_pid
+        for _, data_pid in iterate_oaipmh_query_document_pids(
+            raw_query, request
+        )
+        if data_pid is not None
+    )
+
+
+def execute_oaipmh_query(raw_query, request):
+    """Execute the raw query in database
+
+    Args:
+        raw_query: Query to execute
+        request:
+
+    Returns:
+        Results of the query
+    """
+    return list(iterate_oaipmh_query_pids(raw_query, request))
 
 
 def execute_oaipmh_pid_query(json_query, request):
@@ -193,3 +505,200 @@ def execute_oaipmh_pid_query(json_query, request):
     return execute_pid_query(
         json_query, build_oaipmh_query, execute_oaipmh_query, request
     )
+
+
+def encode_pid_query_cursor(last_pk):
+    """Encode the position of a page of PIDs as an opaque cursor.
+
+    Args:
+        last_pk: int - Primary key of the last document before the page
+
+    Returns:
+        str - Cursor of the page
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps({"last_pk": last_pk}).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_pid_query_cursor(cursor):
+    """Decode the position of a page of PIDs from its cursor.
+
+    Args:
+        cursor: str - Cursor of the page, None for the first page
+
+    Raises:
+        InvalidCursorError: The cursor is not valid.
+
+    Returns:
+        int - Primary key of the last document before the page, None for the
+            first page
+    """
+    if cursor is None:
+        return None
+
+    try:
+        last_pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))[
+            "last_pk"
+        ]
+    except (
+        binascii.Error,
+        KeyError,
+        TypeError,
+        UnicodeError,
+        ValueError,
+    ) as exc:
+        raise InvalidCursorError("Invalid cursor.") from exc
+
+    if not isinstance(last_pk, int) or isinstance(last_pk, bool):
+        raise InvalidCursorError("Invalid cursor.")
+
+    return last_pk
+
+
+def get_query_pid_page(
+    iterate_document_pids_fn, raw_query, request, cursor, page_size
+):
+    """Retrieve a page of the PIDs of the results of a query. A page covers
+    `page_size` documents, so it holds fewer PIDs if some documents have
+    none. Documents are ordered by primary key, and the cursor holds the
+    primary key of the last document of the page, so that documents
+    inserted while paging are neither skipped nor repeated.
+
+    Args:
+        iterate_document_pids_fn: Function iterating over the primary keys
+            and PIDs of the documents of a query
+        raw_query: Query to execute
+        request:
+        cursor: str - Cursor of the page, None for the first page
+        page_size: int - Number of documents in the page
+
+    Returns:
+        dict - PIDs of the page, and cursor of the next page or None
+    """
+    last_pk = decode_pid_query_cursor(cursor)
+    pid_list = list()
+    document_count = 0
+
+    # Read one more document to know if there is a next page.
+    for document_pk, data_pid in iterate_document_pids_fn(
+        raw_query, request, last_pk, page_size + 1
+    ):
+        document_count += 1
+
+        if document_count > page_size:
+            break
+
+        last_pk = document_pk
+
+        if data_pid is not None:
+            pid_list.append(data_pid)
+
+    return {
+        "pids": pid_list,
+        "next": (
+            encode_pid_query_cursor(last_pk)
+            if document_count > page_size
+            else None
+        ),
+    }
+
+
+def iterate_local_pid_query(json_query, request):
+    """Iterate over the PIDs of the results of a query on a local data
+    source.
+
+    Args:
+        json_query:
+        request:
+
+    Returns:
+        Iterator over the PIDs
+    """
+    return execute_pid_query(
+        json_query, build_local_query, iterate_local_query_pids, request
+    )
+
+
+def get_local_pid_query_page(json_query, request, cursor, page_size):
+    """Retrieve a page of the PIDs of the results of a query on a local data
+    source.
+
+    Args:
+        json_query:
+        request:
+        cursor: str - Cursor of the page, None for the first page
+        page_size: int - Number of documents in the page
+
+    Returns:
+        dict - PIDs of the page, and cursor of the next page or None
+    """
+    return execute_pid_query(
+        json_query,
+        build_local_query,
+        lambda raw_query, request: get_query_pid_page(
+            iterate_local_query_document_pids,
+            raw_query,
+            request,
+            cursor,
+            page_size,
+        ),
+        request,
+    )
+
+
+def iterate_oaipmh_pid_query(json_query, request):
+    """Iterate over the PIDs of the results of a query on a OAI-PMH data
+    source.
+
+    Args:
+        json_query:
+        request:
+
+    Returns:
+        Iterator over the PIDs
+    """
+    if "core_explore_oaipmh_app" not in settings.INSTALLED_APPS:
+        raise CoreError(
+            "Missing dependency 'core_explore_oaipmh_app' in INSTALLED_APPS"
+        )
+
+    from core_explore_oaipmh_app.rest.query.views import build_oaipmh_query
+
+    return execute_pid_query(
+        json_query, build_oaipmh_query, iterate_oaipmh_query_pids, request
+    )
+
+
+def get_oaipmh_pid_query_page(json_query, request, cursor, page_size):
+    """Retrieve a page of the PIDs of the results of a query on a OAI-PMH
+    data source.
+
+    Args:
+        json_query:
+        request:
+        cursor: str - Cursor of the page, None for the first page
+        page_size: int - Number of documents in the page
+
+    Returns:
+        dict - PIDs of the page, and cursor of the next page or None
+    """
+    if "core_explore_oaipmh_app" not in settings.INSTALLED_APPS:
+        raise CoreError(
+            "Missing dependency 'core_explore_oaipmh_app' in INSTALLED_APPS"
+        )
+
+    from core_explore_oaipmh_app.rest.query.views import build_oaipmh_query
+
+    return execute_pid_query(
+        json_query,
+        build_oaipmh_query,
+        lambda raw_query, request: get_query_pid_page(
+            iterate_oaipmh_query_document_pids,
+            raw_query,
+            request,
+            cursor,
+            page_size,
+        ),
+        request,
+    )
@@ -0,0 +1,111 @@
+"""Response utilities functions for the PID list views."""
+
+import json
+import logging
+import re
+from itertools import chain, islice
+
+from django.http import StreamingHttpResponse
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils.exceptions import InvalidCursorError
+from core_linked_records_app.utils.query import decode_pid_query_cursor
+
+logger = logging.getLogger(__name__)
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+ID_REGEX = re.compile(r"^[0-9]+$")
+
+
+def is_streaming_requested(request):
+    """Check if the client requested a streamed response, with the `stream`
+    query parameter.
+
+    Args:
+        request:
+
+    Returns:
+        bool - Whether the response should be streamed.
+    """
+    return request.GET.get("stream", "").lower() in ("true", "1")
+
+
+def is_id_list_valid(id_list):
+    """Check that a list only contains document IDs, as integers or strings
+    of digits.
+
+    Args:
+        id_list: list - IDs provided in the request.
+
+    Returns:
+        bool - Whether all the IDs are valid.
+    """
+    return all(
+        (isinstance(id_value, int) and not isinstance(id_value, bool))
+        or (isinstance(id_value, str) and ID_REGEX.match(id_value))
+        for id_value in id_list
+    )
+
+
+def get_page_parameters(request):
+    """Retrieve the pagination parameters of a request, from the `cursor` and
+    `page_size` query parameters.
+
+    Args:
+        request:
+
+    Raises:
+        InvalidCursorError: The cursor or the page size is not valid.
+
+    Returns:
+        tuple - Cursor and page size, or None if no page is requested.
+    """
+    if "cursor" not in request.GET and "page_size" not in request.GET:
+        return None
+
+    cursor = request.GET.get("cursor") or None
+    decode_pid_query_cursor(cursor)
+
+    try:
+        page_size = int(
+            request.GET.get("page_size", settings.PID_QUERY_PAGE_SIZE)
+        )
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid page size.") from exc
+
+    if not 0 < page_size <= settings.PID_QUERY_MAX_PAGE_SIZE:
+        raise InvalidCursorError(
+            "The page size must be between 1 and "
+            f"{settings.PID_QUERY_MAX_PAGE_SIZE}."
+        )
+
+    return cursor, page_size
+
+
+def build_ndjson_streaming_response(item_iterator):
+    """Build a response streaming the items as newline delimited JSON.
+
+    The first item is read before building the response, so that errors
+    occurring when starting the iteration can still be returned with an error
+    status. Errors occurring afterwards end the stream with an `error` line.
+
+    Args:
+        item_iterator: Iterator over JSON serializable items
+
+    Returns:
+        StreamingHttpResponse - Response streaming the items.
+    """
+    item_iterator = iter(item_iterator)
+    first_item_list = list(islice(item_iterator, 1))
+
+    def _iterate_lines():
+        try:
+            for item in chain(first_item_list, item_iterator):
+                yield f"{json.dumps(item)}\n"
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Error while streaming PID list: %s", str(exc))
+            yield f"{json.dumps({'error': str(exc)})}\n"
+
+    return StreamingHttpResponse(
+        _iterate_lines(), content_type=NDJSON_CONTENT_TYPE
+    )
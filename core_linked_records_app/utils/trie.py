@@ -0,0 +1,53 @@
+"""Prefix trie utilities."""
+
+
+class PrefixTrie:
+    """Character trie mapping string prefixes to values. The longest prefix
+    of a string is found in a time proportional to the length of the string,
+    whatever the number of prefixes stored.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root = dict()
+        self._value_key = object()  # Marks the nodes ending a prefix.
+
+    def setdefault(self, prefix, value):
+        """Map a prefix to a value, unless the prefix is already mapped.
+
+        Args:
+            prefix: str - Prefix to map.
+            value: Value of the prefix.
+
+        Returns:
+            Value of the prefix.
+        """
+        node = self._root
+
+        for character in prefix:
+            node = node.setdefault(character, dict())
+
+        return node.setdefault(self._value_key, value)
+
+    def find_longest_prefix(self, string, default=None):
+        """Retrieve the value of the longest prefix of a string.
+
+        Args:
+            string: str - String to match.
+            default: Value returned if no prefix matches.
+
+        Returns:
+            Value of the longest matching prefix, or `default`.
+        """
+        node = self._root
+        value = node.get(self._value_key, default)
+
+        for character in string:
+            node = node.get(character)
+
+            if node is None:
+                break
+
+            value = node.get(self._value_key, value)
+
+        return value
@@ -0,0 +1,17 @@
+"""Worker process utilities.
+
+This module is imported by the worker processes before Django is set up, so
+it must not import any model.
+"""
+
+import django
+from django.db import connections
+
+
+def init_worker():
+    """Initialize a worker process. Django is set up, since a spawned process
+    starts from a fresh interpreter, and the database connections inherited
+    from a forked parent are closed so that they are not shared.
+    """
+    django.setup()
+    connections.close_all()
@@ -2,6 +2,10 @@
 
 import logging
 
+from lxml import etree
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils.cache import LRUCache
 from xml_utils.commons import exceptions as xml_utils_exceptions
 from core_main_app.utils.xml import validate_xml_data
 from xml_utils.xpath import create_tree_from_xpath
@@ -13,6 +17,8 @@ from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 logger = logging.getLogger(__name__)
 
+template_xsd_cache = LRUCache(settings.PID_XSD_CACHE_SIZE)
+
 
 def get_xpath_from_dot_notation(dot_notation_path):
     """Transform MongoDB dot notation to XPath
@@ -65,8 +71,21 @@ def get_xpath_with_target_namespace(xpath, xsd_string):
     Returns:
 
     """
-    target_namespace = get_target_namespace_for_xsd_string(xsd_string)
+    return format_xpath_with_target_namespace(
+        xpath, get_target_namespace_for_xsd_string(xsd_string)
+    )
+
+
+def format_xpath_with_target_namespace(xpath, target_namespace):
+    """Adds an already retrieved target namespace to a given XPath
+
+    Params:
+        xpath:
+        target_namespace:
+
+    Returns:
 
+    """
     xpath = xpath.format(
         list(target_namespace.keys())[0]
         if target_namespace is not None
@@ -79,7 +98,104 @@ def get_xpath_with_target_namespace(xpath, xsd_string):
     return xpath
 
 
-def set_value_at_xpath(xml_tree, xpath, value, namespaces):
+def _get_template_xsd_cache_entry(template):
+    """Retrieve the cache entry of a template, creating it if the template is
+    not cached or has changed since it was cached.
+
+    Params:
+        template:
+
+    Returns:
+        dict - Cache entry of the template.
+    """
+    cache_entry = template_xsd_cache.get(template.pk)
+
+    if cache_entry is None or cache_entry["hash"] != template.hash:
+        cache_entry = {
+            "hash": template.hash,
+            "target_namespace": get_target_namespace_for_xsd_string(
+                template.content
+            ),
+            "xsd_tree": None,
+            "xpaths": {},
+        }
+
+        if template.pk is not None:
+            template_xsd_cache.set(template.pk, cache_entry)
+
+    return cache_entry
+
+
+def get_xsd_tree_for_template(template):
+    """Retrieve the parsed XSD of a template, kept in `template_xsd_cache`
+    until the template changes. The returned tree must not be modified.
+
+    Params:
+        template:
+
+    Returns:
+        lxml.etree.ElementTree - Parsed XSD.
+    """
+    cache_entry = _get_template_xsd_cache_entry(template)
+
+    if cache_entry["xsd_tree"] is None:
+        cache_entry["xsd_tree"] = XSDTree.build_tree(template.content)
+
+    return cache_entry["xsd_tree"]
+
+
+def get_pid_xpath_for_template(template, dot_notation_path):
+    """Retrieve the XPath of a PID path for an XSD template, along with the
+    template target namespace and the compiled XPath. The target namespace is
+    parsed once per template and each XPath is compiled once per PID path,
+    then both are kept in `template_xsd_cache` until the template changes.
+
+    Params:
+        template:
+        dot_notation_path:
+
+    Returns:
+        tuple(str, dict|None, lxml.etree.XPath) - XPath, target namespace and
+            compiled XPath.
+    """
+    cache_entry = _get_template_xsd_cache_entry(template)
+    target_namespace = cache_entry["target_namespace"]
+    xpath_entry = cache_entry["xpaths"].get(dot_notation_path)
+
+    if xpath_entry is None:
+        xpath = format_xpath_with_target_namespace(
+            get_xpath_from_dot_notation(dot_notation_path), target_namespace
+        )
+        xpath_entry = (xpath, etree.XPath(xpath, namespaces=target_namespace))
+        cache_entry["xpaths"][dot_notation_path] = xpath_entry
+
+    return xpath_entry[0], target_namespace, xpath_entry[1]
+
+
+def invalidate_template_xsd_cache(template_id):
+    """Remove the cached target namespace and XPaths of a template.
+
+    Params:
+        template_id:
+
+    Returns:
+
+    """
+    template_xsd_cache.invalidate(template_id)
+
+
+def get_template_xsd_cache_info():
+    """Retrieve the hits, misses and size of the template XSD cache.
+
+    Returns:
+        dict - Statistics of the cache.
+    """
+    return template_xsd_cache.info()
+
+
+def set_value_at_xpath(
+    xml_tree, xpath, value, namespaces, compiled_xpath=None
+):
     """Set value for a given XPath
 
     Params:
@@ -87,12 +203,18 @@ def set_value_at_xpath(xml_tree, xpath, value, namespaces):
         xpath:
         value:
         namespaces:
+        compiled_xpath: Compiled version of `xpath`, used if provided.
 
     Returns:
 
     """
     try:
-        xml_tree.xpath(xpath, namespaces=namespaces)[0].text = value
+        xpath_element_list = (
+            compiled_xpath(xml_tree)
+            if compiled_xpath is not None
+            else xml_tree.xpath(xpath, namespaces=namespaces)
+        )
+        xpath_element_list[0].text = value
     except AttributeError:
         xpath_list = xpath.split("/")
         attribute = xpath_list[-1].replace("@", "")
@@ -103,18 +225,23 @@ def set_value_at_xpath(xml_tree, xpath, value, namespaces):
         )
 
 
-def get_value_at_xpath(xml_tree, xpath, namespaces):
+def get_value_at_xpath(xml_tree, xpath, namespaces, compiled_xpath=None):
     """Retrieve value in XML given a XPath
 
     Params:
         xml_tree:
         xpath:
         namespaces:
+        compiled_xpath: Compiled version of `xpath`, used if provided.
 
     Returns:
 
     """
-    xpath_element_list = xml_tree.xpath(xpath, namespaces=namespaces)
+    xpath_element_list = (
+        compiled_xpath(xml_tree)
+        if compiled_xpath is not None
+        else xml_tree.xpath(xpath, namespaces=namespaces)
+    )
 
     # Check that we found exactly one element matching the given xpath
     if len(xpath_element_list) != 1:
@@ -143,16 +270,39 @@ def can_create_value_at_xpath(xml_string, xsd_string, xpath, value):
         bool - True if the value can be created, False otherwise.
     """
     try:
-        # Replace the current by the modified tree (containing mock PID) and
-        # force document PID to be regenerated.
         target_namespace = get_target_namespace_for_xsd_string(xsd_string)
         xml_tree = XSDTree.build_tree(xml_string)
-
-        modified_xml_tree = create_tree_from_xpath(
-            xpath, xml_tree, target_namespace
-        )
-        set_value_at_xpath(modified_xml_tree, xpath, value, target_namespace)
         xsd_tree = XSDTree.build_tree(xsd_string)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.info("Function 'can_create_value_at_xpath' raised %s", str(exc))
+        return False
+
+    return can_create_value_at_xpath_in_tree(
+        xml_tree, xsd_tree, xpath, value, target_namespace
+    )
+
+
+def can_create_value_at_xpath_in_tree(
+    xml_tree, xsd_tree, xpath, value, namespaces
+):
+    """Evaluate if a value can be set in an already parsed XML document at a
+    given XPath. The document is not modified.
+
+    Params:
+        xml_tree:
+        xsd_tree:
+        xpath:
+        value:
+        namespaces:
+
+    Returns:
+        bool - True if the value can be created, False otherwise.
+    """
+    try:
+        # Validate a modified copy of the tree (containing mock PID), the
+        # original tree being left untouched.
+        modified_xml_tree = create_tree_from_xpath(xpath, xml_tree, namespaces)
+        set_value_at_xpath(modified_xml_tree, xpath, value, namespaces)
 
         validation_error = validate_xml_data(xsd_tree, modified_xml_tree)
         if validation_error is not None:
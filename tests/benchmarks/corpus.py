@@ -0,0 +1,243 @@
+"""Synthetic corpus of templates, documents and blobs for the benchmarks.
+
+Documents have `field_count` text fields and one PID, stored at one of the
+`pid_path_count` PID paths of their template so that every path is used.
+The records of the PIDs are inserted in bulk, and the documents are saved
+without assigning PIDs, so that the corpus is built quickly.
+"""
+
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+PID_RECORD_FORMAT = "BENCH{:08d}"
+FIELD_VALUE = "value"
+
+
+def build_xsd_template_content(field_count, pid_path_count):
+    """Build an XML schema with PID and text fields.
+
+    Args:
+        field_count: int - Number of text fields.
+        pid_path_count: int - Number of PID fields.
+
+    Returns:
+        str - Content of the schema.
+    """
+    element_list = [
+        f'<xs:element name="pid{index}" type="xs:string" minOccurs="0"/>'
+        for index in range(pid_path_count)
+    ] + [
+        f'<xs:element name="field{index}" type="xs:string"/>'
+        for index in range(field_count)
+    ]
+
+    return (
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        '<xs:element name="doc"><xs:complexType><xs:sequence>'
+        f"{''.join(element_list)}"
+        "</xs:sequence></xs:complexType></xs:element>"
+        "</xs:schema>"
+    )
+
+
+def build_xml_document(pid_index, pid_value, field_count):
+    """Build an XML document.
+
+    Args:
+        pid_index: int - Index of the PID field holding the PID.
+        pid_value: str - PID of the document, empty if not assigned.
+        field_count: int - Number of text fields.
+
+    Returns:
+        str - Content of the document.
+    """
+    field_list = [
+        f"<field{index}>{FIELD_VALUE}{index}</field{index}>"
+        for index in range(field_count)
+    ]
+
+    return (
+        f"<doc><pid{pid_index}>{pid_value}</pid{pid_index}>"
+        f"{''.join(field_list)}</doc>"
+    )
+
+
+def build_json_document(pid_index, pid_value, field_count):
+    """Build a JSON document.
+
+    Args:
+        pid_index: int - Index of the PID field holding the PID.
+        pid_value: str - PID of the document, empty if not assigned.
+        field_count: int - Number of text fields.
+
+    Returns:
+        str - Content of the document.
+    """
+    document = {f"pid{pid_index}": pid_value}
+    document.update(
+        {
+            f"field{index}": f"{FIELD_VALUE}{index}"
+            for index in range(field_count)
+        }
+    )
+
+    return json.dumps({"doc": document})
+
+
+def build_document(template_format, pid_index, pid_value, field_count):
+    """Build a document of the given format.
+
+    Args:
+        template_format: str - Format of the template, XSD or JSON.
+        pid_index: int - Index of the PID field holding the PID.
+        pid_value: str - PID of the document, empty if not assigned.
+        field_count: int - Number of text fields.
+
+    Returns:
+        str - Content of the document.
+    """
+    if template_format == "XSD":
+        return build_xml_document(pid_index, pid_value, field_count)
+
+    return build_json_document(pid_index, pid_value, field_count)
+
+
+def insert_template(template_format, field_count, pid_path_count):
+    """Insert a template and its PID paths.
+
+    Args:
+        template_format: str - Format of the template, XSD or JSON.
+        field_count: int - Number of text fields.
+        pid_path_count: int - Number of PID paths.
+
+    Returns:
+        Template - Inserted template.
+    """
+    from core_linked_records_app.components.pid_path.models import PidPath
+    from core_main_app.components.template.models import Template
+
+    template = Template(
+        format=template_format,
+        hash="",
+        filename=f"benchmark.{template_format.lower()}",
+    )
+    template.content = (
+        build_xsd_template_content(field_count, pid_path_count)
+        if template_format == "XSD"
+        else "{}"
+    )
+    template.save()
+
+    for index in range(pid_path_count):
+        PidPath(path=f"doc.pid{index}", template=template).save()
+
+    return template
+
+
+def insert_documents(
+    template, user, document_count, field_count, pid_path_count, start=0
+):
+    """Insert documents with a PID, and the records of their PIDs.
+
+    Args:
+        template: Template of the documents.
+        user: Owner of the documents.
+        document_count: int - Number of documents.
+        field_count: int - Number of text fields.
+        pid_path_count: int - Number of PID paths of the template.
+        start: int - Index of the first PID record.
+
+    Returns:
+        list<str> - PIDs of the documents.
+    """
+    from core_linked_records_app import settings
+    from core_linked_records_app.components.local_id.models import LocalId
+    from core_linked_records_app.utils.providers import ProviderManager
+    from core_main_app.components.data.models import Data
+    from core_main_app.system import api as system_api
+
+    provider = ProviderManager().get()
+    record_name_list = [
+        f"{settings.ID_PROVIDER_PREFIX_DEFAULT}/{PID_RECORD_FORMAT.format(index)}"
+        for index in range(start, start + document_count)
+    ]
+    LocalId.insert_many(
+        [LocalId(record_name=record_name) for record_name in record_name_list]
+    )
+    pid_list = []
+
+    for index, record_name in enumerate(record_name_list):
+        pid_value = f"{provider.provider_lookup_url}/{record_name}"
+        system_api.upsert_data(
+            Data(
+                template=template,
+                user_id=str(user.id),
+                title=f"benchmark_{start + index}",
+                content=build_document(
+                    template.format,
+                    index % pid_path_count,
+                    pid_value,
+                    field_count,
+                ),
+            )
+        )
+        pid_list.append(pid_value)
+
+    return pid_list
+
+
+def insert_blobs(user, blob_count):
+    """Insert blobs and assign them a PID.
+
+    Args:
+        user: Owner of the blobs.
+        blob_count: int - Number of blobs.
+
+    Returns:
+        list<str> - PIDs of the blobs.
+    """
+    from core_linked_records_app.system.blob import api as blob_system_api
+    from core_linked_records_app.utils.backfill import backfill_blob_batch
+    from core_linked_records_app.utils.providers import ProviderManager
+    from core_main_app.components.blob.models import Blob
+
+    blob_id_list = []
+
+    for index in range(blob_count):
+        blob = Blob(
+            filename=f"benchmark_{index}.txt",
+            user_id=str(user.id),
+            blob=SimpleUploadedFile(f"benchmark_{index}.txt", b"benchmark"),
+        )
+        blob.save()
+        blob_id_list.append(blob.pk)
+
+    backfill_blob_batch(blob_id_list)
+    provider_lookup_url = ProviderManager().get().provider_lookup_url
+
+    return [
+        f"{provider_lookup_url}/{local_id_object.record_name}"
+        for local_id_object in blob_system_api.get_pid_dict_for_blob_id_list(
+            [str(blob_id) for blob_id in blob_id_list]
+        ).values()
+    ]
+
+
+def build_blob_reference_document(blob_pid_list, field_count):
+    """Build an XML document referencing blobs by PID, among text fields.
+
+    Args:
+        blob_pid_list: list<str> - PIDs of the blobs.
+        field_count: int - Number of text fields.
+
+    Returns:
+        str - Content of the document.
+    """
+    field_list = [
+        f"<field{index}>{FIELD_VALUE}{index}</field{index}>"
+        for index in range(field_count)
+    ]
+    blob_list = [f"<blob>{blob_pid}</blob>" for blob_pid in blob_pid_list]
+
+    return f"<doc>{''.join(field_list)}{''.join(blob_list)}</doc>"
@@ -0,0 +1,333 @@
+"""Benchmark of the hot paths of the app on a synthetic corpus.
+
+Builds a corpus of XSD and JSON documents with PIDs, and blobs with PIDs, in
+a fresh database, then times the PID assignment of a new document, the
+lookup of a document by PID, the resolution of a PID by the provider view,
+the PID query on the local data source, the creation of a local record and
+the extraction of blob PIDs from a document.
+
+Results are printed as a table and can be written as JSON with `--output`.
+Passing the JSON results of a previous run with `--baseline` adds the ratio
+of the medians to the table, so that regressions are visible.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=tests.test_settings \
+        python -m tests.benchmarks.hotpaths [--documents N] [--fields N] \
+        [--pid-paths N] [--blobs N] [--number N] [--output FILE] \
+        [--baseline FILE]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from itertools import cycle
+
+import django
+
+from tests.benchmarks import corpus
+
+
+def _measure(function, number, setup=None):
+    """Time the calls of a function.
+
+    Args:
+        function: Function called with the value returned by `setup`.
+        number: int - Number of timed calls.
+        setup: Function preparing the argument of each call, not timed.
+
+    Returns:
+        dict - Statistics of the durations, in microseconds.
+    """
+    duration_list = []
+
+    # Untimed call, to fill the caches and check the function succeeds.
+    function(setup() if setup else None)
+
+    for _ in range(number):
+        argument = setup() if setup else None
+        start_time = time.perf_counter()
+        function(argument)
+        duration_list.append((time.perf_counter() - start_time) * 1e6)
+
+    duration_list.sort()
+
+    return {
+        "number": number,
+        "min_us": duration_list[0],
+        "median_us": statistics.median(duration_list),
+        "mean_us": statistics.fmean(duration_list),
+        "p95_us": duration_list[
+            min(len(duration_list) - 1, int(len(duration_list) * 0.95))
+        ],
+        "max_us": duration_list[-1],
+    }
+
+
+def _get_metadata(options):
+    """Describe the environment and the corpus of the run.
+
+    Args:
+        options: Parsed command line arguments.
+
+    Returns:
+        dict - Metadata of the run.
+    """
+    from django.db import connection
+
+    from core_linked_records_app import settings
+
+    try:
+        package_version = metadata.version("core_linked_records_app")
+    except metadata.PackageNotFoundError:
+        package_version = None
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "package_version": package_version,
+        "python_version": platform.python_version(),
+        "django_version": django.get_version(),
+        "platform": platform.platform(),
+        "database": connection.vendor,
+        "settings": {
+            "PID_CONFIG_CACHE_ENABLED": settings.PID_CONFIG_CACHE_ENABLED,
+            "LOCAL_ID_CACHE_SIZE": settings.LOCAL_ID_CACHE_SIZE,
+            "LOCAL_ID_GENERATOR": settings.LOCAL_ID_GENERATOR["class"],
+        },
+        "corpus": {
+            "documents": options.documents,
+            "fields": options.fields,
+            "pid_paths": options.pid_paths,
+            "blobs": options.blobs,
+        },
+    }
+
+
+def _build_benchmark_list(options, user):
+    """Build the corpus and the benchmarked functions.
+
+    Args:
+        options: Parsed command line arguments.
+        user: Superuser owning the corpus and sending the requests.
+
+    Returns:
+        list - Name, function and setup function of each benchmark.
+    """
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from core_linked_records_app import settings
+    from core_linked_records_app.components.data.watch import _set_data_pid
+    from core_linked_records_app.components.pid_settings.models import (
+        PidSettings,
+    )
+    from core_linked_records_app.rest.providers.views import (
+        ProviderRecordView,
+    )
+    from core_linked_records_app.system.data import api as data_system_api
+    from core_linked_records_app.system.pid_settings import (
+        api as pid_settings_system_api,
+    )
+    from core_linked_records_app.utils.blob import get_blob_download_regex
+    from core_linked_records_app.utils.providers import ProviderManager
+    from core_linked_records_app.utils.query import execute_local_pid_query
+    from core_main_app.components.data.models import Data
+
+    pid_settings = PidSettings(auto_set_pid=False)
+    pid_settings_system_api.upsert(pid_settings)
+
+    template_dict = {}
+    pid_list = []
+
+    for template_format in ("XSD", "JSON"):
+        template_dict[template_format] = corpus.insert_template(
+            template_format, options.fields, options.pid_paths
+        )
+        pid_list += corpus.insert_documents(
+            template_dict[template_format],
+            user,
+            options.documents,
+            options.fields,
+            options.pid_paths,
+            start=len(pid_list),
+        )
+
+    blob_pid_list = corpus.insert_blobs(user, options.blobs)
+    blob_reference_document = corpus.build_blob_reference_document(
+        blob_pid_list, options.fields
+    )
+
+    pid_settings.auto_set_pid = True
+    pid_settings_system_api.upsert(pid_settings)
+
+    provider = ProviderManager().get()
+    pid_iterator = cycle(pid_list)
+    request_factory = APIRequestFactory()
+    provider_record_view = ProviderRecordView.as_view()
+
+    def _build_new_data(template_format):
+        template = template_dict[template_format]
+
+        return Data(
+            template=template,
+            user_id=str(user.id),
+            title="benchmark_new",
+            content=corpus.build_document(
+                template.format, 0, "", options.fields
+            ),
+        )
+
+    def _build_request(path):
+        request = request_factory.get(path, HTTP_ACCEPT="application/json")
+        # Authenticates the views, and the functions reading `request.user`.
+        force_authenticate(request, user=user)
+        request.user = user
+        return request
+
+    def _get_provider_record(pid):
+        response = provider_record_view(
+            _build_request(pid.replace(settings.SERVER_URI, "")),
+            provider=settings.ID_PROVIDER_SYSTEM_NAME,
+            record=pid[len(provider.provider_lookup_url) + 1 :],
+        )
+        response.render()
+        assert response.status_code == 200, response.status_code
+
+    def _get_blob_download_regex(_):
+        result = get_blob_download_regex(blob_reference_document)
+        assert len(result) == len(blob_pid_list), len(result)
+
+    local_pid_query = {
+        "query": "{}",
+        "templates": json.dumps(
+            [{"id": template.pk} for template in template_dict.values()]
+        ),
+        "options": "{}",
+    }
+
+    return [
+        (
+            "set_data_pid_xsd",
+            _set_data_pid,
+            lambda: _build_new_data("XSD"),
+        ),
+        (
+            "set_data_pid_json",
+            _set_data_pid,
+            lambda: _build_new_data("JSON"),
+        ),
+        (
+            "get_data_by_pid",
+            data_system_api.get_data_by_pid,
+            lambda: next(pid_iterator),
+        ),
+        (
+            "provider_record_view_get",
+            _get_provider_record,
+            lambda: next(pid_iterator),
+        ),
+        (
+            "execute_local_pid_query",
+            lambda request: execute_local_pid_query(local_pid_query, request),
+            lambda: _build_request("/"),
+        ),
+        (
+            "local_id_provider_create",
+            lambda _: provider.create(settings.ID_PROVIDER_PREFIX_DEFAULT),
+            None,
+        ),
+        (
+            "get_blob_download_regex",
+            _get_blob_download_regex,
+            None,
+        ),
+    ]
+
+
+def _print_results(result_dict, baseline_dict):
+    """Print the results as a table.
+
+    Args:
+        result_dict: dict - Results of the run.
+        baseline_dict: dict - Results of a previous run, or None.
+    """
+    header = f"{'benchmark':<26} {'median (us)':>12} {'p95 (us)':>12}"
+
+    if baseline_dict:
+        header += f" {'ratio':>8}"
+
+    print(header)
+
+    for name, stats in result_dict["benchmarks"].items():
+        line = (
+            f"{name:<26} {stats['median_us']:>12.1f} {stats['p95_us']:>12.1f}"
+        )
+        baseline_stats = (baseline_dict or {}).get("benchmarks", {}).get(name)
+
+        if baseline_stats:
+            line += (
+                f" {stats['median_us'] / baseline_stats['median_us']:>8.2f}"
+            )
+
+        print(line)
+
+
+def main():
+    """Build the corpus, run the benchmarks and report the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--pid-paths", type=int, default=1)
+    parser.add_argument("--blobs", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    options = parser.parse_args()
+
+    if min(options.documents, options.pid_paths, options.number) < 1:
+        parser.error("documents, pid-paths and number must be positive.")
+
+    baseline_dict = None
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as baseline_file:
+            baseline_dict = json.load(baseline_file)
+
+    django.setup()
+
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.test.utils import override_settings
+
+    # Files of the templates, documents and blobs are written in a
+    # temporary directory.
+    with tempfile.TemporaryDirectory() as media_root, override_settings(
+        MEDIA_ROOT=media_root
+    ):
+        call_command("migrate", verbosity=0, interactive=False)
+        user = User.objects.create_superuser("benchmark", password="benchmark")
+
+        result_dict = _get_metadata(options)
+        result_dict["benchmarks"] = {
+            name: _measure(function, options.number, setup)
+            for name, function, setup in _build_benchmark_list(options, user)
+        }
+
+    _print_results(result_dict, baseline_dict)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            json.dump(result_dict, output_file, indent=2)
+    else:
+        json.dump(result_dict, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Micro-benchmark of the provider registry and the precompiled PID regexps.
+
+Compares the per-call cost of retrieving the provider and validating a PID
+when the provider is instantiated and the regexp built on each call, as
+before the registry, with the cached versions.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=tests.test_settings \
+        python -m tests.benchmarks.providers [--number N]
+"""
+
+import argparse
+import re
+import timeit
+
+import django
+
+
+def _uncached_get_provider():
+    from core_linked_records_app import settings
+    from core_linked_records_app.utils.providers import (
+        build_provider_instance,
+    )
+
+    return build_provider_instance(
+        settings.ID_PROVIDER_SYSTEM_NAME, settings.ID_PROVIDER_SYSTEM_CONFIG
+    )
+
+
+def _uncached_is_valid_pid_value(pid_value):
+    from core_linked_records_app import settings
+
+    provider = _uncached_get_provider()
+    pid_prefixes_regexp = "|".join(settings.ID_PROVIDER_PREFIXES)
+    pid_regexp_match = (
+        f"{provider.provider_lookup_url}/(?:{pid_prefixes_regexp})/"
+        f"{settings.PID_FORMAT}"
+    )
+
+    return re.match(pid_regexp_match, pid_value) is not None
+
+
+def _time_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    """Run the benchmark and print the per-call durations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10000)
+    number = parser.parse_args().number
+
+    django.setup()
+
+    from core_linked_records_app import settings
+    from core_linked_records_app.utils.pid import is_valid_pid_value
+    from core_linked_records_app.utils.providers import ProviderManager
+
+    pid_value = (
+        f"{ProviderManager().get().provider_lookup_url}/"
+        f"{settings.ID_PROVIDER_PREFIXES[0]}/PID0001"
+    )
+    benchmark_list = [
+        (
+            "get_provider",
+            _uncached_get_provider,
+            lambda: ProviderManager().get(),
+        ),
+        (
+            "is_valid_pid_value",
+            lambda: _uncached_is_valid_pid_value(pid_value),
+            lambda: is_valid_pid_value(
+                pid_value,
+                settings.ID_PROVIDER_SYSTEM_NAME,
+                settings.PID_FORMAT,
+            ),
+        ),
+    ]
+
+    print(f"{'benchmark':<20} {'before (us)':>12} {'after (us)':>12}")
+    for name, before_func, after_func in benchmark_list:
+        before = _time_per_call(before_func, number) * 1e6
+        after = _time_per_call(after_func, number) * 1e6
+        print(f"{name:<20} {before:>12.2f} {after:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
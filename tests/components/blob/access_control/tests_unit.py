@@ -233,3 +233,44 @@ class TestCanSetPidForBlob(TestCase):
             self.mock_kwargs["blob_pid"],
             self.mock_kwargs["user"],
         )
+
+
+class TestCanGetPidDictForBlobIdList(TestCase):
+    """Unit tests for `can_get_pid_dict_for_blob_id_list` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.mock_func = MagicMock()
+        self.mock_func.return_value = "mock_func_retval"
+
+    @patch.object(blob_acl, "filter_readable_document_list")
+    def test_superuser_is_not_filtered(
+        self, mock_filter_readable_document_list
+    ):
+        """test_superuser_is_not_filtered"""
+        user = create_mock_user("1", is_superuser=True)
+
+        self.assertEqual(
+            blob_acl.can_get_pid_dict_for_blob_id_list(
+                self.mock_func, ["1", "2"], user
+            ),
+            "mock_func_retval",
+        )
+        mock_filter_readable_document_list.assert_not_called()
+        self.mock_func.assert_called_with(["1", "2"], user)
+
+    @patch.object(blob_acl, "filter_readable_document_list")
+    @patch.object(blob_acl, "Blob")
+    def test_only_readable_blobs_are_kept(
+        self, mock_blob, mock_filter_readable_document_list
+    ):
+        """test_only_readable_blobs_are_kept"""
+        user = create_mock_user("1")
+        mock_filter_readable_document_list.return_value = [MagicMock(pk=1)]
+
+        blob_acl.can_get_pid_dict_for_blob_id_list(
+            self.mock_func, ["1", "2"], user
+        )
+
+        mock_blob.objects.filter.assert_called_with(pk__in=["1", "2"])
+        self.mock_func.assert_called_with([1], user)
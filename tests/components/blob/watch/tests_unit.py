@@ -10,6 +10,9 @@ from rest_framework import status
 from core_linked_records_app.components.blob import watch as blob_watch
 from core_linked_records_app.components.pid_settings.models import PidSettings
 from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
 from core_linked_records_app.utils import exceptions as pid_exceptions
 from core_main_app.commons import exceptions as main_exceptions
 from tests import mocks
@@ -251,6 +254,27 @@ class TestSetBlobPid(TestCase):
         blob_watch.set_blob_pid(None, self.mock_document)
         mock_transaction.on_commit.assert_called()
 
+    @patch.object(pid_registration_system_api, "queue_for_blob")
+    @patch.object(PidSettings, "get")
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    @patch.object(blob_watch, "transaction")
+    def test_deferred_registration_queues_blob(
+        self,
+        mock_transaction,
+        mock_is_registration_deferred,
+        mock_pid_settings_get,
+        mock_queue_for_blob,
+    ):
+        """test_deferred_registration_queues_blob"""
+        mock_is_registration_deferred.return_value = True
+        mock_pid_settings_get.return_value = mocks.MockPidSettings(
+            auto_set_pid=True
+        )
+
+        blob_watch.set_blob_pid(None, self.mock_document)
+        mock_transaction.on_commit.assert_not_called()
+        mock_queue_for_blob.assert_called_with(self.mock_document.pk)
+
     @patch.object(blob_system_api, "get_pid_for_blob")
     @patch.object(PidSettings, "get")
     def test_pid_setting_get_failure_raises_core_error(
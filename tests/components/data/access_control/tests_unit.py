@@ -4,6 +4,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from core_linked_records_app.components.data import access_control as data_acl
+from core_linked_records_app.system.data import api as data_system_api
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 
@@ -166,3 +167,40 @@ class TestCanGetPidForData(TestCase):
                 self.mock_kwargs["request"],
             ),
         )
+
+
+class TestCanGetPidDictForDataIdList(TestCase):
+    """Unit tests for `can_get_pid_dict_for_data_id_list` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.mock_func = MagicMock()
+        self.mock_request = MagicMock()
+
+    @patch.object(data_system_api, "get_all_by_id_list")
+    def test_superuser_ids_are_not_filtered(self, mock_get_all_by_id_list):
+        """test_superuser_ids_are_not_filtered"""
+        self.mock_request.user = create_mock_user("1", is_superuser=True)
+
+        data_acl.can_get_pid_dict_for_data_id_list(
+            self.mock_func, [1, 2], self.mock_request
+        )
+
+        mock_get_all_by_id_list.assert_not_called()
+        self.mock_func.assert_called_with([1, 2], self.mock_request)
+
+    @patch.object(data_acl, "filter_readable_document_list")
+    @patch.object(data_system_api, "get_all_by_id_list")
+    def test_unreadable_ids_are_filtered(
+        self, mock_get_all_by_id_list, mock_filter_readable_document_list
+    ):
+        """test_unreadable_ids_are_filtered"""
+        self.mock_request.user = create_mock_user("1")
+        mock_filter_readable_document_list.return_value = [MagicMock(pk=2)]
+
+        data_acl.can_get_pid_dict_for_data_id_list(
+            self.mock_func, [1, 2], self.mock_request
+        )
+
+        mock_get_all_by_id_list.assert_called_with([1, 2])
+        self.mock_func.assert_called_with([2], self.mock_request)
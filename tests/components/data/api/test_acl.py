@@ -8,6 +8,9 @@ from core_linked_records_app.components.data import (
     access_control as pid_data_acl,
 )
 from core_linked_records_app.components.pid_path import api as pid_path_api
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
 from core_main_app.access_control import api as main_acl
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.components.data import api as main_data_api
@@ -23,59 +26,69 @@ class TestGetDataByPid(TestCase):
         self.mock_query_result = MagicMock()
 
     def setup_mocks(
-        self, mock_get_all, mock_execute_json_query, user, owner=None
+        self,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
+        user,
+        owner=None,
     ) -> None:
         """setup_mocks"""
         self.mock_request.user = user
         self.mock_query_result.user_id = owner.id if owner else user.id
 
-        mock_get_all.return_value = []
-        mock_execute_json_query.return_value = [self.mock_query_result]
+        mock_get_data_id_list_by_pid.return_value = ["mock_data_id"]
+        mock_execute_query.return_value = [self.mock_query_result]
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
-    def test_superuser_can_access(self, mock_get_all, mock_execute_json_query):
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
+    def test_superuser_can_access(
+        self, mock_get_data_id_list_by_pid, mock_execute_query
+    ):
         """test_superuser_can_access"""
         user = create_mock_user("1", is_superuser=True)
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user
+        )
 
         self.assertEqual(
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request),
             self.mock_query_result,
         )
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     @patch.object(main_acl, "workspace_api")
     @patch.object(main_acl, "settings")
     def test_registered_user_not_owner_cannot_access_private(
         self,
         mock_setting,
         mock_workspace_api,  # noqa, pylint: disable=unused-argument
-        mock_get_all,
-        mock_execute_json_query,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
     ):
         """test_registered_user_not_owner_cannot_access_private"""
         mock_setting.CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = False
         user = create_mock_user("1")
         owner = create_mock_user("2")
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user, owner)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user, owner
+        )
 
         with self.assertRaises(AccessControlError):
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     @patch.object(main_acl, "workspace_api")
     @patch.object(main_acl, "settings")
     def test_registered_user_not_owner_can_access_public(
         self,
         mock_settings,
         mock_workspace_api,
-        mock_get_all,
-        mock_execute_json_query,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
     ):
         """test_registered_user_not_owner_can_access_public"""
         mock_public_workspace = MagicMock()
@@ -87,65 +100,71 @@ class TestGetDataByPid(TestCase):
         user = create_mock_user("1")
         owner = create_mock_user("2")
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user, owner)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user, owner
+        )
 
         self.assertEqual(
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request),
             self.mock_query_result,
         )
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     @patch.object(main_acl, "workspace_api")
     @patch.object(main_acl, "settings")
     def test_registered_user_and_owner_can_access_private(
         self,
         mock_settings,
         mock_workspace_api,  # noqa, pylint: disable=unused-argument
-        mock_get_all,
-        mock_execute_json_query,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
     ):
         """test_registered_user_and_owner_can_access_private"""
         mock_settings.CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = False
         user = create_mock_user("1")
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user
+        )
 
         self.assertEqual(
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request),
             self.mock_query_result,
         )
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     @patch.object(main_acl, "workspace_api")
     @patch.object(main_acl, "settings")
     def test_anonymous_user_not_public_cannot_access(
         self,
         mock_settings,
         mock_workspace_api,  # noqa, pylint: disable=unused-argument
-        mock_get_all,
-        mock_execute_json_query,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
     ):
         """test_anonymous_user_not_public_cannot_access"""
         mock_settings.CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = False
         user = create_mock_user("1", is_anonymous=True)
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user
+        )
 
         with self.assertRaises(AccessControlError):
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     @patch.object(main_acl, "workspace_api")
     @patch.object(main_acl, "settings")
     def test_anonymous_user_and_public_can_access(
         self,
         mock_settings,
         mock_workspace_api,
-        mock_get_all,
-        mock_execute_json_query,
+        mock_get_data_id_list_by_pid,
+        mock_execute_query,
     ):
         """test_anonymous_user_and_public_can_access"""
         mock_public_workspace = MagicMock()
@@ -156,7 +175,9 @@ class TestGetDataByPid(TestCase):
         ]
         user = create_mock_user("1", is_anonymous=True)
 
-        self.setup_mocks(mock_get_all, mock_execute_json_query, user)
+        self.setup_mocks(
+            mock_get_data_id_list_by_pid, mock_execute_query, user
+        )
 
         self.assertEqual(
             pid_data_api.get_data_by_pid("mock_pid", self.mock_request),
@@ -193,7 +214,7 @@ class TestGetPidForData(TestCase):
 
         mock_get_value_from_dot_notation.return_value = self.mock_data_pid
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -206,7 +227,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_superuser_can_access"""
         user = create_mock_user("1", is_superuser=True)
@@ -224,7 +245,7 @@ class TestGetPidForData(TestCase):
             self.mock_data_pid,
         )
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -241,7 +262,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_registered_user_not_owner_cannot_access_private"""
         mock_settings.CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = False
@@ -261,7 +282,7 @@ class TestGetPidForData(TestCase):
         with self.assertRaises(AccessControlError):
             pid_data_api.get_pid_for_data("mock_data_id", self.mock_request)
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -278,7 +299,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_registered_user_not_owner_can_access_public"""
         mock_public_workspace = MagicMock()
@@ -304,7 +325,7 @@ class TestGetPidForData(TestCase):
             self.mock_data_pid,
         )
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -321,7 +342,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_registered_user_and_owner_can_access_private"""
         mock_settings.CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = False
@@ -340,7 +361,7 @@ class TestGetPidForData(TestCase):
             self.mock_data_pid,
         )
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -357,7 +378,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_anonymous_user_not_public_cannot_access"""
         mock_public_workspace = MagicMock()
@@ -379,7 +400,7 @@ class TestGetPidForData(TestCase):
         with self.assertRaises(AccessControlError):
             pid_data_api.get_pid_for_data("mock_data_id", self.mock_request)
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -396,7 +417,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,  # noqa, pylint: disable=unused-argument
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,  # noqa, pylint: disable=unused-argument
-        mock_is_valid_pid_value,  # noqa, pylint: disable=unused-argument
+        mock_is_valid_routed_pid_value,  # noqa, pylint: disable=unused-argument
     ):
         """test_anonymous_user_and_public_can_access"""
         mock_public_workspace = MagicMock()
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 from core_main_app.commons import exceptions
 from core_main_app.components.data import api as main_data_api
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from django.db.models import Q
 from django.http import HttpRequest
 
 from core_linked_records_app.components.data import (
@@ -13,7 +14,13 @@ from core_linked_records_app.components.data import (
 )
 from core_linked_records_app.components.data import api as pid_data_api
 from core_linked_records_app.components.pid_path import api as pid_path_api
-from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
 from core_linked_records_app.utils.exceptions import MultiplePidError
 from tests import mocks
 
@@ -29,98 +36,106 @@ class TestGetDataByPid(TestCase):
 
         self.mock_kwargs = {"pid": mock_pid, "request": mock_request}
 
-    @patch.object(pid_path_api, "get_all")
-    def test_pid_path_get_all_failure_raises_api_error(self, mock_get_all):
-        """test_pid_path_get_all_failure_raises_api_error"""
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
+    def test_pid_index_failure_raises_api_error(
+        self, mock_get_data_id_list_by_pid
+    ):
+        """test_pid_index_failure_raises_api_error"""
 
-        mock_get_all.side_effect = Exception("mock_get_all_exception")
+        mock_get_data_id_list_by_pid.side_effect = Exception(
+            "mock_get_data_id_list_by_pid_exception"
+        )
 
         with self.assertRaises(exceptions.ApiError):
             pid_data_api.get_data_by_pid(**self.mock_kwargs)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     def test_execute_query_failure_raises_api_error(
-        self, mock_get_all, mock_execute_json_query
+        self, mock_get_data_id_list_by_pid, mock_execute_query
     ):
         """test_execute_query_failure_raises_api_error"""
 
-        mock_get_all.return_value = []
-        mock_execute_json_query.side_effect = Exception(
-            "mock_execute_json_query_exception"
+        mock_get_data_id_list_by_pid.return_value = ["mock_data_id"]
+        mock_execute_query.side_effect = Exception(
+            "mock_execute_query_exception"
         )
 
         with self.assertRaises(exceptions.ApiError):
             pid_data_api.get_data_by_pid(**self.mock_kwargs)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
+    def test_pid_not_indexed_does_not_query_data(
+        self, mock_get_data_id_list_by_pid, mock_execute_query
+    ):
+        """test_pid_not_indexed_does_not_query_data"""
+
+        mock_get_data_id_list_by_pid.return_value = []
+
+        with self.assertRaises(exceptions.DoesNotExist):
+            pid_data_api.get_data_by_pid(**self.mock_kwargs)
+
+        mock_execute_query.assert_not_called()
+
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     def test_no_result_raise_does_not_exist_error(
-        self, mock_get_all, mock_execute_json_query
+        self, mock_get_data_id_list_by_pid, mock_execute_query
     ):
         """test_no_result_raise_does_not_exist_error"""
 
-        mock_get_all.return_value = []
-        mock_execute_json_query.return_value = []
+        mock_get_data_id_list_by_pid.return_value = ["mock_data_id"]
+        mock_execute_query.return_value = []
 
         with self.assertRaises(exceptions.DoesNotExist):
             pid_data_api.get_data_by_pid(**self.mock_kwargs)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     def test_several_results_raise_api_error(
-        self, mock_get_all, mock_execute_json_query
+        self, mock_get_data_id_list_by_pid, mock_execute_query
     ):
         """test_several_results_raise_api_error"""
 
-        mock_get_all.return_value = []
-        mock_execute_json_query.return_value = ["item_a", "item_b"]
+        mock_get_data_id_list_by_pid.return_value = ["mock_a", "mock_b"]
+        mock_execute_query.return_value = ["item_a", "item_b"]
 
         with self.assertRaises(exceptions.ApiError):
             pid_data_api.get_data_by_pid(**self.mock_kwargs)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
     def test_single_result_is_returned(
-        self, mock_get_all, mock_execute_json_query
+        self, mock_get_data_id_list_by_pid, mock_execute_query
     ):
         """test_single_result_is_returned"""
 
-        mock_get_all.return_value = []
+        mock_get_data_id_list_by_pid.return_value = ["mock_data_id"]
         expected_result = mocks.MockData()
         expected_result.user_id = self.mock_user.id
-        mock_execute_json_query.return_value = [expected_result]
+        mock_execute_query.return_value = [expected_result]
 
         result = pid_data_api.get_data_by_pid(**self.mock_kwargs)
         self.assertEqual(result, expected_result)
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
-    def test_get_pid_loops_on_all_set_pid_paths(
-        self, mock_get_all, mock_execute_json_query
+    @patch.object(main_data_api, "execute_query")
+    @patch.object(pid_index_system_api, "get_data_id_list_by_pid")
+    def test_query_is_restricted_to_indexed_data(
+        self, mock_get_data_id_list_by_pid, mock_execute_query
     ):
-        """test_get_pid_loops_on_all_set_pid_paths"""
+        """test_query_is_restricted_to_indexed_data"""
 
-        mock_pid_path_1 = Mock(spec=PidPath)
-        mock_pid_path_1.path = "path_1"
-        mock_pid_path_2 = Mock(spec=PidPath)
-        mock_pid_path_2.path = "path_2"
-        mock_get_all.return_value = [mock_pid_path_1, mock_pid_path_2]
+        mock_get_data_id_list_by_pid.return_value = ["mock_data_id"]
         expected_result = mocks.MockData()
         expected_result.user_id = self.mock_user.id
-        mock_execute_json_query.return_value = [expected_result]
+        mock_execute_query.return_value = [expected_result]
 
-        result = pid_data_api.get_data_by_pid(**self.mock_kwargs)
-        self.assertEqual(result, expected_result)
-        mock_execute_json_query.assert_called_with(
-            {
-                "$or": [
-                    {"dict_content.path_1": "mock_pid"},  # path 1
-                    {"dict_content.path_2": "mock_pid"},  # path 2
-                    {"dict_content.mock.pid": "mock_pid"},  # default setting
-                ]
-            },
-            self.mock_user,
+        pid_data_api.get_data_by_pid(**self.mock_kwargs)
+
+        mock_get_data_id_list_by_pid.assert_called_with("mock_pid")
+        mock_execute_query.assert_called_with(
+            Q(pk__in=["mock_data_id"]), self.mock_user
         )
 
 
@@ -271,7 +286,7 @@ class TestGetPidForData(TestCase):
         with self.assertRaises(exceptions.ApiError):
             pid_data_api.get_pid_for_data(**self.mock_kwargs)
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -286,7 +301,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """test_invalid_pid_raises_api_error"""
 
@@ -295,11 +310,11 @@ class TestGetPidForData(TestCase):
         mock_get_by_template.return_value = [mocks.MockPidPath()]
         mock_is_dot_notation_in_dictionary.return_value = True
         mock_get_value_from_dot_notation.return_value = "mock_pid"
-        mock_is_valid_pid_value.return_value = False
+        mock_is_valid_routed_pid_value.return_value = False
 
         self.assertIsNone(pid_data_api.get_pid_for_data(**self.mock_kwargs))
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
@@ -314,7 +329,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,
         mock_get_value_from_dot_notation,
         mock_is_dot_notation_in_dictionary,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """test_returns_get_value_from_dot_notation_output"""
 
@@ -324,12 +339,12 @@ class TestGetPidForData(TestCase):
         mock_get_by_template.return_value = [mocks.MockPidPath()]
         mock_is_dot_notation_in_dictionary.return_value = True
         mock_get_value_from_dot_notation.return_value = expected_result
-        mock_is_valid_pid_value.return_value = True
+        mock_is_valid_routed_pid_value.return_value = True
 
         result = pid_data_api.get_pid_for_data(**self.mock_kwargs)
         self.assertEqual(result, expected_result)
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_path_api, "get_by_template")
@@ -344,7 +359,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template,
         mock_is_dot_notation_in_dictionary,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """test_more_than_one_pid_path_in_document_raises_error"""
         mock_check_can_read_document.return_value = True
@@ -352,7 +367,7 @@ class TestGetPidForData(TestCase):
         mock_get_by_template.return_value = mocks.MockPidPath()
         mock_get_value_from_dot_notation.side_effect = ["pid1", "pid2"]
         mock_is_dot_notation_in_dictionary.side_effect = [True, True]
-        mock_is_valid_pid_value.side_effect = [True, True]
+        mock_is_valid_routed_pid_value.side_effect = [True, True]
 
         with self.assertRaises(exceptions.ApiError):
             pid_data_api.get_pid_for_data(**self.mock_kwargs)
@@ -370,7 +385,7 @@ class TestGetPidForDataMultiPath(TestCase):
         self.mock_kwargs = {"data_id": mock_data_id, "request": mock_request}
         self.mock_global_data = mocks.MockData()
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_path_api, "get_by_template")
@@ -385,7 +400,7 @@ class TestGetPidForDataMultiPath(TestCase):
         mock_get_by_template,
         mock_is_dot_notation_in_dictionary,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """Test single valid PID in first path is returned"""
         mock_check_can_read_document.return_value = True
@@ -401,12 +416,12 @@ class TestGetPidForDataMultiPath(TestCase):
         # First path has PID, second doesn't
         mock_is_dot_notation_in_dictionary.side_effect = [True, False]
         mock_get_value_from_dot_notation.return_value = "valid_pid"
-        mock_is_valid_pid_value.return_value = True
+        mock_is_valid_routed_pid_value.return_value = True
 
         result = pid_data_api.get_pid_for_data(**self.mock_kwargs)
         self.assertEqual(result, "valid_pid")
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_path_api, "get_by_template")
@@ -421,7 +436,7 @@ class TestGetPidForDataMultiPath(TestCase):
         mock_get_by_template,
         mock_is_dot_notation_in_dictionary,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """Test valid PID in second path is returned"""
         mock_check_can_read_document.return_value = True
@@ -437,12 +452,12 @@ class TestGetPidForDataMultiPath(TestCase):
         # First path doesn't have PID, second does
         mock_is_dot_notation_in_dictionary.side_effect = [False, True]
         mock_get_value_from_dot_notation.return_value = "valid_pid_path2"
-        mock_is_valid_pid_value.return_value = True
+        mock_is_valid_routed_pid_value.return_value = True
 
         result = pid_data_api.get_pid_for_data(**self.mock_kwargs)
         self.assertEqual(result, "valid_pid_path2")
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_path_api, "get_by_template")
@@ -457,7 +472,7 @@ class TestGetPidForDataMultiPath(TestCase):
         mock_get_by_template,
         mock_is_dot_notation_in_dictionary,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """Test error when multiple valid PIDs exist across paths"""
         mock_check_can_read_document.return_value = True
@@ -473,12 +488,12 @@ class TestGetPidForDataMultiPath(TestCase):
         # Both paths have PIDs
         mock_is_dot_notation_in_dictionary.side_effect = [True, True]
         mock_get_value_from_dot_notation.side_effect = ["pid1", "pid2"]
-        mock_is_valid_pid_value.return_value = True
+        mock_is_valid_routed_pid_value.return_value = True
 
         with self.assertRaises(MultiplePidError):
             pid_data_api.get_pid_for_data(**self.mock_kwargs)
 
-    @patch.object(pid_data_api, "is_valid_pid_value")
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
     @patch.object(pid_data_api, "get_value_from_dot_notation")
     @patch.object(pid_data_api, "is_dot_notation_in_dictionary")
     @patch.object(pid_path_api, "get_by_template")
@@ -493,7 +508,7 @@ class TestGetPidForDataMultiPath(TestCase):
         mock_get_by_template,
         mock_is_dot_notation_in_dictionary,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """Test returns None when no PID exists in any path"""
         mock_check_can_read_document.return_value = True
@@ -513,41 +528,91 @@ class TestGetPidForDataMultiPath(TestCase):
         self.assertIsNone(result)
 
 
-class TestGetDataByPidMultiPath(TestCase):
-    """Test Get Data By Pid with multiple paths"""
+class TestGetPidDictForDataIdList(TestCase):
+    """Test Get Pid Dict For Data Id List"""
 
     def setUp(self) -> None:
-        mock_pid = "mock_pid"
-        self.mock_user = create_mock_user("1")
         mock_request = Mock(spec=HttpRequest)
-        mock_request.user = self.mock_user
+        mock_request.user = create_mock_user("1", is_superuser=True)
         self.mock_request = mock_request
-        self.mock_kwargs = {"pid": mock_pid, "request": mock_request}
 
-    @patch.object(main_data_api, "execute_json_query")
-    @patch.object(pid_path_api, "get_all")
-    def test_search_matches_multiple_paths(
-        self, mock_get_all, mock_execute_json_query
+    @staticmethod
+    def _build_data(data_id, template_id, dict_content):
+        mock_data = Mock()
+        mock_data.pk = data_id
+        mock_data.template_id = template_id
+        mock_data.get_dict_content.return_value = dict_content
+        return mock_data
+
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
+    @patch.object(
+        pid_path_system_api, "get_path_list_dict_by_template_id_list"
+    )
+    @patch.object(data_system_api, "get_all_by_id_list")
+    def test_pid_paths_are_retrieved_once(
+        self,
+        mock_get_all_by_id_list,
+        mock_get_path_list_dict_by_template_id_list,
+        mock_is_valid_routed_pid_value,
     ):
-        """Test PID search uses $or condition across multiple paths"""
-        # Mock multiple paths
-        mock_pid_path_1 = mocks.MockPidPath()
-        mock_pid_path_1.path = "path1"
-        mock_pid_path_2 = mocks.MockPidPath()
-        mock_pid_path_2.path = "path2"
-        mock_get_all.return_value = [mock_pid_path_1, mock_pid_path_2]
+        """test_pid_paths_are_retrieved_once"""
+        mock_get_all_by_id_list.return_value.only.return_value = [
+            self._build_data(1, 10, {"a": "pid_1"}),
+            self._build_data(2, 10, {"b": "pid_2"}),
+            self._build_data(3, 20, {"c": "pid_3"}),
+        ]
+        mock_get_path_list_dict_by_template_id_list.return_value = {
+            10: ["a"],
+            20: ["a", "b"],
+        }
+        mock_is_valid_routed_pid_value.return_value = True
+
+        result = pid_data_api.get_pid_dict_for_data_id_list(
+            [1, 2, 3], self.mock_request
+        )
 
-        expected_result = mocks.MockData()
-        expected_result.user_id = self.mock_user.id
-        mock_execute_json_query.return_value = [expected_result]
+        self.assertEqual(result, {"1": "pid_1", "2": None, "3": None})
+        mock_get_path_list_dict_by_template_id_list.assert_called_once()
+        self.assertEqual(
+            sorted(
+                mock_get_path_list_dict_by_template_id_list.call_args[0][0]
+            ),
+            [10, 20],
+        )
 
-        result = pid_data_api.get_data_by_pid(**self.mock_kwargs)
+    @patch.object(pid_data_api, "is_valid_routed_pid_value")
+    @patch.object(
+        pid_path_system_api, "get_path_list_dict_by_template_id_list"
+    )
+    @patch.object(data_system_api, "get_all_by_id_list")
+    def test_multiple_pids_returns_none_for_data(
+        self,
+        mock_get_all_by_id_list,
+        mock_get_path_list_dict_by_template_id_list,
+        mock_is_valid_routed_pid_value,
+    ):
+        """test_multiple_pids_returns_none_for_data"""
+        mock_get_all_by_id_list.return_value.only.return_value = [
+            self._build_data(1, 10, {"a": "pid_1", "b": "pid_2"}),
+            self._build_data(2, 10, {"a": "pid_3"}),
+        ]
+        mock_get_path_list_dict_by_template_id_list.return_value = {
+            10: ["a", "b"],
+        }
+        mock_is_valid_routed_pid_value.return_value = True
+
+        result = pid_data_api.get_pid_dict_for_data_id_list(
+            [1, 2], self.mock_request
+        )
 
-        # Verify query was called with $or condition
-        mock_execute_json_query.assert_called_once()
-        call_args = mock_execute_json_query.call_args
-        query = call_args[0][0]
+        self.assertEqual(result, {"1": None, "2": "pid_3"})
 
-        # Check $or condition exists
-        self.assertIn("$or", query)
-        self.assertEqual(result, expected_result)
+    @patch.object(data_system_api, "get_all_by_id_list")
+    def test_lookup_failure_raises_api_error(self, mock_get_all_by_id_list):
+        """test_lookup_failure_raises_api_error"""
+        mock_get_all_by_id_list.side_effect = Exception(
+            "mock_get_all_by_id_list_exception"
+        )
+
+        with self.assertRaises(exceptions.ApiError):
+            pid_data_api.get_pid_dict_for_data_id_list([1], self.mock_request)
@@ -2,26 +2,55 @@
 created / deleted).
 """
 
+from io import StringIO
 from os.path import join
+from unittest.mock import patch
 
+from django.core.management import call_command
+from django.db import transaction
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.components.pid_path import (
+    watch as pid_path_watch,
+)
+from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
 from core_linked_records_app.settings import (
     ID_PROVIDER_PREFIX_DEFAULT,
     ID_PROVIDER_SYSTEM_NAME,
 )
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
+from core_linked_records_app.system.pid_settings import (
+    api as pid_settings_system_api,
+)
+from core_linked_records_app.utils import data as data_utils
 from core_linked_records_app.utils import (
     exceptions as linked_records_exceptions,
 )
+from core_linked_records_app.utils.cache import pid_config_cache
+from core_linked_records_app.utils.providers import ProviderManager
 from core_main_app.commons import exceptions as main_exceptions
-from core_main_app.utils.integration_tests.integration_base_transaction_test_case import (
-    IntegrationTransactionTestCase,
-)
+from core_main_app.components.data.models import Data
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
-from tests.fixtures import DataFixtures, MultiPIDsDataFixtures
+from tests.fixtures import (
+    DataFixtures,
+    MediaRootIntegrationTestCase,
+    MultiPIDsDataFixtures,
+)
 from tests.test_settings import SERVER_URI
 import json
 
 
-class TestRecordCreationWithDuplicatePid(IntegrationTransactionTestCase):
+class TestRecordCreationWithDuplicatePid(MediaRootIntegrationTestCase):
     """Integration tests checking the creation of two data with duplicate PID."""
 
     fixture = DataFixtures()
@@ -102,7 +131,7 @@ class TestRecordCreationWithDuplicatePid(IntegrationTransactionTestCase):
         self.fixture.insert_record("record_2", self.mock_pid_url, self.user)
 
 
-class TestRecordCreationWithDeletedPid(IntegrationTransactionTestCase):
+class TestRecordCreationWithDeletedPid(MediaRootIntegrationTestCase):
     """Integration tests checking the creation of a data containing a deleted
     PID."""
 
@@ -181,7 +210,7 @@ class TestRecordCreationWithDeletedPid(IntegrationTransactionTestCase):
         self.fixture.insert_record("record_2", self.mock_pid_url, self.user)
 
 
-class TestRecordModificationToNewPid(IntegrationTransactionTestCase):
+class TestRecordModificationToNewPid(MediaRootIntegrationTestCase):
     """Integration tests checking the modification of a data, changing the existing PID
     to a new, unregistered, PID.
     """
@@ -276,7 +305,7 @@ class TestRecordModificationToNewPid(IntegrationTransactionTestCase):
         data_1.save()
 
 
-class TestRecordModificationToExistingPid(IntegrationTransactionTestCase):
+class TestRecordModificationToExistingPid(MediaRootIntegrationTestCase):
     """Integration tests checking the modification of a data, changing the existing PID
     to an already registered PID.
     """
@@ -389,7 +418,7 @@ class TestRecordModificationToExistingPid(IntegrationTransactionTestCase):
         data_2.save()
 
 
-class TestMultiPIDPathWithXMLData(IntegrationTransactionTestCase):
+class TestMultiPIDPathWithXMLData(MediaRootIntegrationTestCase):
     """Integration tests checking the creation of two data with mutliple PID Paths."""
 
     fixture = MultiPIDsDataFixtures()
@@ -567,7 +596,7 @@ class TestMultiPIDPathWithXMLData(IntegrationTransactionTestCase):
         )
 
 
-class TestMultiPIDPathWithJSONData(IntegrationTransactionTestCase):
+class TestMultiPIDPathWithJSONData(MediaRootIntegrationTestCase):
     """Integration tests checking the creation of two data with mutliple PID Paths."""
 
     fixture = MultiPIDsDataFixtures()
@@ -752,3 +781,409 @@ class TestMultiPIDPathWithJSONData(IntegrationTransactionTestCase):
             user=self.user,
             template=self.fixture.json_template,
         )
+
+
+class TestRecordPidIndex(MediaRootIntegrationTestCase):
+    """Integration tests checking the PID index is maintained when data are
+    created, modified and deleted.
+    """
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.mock_pid_url_1 = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid1",
+        )
+        self.mock_pid_url_2 = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid2",
+        )
+        super().setUp()
+
+    def test_created_record_is_indexed(self):
+        """test_created_record_is_indexed"""
+        self.fixture.auto_set_pid(False)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url_1, self.user
+        )
+
+        self.assertEqual(
+            data_system_api.get_data_by_pid(self.mock_pid_url_1).pk, data_1.pk
+        )
+
+    def test_modified_record_is_reindexed(self):
+        """test_modified_record_is_reindexed"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url_1, self.user
+        )
+
+        data_1.xml_content = data_1.xml_content.replace(
+            self.mock_pid_url_1, self.mock_pid_url_2
+        )
+        data_1.save()
+
+        self.assertFalse(data_system_api.is_pid_defined(self.mock_pid_url_1))
+        self.assertTrue(
+            data_system_api.is_pid_defined_for_data(
+                self.mock_pid_url_2, data_1.pk
+            )
+        )
+
+    def test_deleted_record_is_removed_from_index(self):
+        """test_deleted_record_is_removed_from_index"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url_1, self.user
+        )
+        data_1.delete()
+
+        with self.assertRaises(main_exceptions.DoesNotExist):
+            data_system_api.get_data_by_pid(self.mock_pid_url_1)
+
+    def test_existing_records_are_indexed(self):
+        """test_existing_records_are_indexed"""
+        self.fixture.auto_set_pid(False)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url_1, self.user
+        )
+        PidIndex.objects.all().delete()
+
+        self.assertEqual(pid_index_system_api.index_all_data(), (1, 0))
+        self.assertEqual(
+            data_system_api.get_data_by_pid(self.mock_pid_url_1).pk, data_1.pk
+        )
+
+    @patch.object(pid_path_watch, "reindex_executor")
+    @patch.object(settings, "PID_PATH_REINDEX_ENABLED", True)
+    def test_pid_path_change_reindexes_template_records_in_background(
+        self, mock_reindex_executor
+    ):
+        """test_pid_path_change_reindexes_template_records_in_background"""
+        self.fixture.auto_set_pid(False)
+        data_1 = self.fixture.insert_record(
+            self.mock_pid_url_2, self.mock_pid_url_1, self.user
+        )
+        self.assertFalse(data_system_api.is_pid_defined(self.mock_pid_url_2))
+
+        pid_path = PidPath(template=data_1.template, path="mock.name")
+        pid_path.save()
+
+        # The saving thread only queues the indexing.
+        mock_reindex_executor.submit.assert_called_once_with(
+            pid_path_watch.index_template_data, data_1.template_id
+        )
+        self.assertFalse(data_system_api.is_pid_defined(self.mock_pid_url_2))
+
+        pid_path_watch.index_template_data(data_1.template_id)
+        self.assertTrue(
+            data_system_api.is_pid_defined_for_data(
+                self.mock_pid_url_2, data_1.pk
+            )
+        )
+
+        pid_path.delete()
+        pid_path_watch.index_template_data(data_1.template_id)
+
+        self.assertFalse(data_system_api.is_pid_defined(self.mock_pid_url_2))
+        self.assertTrue(data_system_api.is_pid_defined(self.mock_pid_url_1))
+
+    @patch.object(pid_path_watch, "reindex_executor")
+    def test_pid_path_change_without_reindex_is_not_queued(
+        self, mock_reindex_executor
+    ):
+        """test_pid_path_change_without_reindex_is_not_queued"""
+        self.fixture.auto_set_pid(False)
+        data_1 = self.fixture.insert_record(
+            self.mock_pid_url_2, self.mock_pid_url_1, self.user
+        )
+
+        PidPath(template=data_1.template, path="mock.name").save()
+
+        mock_reindex_executor.submit.assert_not_called()
+        self.assertFalse(data_system_api.is_pid_defined(self.mock_pid_url_2))
+
+
+@patch.object(settings, "PID_CONFIG_CACHE_ENABLED", True)
+class TestRecordCachedPidConfig(MediaRootIntegrationTestCase):
+    """Integration tests checking the cached PID configuration is
+    invalidated when it changes.
+    """
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.mock_pid_url = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid1",
+        )
+        super().setUp()
+        pid_config_cache.invalidate()
+
+    def test_pid_settings_change_is_seen(self):
+        """test_pid_settings_change_is_seen"""
+        self.fixture.auto_set_pid(False)
+        self.assertFalse(pid_settings_system_api.get().auto_set_pid)
+
+        self.fixture.auto_set_pid(True)
+        self.assertTrue(pid_settings_system_api.get().auto_set_pid)
+
+    def test_pid_path_change_is_seen(self):
+        """test_pid_path_change_is_seen"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url, self.user
+        )
+        self.assertEqual(
+            pid_path_system_api.get_pid_path_by_template(data_1.template).path,
+            settings.PID_PATH,
+        )
+
+        PidPath(template=data_1.template, path="mock.name").save()
+
+        self.assertEqual(
+            pid_path_system_api.get_pid_path_by_template(data_1.template).path,
+            "mock.name",
+        )
+
+    def test_pid_path_change_in_transaction_is_seen_after_commit(self):
+        """test_pid_path_change_in_transaction_is_seen_after_commit"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url, self.user
+        )
+        committed_pid_path_list_dict = (
+            pid_path_system_api.get_pid_path_list_dict()
+        )
+
+        with transaction.atomic():
+            PidPath(template=data_1.template, path="mock.name").save()
+            self.assertEqual(
+                pid_path_system_api.get_pid_path_by_template(
+                    data_1.template
+                ).path,
+                "mock.name",
+            )
+
+            # Another process, without cached entries, loads the PidPaths
+            # committed before the save.
+            pid_config_cache.invalidate()
+            pid_config_cache.get_or_load(
+                "pid_path_list_dict", lambda: committed_pid_path_list_dict
+            )
+
+        self.assertEqual(
+            pid_path_system_api.get_pid_path_by_template(data_1.template).path,
+            "mock.name",
+        )
+
+
+class TestRecordUnchangedPid(MediaRootIntegrationTestCase):
+    """Integration tests checking the PID is not registered again when a
+    record is saved without changing its PID.
+    """
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.mock_pid_url_1 = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid1",
+        )
+        self.mock_pid_url_2 = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid2",
+        )
+        super().setUp()
+        self.fixture.auto_set_pid(True)
+        self.data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url_1, self.user
+        )
+
+    def _save_and_get_stats_delta(self):
+        """Save the record and compute the PID save counters it changed."""
+        initial_stats = data_utils.get_pid_save_stats()
+        self.data_1.save()
+        final_stats = data_utils.get_pid_save_stats()
+
+        return {
+            outcome: final_stats[outcome] - initial_stats[outcome]
+            for outcome in final_stats
+            if final_stats[outcome] != initial_stats[outcome]
+        }
+
+    def test_save_without_change_skips_registration(self):
+        """test_save_without_change_skips_registration"""
+        self.data_1.title = "new_title"
+
+        self.assertEqual(
+            self._save_and_get_stats_delta(), {"skipped_unchanged_content": 1}
+        )
+        self.assertTrue(
+            data_system_api.is_pid_defined_for_data(
+                self.mock_pid_url_1, self.data_1.pk
+            )
+        )
+
+    @patch.object(PidIndex, "replace_by_data_id")
+    def test_save_without_change_keeps_index(self, mock_replace_by_data_id):
+        """test_save_without_change_keeps_index"""
+        registration_state = pid_index_system_api.get_registration_state(
+            self.data_1.pk
+        )
+        self.data_1.title = "new_title"
+
+        self.assertEqual(
+            self._save_and_get_stats_delta(), {"skipped_unchanged_content": 1}
+        )
+        mock_replace_by_data_id.assert_not_called()
+        self.assertEqual(
+            pid_index_system_api.get_registration_state(self.data_1.pk),
+            registration_state,
+        )
+
+    def test_save_with_content_change_updates_index(self):
+        """test_save_with_content_change_updates_index"""
+        self.data_1.xml_content = self.data_1.xml_content.replace(
+            "record_1", "record_2"
+        )
+
+        with patch.object(
+            PidIndex,
+            "replace_by_data_id",
+            wraps=PidIndex.replace_by_data_id,
+        ) as mock_replace_by_data_id:
+            self.assertEqual(
+                self._save_and_get_stats_delta(), {"skipped_unchanged_pid": 1}
+            )
+
+        mock_replace_by_data_id.assert_called_once()
+
+    def test_save_with_content_change_skips_registration(self):
+        """test_save_with_content_change_skips_registration"""
+        self.data_1.xml_content = self.data_1.xml_content.replace(
+            "record_1", "record_2"
+        )
+
+        self.assertEqual(
+            self._save_and_get_stats_delta(), {"skipped_unchanged_pid": 1}
+        )
+        self.assertEqual(
+            self._save_and_get_stats_delta(), {"skipped_unchanged_content": 1}
+        )
+        self.assertTrue(
+            ProviderManager()
+            .get()
+            .is_id_already_used(f"{ID_PROVIDER_PREFIX_DEFAULT}/pid1")
+        )
+
+    def test_save_with_pid_change_registers_pid(self):
+        """test_save_with_pid_change_registers_pid"""
+        self.data_1.xml_content = self.data_1.xml_content.replace(
+            self.mock_pid_url_1, self.mock_pid_url_2
+        )
+
+        self.assertEqual(self._save_and_get_stats_delta(), {"registered": 1})
+        self.assertTrue(
+            data_system_api.is_pid_defined_for_data(
+                self.mock_pid_url_2, self.data_1.pk
+            )
+        )
+
+
+@patch.object(settings, "PID_REGISTRATION_BACKEND", "outbox")
+class TestRecordPidRegistrationOutbox(MediaRootIntegrationTestCase):
+    """Integration tests checking the PID registration is queued when using
+    the outbox backend, then processed by the `pidregistration` command.
+    """
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.mock_pid_url = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+            "pid1",
+        )
+        super().setUp()
+
+    def test_save_queues_registration(self):
+        """test_save_queues_registration"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url, self.user
+        )
+
+        self.assertEqual(
+            PidRegistration.get_by_data_id(data_1.pk).status,
+            PidRegistration.PENDING,
+        )
+
+    def test_save_with_pid_disabled_does_not_queue_registration(self):
+        """test_save_with_pid_disabled_does_not_queue_registration"""
+        self.fixture.auto_set_pid(False)
+        data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url, self.user
+        )
+
+        with self.assertRaises(main_exceptions.DoesNotExist):
+            PidRegistration.get_by_data_id(data_1.pk)
+
+    def test_command_registers_queued_data(self):
+        """test_command_registers_queued_data"""
+        self.fixture.auto_set_pid(True)
+        PidPath(path="mock.pid", template=self.fixture.template).save()
+        data_1 = self.fixture.insert_record("record_1", "", self.user)
+
+        call_command("pidregistration", stdout=StringIO())
+
+        self.assertEqual(
+            PidRegistration.get_by_data_id(data_1.pk).status,
+            PidRegistration.DONE,
+        )
+        self.assertIn(
+            f"{SERVER_URI}/rest/{ID_PROVIDER_SYSTEM_NAME}/"
+            f"{ID_PROVIDER_PREFIX_DEFAULT}/",
+            Data.objects.get(pk=data_1.pk).xml_content,
+        )
+
+    def test_command_records_failed_registration(self):
+        """test_command_records_failed_registration"""
+        self.fixture.auto_set_pid(True)
+        data_1 = self.fixture.insert_record("record_1", "", self.user)
+
+        with patch.object(ProviderManager, "get") as mock_get:
+            mock_get.side_effect = Exception("mock_provider_error")
+            call_command(
+                "pidregistration", stdout=StringIO(), stderr=StringIO()
+            )
+
+        pid_registration = PidRegistration.get_by_data_id(data_1.pk)
+        self.assertEqual(pid_registration.status, PidRegistration.FAILED)
+        self.assertEqual(pid_registration.attempt_count, 1)
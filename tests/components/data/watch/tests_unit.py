@@ -12,6 +12,9 @@ from core_linked_records_app.system.data import api as data_system_api
 from core_linked_records_app.system.pid_path import (
     api as pid_path_system_api,
 )
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
 from core_linked_records_app.utils import data as data_utils
 from core_linked_records_app.utils import exceptions
 from core_linked_records_app.utils import providers as providers_utils
@@ -254,6 +257,17 @@ class TestSetDataPid(TestCase):
         data_watch.set_data_pid(None, self.mock_kwargs["instance"])
         mock_transaction.on_commit.assert_called()
 
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    @patch.object(data_watch, "transaction")
+    def test_deferred_registration_does_not_set_pid(
+        self, mock_transaction, mock_is_registration_deferred
+    ):
+        """test_deferred_registration_does_not_set_pid"""
+        mock_is_registration_deferred.return_value = True
+
+        data_watch.set_data_pid(None, self.mock_kwargs["instance"])
+        mock_transaction.on_commit.assert_not_called()
+
     @patch.object(PidSettings, "get")
     def test_pid_settings_get_failure_raises_pid_create_error(
         self, mock_pid_settings_get
@@ -737,7 +751,7 @@ class TestSetDataPidMultiPids(TestCase):
 
         # The third call (regular flow) must use path2, not path1.
         third_call = mock_data_utils.get_pid_value_for_data.call_args_list[2]
-        _, called_path = third_call[0]
+        _, called_path, _ = third_call[0]
         self.assertEqual(called_path, "path2")
 
     @patch.object(data_watch, "data_utils")
@@ -802,7 +816,7 @@ class TestSetDataPidMultiPids(TestCase):
             pass
 
         first_call = mock_data_utils.get_pid_value_for_data.call_args_list[0]
-        _, called_path = first_call[0]
+        _, called_path, _ = first_call[0]
         self.assertEqual(called_path, "only_path")
 
     @patch.object(data_watch, "data_utils")
@@ -834,3 +848,79 @@ class TestSetDataPidMultiPids(TestCase):
             data_watch._set_data_pid(self.mock_data)
 
         self.assertIn("Cannot automatically assign PID", str(ctx.exception))
+
+
+class TestQueueDataPid(TestCase):
+    """Unit tests for `queue_data_pid` function."""
+
+    def setUp(self):
+        """setUp"""
+        self.mock_data = mocks.MockData()
+
+    @patch.object(pid_registration_system_api, "queue_for_data")
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    def test_inline_registration_does_not_queue(
+        self, mock_is_registration_deferred, mock_queue_for_data
+    ):
+        """test_inline_registration_does_not_queue"""
+        mock_is_registration_deferred.return_value = False
+
+        data_watch.queue_data_pid(None, self.mock_data)
+        mock_queue_for_data.assert_not_called()
+
+    @patch.object(pid_registration_system_api, "queue_for_data")
+    @patch.object(PidSettings, "get")
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    def test_auto_set_pid_disabled_does_not_queue(
+        self,
+        mock_is_registration_deferred,
+        mock_pid_settings_get,
+        mock_queue_for_data,
+    ):
+        """test_auto_set_pid_disabled_does_not_queue"""
+        mock_is_registration_deferred.return_value = True
+        mock_pid_settings_get.return_value = mocks.MockPidSettings(
+            auto_set_pid=False
+        )
+
+        data_watch.queue_data_pid(None, self.mock_data)
+        mock_queue_for_data.assert_not_called()
+
+    @patch.object(pid_registration_system_api, "queue_for_data")
+    @patch.object(PidSettings, "get")
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    def test_deferred_registration_queues_data(
+        self,
+        mock_is_registration_deferred,
+        mock_pid_settings_get,
+        mock_queue_for_data,
+    ):
+        """test_deferred_registration_queues_data"""
+        mock_is_registration_deferred.return_value = True
+        mock_pid_settings_get.return_value = mocks.MockPidSettings(
+            auto_set_pid=True
+        )
+
+        data_watch.queue_data_pid(None, self.mock_data)
+        mock_queue_for_data.assert_called_with(self.mock_data.pk)
+
+    @patch.object(data_watch, "logger")
+    @patch.object(pid_registration_system_api, "queue_for_data")
+    @patch.object(PidSettings, "get")
+    @patch.object(pid_registration_system_api, "is_registration_deferred")
+    def test_queue_failure_is_logged(
+        self,
+        mock_is_registration_deferred,
+        mock_pid_settings_get,
+        mock_queue_for_data,
+        mock_logger,
+    ):
+        """test_queue_failure_is_logged"""
+        mock_is_registration_deferred.return_value = True
+        mock_pid_settings_get.return_value = mocks.MockPidSettings(
+            auto_set_pid=True
+        )
+        mock_queue_for_data.side_effect = Exception("mock_queue_exception")
+
+        data_watch.queue_data_pid(None, self.mock_data)
+        mock_logger.error.assert_called()
@@ -123,3 +123,133 @@ class TestUpdate(TestCase):
             LocalId.upsert(self.mock_local_id),
             self.mock_local_id,
         )
+
+
+class TestGetAllByNameList(TestCase):
+    """Test Get All By Name List"""
+
+    @patch.object(LocalId, "objects")
+    def test_local_id_filter_failure_raises_model_error(self, mock_objects):
+        """test_local_id_filter_failure_raises_model_error"""
+
+        mock_objects.filter.side_effect = Exception(
+            "mock_objects_filter_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            LocalId.get_all_by_name_list(["mock_record_name"])
+
+    @patch.object(LocalId, "objects")
+    def test_filters_on_record_name_list(self, mock_objects):
+        """test_filters_on_record_name_list"""
+
+        LocalId.get_all_by_name_list(["mock_record_name"])
+
+        mock_objects.filter.assert_called_with(
+            record_name__in=["mock_record_name"]
+        )
+
+
+class TestGetRecordNameListByNameList(TestCase):
+    """Test Get Record Name List By Name List"""
+
+    @patch.object(LocalId, "objects")
+    def test_local_id_filter_failure_raises_model_error(self, mock_objects):
+        """test_local_id_filter_failure_raises_model_error"""
+
+        mock_objects.filter.side_effect = Exception(
+            "mock_objects_filter_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            LocalId.get_record_name_list_by_name_list(["mock_record_name"])
+
+    @patch.object(LocalId, "objects")
+    def test_filters_on_record_name_list(self, mock_objects):
+        """test_filters_on_record_name_list"""
+
+        mock_objects.filter.return_value.values_list.return_value = [
+            "mock_record_name"
+        ]
+
+        self.assertEqual(
+            LocalId.get_record_name_list_by_name_list(
+                ["mock_record_name", "mock_other_record_name"]
+            ),
+            ["mock_record_name"],
+        )
+        mock_objects.filter.assert_called_with(
+            record_name__in=["mock_record_name", "mock_other_record_name"]
+        )
+
+
+class TestInsertMany(TestCase):
+    """Test Insert Many"""
+
+    @patch.object(LocalId, "objects")
+    def test_local_id_bulk_create_failure_raises_model_error(
+        self, mock_objects
+    ):
+        """test_local_id_bulk_create_failure_raises_model_error"""
+
+        mock_objects.bulk_create.side_effect = Exception(
+            "mock_objects_bulk_create_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            LocalId.insert_many([LocalId(record_name="mock_record_name")])
+
+    @patch.object(LocalId, "objects")
+    def test_bulk_create_returns_inserted_objects(self, mock_objects):
+        """test_bulk_create_returns_inserted_objects"""
+
+        local_id_list = [LocalId(record_name="mock_record_name")]
+        mock_objects.bulk_create.return_value = local_id_list
+
+        self.assertEqual(LocalId.insert_many(local_id_list), local_id_list)
+        mock_objects.bulk_create.assert_called_once_with(local_id_list)
+
+    @patch.object(LocalId, "objects")
+    def test_conflicting_objects_are_not_returned(self, mock_objects):
+        """test_conflicting_objects_are_not_returned"""
+
+        local_id_list = [
+            LocalId(record_name="mock_record_name_1"),
+            LocalId(record_name="mock_record_name_2"),
+        ]
+        mock_objects.bulk_create.side_effect = [
+            IntegrityError("mock_integrity_error"),
+            IntegrityError("mock_integrity_error"),
+            [local_id_list[1]],
+        ]
+
+        self.assertEqual(
+            LocalId.insert_many(local_id_list), [local_id_list[1]]
+        )
+        self.assertEqual(mock_objects.bulk_create.call_count, 3)
+
+
+class TestGetAllByClassAndIdList(TestCase):
+    """Test Get All By Class And Id List"""
+
+    @patch.object(LocalId, "objects")
+    def test_local_id_filter_failure_raises_model_error(self, mock_objects):
+        """test_local_id_filter_failure_raises_model_error"""
+
+        mock_objects.filter.side_effect = Exception(
+            "mock_objects_filter_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            LocalId.get_all_by_class_and_id_list("mock_class", [1])
+
+    @patch.object(LocalId, "objects")
+    def test_filters_on_class_and_string_id_list(self, mock_objects):
+        """test_filters_on_class_and_string_id_list"""
+
+        LocalId.get_all_by_class_and_id_list("mock_class", [1, "2"])
+
+        mock_objects.filter.assert_called_with(
+            record_object_class="mock_class",
+            record_object_id__in=["1", "2"],
+        )
@@ -0,0 +1,41 @@
+"""Integration tests for the LocalId model."""
+
+from django.db import transaction
+
+from core_linked_records_app.components.local_id.models import LocalId
+from core_main_app.utils.integration_tests.integration_base_transaction_test_case import (
+    IntegrationTransactionTestCase,
+)
+
+
+class TestInsertMany(IntegrationTransactionTestCase):
+    """Integration tests for `LocalId.insert_many`."""
+
+    def test_existing_record_is_not_returned(self):
+        """test_existing_record_is_not_returned"""
+        LocalId(record_name="mock_prefix/record_1").save()
+
+        inserted_local_id_list = LocalId.insert_many(
+            [
+                LocalId(record_name="mock_prefix/record_1"),
+                LocalId(record_name="mock_prefix/record_2"),
+            ]
+        )
+
+        self.assertEqual(
+            [local_id.record_name for local_id in inserted_local_id_list],
+            ["mock_prefix/record_2"],
+        )
+        self.assertEqual(LocalId.objects.count(), 2)
+
+    def test_conflict_does_not_break_outer_transaction(self):
+        """test_conflict_does_not_break_outer_transaction"""
+        LocalId(record_name="mock_prefix/record_1").save()
+
+        with transaction.atomic():
+            LocalId.insert_many([LocalId(record_name="mock_prefix/record_1")])
+            LocalId(record_name="mock_prefix/record_3").save()
+
+        self.assertTrue(
+            LocalId.objects.filter(record_name="mock_prefix/record_3").exists()
+        )
@@ -0,0 +1,56 @@
+"""Unit tests for core_linked_records_app.components.local_id.watch"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_linked_records_app.components.local_id import watch as local_id_watch
+from core_linked_records_app.components.local_id.models import LocalId
+
+
+class TestInvalidateLocalIdCacheOnSave(TestCase):
+    """Unit tests for `invalidate_local_id_cache_on_save` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.local_id = LocalId(
+            record_name="mock_record_name",
+            record_object_class="mock_class",
+            record_object_id="1",
+        )
+
+    @patch.object(local_id_watch, "local_id_system_api")
+    def test_created_invalidates_linked_object(self, mock_local_id_api):
+        """test_created_invalidates_linked_object"""
+        local_id_watch.invalidate_local_id_cache_on_save(
+            LocalId, self.local_id, True
+        )
+
+        mock_local_id_api.invalidate_local_id_cache.assert_called_with(
+            "mock_class", "1"
+        )
+        mock_local_id_api.local_id_cache.clear.assert_not_called()
+
+    @patch.object(local_id_watch, "local_id_system_api")
+    def test_updated_clears_cache(self, mock_local_id_api):
+        """test_updated_clears_cache"""
+        local_id_watch.invalidate_local_id_cache_on_save(
+            LocalId, self.local_id, False
+        )
+
+        mock_local_id_api.local_id_cache.clear.assert_called_once()
+
+
+class TestInvalidateLocalIdCacheOnDelete(TestCase):
+    """Unit tests for `invalidate_local_id_cache_on_delete` function."""
+
+    @patch.object(local_id_watch, "local_id_system_api")
+    def test_invalidates_linked_object(self, mock_local_id_api):
+        """test_invalidates_linked_object"""
+        local_id_watch.invalidate_local_id_cache_on_delete(
+            LocalId,
+            LocalId(record_object_class="mock_class", record_object_id="1"),
+        )
+
+        mock_local_id_api.invalidate_local_id_cache.assert_called_with(
+            "mock_class", "1"
+        )
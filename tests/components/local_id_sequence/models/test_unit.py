@@ -0,0 +1,33 @@
+"""Unit tests for core_linked_records_app.components.local_id_sequence.models"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_linked_records_app.components.local_id_sequence.models import (
+    LocalIdSequence,
+)
+from core_main_app.commons import exceptions
+
+
+class TestReserveBlock(TestCase):
+    """Test Reserve Block"""
+
+    @patch.object(LocalIdSequence, "objects")
+    def test_returns_start_of_reserved_block(self, mock_objects):
+        """test_returns_start_of_reserved_block"""
+        mock_objects.filter.return_value.values_list.return_value.get.return_value = (
+            1010
+        )
+
+        self.assertEqual(LocalIdSequence.reserve_block("mock_name", 10), 1000)
+        mock_objects.get_or_create.assert_called_with(name="mock_name")
+
+    @patch.object(LocalIdSequence, "objects")
+    def test_failure_raises_model_error(self, mock_objects):
+        """test_failure_raises_model_error"""
+        mock_objects.get_or_create.side_effect = Exception(
+            "mock_get_or_create_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            LocalIdSequence.reserve_block("mock_name", 10)
@@ -1,12 +1,15 @@
 """Unit tests for core_linked_records_app.components.oai_record.api"""
 
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 from core_linked_records_app.components.oai_record import (
     api as oai_record_api,
 )
 from core_linked_records_app.components.pid_path import api as pid_path_api
+from core_linked_records_app.system.pid_path import (
+    api as pid_path_system_api,
+)
 from core_main_app.commons.exceptions import ApiError
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_oaipmh_harvester_app.components.oai_record import (
@@ -114,3 +117,56 @@ class TestGetPidForData(TestCase):
 
         with self.assertRaises(MultiplePidError):
             oai_record_api.get_pid_for_data(**self.kwargs)
+
+
+class TestGetPidDictForDataIdList(TestCase):
+    """Test Get Pid Dict For Data Id List"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+        self.mock_request.user = create_mock_user("1")
+
+    @staticmethod
+    def _build_oai_record(oai_record_id, template_id, dict_content):
+        mock_oai_record = MagicMock()
+        mock_oai_record.pk = oai_record_id
+        mock_oai_record.harvester_metadata_format.template_id = template_id
+        mock_oai_record.get_dict_content.return_value = dict_content
+        return mock_oai_record
+
+    @patch.object(
+        pid_path_system_api, "get_path_list_dict_by_template_id_list"
+    )
+    @patch.object(oai_record_api, "OaiRecord")
+    def test_pid_paths_are_retrieved_once(
+        self, mock_oai_record, mock_get_path_list_dict_by_template_id_list
+    ):
+        """test_pid_paths_are_retrieved_once"""
+        mock_oai_record.objects.filter.return_value.select_related.return_value.only.return_value = [
+            self._build_oai_record(1, 10, {"a": "pid_1"}),
+            self._build_oai_record(2, 10, {"a": "pid_2", "b": "pid_3"}),
+        ]
+        mock_get_path_list_dict_by_template_id_list.return_value = {
+            10: ["a", "b"],
+        }
+
+        result = oai_record_api.get_pid_dict_for_data_id_list(
+            [1, 2], self.mock_request
+        )
+
+        self.assertEqual(result, {"1": "pid_1", "2": None})
+        mock_get_path_list_dict_by_template_id_list.assert_called_once_with(
+            [10]
+        )
+
+    @patch.object(oai_record_api, "OaiRecord")
+    def test_lookup_failure_raises_api_error(self, mock_oai_record):
+        """test_lookup_failure_raises_api_error"""
+        mock_oai_record.objects.filter.side_effect = Exception(
+            "mock_filter_exception"
+        )
+
+        with self.assertRaises(ApiError):
+            oai_record_api.get_pid_dict_for_data_id_list(
+                [1], self.mock_request
+            )
@@ -0,0 +1,111 @@
+"""Unit tests for `core_linked_records_app.components.pid.access_control`."""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_linked_records_app.components.pid import (
+    access_control as pid_acl,
+)
+from core_linked_records_app.utils import (
+    access_control as access_control_utils,
+)
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.components.workspace import api as workspace_api
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestCanResolvePidList(TestCase):
+    """Unit tests for `can_resolve_pid_list` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.mock_func = MagicMock()
+        self.mock_func.side_effect = lambda pid_list, user: [
+            {
+                "pid": "mock_owned_pid",
+                "status": "found",
+                "type": "data",
+                "id": 1,
+                "document": MagicMock(user_id="1", workspace_id=None),
+            },
+            {
+                "pid": "mock_shared_pid",
+                "status": "found",
+                "type": "blob",
+                "id": 2,
+                "document": MagicMock(user_id="2", workspace_id=10),
+            },
+            {
+                "pid": "mock_private_pid",
+                "status": "found",
+                "type": "data",
+                "id": 3,
+                "document": MagicMock(user_id="2", workspace_id=20),
+            },
+            {
+                "pid": "mock_unknown_pid",
+                "status": "not_found",
+                "type": None,
+                "id": None,
+                "document": None,
+            },
+        ]
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_superuser_reads_everything(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_superuser_reads_everything"""
+        user = create_mock_user("3", is_superuser=True)
+
+        result = pid_acl.can_resolve_pid_list(self.mock_func, [], user)
+
+        mock_get_all_workspaces_with_read_access_by_user.assert_not_called()
+        self.assertEqual(
+            [resolution["status"] for resolution in result],
+            ["found", "found", "found", "not_found"],
+        )
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_user_reads_owned_and_accessible_documents(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_user_reads_owned_and_accessible_documents"""
+        user = create_mock_user("1")
+        mock_get_all_workspaces_with_read_access_by_user.return_value = [
+            MagicMock(pk=10)
+        ]
+
+        result = pid_acl.can_resolve_pid_list(self.mock_func, [], user)
+
+        mock_get_all_workspaces_with_read_access_by_user.assert_called_once()
+        self.assertEqual(
+            [
+                (resolution["status"], resolution["id"])
+                for resolution in result
+            ],
+            [
+                ("found", 1),
+                ("found", 2),
+                ("forbidden", None),
+                ("not_found", None),
+            ],
+        )
+        self.assertIsNone(result[2]["document"])
+
+    @patch.object(access_control_utils, "check_anonymous_access")
+    def test_denied_anonymous_user_reads_nothing(
+        self, mock_check_anonymous_access
+    ):
+        """test_denied_anonymous_user_reads_nothing"""
+        user = create_mock_user("1", is_anonymous=True)
+        mock_check_anonymous_access.side_effect = AccessControlError(
+            "mock_check_anonymous_access_error"
+        )
+
+        result = pid_acl.can_resolve_pid_list(self.mock_func, [], user)
+
+        self.assertEqual(
+            [resolution["status"] for resolution in result],
+            ["forbidden", "forbidden", "forbidden", "not_found"],
+        )
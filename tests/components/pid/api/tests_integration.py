@@ -0,0 +1,87 @@
+"""Integration tests for `core_linked_records_app.components.pid.api`."""
+
+from os.path import join
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core_linked_records_app.components.pid import api as pid_api
+from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.settings import (
+    ID_PROVIDER_PREFIX_DEFAULT,
+    ID_PROVIDER_SYSTEM_NAME,
+)
+from core_main_app.components.workspace import api as workspace_api
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from tests.fixtures import DataFixtures, MediaRootIntegrationTestCase
+from tests.test_settings import SERVER_URI
+
+
+class TestResolvePidList(MediaRootIntegrationTestCase):
+    """Integration tests for `resolve_pid_list` function."""
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        super().setUp()
+        self.owner = create_mock_user(1)
+        self.fixture.auto_set_pid(False)
+        PidPath(path="mock.pid", template=self.fixture.template).save()
+
+        self.pid_url_list = [
+            join(
+                SERVER_URI,
+                "rest",
+                ID_PROVIDER_SYSTEM_NAME,
+                ID_PROVIDER_PREFIX_DEFAULT,
+                f"pid{index}",
+            )
+            for index in range(3)
+        ]
+        self.data_list = [
+            self.fixture.insert_record(
+                f"record_{index}", self.pid_url_list[index], self.owner
+            )
+            for index in range(2)
+        ]
+        self.fixture.insert_record(
+            "record_duplicate", self.pid_url_list[1], self.owner
+        )
+
+    def test_resolves_data_with_constant_query_count(self):
+        """test_resolves_data_with_constant_query_count"""
+        with CaptureQueriesContext(connection) as queries:
+            result = pid_api.resolve_pid_list(
+                self.pid_url_list, create_mock_user(1, is_superuser=True)
+            )
+
+        self.assertEqual(
+            [
+                (resolution["status"], resolution["id"])
+                for resolution in result
+            ],
+            [
+                ("found", self.data_list[0].pk),
+                ("not_unique", None),
+                ("not_found", None),
+            ],
+        )
+        # One query on the PID index, one on the data and one on the local
+        # IDs, whatever the number of PIDs.
+        self.assertEqual(len(queries), 3)
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_other_user_cannot_read_private_data(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_other_user_cannot_read_private_data"""
+        mock_get_all_workspaces_with_read_access_by_user.return_value = []
+
+        result = pid_api.resolve_pid_list(
+            self.pid_url_list[:1], create_mock_user(2)
+        )
+
+        self.assertEqual(result[0]["status"], "forbidden")
+        self.assertIsNone(result[0]["id"])
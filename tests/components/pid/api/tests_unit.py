@@ -0,0 +1,114 @@
+"""Unit tests for `core_linked_records_app.components.pid.api`."""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_linked_records_app.components.pid import api as pid_api
+from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.data import api as data_system_api
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestResolvePidList(TestCase):
+    """Unit tests for `resolve_pid_list` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.user = create_mock_user("1", is_superuser=True)
+        self.mock_data = MagicMock(pk=1)
+        self.mock_blob = MagicMock(pk=2)
+
+    @patch.object(blob_system_api, "get_blob_dict_by_pid_list")
+    @patch.object(data_system_api, "get_data_dict_by_pid_list")
+    def test_statuses_follow_input_order(
+        self, mock_get_data_dict_by_pid_list, mock_get_blob_dict_by_pid_list
+    ):
+        """test_statuses_follow_input_order"""
+        mock_get_data_dict_by_pid_list.return_value = {
+            "mock_data_pid": [self.mock_data],
+            "mock_duplicate_pid": [MagicMock(), MagicMock()],
+        }
+        mock_get_blob_dict_by_pid_list.return_value = {
+            "mock_blob_pid": self.mock_blob
+        }
+
+        result = pid_api.resolve_pid_list(
+            [
+                "mock_blob_pid",
+                "mock_data_pid/",
+                "mock_duplicate_pid",
+                "mock_unknown_pid",
+                None,
+            ],
+            self.user,
+        )
+
+        self.assertEqual(
+            [
+                (resolution["status"], resolution["type"], resolution["id"])
+                for resolution in result
+            ],
+            [
+                ("found", "blob", 2),
+                ("found", "data", 1),
+                ("not_unique", "data", None),
+                ("not_found", None, None),
+                ("invalid", None, None),
+            ],
+        )
+        self.assertEqual(result[1]["pid"], "mock_data_pid/")
+
+    @patch.object(blob_system_api, "get_blob_dict_by_pid_list")
+    @patch.object(data_system_api, "get_data_dict_by_pid_list")
+    def test_lookups_are_done_once_for_the_list(
+        self, mock_get_data_dict_by_pid_list, mock_get_blob_dict_by_pid_list
+    ):
+        """test_lookups_are_done_once_for_the_list"""
+        mock_get_data_dict_by_pid_list.return_value = {
+            "mock_data_pid": [self.mock_data],
+        }
+        mock_get_blob_dict_by_pid_list.return_value = {}
+
+        pid_api.resolve_pid_list(
+            ["mock_data_pid", "mock_pid_1", "mock_pid_2", "mock_pid_1"],
+            self.user,
+        )
+
+        mock_get_data_dict_by_pid_list.assert_called_once()
+        self.assertEqual(
+            set(mock_get_data_dict_by_pid_list.call_args[0][0]),
+            {"mock_data_pid", "mock_pid_1", "mock_pid_2"},
+        )
+        mock_get_blob_dict_by_pid_list.assert_called_once()
+        self.assertEqual(
+            set(mock_get_blob_dict_by_pid_list.call_args[0][0]),
+            {"mock_pid_1", "mock_pid_2"},
+        )
+
+    @patch.object(blob_system_api, "get_blob_dict_by_pid_list")
+    @patch.object(data_system_api, "get_data_dict_by_pid_list")
+    def test_no_valid_pid_skips_lookups(
+        self, mock_get_data_dict_by_pid_list, mock_get_blob_dict_by_pid_list
+    ):
+        """test_no_valid_pid_skips_lookups"""
+        result = pid_api.resolve_pid_list(["", 42], self.user)
+
+        mock_get_data_dict_by_pid_list.assert_not_called()
+        mock_get_blob_dict_by_pid_list.assert_not_called()
+        self.assertEqual(
+            [resolution["status"] for resolution in result],
+            ["invalid", "invalid"],
+        )
+
+    @patch.object(data_system_api, "get_data_dict_by_pid_list")
+    def test_lookup_error_raises_api_error(
+        self, mock_get_data_dict_by_pid_list
+    ):
+        """test_lookup_error_raises_api_error"""
+        mock_get_data_dict_by_pid_list.side_effect = Exception(
+            "mock_get_data_dict_by_pid_list_exception"
+        )
+
+        with self.assertRaises(ApiError):
+            pid_api.resolve_pid_list(["mock_pid"], self.user)
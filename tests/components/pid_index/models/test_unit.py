@@ -0,0 +1,81 @@
+"""Unit tests for core_linked_records_app.components.pid_index.models"""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_main_app.commons import exceptions
+
+
+class TestGetDataIdListByPid(TestCase):
+    """Test Get Data Id List By Pid"""
+
+    @patch.object(PidIndex, "objects")
+    def test_filter_failure_raises_model_error(self, mock_objects):
+        """test_filter_failure_raises_model_error"""
+        mock_objects.filter.side_effect = Exception("mock_filter_exception")
+
+        with self.assertRaises(exceptions.ModelError):
+            PidIndex.get_data_id_list_by_pid("mock_pid")
+
+    @patch.object(PidIndex, "objects")
+    def test_returns_distinct_data_ids(self, mock_objects):
+        """test_returns_distinct_data_ids"""
+        mock_objects.filter.return_value.values_list.return_value.distinct.return_value = [
+            1
+        ]
+
+        self.assertEqual(PidIndex.get_data_id_list_by_pid("mock_pid"), [1])
+        mock_objects.filter.assert_called_with(pid="mock_pid")
+
+
+class TestGetAllByDataIdList(TestCase):
+    """Test Get All By Data Id List"""
+
+    @patch.object(PidIndex, "objects")
+    def test_filter_failure_raises_model_error(self, mock_objects):
+        """test_filter_failure_raises_model_error"""
+        mock_objects.filter.side_effect = Exception("mock_filter_exception")
+
+        with self.assertRaises(exceptions.ModelError):
+            PidIndex.get_all_by_data_id_list([1])
+
+    @patch.object(PidIndex, "objects")
+    def test_returns_filter_output(self, mock_objects):
+        """test_returns_filter_output"""
+        mock_objects.filter.return_value = "mock_filter"
+
+        self.assertEqual(PidIndex.get_all_by_data_id_list([1]), "mock_filter")
+        mock_objects.filter.assert_called_with(data_id__in=[1])
+
+
+class TestReplaceByDataId(TestCase):
+    """Test Replace By Data Id"""
+
+    @patch("core_linked_records_app.components.pid_index.models.transaction")
+    @patch.object(PidIndex, "objects")
+    def test_bulk_create_failure_raises_model_error(
+        self, mock_objects, mock_transaction
+    ):
+        """test_bulk_create_failure_raises_model_error"""
+        mock_transaction.atomic.return_value = MagicMock()
+        mock_objects.bulk_create.side_effect = Exception(
+            "mock_bulk_create_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            PidIndex.replace_by_data_id(1, [])
+
+    @patch("core_linked_records_app.components.pid_index.models.transaction")
+    @patch.object(PidIndex, "objects")
+    def test_previous_entries_are_deleted(
+        self, mock_objects, mock_transaction
+    ):
+        """test_previous_entries_are_deleted"""
+        mock_transaction.atomic.return_value = MagicMock()
+
+        PidIndex.replace_by_data_id(1, ["mock_pid_index"])
+
+        mock_objects.filter.assert_called_with(data_id=1)
+        mock_objects.filter.return_value.delete.assert_called_once()
+        mock_objects.bulk_create.assert_called_with(["mock_pid_index"])
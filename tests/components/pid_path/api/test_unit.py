@@ -134,3 +134,24 @@ class TestGetAll(TestCase):
         self.assertEqual(
             pid_path_api.get_all(self.mock_request), expected_result
         )
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ENABLED", True)
+    @patch.object(pid_path_api.pid_path_system_api, "get_pid_path_list_dict")
+    @patch.object(template_api, "get_all")
+    def test_cached_paths_are_filtered_by_readable_template(
+        self, mock_get_all, mock_get_pid_path_list_dict
+    ):
+        """test_cached_paths_are_filtered_by_readable_template"""
+        readable_pid_path = PidPath(template_id=1, path="path_1")
+        mock_get_pid_path_list_dict.return_value = {
+            1: [readable_pid_path],
+            2: [PidPath(template_id=2, path="path_2")],
+        }
+        mock_get_all.return_value.filter.return_value.values_list.return_value = [
+            1
+        ]
+
+        self.assertEqual(
+            pid_path_api.get_all(self.mock_request), [readable_pid_path]
+        )
+        mock_get_all.return_value.filter.assert_called_with(pk__in=[1, 2])
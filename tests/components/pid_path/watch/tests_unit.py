@@ -0,0 +1,42 @@
+"""Unit tests for core_linked_records_app.components.pid_path.watch"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_linked_records_app.components.pid_path import (
+    watch as pid_path_watch,
+)
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+
+
+class TestIndexTemplateData(TestCase):
+    """Unit tests for `index_template_data` function."""
+
+    @patch.object(pid_path_watch, "connection")
+    @patch.object(pid_index_system_api, "index_all_data")
+    def test_template_data_are_indexed(
+        self, mock_index_all_data, mock_connection
+    ):
+        """test_template_data_are_indexed"""
+        mock_index_all_data.return_value = (1, 0)
+
+        pid_path_watch.index_template_data(1)
+
+        mock_index_all_data.assert_called_with(1)
+        mock_connection.close.assert_called()
+
+    @patch.object(pid_path_watch, "logger")
+    @patch.object(pid_path_watch, "connection")
+    @patch.object(pid_index_system_api, "index_all_data")
+    def test_error_is_logged_and_connection_closed(
+        self, mock_index_all_data, mock_connection, mock_logger
+    ):
+        """test_error_is_logged_and_connection_closed"""
+        mock_index_all_data.side_effect = Exception("mock_exception")
+
+        pid_path_watch.index_template_data(1)
+
+        mock_logger.error.assert_called()
+        mock_connection.close.assert_called()
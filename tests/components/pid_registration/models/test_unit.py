@@ -0,0 +1,99 @@
+"""Unit tests for core_linked_records_app.components.pid_registration.models"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_main_app.commons import exceptions
+
+
+class TestQueue(TestCase):
+    """Test Queue"""
+
+    @patch.object(PidRegistration, "objects")
+    def test_update_or_create_failure_raises_model_error(self, mock_objects):
+        """test_update_or_create_failure_raises_model_error"""
+        mock_objects.update_or_create.side_effect = Exception(
+            "mock_update_or_create_exception"
+        )
+
+        with self.assertRaises(exceptions.ModelError):
+            PidRegistration.queue(data_id=1)
+
+    @patch.object(PidRegistration, "objects")
+    def test_registration_is_reset_to_pending(self, mock_objects):
+        """test_registration_is_reset_to_pending"""
+        mock_objects.update_or_create.return_value = (None, False)
+
+        PidRegistration.queue(blob_id=1)
+        mock_objects.update_or_create.assert_called_with(
+            data_id=None,
+            blob_id=1,
+            defaults={
+                "status": PidRegistration.PENDING,
+                "attempt_count": 0,
+                "message": "",
+            },
+        )
+
+
+class TestGetByDataId(TestCase):
+    """Test Get By Data Id"""
+
+    @patch.object(PidRegistration, "objects")
+    def test_get_does_not_exist_raises_does_not_exist_error(
+        self, mock_objects
+    ):
+        """test_get_does_not_exist_raises_does_not_exist_error"""
+        mock_objects.get.side_effect = ObjectDoesNotExist(
+            "mock_objects_get_does_not_exist"
+        )
+
+        with self.assertRaises(exceptions.DoesNotExist):
+            PidRegistration.get_by_data_id(1)
+
+    @patch.object(PidRegistration, "objects")
+    def test_get_failure_raises_model_error(self, mock_objects):
+        """test_get_failure_raises_model_error"""
+        mock_objects.get.side_effect = Exception("mock_objects_get_exception")
+
+        with self.assertRaises(exceptions.ModelError):
+            PidRegistration.get_by_data_id(1)
+
+
+class TestClaim(TestCase):
+    """Test Claim"""
+
+    @patch.object(PidRegistration, "objects")
+    def test_no_updated_row_returns_false(self, mock_objects):
+        """test_no_updated_row_returns_false"""
+        mock_objects.filter.return_value.update.return_value = 0
+
+        self.assertFalse(
+            PidRegistration.claim(
+                PidRegistration(pk=1, status=PidRegistration.PENDING)
+            )
+        )
+
+    @patch.object(PidRegistration, "objects")
+    def test_updated_row_returns_true(self, mock_objects):
+        """test_updated_row_returns_true"""
+        mock_objects.filter.return_value.update.return_value = 1
+
+        self.assertTrue(
+            PidRegistration.claim(
+                PidRegistration(pk=1, status=PidRegistration.PENDING)
+            )
+        )
+
+    @patch.object(PidRegistration, "objects")
+    def test_filter_failure_raises_model_error(self, mock_objects):
+        """test_filter_failure_raises_model_error"""
+        mock_objects.filter.side_effect = Exception("mock_filter_exception")
+
+        with self.assertRaises(exceptions.ModelError):
+            PidRegistration.claim(PidRegistration(pk=1))
@@ -84,3 +84,14 @@ class TestInit(TestCase):
         mock_pid_settings_upsert.return_value = None
 
         self.assertIsNone(pid_settings_watch.init())
+
+
+class TestInvalidatePidConfigCache(TestCase):
+    """Test Invalidate Pid Config Cache"""
+
+    @patch.object(pid_settings_watch, "invalidate_pid_config")
+    def test_cache_is_invalidated(self, mock_invalidate_pid_config):
+        """test_cache_is_invalidated"""
+        pid_settings_watch.invalidate_pid_config_cache(PidSettings)
+
+        mock_invalidate_pid_config.assert_called_once()
@@ -0,0 +1,33 @@
+"""Unit tests for `core_linked_records_app.components.template.watch`."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core_linked_records_app.components.template import watch as template_watch
+
+
+class TestInvalidateTemplateXsdCache(TestCase):
+    """Unit tests for `invalidate_template_xsd_cache` function."""
+
+    @patch.object(template_watch, "pid_xml_utils")
+    def test_template_cache_invalidated(self, mock_pid_xml_utils):
+        """test_template_cache_invalidated"""
+        mock_template = MagicMock()
+
+        template_watch.invalidate_template_xsd_cache(None, mock_template)
+
+        mock_pid_xml_utils.invalidate_template_xsd_cache.assert_called_with(
+            mock_template.pk
+        )
+
+    @patch.object(template_watch, "invalidate_pid_config")
+    @patch.object(template_watch, "pid_xml_utils")
+    def test_pid_config_cache_invalidated(
+        self,
+        mock_pid_xml_utils,  # noqa, pylint: disable=unused-argument
+        mock_invalidate_pid_config,
+    ):
+        """test_pid_config_cache_invalidated"""
+        template_watch.invalidate_template_xsd_cache(None, MagicMock())
+
+        mock_invalidate_pid_config.assert_called_once()
@@ -1,5 +1,10 @@
 """Fixtures for data integration tests cases."""
 
+import shutil
+import tempfile
+
+from django.test.utils import override_settings
+
 from core_linked_records_app.components.pid_settings.models import PidSettings
 from core_linked_records_app.components.pid_path.models import PidPath
 from core_linked_records_app.system.pid_settings import (
@@ -11,6 +16,9 @@ from core_main_app.system import api as system_api
 from core_main_app.utils.integration_tests.fixture_interface import (
     FixtureInterface,
 )
+from core_main_app.utils.integration_tests.integration_base_transaction_test_case import (
+    IntegrationTransactionTestCase,
+)
 
 
 class DataFixtures(FixtureInterface):
@@ -68,7 +76,7 @@ class DataFixtures(FixtureInterface):
         self.template.format = "XSD"
         self.template.hash = ""
         self.template.filename = "filename"
-        self.template.save()
+        self.template.save_template()
 
 
 class MultiPIDsDataFixtures(FixtureInterface):
@@ -143,3 +151,24 @@ class MultiPIDsDataFixtures(FixtureInterface):
         self.json_template.hash = ""
         self.json_template.filename = "filename.json"
         self.json_template.save()
+
+
+class MediaRootIntegrationTestCase(IntegrationTransactionTestCase):
+    """Integration test case writing the files of the documents in a
+    temporary `MEDIA_ROOT`, removed after each test.
+    """
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.media_root = tempfile.mkdtemp()
+        self.media_root_settings = override_settings(
+            MEDIA_ROOT=self.media_root
+        )
+        self.media_root_settings.enable()
+        super().setUp()
+
+    def tearDown(self):  # pylint: disable=invalid-name
+        """tearDown"""
+        self.media_root_settings.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+        super().tearDown()
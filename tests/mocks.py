@@ -84,6 +84,8 @@ class MockRequest(Mock):
 
     user = None
     session = MockSession()
+    method = "GET"
+    META = {}
 
 
 class MockProviderManager(Mock):
@@ -92,6 +94,8 @@ class MockProviderManager(Mock):
     provider_lookup_url = "mock_provider_url"
     create_exc = None
     create_result = None
+    create_many_exc = None
+    create_many_result = None
     update_exc = None
     update_result = None
     get_exc = None
@@ -106,6 +110,17 @@ class MockProviderManager(Mock):
 
         return self.create_result
 
+    def create_many(
+        self, *args, **kwargs
+    ):  # noqa, pylint: disable=unused-argument
+        """create_many"""
+        if self.create_many_exc and issubclass(
+            self.create_many_exc, Exception
+        ):
+            raise self.create_many_exc  # pylint: disable=raising-bad-type
+
+        return self.create_many_result
+
     def update(self, *args, **kwargs):  # noqa, pylint: disable=unused-argument
         """update"""
         if self.update_exc and issubclass(self.update_exc, Exception):
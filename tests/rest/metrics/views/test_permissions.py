@@ -0,0 +1,47 @@
+"""Permission tests for core_linked_records_app.rest.metrics.views"""
+
+from unittest import TestCase
+
+from rest_framework import status
+
+from core_linked_records_app.rest.metrics import views as metrics_views
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+
+
+class TestMetricsViewGet(TestCase):
+    """Unit tests for `MetricsView.get` method."""
+
+    def test_anonymous_returns_403(self):
+        """test_anonymous_returns_403"""
+
+        response = RequestMock.do_request_get(
+            metrics_views.MetricsView.as_view(), None
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_authenticated_returns_403(self):
+        """test_authenticated_returns_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_get(
+            metrics_views.MetricsView.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_returns_200(self):
+        """test_staff_returns_200"""
+
+        mock_user = create_mock_user("1", is_staff=True)
+
+        response = RequestMock.do_request_get(
+            metrics_views.MetricsView.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Type"], metrics_views.METRICS_CONTENT_TYPE
+        )
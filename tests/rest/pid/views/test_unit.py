@@ -2,7 +2,10 @@
 
 import json
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 from core_explore_common_app.components.query import api as query_api
 from core_explore_common_app.utils.oaipmh import oaipmh as oaipmh_utils
@@ -11,11 +14,18 @@ from core_federated_search_app.components.instance import (
     api as instance_api,
 )
 from core_linked_records_app.components.blob import api as blob_api
+from core_linked_records_app import settings
 from core_linked_records_app.components.data import api as data_api
 from core_linked_records_app.components.oai_record import (
     api as oai_record_api,
 )
+from core_linked_records_app.components.pid import api as pid_api
 from core_linked_records_app.rest.pid import views as pid_views
+from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.template_html_rendering import (
+    api as template_html_rendering_api,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from tests import mocks
 
 
@@ -191,6 +201,7 @@ class TestRetrieveListPidPost(TestCase):
         self.mock_request = mocks.MockRequest(
             data={"query_id": "mock_query_id"}
         )
+        self.mock_request.GET = {}
 
     @patch.object(query_api, "get_by_id")
     def test_get_by_id_fails_returns_500(self, mock_get_by_id):
@@ -351,6 +362,43 @@ class TestRetrieveListPidPost(TestCase):
 
         self.assertEqual(result, expected_result)
 
+    @patch.object(pid_views, "execute_local_pid_query")
+    @patch.object(query_utils, "is_local_data_source")
+    @patch.object(pid_views, "build_data_source_json_query")
+    @patch.object(query_api, "get_by_id")
+    def test_json_query_is_built_by_data_source_helper(
+        self,
+        mock_get_by_id,
+        mock_build_data_source_json_query,
+        mock_is_local_data_source,
+        mock_execute_local_pid_query,
+    ):
+        """test_json_query_is_built_by_data_source_helper"""
+        mock_query = mocks.MockQuery(
+            data_sources=[
+                dict(
+                    query_options={},
+                    order_by_field="",
+                    capabilities={},
+                    authentication=dict(auth_type="session"),
+                )
+            ]
+        )
+        mock_get_by_id.return_value = mock_query
+        mock_build_data_source_json_query.return_value = {"query": "mock"}
+        mock_is_local_data_source.return_value = True
+        mock_execute_local_pid_query.return_value = []
+
+        test_view = pid_views.RetrieveListPIDView()
+        test_view.post(self.mock_request)
+
+        mock_build_data_source_json_query.assert_called_with(
+            mock_query, mock_query.data_sources[0]
+        )
+        mock_execute_local_pid_query.assert_called_with(
+            {"query": "mock"}, self.mock_request
+        )
+
     @patch.object(pid_views, "execute_oaipmh_pid_query")
     @patch.object(oaipmh_utils, "is_oai_data_source")
     @patch.object(query_utils, "is_local_data_source")
@@ -504,3 +552,479 @@ class TestRetrieveListPidPost(TestCase):
         response = test_view.post(self.mock_request)
 
         self.assertEqual(response.status_code, 400)
+
+    @patch.object(pid_views, "iterate_local_pid_query")
+    @patch.object(oaipmh_utils, "is_oai_data_source")
+    @patch.object(query_utils, "is_local_data_source")
+    @patch.object(query_api, "get_by_id")
+    def test_local_datasource_stream_returns_ndjson(
+        self,
+        mock_get_by_id,
+        mock_is_local_data_source,
+        mock_is_oai_data_source,
+        mock_iterate_local_pid_query,
+    ):
+        """test_local_datasource_stream_returns_ndjson"""
+        mock_get_by_id.return_value = mocks.MockQuery(
+            data_sources=[
+                dict(
+                    query_options={},
+                    order_by_field="",
+                    capabilities={},
+                    authentication=dict(
+                        auth_type="session",
+                    ),
+                )
+            ]
+        )
+        mock_is_local_data_source.return_value = True
+        mock_is_oai_data_source.return_value = False
+        mock_iterate_local_pid_query.return_value = iter(
+            ["mock_pid_1", "mock_pid_2"]
+        )
+        self.mock_request.GET = {"stream": "true"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            b'"mock_pid_1"\n"mock_pid_2"\n',
+        )
+
+    @patch.object(pid_views, "get_local_pid_query_page")
+    @patch.object(oaipmh_utils, "is_oai_data_source")
+    @patch.object(query_utils, "is_local_data_source")
+    @patch.object(query_api, "get_by_id")
+    def test_local_datasource_page_returns_page(
+        self,
+        mock_get_by_id,
+        mock_is_local_data_source,
+        mock_is_oai_data_source,
+        mock_get_local_pid_query_page,
+    ):
+        """test_local_datasource_page_returns_page"""
+        mock_get_by_id.return_value = mocks.MockQuery(
+            data_sources=[
+                dict(
+                    query_options={},
+                    order_by_field="",
+                    capabilities={},
+                    authentication=dict(
+                        auth_type="session",
+                    ),
+                )
+            ]
+        )
+        mock_is_local_data_source.return_value = True
+        mock_is_oai_data_source.return_value = False
+        expected_result = {"pids": ["mock_pid"], "next": "mock_cursor"}
+        mock_get_local_pid_query_page.return_value = expected_result
+        self.mock_request.GET = {"page_size": "10"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.data, expected_result)
+        mock_get_local_pid_query_page.assert_called_once()
+        self.assertEqual(
+            mock_get_local_pid_query_page.call_args.args[2:], (None, 10)
+        )
+
+    def test_invalid_cursor_returns_400(self):
+        """test_invalid_cursor_returns_400"""
+        self.mock_request.GET = {"cursor": "mock_invalid_cursor"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_stream_with_page_returns_400(self):
+        """test_stream_with_page_returns_400"""
+        self.mock_request.GET = {"stream": "true", "page_size": "10"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(pid_views, "oauth2_post_request")
+    @patch.object(query_api, "get_by_id")
+    def test_oauth2_page_returns_400(
+        self, mock_get_by_id, mock_oauth2_post_request
+    ):
+        """test_oauth2_page_returns_400"""
+        mock_get_by_id.return_value = mocks.MockQuery(
+            data_sources=[
+                dict(
+                    query_options={},
+                    order_by_field="",
+                    capabilities={"query_pid": "mock_url_pid"},
+                    authentication=dict(
+                        auth_type="oauth2",
+                        params={"access_token": "mock_access_token"},
+                    ),
+                )
+            ]
+        )
+        self.mock_request.GET = {"page_size": "10"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
+        mock_oauth2_post_request.assert_not_called()
+
+    @patch.object(pid_views, "execute_query_pid_fan_out")
+    @patch.object(query_api, "get_by_id")
+    def test_all_data_sources_returns_fan_out(
+        self, mock_get_by_id, mock_execute_query_pid_fan_out
+    ):
+        """test_all_data_sources_returns_fan_out"""
+        mock_query = mocks.MockQuery(data_sources=[])
+        mock_get_by_id.return_value = mock_query
+        expected_result = {"pids": ["mock_pid"], "data_sources": []}
+        mock_execute_query_pid_fan_out.return_value = expected_result
+        self.mock_request.data["all_data_sources"] = True
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, expected_result)
+        mock_execute_query_pid_fan_out.assert_called_with(
+            mock_query, self.mock_request
+        )
+
+    def test_all_data_sources_with_stream_returns_400(self):
+        """test_all_data_sources_with_stream_returns_400"""
+        self.mock_request.data["all_data_sources"] = True
+        self.mock_request.GET = {"stream": "true"}
+
+        test_view = pid_views.RetrieveListPIDView()
+        response = test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TestResolveListPidPost(TestCase):
+    """Test Resolve List Pid Post"""
+
+    def test_missing_pids_returns_400(self):
+        """test_missing_pids_returns_400"""
+        test_view = pid_views.ResolveListPIDView()
+        response = test_view.post(mocks.MockRequest(data={}))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_pids_not_a_list_returns_400(self):
+        """test_pids_not_a_list_returns_400"""
+        test_view = pid_views.ResolveListPIDView()
+        response = test_view.post(mocks.MockRequest(data={"pids": "mock"}))
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(settings, "PID_BULK_RESOLVE_LIMIT", 2)
+    def test_too_many_pids_returns_400(self):
+        """test_too_many_pids_returns_400"""
+        test_view = pid_views.ResolveListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"pids": ["pid1", "pid2", "pid3"]})
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(pid_api, "resolve_pid_list")
+    def test_resolve_pid_list_fails_returns_500(self, mock_resolve_pid_list):
+        """test_resolve_pid_list_fails_returns_500"""
+        mock_resolve_pid_list.side_effect = Exception(
+            "mock_resolve_pid_list_exception"
+        )
+
+        test_view = pid_views.ResolveListPIDView()
+        response = test_view.post(mocks.MockRequest(data={"pids": ["pid1"]}))
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch.object(pid_api, "resolve_pid_list")
+    def test_success_returns_results_without_documents(
+        self, mock_resolve_pid_list
+    ):
+        """test_success_returns_results_without_documents"""
+        mock_resolve_pid_list.return_value = [
+            {
+                "pid": "pid1",
+                "status": "found",
+                "type": "data",
+                "id": 1,
+                "document": mocks.MockData(),
+            }
+        ]
+
+        test_view = pid_views.ResolveListPIDView()
+        response = test_view.post(mocks.MockRequest(data={"pids": ["pid1"]}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {
+                "results": [
+                    {"pid": "pid1", "status": "found", "type": "data", "id": 1}
+                ]
+            },
+        )
+
+
+class TestRetrieveDataListPidPost(TestCase):
+    """Test Retrieve Data List Pid Post"""
+
+    def test_ids_not_a_list_returns_400(self):
+        """test_ids_not_a_list_returns_400"""
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"data_ids": "mock_data_id"})
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(data_api, "get_pid_dict_for_data_id_list")
+    def test_malformed_data_id_returns_400(
+        self, mock_get_pid_dict_for_data_id_list
+    ):
+        """test_malformed_data_id_returns_400"""
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"data_ids": ["1", "abc"]})
+        )
+
+        self.assertEqual(response.status_code, 400)
+        mock_get_pid_dict_for_data_id_list.assert_not_called()
+
+    @patch.object(oai_record_api, "get_pid_dict_for_data_id_list")
+    def test_malformed_oai_data_id_returns_400(
+        self, mock_get_pid_dict_for_data_id_list
+    ):
+        """test_malformed_oai_data_id_returns_400"""
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"oai_data_ids": [True]})
+        )
+
+        self.assertEqual(response.status_code, 400)
+        mock_get_pid_dict_for_data_id_list.assert_not_called()
+
+    @patch.object(settings, "PID_BULK_RETRIEVE_LIMIT", 2)
+    def test_too_many_ids_returns_400(self):
+        """test_too_many_ids_returns_400"""
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(
+                data={"data_ids": ["1", "2"], "oai_data_ids": ["3"]}
+            )
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(data_api, "get_pid_dict_for_data_id_list")
+    def test_data_api_failure_returns_500(
+        self, mock_get_pid_dict_for_data_id_list
+    ):
+        """test_data_api_failure_returns_500"""
+        mock_get_pid_dict_for_data_id_list.side_effect = Exception(
+            "mock_get_pid_dict_for_data_id_list_exception"
+        )
+
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(mocks.MockRequest(data={"data_ids": ["1"]}))
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch.object(oai_record_api, "get_pid_dict_for_data_id_list")
+    @patch.object(data_api, "get_pid_dict_for_data_id_list")
+    def test_success_returns_pid_dicts(
+        self,
+        mock_data_get_pid_dict_for_data_id_list,
+        mock_oai_get_pid_dict_for_data_id_list,
+    ):
+        """test_success_returns_pid_dicts"""
+        mock_data_get_pid_dict_for_data_id_list.return_value = {"1": "pid_1"}
+        mock_oai_get_pid_dict_for_data_id_list.return_value = {"2": None}
+
+        test_view = pid_views.RetrieveDataListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"data_ids": ["1"], "oai_data_ids": ["2"]})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {"data_pids": {"1": "pid_1"}, "oai_data_pids": {"2": None}},
+        )
+
+
+class TestRetrieveBlobListPidPost(TestCase):
+    """Test Retrieve Blob List Pid Post"""
+
+    def test_ids_not_a_list_returns_400(self):
+        """test_ids_not_a_list_returns_400"""
+        test_view = pid_views.RetrieveBlobListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"blob_ids": "mock_blob_id"})
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(blob_api, "get_pid_dict_for_blob_id_list")
+    def test_malformed_blob_id_returns_400(
+        self, mock_get_pid_dict_for_blob_id_list
+    ):
+        """test_malformed_blob_id_returns_400"""
+        test_view = pid_views.RetrieveBlobListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"blob_ids": [1, "abc"]})
+        )
+
+        self.assertEqual(response.status_code, 400)
+        mock_get_pid_dict_for_blob_id_list.assert_not_called()
+
+    @patch.object(settings, "PID_BULK_RETRIEVE_LIMIT", 1)
+    def test_too_many_ids_returns_400(self):
+        """test_too_many_ids_returns_400"""
+        test_view = pid_views.RetrieveBlobListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"blob_ids": ["1", "2"]})
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(blob_api, "get_pid_dict_for_blob_id_list")
+    def test_blob_api_failure_returns_500(
+        self, mock_get_pid_dict_for_blob_id_list
+    ):
+        """test_blob_api_failure_returns_500"""
+        mock_get_pid_dict_for_blob_id_list.side_effect = Exception(
+            "mock_get_pid_dict_for_blob_id_list_exception"
+        )
+
+        test_view = pid_views.RetrieveBlobListPIDView()
+        response = test_view.post(mocks.MockRequest(data={"blob_ids": ["1"]}))
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch.object(blob_api, "get_pid_dict_for_blob_id_list")
+    def test_success_returns_pid_dict(
+        self, mock_get_pid_dict_for_blob_id_list
+    ):
+        """test_success_returns_pid_dict"""
+        mock_local_id = mocks.MockLocalId()
+        mock_local_id.record_name = "mock_record_name"
+        mock_get_pid_dict_for_blob_id_list.return_value = {"1": mock_local_id}
+
+        test_view = pid_views.RetrieveBlobListPIDView()
+        response = test_view.post(
+            mocks.MockRequest(data={"blob_ids": ["1", 2]})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.data["blob_pids"]["1"].endswith("/mock_record_name")
+        )
+        self.assertIsNone(response.data["blob_pids"]["2"])
+
+
+class TestDataHtmlRenderByPIDGet(TestCase):
+    """Test Data Html Render By PID Get"""
+
+    def setUp(self) -> None:
+        self.request_factory = APIRequestFactory()
+        self.mock_user = create_mock_user("1")
+        self.mock_data = mocks.MockData(workspace=None)
+
+    def _send_request(self, **extra):
+        request = self.request_factory.get(
+            "/", {"pid": "mock_pid", "rendering": "detail"}, **extra
+        )
+        force_authenticate(request, user=self.mock_user)
+
+        return pid_views.DataHtmlRenderByPID.as_view()(request)
+
+    @patch.object(template_html_rendering_api, "render_data")
+    @patch.object(template_html_rendering_api, "get_by_template_id")
+    @patch.object(data_api, "get_data_by_pid")
+    def test_data_is_retrieved_once(
+        self,
+        mock_get_data_by_pid,
+        mock_get_by_template_id,
+        mock_render_data,
+    ):
+        """test_data_is_retrieved_once"""
+
+        mock_get_data_by_pid.return_value = self.mock_data
+        mock_get_by_template_id.return_value = Mock(detail_rendering="")
+        mock_render_data.return_value = "mock_html"
+
+        response = self._send_request()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(mock_get_data_by_pid.call_count, 1)
+        self.assertEqual(
+            response["Cache-Control"], settings.PID_PRIVATE_CACHE_CONTROL
+        )
+
+    @patch.object(template_html_rendering_api, "render_data")
+    @patch.object(template_html_rendering_api, "get_by_template_id")
+    @patch.object(data_api, "get_data_by_pid")
+    def test_matching_etag_returns_304_without_rendering(
+        self,
+        mock_get_data_by_pid,
+        mock_get_by_template_id,
+        mock_render_data,
+    ):
+        """test_matching_etag_returns_304_without_rendering"""
+
+        mock_get_data_by_pid.return_value = self.mock_data
+        mock_get_by_template_id.return_value = Mock(detail_rendering="")
+        mock_render_data.return_value = "mock_html"
+        etag = self._send_request()["ETag"]
+        mock_render_data.reset_mock()
+
+        response = self._send_request(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_render_data.assert_not_called()
+
+    @patch.object(template_html_rendering_api, "render_data")
+    @patch.object(template_html_rendering_api, "get_by_template_id")
+    @patch.object(data_api, "get_data_by_pid")
+    def test_rendering_change_changes_etag(
+        self,
+        mock_get_data_by_pid,
+        mock_get_by_template_id,
+        mock_render_data,
+    ):
+        """test_rendering_change_changes_etag"""
+
+        mock_get_data_by_pid.return_value = self.mock_data
+        mock_get_by_template_id.return_value = Mock(detail_rendering="old")
+        mock_render_data.return_value = "mock_html"
+        etag = self._send_request()["ETag"]
+        mock_get_by_template_id.return_value = Mock(detail_rendering="new")
+
+        response = self._send_request(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch.object(data_api, "get_data_by_pid")
+    def test_missing_data_returns_404_without_cache_headers(
+        self, mock_get_data_by_pid
+    ):
+        """test_missing_data_returns_404_without_cache_headers"""
+
+        mock_get_data_by_pid.side_effect = DoesNotExist("mock_does_not_exist")
+
+        response = self._send_request()
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", response)
@@ -0,0 +1,88 @@
+"""Unit tests for core_linked_records_app.rest.pid_registration.views"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_linked_records_app.components.pid_registration import (
+    api as pid_registration_api,
+)
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_linked_records_app.rest.pid_registration import (
+    views as pid_registration_views,
+)
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
+from tests import mocks
+
+
+class TestRetrieveRegistrationStatusGet(TestCase):
+    """Test Retrieve Registration Status Get"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+        self.mock_request.GET = {}
+
+    def test_missing_parameter_returns_400(self):
+        """test_missing_parameter_returns_400"""
+
+        test_view = pid_registration_views.RetrieveRegistrationStatusView()
+        response = test_view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(pid_registration_api, "get_by_data_id")
+    def test_data_registration_returns_200(self, mock_get_by_data_id):
+        """test_data_registration_returns_200"""
+
+        self.mock_request.GET["data_id"] = "1"
+        mock_get_by_data_id.return_value = PidRegistration(
+            data_id=1, status=PidRegistration.DONE
+        )
+
+        test_view = pid_registration_views.RetrieveRegistrationStatusView()
+        response = test_view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], PidRegistration.DONE)
+
+    @patch.object(pid_registration_api, "get_by_blob_id")
+    def test_blob_registration_not_found_returns_404(
+        self, mock_get_by_blob_id
+    ):
+        """test_blob_registration_not_found_returns_404"""
+
+        self.mock_request.GET["blob_id"] = "1"
+        mock_get_by_blob_id.side_effect = DoesNotExist("mock_does_not_exist")
+
+        test_view = pid_registration_views.RetrieveRegistrationStatusView()
+        response = test_view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch.object(pid_registration_api, "get_by_data_id")
+    def test_access_control_error_returns_403(self, mock_get_by_data_id):
+        """test_access_control_error_returns_403"""
+
+        self.mock_request.GET["data_id"] = "1"
+        mock_get_by_data_id.side_effect = AccessControlError(
+            "mock_access_control_error"
+        )
+
+        test_view = pid_registration_views.RetrieveRegistrationStatusView()
+        response = test_view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, 403)
+
+    @patch.object(pid_registration_api, "get_by_data_id")
+    def test_unexpected_error_returns_500(self, mock_get_by_data_id):
+        """test_unexpected_error_returns_500"""
+
+        self.mock_request.GET["data_id"] = "1"
+        mock_get_by_data_id.side_effect = Exception("mock_exception")
+
+        test_view = pid_registration_views.RetrieveRegistrationStatusView()
+        response = test_view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, 500)
@@ -125,7 +125,7 @@ class TestProviderRecordViewGet(TestCase):
                 content=json.dumps({"url": "mock_url"})
             )
         )
-        mock_get_data_by_pid.return_value = None
+        mock_get_data_by_pid.return_value = mocks.MockData()
         mock_data_serializer.return_value = mocks.MockSerializer()
         return RequestMock.do_request_get(
             providers_views.ProviderRecordView.as_view(),
@@ -247,3 +247,49 @@ class TestProviderRecordViewDelete(TestCase):
         response = self._send_request(mock_provider_manager_get, mock_user)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class TestProviderRecordListViewPost(TestCase):
+    """Test Provider Record List View Post"""
+
+    @staticmethod
+    def _send_request(mock_provider_manager_get, mock_user):
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            create_many_result=mocks.MockResponse(
+                status_code=status.HTTP_201_CREATED
+            )
+        )
+        return RequestMock.do_request_post(
+            providers_views.ProviderRecordListView.as_view(),
+            mock_user,
+            data={"prefix": settings.ID_PROVIDER_PREFIXES[0], "count": 2},
+            param={"provider": "local"},
+        )
+
+    @patch.object(ProviderManager, "get")
+    def test_anonymous_returns_403(self, mock_provider_manager_get):
+        """test_anonymous_returns_403"""
+
+        response = self._send_request(mock_provider_manager_get, None)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(ProviderManager, "get")
+    def test_authenticated_returns_403(self, mock_provider_manager_get):
+        """test_authenticated_returns_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = self._send_request(mock_provider_manager_get, mock_user)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(ProviderManager, "get")
+    def test_staff_returns_201(self, mock_provider_manager_get):
+        """test_staff_returns_201"""
+
+        mock_user = create_mock_user("1", is_staff=True)
+
+        response = self._send_request(mock_provider_manager_get, mock_user)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -4,12 +4,18 @@ import json
 from unittest import TestCase
 from unittest.mock import patch
 
+from django.http import HttpResponse
+
 from core_linked_records_app import settings
 from core_linked_records_app.rest.providers import views as providers_views
+from core_linked_records_app.utils import http as http_utils
+from core_linked_records_app.utils.cache import TTLCache
 from core_linked_records_app.utils.providers import ProviderManager
 from core_main_app.access_control.exceptions import AccessControlError
-from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.commons.exceptions import CoreError, DoesNotExist
 from core_main_app.rest.data.serializers import DataSerializer
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
 from tests import mocks
 
 
@@ -93,6 +99,18 @@ class TestProviderRecordViewPost(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_unknown_provider_returns_404(self):
+        """test_unknown_provider_returns_404"""
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.post(
+            self.mock_request,
+            "mock_unknown_provider",
+            f"{settings.ID_PROVIDER_PREFIXES[0]}/mock_record",
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class TestProviderRecordViewPut(TestCase):
     """Test Provider Record View Put"""
@@ -154,12 +172,25 @@ class TestProviderRecordViewPut(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_unknown_provider_returns_404(self):
+        """test_unknown_provider_returns_404"""
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.put(
+            self.mock_request,
+            "mock_unknown_provider",
+            f"{settings.ID_PROVIDER_PREFIXES[0]}/mock_record",
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class TestProviderRecordViewGet(TestCase):
     """Test Provider Record View Get"""
 
     def setUp(self) -> None:
         self.mock_request = mocks.MockRequest()
+        self.mock_record = f"{settings.ID_PROVIDER_PREFIXES[0]}/mock_record"
 
     @patch.object(ProviderManager, "get")
     def test_provider_manager_get_fails_returns_500(
@@ -280,6 +311,105 @@ class TestProviderRecordViewGet(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    @patch.object(DataSerializer, "__new__")
+    @patch.object(providers_views, "get_data_by_pid")
+    @patch.object(ProviderManager, "get")
+    def test_get_data_response_has_private_cache_headers(
+        self,
+        mock_provider_manager_get,
+        mock_get_data_by_pid,
+        mock_data_serializer,
+    ):
+        """test_get_data_response_has_private_cache_headers"""
+
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            get_result=mocks.MockResponse(
+                content=json.dumps({"url": "mock_url"})
+            )
+        )
+        mock_get_data_by_pid.return_value = mocks.MockData(workspace=None)
+        mock_data_serializer.return_value = mocks.MockSerializer()
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.get(
+            self.mock_request, "mock_provider", self.mock_record
+        )
+
+        self.assertEqual(
+            response["Cache-Control"], settings.PID_PRIVATE_CACHE_CONTROL
+        )
+        self.assertIn("ETag", response)
+        self.assertEqual(response["Vary"], "Accept")
+
+    @patch.object(DataSerializer, "__new__")
+    @patch.object(providers_views, "get_data_by_pid")
+    @patch.object(ProviderManager, "get")
+    def test_get_data_matching_etag_returns_304_without_serializing(
+        self,
+        mock_provider_manager_get,
+        mock_get_data_by_pid,
+        mock_data_serializer,
+    ):
+        """test_get_data_matching_etag_returns_304_without_serializing"""
+
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            get_result=mocks.MockResponse(
+                content=json.dumps({"url": "mock_url"})
+            )
+        )
+        mock_get_data_by_pid.return_value = mocks.MockData(workspace=None)
+        mock_data_serializer.return_value = mocks.MockSerializer()
+
+        test_view = providers_views.ProviderRecordView()
+        etag = test_view.get(
+            self.mock_request, "mock_provider", self.mock_record
+        )["ETag"]
+        mock_data_serializer.reset_mock()
+        self.mock_request.META = {"HTTP_IF_NONE_MATCH": etag}
+        response = test_view.get(
+            self.mock_request, "mock_provider", self.mock_record
+        )
+
+        self.assertEqual(response.status_code, 304)
+        mock_data_serializer.assert_not_called()
+
+    @patch.object(providers_views, "get_blob_file_response")
+    @patch.object(providers_views, "get_blob_by_pid")
+    @patch.object(providers_views, "get_data_by_pid")
+    @patch.object(ProviderManager, "get")
+    def test_get_blob_matching_etag_returns_304_without_reading_file(
+        self,
+        mock_provider_manager_get,
+        mock_get_data_by_pid,
+        mock_get_blob_by_pid,
+        mock_get_blob_file_response,
+    ):
+        """test_get_blob_matching_etag_returns_304_without_reading_file"""
+
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            get_result=mocks.MockResponse(
+                content=json.dumps({"url": "mock_url"})
+            )
+        )
+        mock_get_data_by_pid.side_effect = DoesNotExist(
+            "mock_get_data_by_pid_does_not_exist"
+        )
+        mock_blob = mocks.MockBlob(
+            pk=1, checksum="mock_checksum", creation_date=None, workspace=None
+        )
+        mock_get_blob_by_pid.return_value = mock_blob
+        self.mock_request.META = {
+            "HTTP_IF_NONE_MATCH": http_utils.get_blob_validators(mock_blob)[0]
+        }
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.get(
+            self.mock_request, "mock_provider", self.mock_record
+        )
+
+        self.assertEqual(response.status_code, 304)
+        mock_get_blob_file_response.assert_not_called()
+
     @patch.object(providers_views, "get_blob_by_pid")
     @patch.object(providers_views, "get_data_by_pid")
     @patch.object(ProviderManager, "get")
@@ -376,18 +506,99 @@ class TestProviderRecordViewGet(TestCase):
 
         self.assertEqual(response.status_code, 404)
 
-    @patch.object(providers_views, "get_file_http_response")
+    @patch.object(
+        providers_views.pid_index_system_api, "get_data_id_list_by_pid"
+    )
     @patch.object(providers_views, "get_blob_by_pid")
     @patch.object(providers_views, "get_data_by_pid")
     @patch.object(ProviderManager, "get")
-    def test_get_file_http_response_fails_returns_500(
+    def test_unknown_pid_is_cached(
         self,
         mock_provider_manager_get,
         mock_get_data_by_pid,
         mock_get_blob_by_pid,
-        mock_get_file_http_response,
+        mock_get_data_id_list_by_pid,
     ):
-        """test_get_file_http_response_fails_returns_500"""
+        """test_unknown_pid_is_cached"""
+
+        mock_provider = mocks.MockProviderManager(
+            get_result=mocks.MockResponse(
+                content=json.dumps(
+                    {"url": f"mock_provider_url/{self.mock_record}"}
+                )
+            )
+        )
+        mock_provider_manager_get.return_value = mock_provider
+        mock_get_data_by_pid.side_effect = DoesNotExist("mock_dne")
+        mock_get_blob_by_pid.side_effect = DoesNotExist("mock_dne")
+        mock_get_data_id_list_by_pid.return_value = []
+        unknown_pid_cache = TTLCache(2, 60)
+
+        with patch.object(
+            providers_views, "unknown_pid_cache", unknown_pid_cache
+        ):
+            test_view = providers_views.ProviderRecordView()
+            first_response = test_view.get(
+                self.mock_request, "mock_provider", self.mock_record
+            )
+            mock_provider.get_result = None
+            second_response = test_view.get(
+                self.mock_request, "mock_provider", self.mock_record
+            )
+
+        self.assertEqual(first_response.status_code, 404)
+        self.assertEqual(second_response.status_code, 404)
+        self.assertEqual(mock_get_data_by_pid.call_count, 1)
+
+    @patch.object(
+        providers_views.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    @patch.object(providers_views, "get_blob_by_pid")
+    @patch.object(providers_views, "get_data_by_pid")
+    @patch.object(ProviderManager, "get")
+    def test_pid_of_unreadable_data_is_not_cached(
+        self,
+        mock_provider_manager_get,
+        mock_get_data_by_pid,
+        mock_get_blob_by_pid,
+        mock_get_data_id_list_by_pid,
+    ):
+        """test_pid_of_unreadable_data_is_not_cached"""
+
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            get_result=mocks.MockResponse(
+                content=json.dumps(
+                    {"url": f"mock_provider_url/{self.mock_record}"}
+                )
+            )
+        )
+        mock_get_data_by_pid.side_effect = DoesNotExist("mock_dne")
+        mock_get_blob_by_pid.side_effect = DoesNotExist("mock_dne")
+        mock_get_data_id_list_by_pid.return_value = [1]
+        unknown_pid_cache = TTLCache(2, 60)
+
+        with patch.object(
+            providers_views, "unknown_pid_cache", unknown_pid_cache
+        ):
+            response = providers_views.ProviderRecordView().get(
+                self.mock_request, "mock_provider", self.mock_record
+            )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(unknown_pid_cache), 0)
+
+    @patch.object(providers_views, "get_blob_file_response")
+    @patch.object(providers_views, "get_blob_by_pid")
+    @patch.object(providers_views, "get_data_by_pid")
+    @patch.object(ProviderManager, "get")
+    def test_get_blob_file_response_fails_returns_500(
+        self,
+        mock_provider_manager_get,
+        mock_get_data_by_pid,
+        mock_get_blob_by_pid,
+        mock_get_blob_file_response,
+    ):
+        """test_get_blob_file_response_fails_returns_500"""
 
         mock_provider_manager_get.return_value = mocks.MockProviderManager(
             get_result=mocks.MockResponse(
@@ -398,8 +609,8 @@ class TestProviderRecordViewGet(TestCase):
             "mock_get_data_by_pid_does_not_exist"
         )
         mock_get_blob_by_pid.return_value = mocks.MockBlob()
-        mock_get_file_http_response.side_effect = Exception(
-            "mock_get_file_http_response"
+        mock_get_blob_file_response.side_effect = Exception(
+            "mock_get_blob_file_response"
         )
 
         test_view = providers_views.ProviderRecordView()
@@ -411,18 +622,18 @@ class TestProviderRecordViewGet(TestCase):
 
         self.assertEqual(response.status_code, 500)
 
-    @patch.object(providers_views, "get_file_http_response")
+    @patch.object(providers_views, "get_blob_file_response")
     @patch.object(providers_views, "get_blob_by_pid")
     @patch.object(providers_views, "get_data_by_pid")
     @patch.object(ProviderManager, "get")
-    def test_get_file_http_response_success_returns_200(
+    def test_get_blob_file_response_success_returns_200(
         self,
         mock_provider_manager_get,
         mock_get_data_by_pid,
         mock_get_blob_by_pid,
-        mock_get_file_http_response,
+        mock_get_blob_file_response,
     ):
-        """test_get_file_http_response_success_returns_200"""
+        """test_get_blob_file_response_success_returns_200"""
 
         mock_provider_manager_get.return_value = mocks.MockProviderManager(
             get_result=mocks.MockResponse(
@@ -433,7 +644,7 @@ class TestProviderRecordViewGet(TestCase):
             "mock_get_data_by_pid_does_not_exist"
         )
         mock_get_blob_by_pid.return_value = mocks.MockBlob()
-        mock_get_file_http_response.return_value = mocks.MockResponse()
+        mock_get_blob_file_response.return_value = HttpResponse()
 
         test_view = providers_views.ProviderRecordView()
         response = test_view.get(
@@ -444,6 +655,18 @@ class TestProviderRecordViewGet(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_unknown_provider_returns_404(self):
+        """test_unknown_provider_returns_404"""
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.get(
+            self.mock_request,
+            "mock_unknown_provider",
+            f"{settings.ID_PROVIDER_PREFIXES[0]}/mock_record",
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class TestProviderRecordViewDelete(TestCase):
     """Test Provider Record View Delete"""
@@ -504,3 +727,119 @@ class TestProviderRecordViewDelete(TestCase):
         )
 
         self.assertEqual(response.status_code, 200)
+
+    def test_unknown_provider_returns_404(self):
+        """test_unknown_provider_returns_404"""
+
+        test_view = providers_views.ProviderRecordView()
+        response = test_view.delete(
+            self.mock_request,
+            "mock_unknown_provider",
+            f"{settings.ID_PROVIDER_PREFIXES[0]}/mock_record",
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestProviderRecordListViewPost(TestCase):
+    """Test Provider Record List View Post"""
+
+    def setUp(self) -> None:
+        self.mock_user = create_mock_user("1", is_staff=True)
+        self.prefix = settings.ID_PROVIDER_PREFIXES[0]
+
+    def _send_request(self, data):
+        return RequestMock.do_request_post(
+            providers_views.ProviderRecordListView.as_view(),
+            self.mock_user,
+            data=data,
+            param={"provider": "mock_provider"},
+        )
+
+    def test_invalid_prefix_returns_400(self):
+        """test_invalid_prefix_returns_400"""
+
+        response = self._send_request({"prefix": "mock_prefix", "count": 2})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_record_returns_400(self):
+        """test_invalid_record_returns_400"""
+
+        response = self._send_request(
+            {"prefix": self.prefix, "records": ["mock_record", "@@@@@"]}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_records_not_a_list_returns_400(self):
+        """test_records_not_a_list_returns_400"""
+
+        response = self._send_request(
+            {"prefix": self.prefix, "records": "mock_record"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(providers_views.settings, "ID_PROVIDER_BULK_CREATE_LIMIT", 2)
+    def test_count_above_limit_returns_400(self):
+        """test_count_above_limit_returns_400"""
+
+        response = self._send_request({"prefix": self.prefix, "count": 3})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(ProviderManager, "get")
+    def test_provider_create_many_core_error_returns_400(
+        self, mock_provider_manager_get
+    ):
+        """test_provider_create_many_core_error_returns_400"""
+
+        mock_provider_manager_get.return_value.create_many.side_effect = (
+            CoreError("mock_create_many_error")
+        )
+        response = self._send_request({"prefix": self.prefix})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(ProviderManager, "get")
+    def test_provider_create_many_fails_returns_500(
+        self, mock_provider_manager_get
+    ):
+        """test_provider_create_many_fails_returns_500"""
+
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            create_many_exc=Exception("mock_create_many_exception")
+        )
+        response = self._send_request({"prefix": self.prefix, "count": 2})
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch.object(ProviderManager, "get")
+    def test_returns_provider_response(self, mock_provider_manager_get):
+        """test_returns_provider_response"""
+
+        expected_content = {"records": [{"record": "mock_record"}]}
+        mock_provider_manager_get.return_value = mocks.MockProviderManager(
+            create_many_result=mocks.MockResponse(
+                status_code=207, content=json.dumps(expected_content)
+            )
+        )
+        response = self._send_request(
+            {"prefix": self.prefix, "records": ["mock_record"]}
+        )
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data, expected_content)
+
+    def test_unknown_provider_returns_404(self):
+        """test_unknown_provider_returns_404"""
+
+        response = RequestMock.do_request_post(
+            providers_views.ProviderRecordListView.as_view(),
+            self.mock_user,
+            data={"prefix": self.prefix, "count": 2},
+            param={"provider": "mock_unknown_provider"},
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -14,6 +14,7 @@ class TestRetrieveQueryPidListViewPost(TestCase):
         """setUp"""
         self.test_view = query_views.RetrieveQueryPidListView()
         self.mock_request = mocks.MockRequest()
+        self.mock_request.GET = {}
 
     @patch.object(query_views, "execute_local_pid_query")
     def test_execute_local_pid_query_error_returns_500(
@@ -47,3 +48,76 @@ class TestRetrieveQueryPidListViewPost(TestCase):
 
         response = self.test_view.post(self.mock_request)
         self.assertEqual(response.data, expected_result)
+
+    @patch.object(query_views, "iterate_local_pid_query")
+    def test_stream_returns_ndjson(self, mock_iterate_local_pid_query):
+        """test_stream_returns_ndjson"""
+        mock_iterate_local_pid_query.return_value = iter(
+            ["mock_pid_1", "mock_pid_2"]
+        )
+        self.mock_request.GET = {"stream": "true"}
+
+        response = self.test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            b'"mock_pid_1"\n"mock_pid_2"\n',
+        )
+
+    @patch.object(query_views, "iterate_local_pid_query")
+    def test_stream_error_before_first_pid_returns_500(
+        self, mock_iterate_local_pid_query
+    ):
+        """test_stream_error_before_first_pid_returns_500"""
+        mock_iterate_local_pid_query.side_effect = Exception(
+            "mock_iterate_local_pid_query_exception"
+        )
+        self.mock_request.GET = {"stream": "true"}
+
+        response = self.test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch.object(query_views, "iterate_local_pid_query")
+    def test_stream_error_after_first_pid_ends_with_error(
+        self, mock_iterate_local_pid_query
+    ):
+        """test_stream_error_after_first_pid_ends_with_error"""
+
+        def _iterate_pids():
+            yield "mock_pid_1"
+            raise Exception("mock_exception")
+
+        mock_iterate_local_pid_query.return_value = _iterate_pids()
+        self.mock_request.GET = {"stream": "true"}
+
+        response = self.test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            b'"mock_pid_1"\n{"error": "mock_exception"}\n',
+        )
+
+    @patch.object(query_views, "get_local_pid_query_page")
+    def test_page_returns_get_local_pid_query_page(
+        self, mock_get_local_pid_query_page
+    ):
+        """test_page_returns_get_local_pid_query_page"""
+        expected_result = {"pids": ["mock_pid"], "next": None}
+        mock_get_local_pid_query_page.return_value = expected_result
+        self.mock_request.GET = {"cursor": "", "page_size": "5"}
+
+        response = self.test_view.post(self.mock_request)
+
+        self.assertEqual(response.data, expected_result)
+
+    def test_invalid_page_size_returns_400(self):
+        """test_invalid_page_size_returns_400"""
+        self.mock_request.GET = {"page_size": "0"}
+
+        response = self.test_view.post(self.mock_request)
+
+        self.assertEqual(response.status_code, 400)
@@ -3,10 +3,12 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock, MagicMock
 
+from core_linked_records_app import settings
 from core_linked_records_app.components.local_id.models import LocalId
 from core_linked_records_app.system.blob import api as blob_system_api
 from core_linked_records_app.system.local_id import api as local_id_system_api
 from core_linked_records_app.utils.path import get_api_path_from_object
+from core_linked_records_app.utils.providers import ProviderManager
 from core_main_app.commons import exceptions
 from core_main_app.components.blob.models import Blob
 from tests import mocks
@@ -75,6 +77,33 @@ class TestGetPidForBlob(TestCase):
 class TestSetPidForBlob(TestCase):
     """Test Set Pid For Blob"""
 
+    @patch.object(blob_system_api, "invalidate_unknown_pid_list")
+    @patch.object(blob_system_api, "get_provider_lookup_url_list")
+    @patch.object(local_id_system_api, "insert")
+    @patch.object(blob_system_api, "get_pid_for_blob")
+    def test_pid_is_removed_from_unknown_pid_cache(
+        self,
+        mock_get_pid_for_blob,
+        mock_insert,
+        mock_get_provider_lookup_url_list,
+        mock_invalidate_unknown_pid_list,
+    ):
+        """test_pid_is_removed_from_unknown_pid_cache"""
+
+        mock_get_pid_for_blob.return_value = Mock()
+        mock_get_provider_lookup_url_list.return_value = [
+            "mock_url_1",
+            "mock_url_2",
+        ]
+
+        blob_system_api.set_pid_for_blob("mock_blob_id", "mock_url_1/mock_pid")
+
+        record_name = f"{settings.ID_PROVIDER_PREFIX_BLOB}/mock_pid"
+        self.assertEqual(
+            list(mock_invalidate_unknown_pid_list.call_args.args[0]),
+            [f"mock_url_1/{record_name}", f"mock_url_2/{record_name}"],
+        )
+
     @patch.object(blob_system_api, "get_pid_for_blob")
     def test_get_pid_for_blob_exception_raises_api_error(
         self, mock_get_pid_for_blob
@@ -306,9 +335,76 @@ class TestDeletePidForBlob(TestCase):
         mock_get_by_class_and_id.return_value = mock_local_id
         blob_system_api.delete_pid_for_blob(self.blob)
         mock_delete_record_from_provider.assert_called_with(
-            mock_local_id.record_name
+            f"{ProviderManager().get().provider_lookup_url}/"
+            f"{mock_local_id.record_name}"
+        )
+
+
+class TestGetBlobDictByPidList(TestCase):
+    """Unit tests for `get_blob_dict_by_pid_list` function."""
+
+    @patch.object(Blob, "objects")
+    @patch.object(local_id_system_api, "get_all_by_name_list")
+    def test_blobs_are_mapped_to_pids(
+        self, mock_get_all_by_name_list, mock_objects
+    ):
+        """test_blobs_are_mapped_to_pids"""
+        blob_class = get_api_path_from_object(Blob())
+        mock_get_all_by_name_list.return_value = [
+            LocalId(
+                record_name="prefix/blob",
+                record_object_class=blob_class,
+                record_object_id="1",
+            ),
+            LocalId(
+                record_name="prefix/unassigned",
+                record_object_class=None,
+                record_object_id=None,
+            ),
+            LocalId(
+                record_name="prefix/deleted",
+                record_object_class=blob_class,
+                record_object_id="2",
+            ),
+        ]
+        mock_blob = MagicMock(pk=1)
+        mock_objects.filter.return_value.only.return_value = [mock_blob]
+
+        result = blob_system_api.get_blob_dict_by_pid_list(
+            [
+                "https://mock/prefix/blob",
+                "https://mock/prefix/unassigned",
+                "https://mock/prefix/deleted",
+            ]
+        )
+
+        self.assertEqual(result, {"https://mock/prefix/blob": mock_blob})
+        mock_objects.filter.assert_called_once_with(pk__in={"1", "2"})
+
+    @patch.object(Blob, "objects")
+    @patch.object(local_id_system_api, "get_all_by_name_list")
+    def test_no_local_id_skips_blob_query(
+        self, mock_get_all_by_name_list, mock_objects
+    ):
+        """test_no_local_id_skips_blob_query"""
+        mock_get_all_by_name_list.return_value = []
+
+        self.assertEqual(
+            blob_system_api.get_blob_dict_by_pid_list(["https://mock/a/b"]),
+            {},
+        )
+        mock_objects.filter.assert_not_called()
+
+    @patch.object(local_id_system_api, "get_all_by_name_list")
+    def test_lookup_failure_raises_api_error(self, mock_get_all_by_name_list):
+        """test_lookup_failure_raises_api_error"""
+        mock_get_all_by_name_list.side_effect = Exception(
+            "mock_get_all_by_name_list_exception"
         )
 
+        with self.assertRaises(exceptions.ApiError):
+            blob_system_api.get_blob_dict_by_pid_list(["https://mock/a/b"])
+
 
 class TestGetBlobByPid(TestCase):
     """Unit tests for `get_blob_by_pid` function."""
@@ -400,3 +496,35 @@ class TestGetBlobByPid(TestCase):
         self.assertEqual(
             blob_system_api.get_blob_by_pid(**self.mock_kwargs), mock_blob
         )
+
+
+class TestGetPidDictForBlobIdList(TestCase):
+    """Unit tests for `get_pid_dict_for_blob_id_list` function."""
+
+    @patch.object(local_id_system_api, "get_all_by_class_and_id_list")
+    def test_local_ids_are_mapped_by_blob_id(
+        self, mock_get_all_by_class_and_id_list
+    ):
+        """test_local_ids_are_mapped_by_blob_id"""
+        local_id = LocalId(record_name="prefix/blob", record_object_id="1")
+        mock_get_all_by_class_and_id_list.return_value = [local_id]
+
+        self.assertEqual(
+            blob_system_api.get_pid_dict_for_blob_id_list(["1", "2"]),
+            {"1": local_id},
+        )
+        mock_get_all_by_class_and_id_list.assert_called_once_with(
+            get_api_path_from_object(Blob()), ["1", "2"]
+        )
+
+    @patch.object(local_id_system_api, "get_all_by_class_and_id_list")
+    def test_lookup_failure_raises_api_error(
+        self, mock_get_all_by_class_and_id_list
+    ):
+        """test_lookup_failure_raises_api_error"""
+        mock_get_all_by_class_and_id_list.side_effect = Exception(
+            "mock_get_all_by_class_and_id_list_exception"
+        )
+
+        with self.assertRaises(exceptions.ApiError):
+            blob_system_api.get_pid_dict_for_blob_id_list(["1"])
@@ -1,9 +1,7 @@
 """Unit tests for core_linked_records_app.system.data.api"""
 
 from unittest import TestCase
-from unittest.mock import patch, Mock, MagicMock
-
-from django.test import tag, override_settings
+from unittest.mock import patch, Mock
 
 from core_linked_records_app.system.data import api as data_system_api
 from core_linked_records_app.utils.providers import AbstractIdProvider
@@ -11,33 +9,29 @@ from core_main_app.commons.exceptions import DoesNotExist, ApiError
 from core_main_app.components.data.models import Data
 
 
-class TestIsPidDefinedForDataPsql(TestCase):
-    """Test Is Pid Defined For Document"""
+class TestIsPidDefinedForData(TestCase):
+    """Test Is Pid Defined For Data"""
 
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_wrong_document_id_raise_error(self, mock_data_get_by_id):
-        """test_wrong_document_id_raise_error"""
-        mock_data_get_by_id.side_effect = DoesNotExist("mock_does_not_exist")
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_index_failure_raises_error(self, mock_get_data_id_list_by_pid):
+        """test_index_failure_raises_error"""
+        mock_get_data_id_list_by_pid.side_effect = ApiError(
+            "mock_get_data_id_list_by_pid_exception"
+        )
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(ApiError):
             data_system_api.is_pid_defined_for_data(
                 "mock_pid", "mock_document_id"
             )
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_undefined_pid_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_undefined_pid_returns_false(self, mock_get_data_id_list_by_pid):
         """test_undefined_pid_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_data_execute_query.return_value = []
+        mock_get_data_id_list_by_pid.return_value = []
 
         self.assertFalse(
             data_system_api.is_pid_defined_for_data(
@@ -45,20 +39,15 @@ class TestIsPidDefinedForDataPsql(TestCase):
             )
         )
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_duplicate_pid_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_duplicate_pid_returns_false(self, mock_get_data_id_list_by_pid):
         """test_duplicate_pid_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_data_execute_query.return_value = [MagicMock(), MagicMock()]
+        mock_get_data_id_list_by_pid.return_value = [
+            "mock_document_id",
+            "mock_document_id_other",
+        ]
 
         self.assertFalse(
             data_system_api.is_pid_defined_for_data(
@@ -66,22 +55,14 @@ class TestIsPidDefinedForDataPsql(TestCase):
             )
         )
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
     def test_defined_pid_for_other_document_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
+        self, mock_get_data_id_list_by_pid
     ):
         """test_defined_pid_for_other_document_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_result = MagicMock()
-        mock_result.pk = "mock_document_id_other"
-        mock_data_execute_query.return_value = [mock_result]
+        mock_get_data_id_list_by_pid.return_value = ["mock_document_id_other"]
 
         self.assertFalse(
             data_system_api.is_pid_defined_for_data(
@@ -89,229 +70,98 @@ class TestIsPidDefinedForDataPsql(TestCase):
             )
         )
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
     def test_defined_pid_for_current_document_returns_true(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
+        self, mock_get_data_id_list_by_pid
     ):
         """test_defined_pid_for_current_document_returns_true"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_result = MagicMock()
-        mock_result.pk = "mock_document_id"
-        mock_data_execute_query.return_value = [mock_result]
+        mock_get_data_id_list_by_pid.return_value = [1234]
 
         self.assertTrue(
-            data_system_api.is_pid_defined_for_data(
-                "mock_pid", "mock_document_id"
-            )
-        )
-
-
-class TestIsPidDefinedForDataMongo(TestCase):
-    """Test Is Pid Defined For Document"""
-
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_undefined_pid_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
-        """test_undefined_pid_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_data_execute_query.return_value = []
-
-        self.assertFalse(
-            data_system_api.is_pid_defined_for_data(
-                "mock_pid", "mock_document_id"
-            )
-        )
-
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_duplicate_pid_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
-        """test_duplicate_pid_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_data_execute_query.return_value = [MagicMock(), MagicMock()]
-
-        self.assertFalse(
-            data_system_api.is_pid_defined_for_data(
-                "mock_pid", "mock_document_id"
-            )
-        )
-
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_defined_pid_for_other_document_returns_false(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
-        """test_defined_pid_for_other_document_returns_false"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_result = MagicMock()
-        mock_result.pk = "mock_document_id_other"
-        mock_data_execute_query.return_value = [mock_result]
-
-        self.assertFalse(
-            data_system_api.is_pid_defined_for_data(
-                "mock_pid", "mock_document_id"
-            )
+            data_system_api.is_pid_defined_for_data("mock_pid", 1234)
         )
-
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.get_pid_path_by_template")
-    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
-    def test_defined_pid_for_current_document_returns_true(
-        self,
-        mock_data_get_by_id,
-        mock_get_pid_path_by_template,
-        mock_data_execute_query,
-    ):
-        """test_defined_pid_for_current_document_returns_true"""
-        mock_data_get_by_id.return_value = MagicMock()
-        mock_get_pid_path_by_template.return_value = MagicMock()
-        mock_result = MagicMock()
-        mock_result.pk = "mock_document_id"
-        mock_data_execute_query.return_value = [mock_result]
-
         self.assertTrue(
-            data_system_api.is_pid_defined_for_data(
-                "mock_pid", "mock_document_id"
-            )
+            data_system_api.is_pid_defined_for_data("mock_pid", "1234")
         )
 
 
-class TestGetDataByPidPsql(TestCase):
-    """Test Get Data By Pid"""
+class TestIsPidDefined(TestCase):
+    """Test Is Pid Defined"""
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_no_results_raises_error(
-        self, mock_pid_path_get_all, mock_execute_query
-    ):
-        """test_query_returns_no_results_raises_error"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 0
-        mock_execute_query.return_value = mock_queryset
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_index_failure_returns_false(self, mock_get_data_id_list_by_pid):
+        """test_index_failure_returns_false"""
+        mock_get_data_id_list_by_pid.side_effect = ApiError(
+            "mock_get_data_id_list_by_pid_exception"
+        )
 
-        with self.assertRaises(DoesNotExist):
-            data_system_api.get_data_by_pid("mock_pid")
+        self.assertFalse(data_system_api.is_pid_defined("mock_pid"))
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_several_results_raises_error(
-        self, mock_pid_path_get_all, mock_execute_query
-    ):
-        """test_query_returns_several_results_raises_error"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 2
-        mock_execute_query.return_value = mock_queryset
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_undefined_pid_returns_false(self, mock_get_data_id_list_by_pid):
+        """test_undefined_pid_returns_false"""
+        mock_get_data_id_list_by_pid.return_value = []
 
-        with self.assertRaises(ApiError):
-            data_system_api.get_data_by_pid("mock_pid")
+        self.assertFalse(data_system_api.is_pid_defined("mock_pid"))
 
-    @override_settings(MONGODB_INDEXING=False)
-    @patch("core_linked_records_app.system.data.api.Data.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_single_result_returns_result(
-        self, mock_pid_path_get_all, mock_execute_query
-    ):
-        """test_query_returns_single_result_returns_result"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 1
-        mock_queryset.__getitem__.return_value = "mock_data"
-        mock_execute_query.return_value = mock_queryset
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_defined_pid_returns_true(self, mock_get_data_id_list_by_pid):
+        """test_defined_pid_returns_true"""
+        mock_get_data_id_list_by_pid.return_value = ["mock_document_id"]
 
-        self.assertEqual(
-            data_system_api.get_data_by_pid("mock_pid"), "mock_data"
-        )
+        self.assertTrue(data_system_api.is_pid_defined("mock_pid"))
 
 
-class TestGetDataByPidMongo(TestCase):
+class TestGetDataByPid(TestCase):
     """Test Get Data By Pid"""
 
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_no_results_raises_error(
-        self, mock_pid_path_get_all, mock_execute_query
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_index_returns_no_results_raises_error(
+        self, mock_get_data_id_list_by_pid
     ):
-        """test_query_returns_no_results_raises_error"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 0
-        mock_execute_query.return_value = mock_queryset
+        """test_index_returns_no_results_raises_error"""
+        mock_get_data_id_list_by_pid.return_value = []
 
         with self.assertRaises(DoesNotExist):
             data_system_api.get_data_by_pid("mock_pid")
 
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_several_results_raises_error(
-        self, mock_pid_path_get_all, mock_execute_query
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_index_returns_several_results_raises_error(
+        self, mock_get_data_id_list_by_pid
     ):
-        """test_query_returns_several_results_raises_error"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 2
-        mock_execute_query.return_value = mock_queryset
+        """test_index_returns_several_results_raises_error"""
+        mock_get_data_id_list_by_pid.return_value = [1, 2]
 
         with self.assertRaises(ApiError):
             data_system_api.get_data_by_pid("mock_pid")
 
-    @tag("mongodb")
-    @override_settings(MONGODB_INDEXING=True)
-    @patch("core_main_app.components.mongo.models.MongoData.execute_query")
-    @patch("core_linked_records_app.system.data.api.PidPath.get_all")
-    def test_query_returns_single_result_returns_result(
-        self, mock_pid_path_get_all, mock_execute_query
+    @patch("core_linked_records_app.system.data.api.Data.get_by_id")
+    @patch.object(
+        data_system_api.pid_index_system_api, "get_data_id_list_by_pid"
+    )
+    def test_index_returns_single_result_returns_data(
+        self, mock_get_data_id_list_by_pid, mock_data_get_by_id
     ):
-        """test_query_returns_single_result_returns_result"""
-        mock_pid_path_get_all.return_value = [MagicMock()]
-        mock_queryset = MagicMock()
-        mock_queryset.count.return_value = 1
-        mock_queryset.__getitem__.return_value = "mock_data"
-        mock_execute_query.return_value = mock_queryset
+        """test_index_returns_single_result_returns_data"""
+        mock_get_data_id_list_by_pid.return_value = [1]
+        mock_data_get_by_id.return_value = "mock_data"
 
         self.assertEqual(
             data_system_api.get_data_by_pid("mock_pid"), "mock_data"
         )
+        mock_data_get_by_id.assert_called_with(1)
 
 
 class TestDeletePidForData(TestCase):
@@ -7,6 +7,7 @@ from core_linked_records_app.components.local_id.models import LocalId
 from core_linked_records_app.system.local_id import (
     api as local_id_system_api,
 )
+from core_linked_records_app.utils.cache import LRUCache
 from core_main_app.commons import exceptions
 
 
@@ -152,3 +153,142 @@ class TestDelete(TestCase):
         self.assertEqual(
             local_id_system_api.delete(self.mock_local_id), expected_result
         )
+
+
+class TestGetRecordNameListByNameList(TestCase):
+    """Unit tests for `get_record_name_list_by_name_list` function."""
+
+    @patch.object(LocalId, "get_record_name_list_by_name_list")
+    def test_failure_raises_api_error(
+        self, mock_get_record_name_list_by_name_list
+    ):
+        """test_failure_raises_api_error"""
+        mock_get_record_name_list_by_name_list.side_effect = Exception(
+            "mock_get_record_name_list_by_name_list_exception"
+        )
+
+        with self.assertRaises(exceptions.ApiError):
+            local_id_system_api.get_record_name_list_by_name_list(
+                ["mock_name"]
+            )
+
+    @patch.object(LocalId, "get_record_name_list_by_name_list")
+    def test_returns_model_output(
+        self, mock_get_record_name_list_by_name_list
+    ):
+        """test_returns_model_output"""
+        mock_get_record_name_list_by_name_list.return_value = ["mock_name"]
+
+        self.assertEqual(
+            local_id_system_api.get_record_name_list_by_name_list(
+                ["mock_name"]
+            ),
+            ["mock_name"],
+        )
+
+
+class TestInsertMany(TestCase):
+    """Unit tests for `insert_many` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.mock_local_id_list = [MagicMock()]
+
+    @patch.object(LocalId, "insert_many")
+    def test_failure_raises_api_error(self, mock_insert_many):
+        """test_failure_raises_api_error"""
+        mock_insert_many.side_effect = Exception("mock_insert_many_exception")
+
+        with self.assertRaises(exceptions.ApiError):
+            local_id_system_api.insert_many(self.mock_local_id_list)
+
+    @patch.object(LocalId, "insert_many")
+    def test_returns_model_output(self, mock_insert_many):
+        """test_returns_model_output"""
+        mock_insert_many.return_value = self.mock_local_id_list
+
+        self.assertEqual(
+            local_id_system_api.insert_many(self.mock_local_id_list),
+            self.mock_local_id_list,
+        )
+
+
+class TestGetByClassAndIdCache(TestCase):
+    """Unit tests for the cache of `get_by_class_and_id` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.local_id_cache = local_id_system_api.local_id_cache
+        local_id_system_api.local_id_cache = LRUCache(10)
+
+    def tearDown(self) -> None:
+        """tearDown"""
+        local_id_system_api.local_id_cache = self.local_id_cache
+
+    @patch.object(LocalId, "get_by_class_and_id")
+    def test_second_lookup_hits_cache(self, mock_get_by_class_and_id):
+        """test_second_lookup_hits_cache"""
+        mock_get_by_class_and_id.return_value = LocalId(
+            pk=1,
+            record_name="mock_record_name",
+            record_object_class="class",
+            record_object_id="id",
+        )
+
+        local_id_system_api.get_by_class_and_id("class", "id")
+        result = local_id_system_api.get_by_class_and_id("class", "id")
+
+        mock_get_by_class_and_id.assert_called_once()
+        self.assertEqual(result.pk, 1)
+        self.assertEqual(result.record_name, "mock_record_name")
+        self.assertIsNot(result, mock_get_by_class_and_id.return_value)
+
+    @patch.object(LocalId, "get_by_class_and_id")
+    def test_does_not_exist_is_not_cached(self, mock_get_by_class_and_id):
+        """test_does_not_exist_is_not_cached"""
+        mock_get_by_class_and_id.side_effect = exceptions.DoesNotExist(
+            "mock_get_by_class_and_id_exception"
+        )
+
+        for _ in range(2):
+            with self.assertRaises(exceptions.DoesNotExist):
+                local_id_system_api.get_by_class_and_id("class", "id")
+
+        self.assertEqual(mock_get_by_class_and_id.call_count, 2)
+
+    @patch.object(LocalId, "get_by_class_and_id")
+    def test_invalidate_forces_new_lookup(self, mock_get_by_class_and_id):
+        """test_invalidate_forces_new_lookup"""
+        mock_get_by_class_and_id.return_value = LocalId(
+            pk=1, record_name="mock_record_name"
+        )
+
+        local_id_system_api.get_by_class_and_id("class", 1)
+        local_id_system_api.invalidate_local_id_cache("class", "1")
+        local_id_system_api.get_by_class_and_id("class", 1)
+
+        self.assertEqual(mock_get_by_class_and_id.call_count, 2)
+
+
+class TestGetAllByClassAndIdList(TestCase):
+    """Unit tests for `get_all_by_class_and_id_list` function."""
+
+    @patch.object(LocalId, "get_all_by_class_and_id_list")
+    def test_failure_raises_api_error(self, mock_get_all_by_class_and_id_list):
+        """test_failure_raises_api_error"""
+        mock_get_all_by_class_and_id_list.side_effect = Exception(
+            "mock_get_all_by_class_and_id_list_exception"
+        )
+
+        with self.assertRaises(exceptions.ApiError):
+            local_id_system_api.get_all_by_class_and_id_list("class", ["id"])
+
+    @patch.object(LocalId, "get_all_by_class_and_id_list")
+    def test_returns_model_output(self, mock_get_all_by_class_and_id_list):
+        """test_returns_model_output"""
+        mock_get_all_by_class_and_id_list.return_value = "mock_local_id_list"
+
+        self.assertEqual(
+            local_id_system_api.get_all_by_class_and_id_list("class", ["id"]),
+            "mock_local_id_list",
+        )
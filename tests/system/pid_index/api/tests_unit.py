@@ -0,0 +1,372 @@
+"""Unit tests for core_linked_records_app.system.pid_index.api"""
+
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from core_linked_records_app.system.pid_index import (
+    api as pid_index_system_api,
+)
+from core_main_app.commons.exceptions import ApiError, ModelError
+from tests import mocks
+
+
+class TestGetDataIdListByPid(TestCase):
+    """Test get_data_id_list_by_pid"""
+
+    @patch.object(pid_index_system_api.PidIndex, "get_data_id_list_by_pid")
+    def test_model_failure_raises_api_error(
+        self, mock_get_data_id_list_by_pid
+    ):
+        """test_model_failure_raises_api_error"""
+        mock_get_data_id_list_by_pid.side_effect = ModelError(
+            "mock_get_data_id_list_by_pid_exception"
+        )
+
+        with self.assertRaises(ApiError):
+            pid_index_system_api.get_data_id_list_by_pid("mock_pid")
+
+    @patch.object(pid_index_system_api.PidIndex, "get_data_id_list_by_pid")
+    def test_invalid_pid_returns_empty_list(
+        self, mock_get_data_id_list_by_pid
+    ):
+        """test_invalid_pid_returns_empty_list"""
+        self.assertEqual(
+            pid_index_system_api.get_data_id_list_by_pid(None), []
+        )
+        self.assertEqual(pid_index_system_api.get_data_id_list_by_pid(""), [])
+        mock_get_data_id_list_by_pid.assert_not_called()
+
+    @patch.object(pid_index_system_api.PidIndex, "get_data_id_list_by_pid")
+    def test_pid_is_normalized(self, mock_get_data_id_list_by_pid):
+        """test_pid_is_normalized"""
+        mock_get_data_id_list_by_pid.return_value = [1]
+
+        self.assertEqual(
+            pid_index_system_api.get_data_id_list_by_pid(" mock_pid/ "), [1]
+        )
+        mock_get_data_id_list_by_pid.assert_called_with("mock_pid")
+
+
+class TestGetDataIdDictByPidList(TestCase):
+    """Test get_data_id_dict_by_pid_list"""
+
+    @patch.object(
+        pid_index_system_api.PidIndex, "get_pid_and_data_id_list_by_pid_list"
+    )
+    def test_model_failure_raises_api_error(
+        self, mock_get_pid_and_data_id_list_by_pid_list
+    ):
+        """test_model_failure_raises_api_error"""
+        mock_get_pid_and_data_id_list_by_pid_list.side_effect = ModelError(
+            "mock_get_pid_and_data_id_list_by_pid_list_exception"
+        )
+
+        with self.assertRaises(ApiError):
+            pid_index_system_api.get_data_id_dict_by_pid_list(["mock_pid"])
+
+    @patch.object(
+        pid_index_system_api.PidIndex, "get_pid_and_data_id_list_by_pid_list"
+    )
+    def test_invalid_pids_skip_query(
+        self, mock_get_pid_and_data_id_list_by_pid_list
+    ):
+        """test_invalid_pids_skip_query"""
+        self.assertEqual(
+            pid_index_system_api.get_data_id_dict_by_pid_list([None, ""]), {}
+        )
+        mock_get_pid_and_data_id_list_by_pid_list.assert_not_called()
+
+    @patch.object(
+        pid_index_system_api.PidIndex, "get_pid_and_data_id_list_by_pid_list"
+    )
+    def test_data_ids_are_grouped_by_normalized_pid(
+        self, mock_get_pid_and_data_id_list_by_pid_list
+    ):
+        """test_data_ids_are_grouped_by_normalized_pid"""
+        mock_get_pid_and_data_id_list_by_pid_list.return_value = [
+            ("mock_pid_1", 1),
+            ("mock_pid_1", 2),
+            ("mock_pid_2", 3),
+        ]
+
+        self.assertEqual(
+            pid_index_system_api.get_data_id_dict_by_pid_list(
+                [" mock_pid_1/ ", "mock_pid_2", "mock_pid_1"]
+            ),
+            {"mock_pid_1": [1, 2], "mock_pid_2": [3]},
+        )
+        self.assertEqual(
+            sorted(mock_get_pid_and_data_id_list_by_pid_list.call_args[0][0]),
+            ["mock_pid_1", "mock_pid_2"],
+        )
+
+
+class TestGetPidIndexListForData(TestCase):
+    """Test get_pid_index_list_for_data"""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.mock_data = mocks.MockData()
+        self.mock_data.template = mocks.MockTemplate()
+        self.mock_data.template.pk = 5678
+
+    @patch.object(pid_index_system_api, "get_dict_content_for_data")
+    @patch.object(
+        pid_index_system_api.pid_path_system_api,
+        "get_all_pid_paths_by_template",
+    )
+    def test_all_template_paths_are_indexed(
+        self, mock_get_all_pid_paths_by_template, mock_get_dict_content
+    ):
+        """test_all_template_paths_are_indexed"""
+        mock_pid_path_1 = mocks.MockPidPath()
+        mock_pid_path_1.path = "root.pid1"
+        mock_pid_path_2 = mocks.MockPidPath()
+        mock_pid_path_2.path = "root.pid2"
+        mock_get_all_pid_paths_by_template.return_value = [
+            mock_pid_path_1,
+            mock_pid_path_2,
+        ]
+        mock_get_dict_content.return_value = {
+            "root": {"pid1": "mock_pid_1/", "pid2": "mock_pid_2"},
+            "mock": {"pid": "mock_pid_3"},
+        }
+
+        result = pid_index_system_api.get_pid_index_list_for_data(
+            self.mock_data
+        )
+
+        self.assertEqual(
+            [(pid_index.path, pid_index.pid) for pid_index in result],
+            [
+                ("root.pid1", "mock_pid_1"),
+                ("root.pid2", "mock_pid_2"),
+                ("mock.pid", "mock_pid_3"),
+            ],
+        )
+        self.assertTrue(
+            all(
+                pid_index.data_id == self.mock_data.pk
+                and pid_index.template_id == 5678
+                for pid_index in result
+            )
+        )
+
+    @patch.object(pid_index_system_api, "get_dict_content_for_data")
+    @patch.object(
+        pid_index_system_api.pid_path_system_api,
+        "get_all_pid_paths_by_template",
+    )
+    def test_duplicate_paths_are_indexed_once(
+        self, mock_get_all_pid_paths_by_template, mock_get_dict_content
+    ):
+        """test_duplicate_paths_are_indexed_once"""
+        mock_pid_path = mocks.MockPidPath()
+        mock_pid_path.path = "mock.pid"
+        mock_get_all_pid_paths_by_template.return_value = [mock_pid_path]
+        mock_get_dict_content.return_value = {"mock": {"pid": "mock_pid"}}
+
+        result = pid_index_system_api.get_pid_index_list_for_data(
+            self.mock_data
+        )
+
+        self.assertEqual(len(result), 1)
+
+    @patch.object(pid_index_system_api, "get_dict_content_for_data")
+    @patch.object(
+        pid_index_system_api.pid_path_system_api,
+        "get_all_pid_paths_by_template",
+    )
+    def test_missing_or_invalid_values_are_not_indexed(
+        self, mock_get_all_pid_paths_by_template, mock_get_dict_content
+    ):
+        """test_missing_or_invalid_values_are_not_indexed"""
+        mock_pid_path_1 = mocks.MockPidPath()
+        mock_pid_path_1.path = "root.pid1"
+        mock_pid_path_2 = mocks.MockPidPath()
+        mock_pid_path_2.path = "root.pid2"
+        mock_get_all_pid_paths_by_template.return_value = [
+            mock_pid_path_1,
+            mock_pid_path_2,
+        ]
+        mock_get_dict_content.return_value = {
+            "root": {"pid1": {"#text": "mock_pid"}, "pid2": ""}
+        }
+
+        self.assertEqual(
+            pid_index_system_api.get_pid_index_list_for_data(self.mock_data),
+            [],
+        )
+
+
+class TestIsDataIndexed(TestCase):
+    """Test is_data_indexed"""
+
+    @patch.object(pid_index_system_api.PidIndex, "get_all_by_data_id_list")
+    @patch.object(pid_index_system_api, "get_pid_index_list_for_data")
+    def test_matching_index_returns_true(
+        self, mock_get_pid_index_list_for_data, mock_get_all_by_data_id_list
+    ):
+        """test_matching_index_returns_true"""
+        mock_pid_index = Mock(path="mock.pid", pid="mock_pid")
+        mock_get_pid_index_list_for_data.return_value = [mock_pid_index]
+        mock_get_all_by_data_id_list.return_value = [
+            Mock(path="mock.pid", pid="mock_pid")
+        ]
+
+        self.assertTrue(pid_index_system_api.is_data_indexed(mocks.MockData()))
+
+    @patch.object(pid_index_system_api.PidIndex, "get_all_by_data_id_list")
+    @patch.object(pid_index_system_api, "get_pid_index_list_for_data")
+    def test_outdated_index_returns_false(
+        self, mock_get_pid_index_list_for_data, mock_get_all_by_data_id_list
+    ):
+        """test_outdated_index_returns_false"""
+        mock_get_pid_index_list_for_data.return_value = [
+            Mock(path="mock.pid", pid="mock_pid")
+        ]
+        mock_get_all_by_data_id_list.return_value = [
+            Mock(path="mock.pid", pid="mock_old_pid")
+        ]
+
+        self.assertFalse(
+            pid_index_system_api.is_data_indexed(mocks.MockData())
+        )
+
+
+class TestIndexData(TestCase):
+    """Test index_data"""
+
+    @patch.object(pid_index_system_api.PidIndex, "replace_by_data_id")
+    @patch.object(pid_index_system_api, "get_pid_index_list_for_data")
+    def test_index_is_replaced(
+        self, mock_get_pid_index_list_for_data, mock_replace_by_data_id
+    ):
+        """test_index_is_replaced"""
+        mock_data = mocks.MockData()
+        mock_get_pid_index_list_for_data.return_value = ["mock_pid_index"]
+
+        pid_index_system_api.index_data(mock_data)
+
+        mock_replace_by_data_id.assert_called_with(
+            mock_data.pk, ["mock_pid_index"]
+        )
+
+    @patch.object(pid_index_system_api, "invalidate_unknown_pid_list")
+    @patch.object(pid_index_system_api.PidIndex, "replace_by_data_id")
+    @patch.object(pid_index_system_api, "get_pid_index_list_for_data")
+    def test_indexed_pids_are_removed_from_unknown_pid_cache(
+        self,
+        mock_get_pid_index_list_for_data,
+        mock_replace_by_data_id,
+        mock_invalidate_unknown_pid_list,
+    ):
+        """test_indexed_pids_are_removed_from_unknown_pid_cache"""
+        mock_get_pid_index_list_for_data.return_value = [
+            Mock(pid="mock_pid_1"),
+            Mock(pid="mock_pid_2"),
+        ]
+
+        pid_index_system_api.index_data(mocks.MockData())
+
+        self.assertEqual(
+            list(mock_invalidate_unknown_pid_list.call_args.args[0]),
+            ["mock_pid_1", "mock_pid_2"],
+        )
+
+    @patch.object(pid_index_system_api.PidIndex, "replace_by_data_id")
+    @patch.object(pid_index_system_api, "get_pid_index_list_for_data")
+    def test_replace_failure_raises_api_error(
+        self, mock_get_pid_index_list_for_data, mock_replace_by_data_id
+    ):
+        """test_replace_failure_raises_api_error"""
+        mock_get_pid_index_list_for_data.return_value = []
+        mock_replace_by_data_id.side_effect = ModelError(
+            "mock_replace_by_data_id_exception"
+        )
+
+        with self.assertRaises(ApiError):
+            pid_index_system_api.index_data(mocks.MockData())
+
+
+class TestComputeRegistrationDigest(TestCase):
+    """Test compute_registration_digest"""
+
+    def setUp(self):
+        """setUp"""
+        self.mock_data = mocks.MockData()
+        self.mock_data.template.pk = 1
+        self.mock_data.content = "<mock><pid>pid1</pid></mock>"
+        self.digest = pid_index_system_api.compute_registration_digest(
+            self.mock_data, ["mock.pid"]
+        )
+
+    def test_same_data_has_same_digest(self):
+        """test_same_data_has_same_digest"""
+        self.assertEqual(
+            pid_index_system_api.compute_registration_digest(
+                self.mock_data, ["mock.pid"]
+            ),
+            self.digest,
+        )
+
+    def test_content_change_changes_digest(self):
+        """test_content_change_changes_digest"""
+        self.mock_data.content = "<mock><pid>pid2</pid></mock>"
+
+        self.assertNotEqual(
+            pid_index_system_api.compute_registration_digest(
+                self.mock_data, ["mock.pid"]
+            ),
+            self.digest,
+        )
+
+    def test_pid_path_change_changes_digest(self):
+        """test_pid_path_change_changes_digest"""
+        self.assertNotEqual(
+            pid_index_system_api.compute_registration_digest(
+                self.mock_data, ["mock.other_pid"]
+            ),
+            self.digest,
+        )
+
+
+class TestGetRegistrationState(TestCase):
+    """Test get_registration_state"""
+
+    @patch.object(pid_index_system_api.PidIndex, "get_all_by_data_id_list")
+    def test_returns_digest_and_pid_dict(self, mock_get_all_by_data_id_list):
+        """test_returns_digest_and_pid_dict"""
+        mock_get_all_by_data_id_list.return_value = [
+            Mock(path="mock.pid", pid="pid1", registration_digest="digest"),
+            Mock(path="mock.url", pid="pid2", registration_digest="digest"),
+        ]
+
+        self.assertEqual(
+            pid_index_system_api.get_registration_state(1),
+            ("digest", {"mock.pid": "pid1", "mock.url": "pid2"}),
+        )
+        mock_get_all_by_data_id_list.assert_called_with([1])
+
+    @patch.object(pid_index_system_api.PidIndex, "get_all_by_data_id_list")
+    def test_unindexed_data_has_empty_digest(
+        self, mock_get_all_by_data_id_list
+    ):
+        """test_unindexed_data_has_empty_digest"""
+        mock_get_all_by_data_id_list.return_value = []
+
+        self.assertEqual(
+            pid_index_system_api.get_registration_state(1), ("", {})
+        )
+
+    @patch.object(pid_index_system_api.PidIndex, "get_all_by_data_id_list")
+    def test_model_failure_raises_api_error(
+        self, mock_get_all_by_data_id_list
+    ):
+        """test_model_failure_raises_api_error"""
+        mock_get_all_by_data_id_list.side_effect = ModelError(
+            "mock_get_all_by_data_id_list_error"
+        )
+
+        with self.assertRaises(ApiError):
+            pid_index_system_api.get_registration_state(1)
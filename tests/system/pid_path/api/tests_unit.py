@@ -6,6 +6,8 @@ from unittest.mock import patch, Mock
 from core_linked_records_app import settings
 from core_linked_records_app.system.pid_path import api as pid_path_system_api
 from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.utils.cache import pid_config_cache
+from core_main_app.components.template.models import Template
 from tests import mocks
 
 
@@ -152,3 +154,90 @@ class TestGetAllPidPathsByTemplate(TestCase):
         self.assertIsInstance(result, list)
         self.assertIsNotNone(result[0])
         self.assertGreater(len(result), 0)
+
+
+class TestGetPathListDictByTemplateIdList(TestCase):
+    """Test get_path_list_dict_by_template_id_list"""
+
+    @patch.object(PidPath, "get_all_by_template_list")
+    def test_paths_are_grouped_by_template(
+        self, mock_get_all_by_template_list
+    ):
+        """test_paths_are_grouped_by_template"""
+        mock_get_all_by_template_list.return_value = [
+            PidPath(template_id=1, path="path_1"),
+            PidPath(template_id=1, path="path_2"),
+        ]
+
+        result = pid_path_system_api.get_path_list_dict_by_template_id_list(
+            [1, 2]
+        )
+
+        mock_get_all_by_template_list.assert_called_once_with([1, 2])
+        self.assertEqual(
+            result, {1: ["path_1", "path_2"], 2: [settings.PID_PATH]}
+        )
+
+
+@patch.object(settings, "PID_CONFIG_CACHE_ENABLED", True)
+class TestCachedPidPath(TestCase):
+    """Test the PidPath functions using the PID configuration cache"""
+
+    def setUp(self):
+        """setUp"""
+        pid_config_cache.invalidate()
+        self.mock_template = Template(pk=1)
+        self.pid_path_list = [
+            PidPath(template_id=1, path="path_1"),
+            PidPath(template_id=1, path="path_2"),
+        ]
+
+    def tearDown(self):
+        """tearDown"""
+        pid_config_cache.invalidate()
+
+    @patch.object(PidPath, "get_all")
+    def test_paths_are_loaded_once(self, mock_get_all):
+        """test_paths_are_loaded_once"""
+        mock_get_all.return_value.order_by.return_value = self.pid_path_list
+
+        pid_path_system_api.get_all_pid_paths_by_template(self.mock_template)
+        result = pid_path_system_api.get_all_pid_paths_by_template(
+            self.mock_template
+        )
+
+        self.assertEqual(result, self.pid_path_list)
+        mock_get_all.assert_called_once()
+
+    @patch.object(PidPath, "get_all")
+    def test_first_path_is_returned(self, mock_get_all):
+        """test_first_path_is_returned"""
+        mock_get_all.return_value.order_by.return_value = self.pid_path_list
+
+        self.assertEqual(
+            pid_path_system_api.get_pid_path_by_template(self.mock_template),
+            self.pid_path_list[0],
+        )
+
+    @patch.object(PidPath, "get_all")
+    def test_template_without_path_returns_default(self, mock_get_all):
+        """test_template_without_path_returns_default"""
+        mock_get_all.return_value.order_by.return_value = []
+
+        result = pid_path_system_api.get_all_pid_paths_by_template(
+            self.mock_template
+        )
+
+        self.assertEqual(
+            [pid_path.path for pid_path in result], [settings.PID_PATH]
+        )
+
+    @patch.object(PidPath, "get_all")
+    def test_path_list_dict_uses_cache(self, mock_get_all):
+        """test_path_list_dict_uses_cache"""
+        mock_get_all.return_value.order_by.return_value = self.pid_path_list
+
+        self.assertEqual(
+            pid_path_system_api.get_path_list_dict_by_template_id_list([1, 2]),
+            {1: ["path_1", "path_2"], 2: [settings.PID_PATH]},
+        )
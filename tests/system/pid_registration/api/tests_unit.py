@@ -0,0 +1,116 @@
+"""Unit tests for core_linked_records_app.system.pid_registration.api."""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_linked_records_app import settings
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_linked_records_app.system.pid_registration import (
+    api as pid_registration_system_api,
+)
+from core_main_app.commons import exceptions
+
+
+class TestIsRegistrationDeferred(TestCase):
+    """Unit tests for `is_registration_deferred` function."""
+
+    @patch.object(settings, "PID_REGISTRATION_BACKEND", "inline")
+    def test_inline_backend_returns_false(self):
+        """test_inline_backend_returns_false"""
+        self.assertFalse(
+            pid_registration_system_api.is_registration_deferred()
+        )
+
+    @patch.object(settings, "PID_REGISTRATION_BACKEND", "outbox")
+    def test_outbox_backend_returns_true(self):
+        """test_outbox_backend_returns_true"""
+        self.assertTrue(pid_registration_system_api.is_registration_deferred())
+
+    @patch.object(settings, "PID_REGISTRATION_BACKEND", "outbox")
+    def test_inline_registration_context_returns_false(self):
+        """test_inline_registration_context_returns_false"""
+        with pid_registration_system_api.inline_registration():
+            self.assertFalse(
+                pid_registration_system_api.is_registration_deferred()
+            )
+
+        self.assertTrue(pid_registration_system_api.is_registration_deferred())
+
+
+class TestQueueForData(TestCase):
+    """Unit tests for `queue_for_data` function."""
+
+    @patch.object(PidRegistration, "queue")
+    def test_failure_raises_api_error(self, mock_queue):
+        """test_failure_raises_api_error"""
+        mock_queue.side_effect = Exception("mock_queue_exception")
+
+        with self.assertRaises(exceptions.ApiError):
+            pid_registration_system_api.queue_for_data(1)
+
+    @patch.object(PidRegistration, "queue")
+    def test_queue_called_with_data_id(self, mock_queue):
+        """test_queue_called_with_data_id"""
+        pid_registration_system_api.queue_for_data(1)
+        mock_queue.assert_called_with(data_id=1)
+
+
+class TestQueueForBlob(TestCase):
+    """Unit tests for `queue_for_blob` function."""
+
+    @patch.object(PidRegistration, "queue")
+    def test_failure_raises_api_error(self, mock_queue):
+        """test_failure_raises_api_error"""
+        mock_queue.side_effect = Exception("mock_queue_exception")
+
+        with self.assertRaises(exceptions.ApiError):
+            pid_registration_system_api.queue_for_blob(1)
+
+    @patch.object(PidRegistration, "queue")
+    def test_queue_called_with_blob_id(self, mock_queue):
+        """test_queue_called_with_blob_id"""
+        pid_registration_system_api.queue_for_blob(1)
+        mock_queue.assert_called_with(blob_id=1)
+
+
+class TestGetByDataId(TestCase):
+    """Unit tests for `get_by_data_id` function."""
+
+    @patch.object(PidRegistration, "get_by_data_id")
+    def test_does_not_exist_raises_does_not_exist(self, mock_get_by_data_id):
+        """test_does_not_exist_raises_does_not_exist"""
+        mock_get_by_data_id.side_effect = exceptions.DoesNotExist(
+            "mock_does_not_exist"
+        )
+
+        with self.assertRaises(exceptions.DoesNotExist):
+            pid_registration_system_api.get_by_data_id(1)
+
+    @patch.object(PidRegistration, "get_by_data_id")
+    def test_failure_raises_api_error(self, mock_get_by_data_id):
+        """test_failure_raises_api_error"""
+        mock_get_by_data_id.side_effect = Exception("mock_exception")
+
+        with self.assertRaises(exceptions.ApiError):
+            pid_registration_system_api.get_by_data_id(1)
+
+
+class TestClaim(TestCase):
+    """Unit tests for `claim` function."""
+
+    @patch.object(PidRegistration, "claim")
+    def test_failure_raises_api_error(self, mock_claim):
+        """test_failure_raises_api_error"""
+        mock_claim.side_effect = Exception("mock_claim_exception")
+
+        with self.assertRaises(exceptions.ApiError):
+            pid_registration_system_api.claim(MagicMock())
+
+    @patch.object(PidRegistration, "claim")
+    def test_returns_model_output(self, mock_claim):
+        """test_returns_model_output"""
+        mock_claim.return_value = False
+
+        self.assertFalse(pid_registration_system_api.claim(MagicMock()))
@@ -89,3 +89,12 @@ ENABLE_BLOB_MODULES_SIGNALS = False
 ENABLE_DATA_MODULES_SIGNALS = False
 
 ENABLE_JSON_SCHEMA_SUPPORT = True
+
+# Unit tests mock the PidSettings and PidPath models.
+PID_CONFIG_CACHE_ENABLED = False
+
+# Test databases are rebuilt, so PIDs unknown in a test may exist in another.
+PID_NEGATIVE_CACHE_SIZE = 0
+
+# Background threads would outlive the tests saving PID paths.
+PID_PATH_REINDEX_ENABLED = False
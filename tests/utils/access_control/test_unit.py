@@ -0,0 +1,83 @@
+"""Unit tests for core_linked_records_app.utils.access_control"""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_linked_records_app.utils import (
+    access_control as access_control_utils,
+)
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.components.workspace import api as workspace_api
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestFilterReadableDocumentList(TestCase):
+    """Unit tests for `filter_readable_document_list` function."""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.owned_document = MagicMock(user_id="1", workspace_id=None)
+        self.shared_document = MagicMock(user_id="2", workspace_id=10)
+        self.private_document = MagicMock(user_id="2", workspace_id=None)
+        self.document_list = [
+            self.owned_document,
+            self.shared_document,
+            self.private_document,
+        ]
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_superuser_reads_all_documents(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_superuser_reads_all_documents"""
+        result = access_control_utils.filter_readable_document_list(
+            self.document_list, create_mock_user("3", is_superuser=True)
+        )
+
+        self.assertEqual(result, self.document_list)
+        mock_get_all_workspaces_with_read_access_by_user.assert_not_called()
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_workspaces_are_retrieved_once(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_workspaces_are_retrieved_once"""
+        mock_get_all_workspaces_with_read_access_by_user.return_value = [
+            MagicMock(pk=10)
+        ]
+
+        result = access_control_utils.filter_readable_document_list(
+            self.document_list + [MagicMock(user_id="2", workspace_id=20)],
+            create_mock_user("1"),
+        )
+
+        self.assertEqual(result, [self.owned_document, self.shared_document])
+        mock_get_all_workspaces_with_read_access_by_user.assert_called_once()
+
+    @patch.object(workspace_api, "get_all_workspaces_with_read_access_by_user")
+    def test_owned_documents_do_not_retrieve_workspaces(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_owned_documents_do_not_retrieve_workspaces"""
+        result = access_control_utils.filter_readable_document_list(
+            [self.owned_document], create_mock_user("1")
+        )
+
+        self.assertEqual(result, [self.owned_document])
+        mock_get_all_workspaces_with_read_access_by_user.assert_not_called()
+
+    @patch.object(access_control_utils, "check_anonymous_access")
+    def test_denied_anonymous_user_reads_nothing(
+        self, mock_check_anonymous_access
+    ):
+        """test_denied_anonymous_user_reads_nothing"""
+        mock_check_anonymous_access.side_effect = AccessControlError(
+            "mock_check_anonymous_access_error"
+        )
+
+        self.assertEqual(
+            access_control_utils.filter_readable_document_list(
+                self.document_list, create_mock_user("1", is_anonymous=True)
+            ),
+            [],
+        )
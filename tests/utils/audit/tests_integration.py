@@ -0,0 +1,203 @@
+"""Integration tests for the PID audit utilities and command."""
+
+from datetime import timedelta
+from io import StringIO
+from os.path import join
+
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from core_linked_records_app.components.local_id.models import LocalId
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.components.pid_registration.models import (
+    PidRegistration,
+)
+from core_linked_records_app.settings import (
+    ID_PROVIDER_PREFIX_DEFAULT,
+    ID_PROVIDER_SYSTEM_NAME,
+)
+from core_linked_records_app.utils import audit as audit_utils
+from core_linked_records_app.utils.path import get_api_path_from_object
+from core_main_app.components.blob.models import Blob
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from tests.fixtures import DataFixtures, MediaRootIntegrationTestCase
+from tests.test_settings import SERVER_URI
+
+
+class TestPidAudit(MediaRootIntegrationTestCase):
+    """Integration tests for the PID audit."""
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.record_name = f"{ID_PROVIDER_PREFIX_DEFAULT}/pid1"
+        self.mock_pid_url = join(
+            SERVER_URI, "rest", ID_PROVIDER_SYSTEM_NAME, self.record_name
+        )
+        super().setUp()
+        self.fixture.auto_set_pid(True)
+        self.data_1 = self.fixture.insert_record(
+            "record_1", self.mock_pid_url, self.user
+        )
+
+    @staticmethod
+    def _call_audit(*args):
+        """Run the audit command and return its output and error."""
+        stdout = StringIO()
+        error = None
+
+        try:
+            call_command("pidaudit", *args, stdout=stdout)
+        except CommandError as exc:
+            error = exc
+
+        return stdout.getvalue(), error
+
+    def test_get_local_pid_url_list_returns_local_provider_url(self):
+        """test_get_local_pid_url_list_returns_local_provider_url"""
+        self.assertEqual(
+            audit_utils.get_local_pid_url_list(),
+            [join(SERVER_URI, "rest", ID_PROVIDER_SYSTEM_NAME)],
+        )
+
+    def test_consistent_pids_are_not_reported(self):
+        """test_consistent_pids_are_not_reported"""
+        output, error = self._call_audit()
+
+        self.assertIsNone(error)
+        self.assertIn(
+            "1 records processed, 0 orphan, 0 missing, 0 duplicate PIDs, 0 "
+            "dangling blob PIDs.",
+            output,
+        )
+
+    def test_orphan_record_is_reported(self):
+        """test_orphan_record_is_reported"""
+        LocalId(record_name=f"{ID_PROVIDER_PREFIX_DEFAULT}/orphan").save()
+
+        output, error = self._call_audit()
+
+        self.assertIsNotNone(error)
+        self.assertIn(
+            f"Orphan record: {ID_PROVIDER_PREFIX_DEFAULT}/orphan.", output
+        )
+        self.assertEqual(LocalId.objects.count(), 2)
+
+    def test_repair_deletes_orphan_record(self):
+        """test_repair_deletes_orphan_record"""
+        LocalId(record_name=f"{ID_PROVIDER_PREFIX_DEFAULT}/orphan").save()
+
+        _, error = self._call_audit("--repair", "--batch-size", "1")
+
+        self.assertIsNone(error)
+        self.assertEqual(
+            list(LocalId.objects.values_list("record_name", flat=True)),
+            [self.record_name],
+        )
+
+    def test_missing_record_is_reported(self):
+        """test_missing_record_is_reported"""
+        LocalId.objects.filter(record_name=self.record_name).delete()
+
+        output, error = self._call_audit()
+
+        self.assertIsNotNone(error)
+        self.assertIn(f"Missing record: {self.record_name}.", output)
+
+    def test_repair_creates_missing_record(self):
+        """test_repair_creates_missing_record"""
+        LocalId.objects.filter(record_name=self.record_name).delete()
+
+        _, error = self._call_audit("--repair")
+
+        self.assertIsNone(error)
+        self.assertTrue(
+            LocalId.objects.filter(record_name=self.record_name).exists()
+        )
+
+    def test_dangling_blob_pid_is_repaired(self):
+        """test_dangling_blob_pid_is_repaired"""
+        LocalId(
+            record_name=f"{ID_PROVIDER_PREFIX_DEFAULT}/blob1",
+            record_object_class=get_api_path_from_object(Blob()),
+            record_object_id="999",
+        ).save()
+
+        output, error = self._call_audit("--repair")
+
+        self.assertIsNone(error)
+        self.assertIn(
+            f"Dangling blob PID: {ID_PROVIDER_PREFIX_DEFAULT}/blob1 "
+            "(blob 999).",
+            output,
+        )
+        self.assertFalse(
+            LocalId.objects.filter(record_object_id="999").exists()
+        )
+
+    def test_duplicate_pid_is_reported_and_not_repaired(self):
+        """test_duplicate_pid_is_reported_and_not_repaired"""
+        self.fixture.auto_set_pid(False)
+        data_2 = self.fixture.insert_record(
+            "record_2", self.mock_pid_url, self.user
+        )
+
+        output, error = self._call_audit("--repair")
+
+        self.assertIsNotNone(error)
+        self.assertIn(
+            f"Duplicate PID: {self.mock_pid_url} (data {self.data_1.pk}, "
+            f"{data_2.pk}).",
+            output,
+        )
+
+    def test_repair_is_refused_if_index_is_outdated(self):
+        """test_repair_is_refused_if_index_is_outdated"""
+        PidIndex.objects.filter(data_id=self.data_1.pk).delete()
+        LocalId(record_name=f"{ID_PROVIDER_PREFIX_DEFAULT}/orphan").save()
+
+        _, error = self._call_audit("--repair")
+
+        self.assertIsNotNone(error)
+        self.assertIn("pidindex", str(error))
+        self.assertEqual(LocalId.objects.count(), 2)
+
+    def test_delete_keeps_record_of_data_changed_during_audit(self):
+        """test_delete_keeps_record_of_data_changed_during_audit"""
+        audit_date = timezone.now() - timedelta(minutes=1)
+        PidIndex.objects.filter(data_id=self.data_1.pk).delete()
+        url_list = audit_utils.get_local_pid_url_list()
+        orphan_local_id_list = audit_utils.find_orphan_local_id_list(
+            LocalId.objects.all(), url_list
+        )
+
+        deleted_count = audit_utils.delete_orphan_local_id_list(
+            orphan_local_id_list, url_list, audit_date
+        )
+
+        self.assertEqual(len(orphan_local_id_list), 1)
+        self.assertEqual(deleted_count, 0)
+        self.assertTrue(
+            LocalId.objects.filter(record_name=self.record_name).exists()
+        )
+
+    def test_delete_keeps_record_of_pending_registration(self):
+        """test_delete_keeps_record_of_pending_registration"""
+        audit_date = timezone.now() + timedelta(minutes=1)
+        PidIndex.objects.filter(data_id=self.data_1.pk).delete()
+        PidRegistration.queue(data_id=self.data_1.pk)
+        url_list = audit_utils.get_local_pid_url_list()
+        orphan_local_id_list = audit_utils.find_orphan_local_id_list(
+            LocalId.objects.all(), url_list
+        )
+
+        deleted_count = audit_utils.delete_orphan_local_id_list(
+            orphan_local_id_list, url_list, audit_date
+        )
+
+        self.assertEqual(deleted_count, 0)
+        self.assertTrue(
+            LocalId.objects.filter(record_name=self.record_name).exists()
+        )
@@ -0,0 +1,312 @@
+"""Integration tests for the PID backfill utilities and command."""
+
+import json
+import os
+import tempfile
+from io import StringIO
+from os.path import join
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+
+from core_linked_records_app.components.pid_index.models import PidIndex
+from core_linked_records_app.settings import (
+    ID_PROVIDER_PREFIX_BLOB,
+    ID_PROVIDER_PREFIX_DEFAULT,
+    ID_PROVIDER_SYSTEM_NAME,
+)
+from core_linked_records_app.system.blob import api as blob_system_api
+from core_linked_records_app.system.data import api as data_system_api
+from core_linked_records_app.utils import backfill as backfill_utils
+from core_linked_records_app.utils import data as data_utils
+from core_linked_records_app.utils.providers import ProviderManager
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from tests.fixtures import DataFixtures, MediaRootIntegrationTestCase
+from tests.test_settings import SERVER_URI
+
+PARENT_PROCESS_ID = os.getpid()
+
+
+def _backfill_data_batch_in_worker(data_id_list):
+    """Count the data of a batch as assigned if it runs in a worker
+    process.
+    """
+    if os.getpid() == PARENT_PROCESS_ID:
+        return {"errors": ["Batch processed by the parent process."]}
+
+    return {"assigned": len(data_id_list), "skipped": 0, "errors": []}
+
+
+class TestBackfillData(MediaRootIntegrationTestCase):
+    """Integration tests for the PID backfill of data."""
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        self.user = create_mock_user(1)
+        self.pid_url_prefix = join(
+            SERVER_URI,
+            "rest",
+            ID_PROVIDER_SYSTEM_NAME,
+            ID_PROVIDER_PREFIX_DEFAULT,
+        )
+        super().setUp()
+        self.fixture.auto_set_pid(False)
+        self.data_1 = self.fixture.insert_record("record_1", "", self.user)
+        self.data_2 = self.fixture.insert_record(
+            "record_2", join(self.pid_url_prefix, "pid2"), self.user
+        )
+
+    def _get_pid(self, data):
+        """Retrieve the PID stored in a data."""
+        return data_utils.get_pid_value_for_data(
+            Data.objects.get(pk=data.pk), "mock.pid"
+        )
+
+    def test_get_data_id_batch_returns_data_without_pid(self):
+        """test_get_data_id_batch_returns_data_without_pid"""
+        self.assertEqual(
+            backfill_utils.get_data_id_batch(None, 10), [self.data_1.pk]
+        )
+
+    def test_get_data_id_batch_starts_after_last_pk(self):
+        """test_get_data_id_batch_starts_after_last_pk"""
+        self.assertEqual(
+            backfill_utils.get_data_id_batch(self.data_1.pk, 10), []
+        )
+
+    def test_backfill_data_batch_assigns_and_indexes_pid(self):
+        """test_backfill_data_batch_assigns_and_indexes_pid"""
+        result = backfill_utils.backfill_data_batch([self.data_1.pk])
+        pid_value = self._get_pid(self.data_1)
+
+        self.assertEqual(result, {"assigned": 1, "skipped": 0, "errors": []})
+        self.assertTrue(pid_value.startswith(f"{self.pid_url_prefix}/"))
+        self.assertEqual(
+            data_system_api.get_data_by_pid(pid_value).pk, self.data_1.pk
+        )
+        self.assertEqual(backfill_utils.get_data_id_batch(None, 10), [])
+
+    def test_backfill_data_batch_skips_data_with_pid(self):
+        """test_backfill_data_batch_skips_data_with_pid"""
+        result = backfill_utils.backfill_data_batch([self.data_2.pk])
+
+        self.assertEqual(result, {"assigned": 0, "skipped": 1, "errors": []})
+        self.assertEqual(
+            self._get_pid(self.data_2), join(self.pid_url_prefix, "pid2")
+        )
+
+    def test_backfill_data_batch_indexes_skipped_data(self):
+        """test_backfill_data_batch_indexes_skipped_data"""
+        PidIndex.objects.filter(data_id=self.data_2.pk).delete()
+        self.assertIn(
+            self.data_2.pk, backfill_utils.get_data_id_batch(None, 10)
+        )
+
+        result = backfill_utils.backfill_data_batch([self.data_2.pk])
+
+        self.assertEqual(result, {"assigned": 0, "skipped": 1, "errors": []})
+        self.assertEqual(
+            data_system_api.get_data_by_pid(
+                join(self.pid_url_prefix, "pid2")
+            ).pk,
+            self.data_2.pk,
+        )
+        self.assertNotIn(
+            self.data_2.pk, backfill_utils.get_data_id_batch(None, 10)
+        )
+
+    def test_backfill_data_batch_reports_provider_error(self):
+        """test_backfill_data_batch_reports_provider_error"""
+        with patch.object(ProviderManager, "get") as mock_get:
+            mock_get.side_effect = Exception("mock_provider_error")
+            result = backfill_utils.backfill_data_batch([self.data_1.pk])
+
+        self.assertEqual(result["assigned"], 0)
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertFalse(self._get_pid(self.data_1))
+
+    def test_command_assigns_pids_and_writes_checkpoint(self):
+        """test_command_assigns_pids_and_writes_checkpoint"""
+        data_3 = self.fixture.insert_record("record_3", "", self.user)
+        stdout = StringIO()
+
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpoint_path = join(checkpoint_dir, "checkpoint.json")
+            call_command(
+                "pidbackfill",
+                "--no-blobs",
+                "--batch-size",
+                "1",
+                "--checkpoint",
+                checkpoint_path,
+                stdout=stdout,
+            )
+
+            with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+
+        self.assertEqual(checkpoint, {"data": data_3.pk, "blobs": None})
+        self.assertTrue(self._get_pid(self.data_1))
+        self.assertTrue(self._get_pid(data_3))
+        self.assertIn("2 data processed, 2 assigned", stdout.getvalue())
+
+    def test_command_resumes_after_checkpoint(self):
+        """test_command_resumes_after_checkpoint"""
+        data_3 = self.fixture.insert_record("record_3", "", self.user)
+
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpoint_path = join(checkpoint_dir, "checkpoint.json")
+
+            with open(
+                checkpoint_path, "w", encoding="utf-8"
+            ) as checkpoint_file:
+                json.dump({"data": self.data_1.pk}, checkpoint_file)
+
+            call_command(
+                "pidbackfill",
+                "--no-blobs",
+                "--checkpoint",
+                checkpoint_path,
+                "--resume",
+                stdout=StringIO(),
+            )
+
+        self.assertFalse(self._get_pid(self.data_1))
+        self.assertTrue(self._get_pid(data_3))
+
+    def test_command_does_not_checkpoint_failed_batch(self):
+        """test_command_does_not_checkpoint_failed_batch"""
+        data_3 = self.fixture.insert_record("record_3", "", self.user)
+        result_list = [
+            {"assigned": 0, "skipped": 0, "errors": ["mock_error"]},
+            {"assigned": 1, "skipped": 0, "errors": []},
+        ]
+
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpoint_path = join(checkpoint_dir, "checkpoint.json")
+
+            with patch.object(
+                backfill_utils,
+                "backfill_data_batch",
+                side_effect=result_list,
+            ):
+                call_command(
+                    "pidbackfill",
+                    "--no-blobs",
+                    "--batch-size",
+                    "1",
+                    "--checkpoint",
+                    checkpoint_path,
+                    stdout=StringIO(),
+                    stderr=StringIO(),
+                )
+
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+            call_command(
+                "pidbackfill",
+                "--no-blobs",
+                "--checkpoint",
+                checkpoint_path,
+                "--resume",
+                stdout=StringIO(),
+            )
+
+            with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+
+        self.assertEqual(checkpoint["data"], data_3.pk)
+        self.assertTrue(self._get_pid(self.data_1))
+
+    @patch.object(
+        backfill_utils, "backfill_data_batch", _backfill_data_batch_in_worker
+    )
+    def test_command_processes_batches_in_workers(self):
+        """test_command_processes_batches_in_workers"""
+        self.fixture.insert_record("record_3", "", self.user)
+        stdout = StringIO()
+        stderr = StringIO()
+
+        call_command(
+            "pidbackfill",
+            "--no-blobs",
+            "--batch-size",
+            "1",
+            "--workers",
+            "2",
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        self.assertEqual(stderr.getvalue(), "")
+        self.assertIn(
+            "2 data processed, 2 assigned, 0 skipped, 0 errors",
+            stdout.getvalue(),
+        )
+
+    def test_command_resume_without_checkpoint_raises_error(self):
+        """test_command_resume_without_checkpoint_raises_error"""
+        with self.assertRaises(CommandError):
+            call_command("pidbackfill", "--resume", stdout=StringIO())
+
+    def test_command_reports_errors(self):
+        """test_command_reports_errors"""
+        stderr = StringIO()
+
+        with patch.object(ProviderManager, "get") as mock_get:
+            mock_get.side_effect = Exception("mock_provider_error")
+            call_command(
+                "pidbackfill", "--no-blobs", stdout=StringIO(), stderr=stderr
+            )
+
+        self.assertIn("mock_provider_error", stderr.getvalue())
+        self.assertFalse(self._get_pid(self.data_1))
+
+
+class TestBackfillBlob(MediaRootIntegrationTestCase):
+    """Integration tests for the PID backfill of blobs."""
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        super().setUp()
+        self.fixture.auto_set_pid(False)
+        self.blob = Blob(
+            filename="blob.txt",
+            user_id="1",
+            blob=SimpleUploadedFile("blob.txt", b"blob_content"),
+        )
+        self.blob.save()
+
+    def test_backfill_blob_batch_assigns_pid(self):
+        """test_backfill_blob_batch_assigns_pid"""
+        self.assertEqual(
+            backfill_utils.get_blob_id_batch(None, 10), [self.blob.pk]
+        )
+
+        result = backfill_utils.backfill_blob_batch([self.blob.pk])
+
+        self.assertEqual(result, {"assigned": 1, "skipped": 0, "errors": []})
+        self.assertTrue(
+            blob_system_api.get_pid_for_blob(
+                str(self.blob.pk)
+            ).record_name.startswith(f"{ID_PROVIDER_PREFIX_BLOB}/")
+        )
+        self.assertEqual(backfill_utils.get_blob_id_batch(None, 10), [])
+
+    def test_command_assigns_blob_pids(self):
+        """test_command_assigns_blob_pids"""
+        stdout = StringIO()
+
+        call_command("pidbackfill", "--no-data", stdout=stdout)
+
+        self.assertIn("1 blobs processed, 1 assigned", stdout.getvalue())
+        self.assertIsNotNone(
+            blob_system_api.get_pid_for_blob(str(self.blob.pk))
+        )
@@ -0,0 +1,316 @@
+"""Unit tests for `core_linked_records_app.utils.cache`."""
+
+from unittest import TestCase
+from unittest.mock import ANY, MagicMock, patch
+
+from django.core.cache import caches
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils import cache as cache_utils
+from core_linked_records_app.utils.cache import (
+    LRUCache,
+    TTLCache,
+    VersionedCache,
+)
+
+
+class TestLRUCache(TestCase):
+    """Unit tests for `LRUCache` class."""
+
+    def test_get_missing_key_returns_default(self):
+        """test_get_missing_key_returns_default"""
+        cache = LRUCache(2)
+
+        self.assertEqual(cache.get("mock_key", "mock_default"), "mock_default")
+
+    def test_get_returns_stored_value(self):
+        """test_get_returns_stored_value"""
+        cache = LRUCache(2)
+        cache.set("mock_key", "mock_value")
+
+        self.assertEqual(cache.get("mock_key"), "mock_value")
+
+    def test_hits_and_misses_are_counted(self):
+        """test_hits_and_misses_are_counted"""
+        cache = LRUCache(2)
+        cache.get("mock_key")
+        cache.set("mock_key", "mock_value")
+        cache.get("mock_key")
+        cache.get("mock_key")
+
+        self.assertEqual(
+            cache.info(), {"hits": 2, "misses": 1, "size": 1, "maxsize": 2}
+        )
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """test_least_recently_used_entry_is_evicted"""
+        cache = LRUCache(2)
+        cache.set("mock_key_1", "mock_value_1")
+        cache.set("mock_key_2", "mock_value_2")
+        cache.get("mock_key_1")
+        cache.set("mock_key_3", "mock_value_3")
+
+        self.assertIsNone(cache.get("mock_key_2"))
+        self.assertEqual(cache.get("mock_key_1"), "mock_value_1")
+        self.assertEqual(cache.get("mock_key_3"), "mock_value_3")
+
+    def test_invalidate_removes_entry(self):
+        """test_invalidate_removes_entry"""
+        cache = LRUCache(2)
+        cache.set("mock_key", "mock_value")
+        cache.invalidate("mock_key")
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    def test_clear_removes_entries_and_counters(self):
+        """test_clear_removes_entries_and_counters"""
+        cache = LRUCache(2)
+        cache.set("mock_key", "mock_value")
+        cache.get("mock_key")
+        cache.clear()
+
+        self.assertEqual(
+            cache.info(), {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+        )
+
+    def test_zero_size_cache_stores_nothing(self):
+        """test_zero_size_cache_stores_nothing"""
+        cache = LRUCache(0)
+        cache.set("mock_key", "mock_value")
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestTTLCache(TestCase):
+    """Unit tests for `TTLCache` class."""
+
+    def test_get_returns_stored_value(self):
+        """test_get_returns_stored_value"""
+        cache = TTLCache(2, 60)
+        cache.set("mock_key", "mock_value")
+
+        self.assertEqual(cache.get("mock_key"), "mock_value")
+
+    @patch.object(cache_utils.time, "monotonic")
+    def test_expired_entry_is_missed(self, mock_monotonic):
+        """test_expired_entry_is_missed"""
+        cache = TTLCache(2, 60)
+        mock_monotonic.return_value = 100
+        cache.set("mock_key", "mock_value")
+        mock_monotonic.return_value = 160
+
+        self.assertIsNone(cache.get("mock_key"))
+        self.assertEqual(cache.info()["size"], 0)
+
+    def test_set_after_invalidation_is_ignored(self):
+        """test_set_after_invalidation_is_ignored"""
+        cache = TTLCache(2, 60)
+        generation = cache.get_generation("mock_key")
+        cache.invalidate("mock_key")
+        cache.set("mock_key", "mock_value", generation)
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    def test_invalidate_many_removes_entries(self):
+        """test_invalidate_many_removes_entries"""
+        cache = TTLCache(3, 60)
+        cache.set("mock_key_1", "mock_value")
+        cache.set("mock_key_2", "mock_value")
+        cache.set("mock_key_3", "mock_value")
+        cache.invalidate_many(["mock_key_1", "mock_key_2"])
+
+        self.assertEqual(list(cache._entries), ["mock_key_3"])
+
+    def test_zero_ttl_cache_stores_nothing(self):
+        """test_zero_ttl_cache_stores_nothing"""
+        cache = TTLCache(2, 0)
+        cache.set("mock_key", "mock_value")
+
+        self.assertEqual(len(cache), 0)
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_shared_invalidation_invalidates_other_processes(self):
+        """test_shared_invalidation_invalidates_other_processes"""
+        cache = TTLCache(2, 60, "mock_cache")
+        other_process_cache = TTLCache(2, 60, "mock_cache")
+        cache.set("mock_key", "mock_value")
+        other_process_cache.invalidate("mock_key")
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_shared_invalidation_keeps_other_keys(self):
+        """test_shared_invalidation_keeps_other_keys"""
+        cache = TTLCache(2, 60, "mock_cache")
+        cache.set("mock_key_1", "mock_value_1")
+        cache.set("mock_key_2", "mock_value_2")
+        TTLCache(2, 60, "mock_cache").invalidate("mock_key_1")
+
+        self.assertIsNone(cache.get("mock_key_1"))
+        self.assertEqual(cache.get("mock_key_2"), "mock_value_2")
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_set_after_shared_invalidation_is_ignored(self):
+        """test_set_after_shared_invalidation_is_ignored"""
+        cache = TTLCache(2, 60, "mock_cache")
+        generation = cache.get_generation("mock_key")
+        TTLCache(2, 60, "mock_cache").invalidate("mock_key")
+        cache.set("mock_key", "mock_value", generation)
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_set_after_shared_invalidation_of_other_key_is_stored(self):
+        """test_set_after_shared_invalidation_of_other_key_is_stored"""
+        cache = TTLCache(2, 60, "mock_cache")
+        generation = cache.get_generation("mock_key_1")
+        TTLCache(2, 60, "mock_cache").invalidate("mock_key_2")
+        cache.set("mock_key_1", "mock_value", generation)
+
+        self.assertEqual(cache.get("mock_key_1"), "mock_value")
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_evicted_shared_version_invalidates(self):
+        """test_evicted_shared_version_invalidates"""
+        cache = TTLCache(2, 60, "mock_cache")
+        TTLCache(2, 60, "mock_cache").invalidate("mock_key")
+        cache.set("mock_key", "mock_value")
+        caches["default"].delete(cache._get_version_key("mock_key"))
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_shared_version_expires_with_entries(self):
+        """test_shared_version_expires_with_entries"""
+        cache = TTLCache(2, 60.5, "mock_cache")
+
+        with patch.object(caches["default"], "set_many") as mock_set_many:
+            cache.invalidate("mock_pid")
+
+        mock_set_many.assert_called_once_with(
+            {cache._get_version_key("mock_pid"): ANY}, timeout=61
+        )
+
+    def test_unnamed_cache_is_not_shared(self):
+        """test_unnamed_cache_is_not_shared"""
+        cache = TTLCache(2, 60)
+
+        with patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default"):
+            self.assertIsNone(cache._get_shared_version("mock_key"))
+
+
+class TestInvalidateUnknownPidList(TestCase):
+    """Unit tests for `invalidate_unknown_pid_list` function."""
+
+    def test_pids_are_removed(self):
+        """test_pids_are_removed"""
+        unknown_pid_cache = TTLCache(2, 60)
+        unknown_pid_cache.set("mock_pid_1", True)
+        unknown_pid_cache.set("mock_pid_2", True)
+
+        with patch.object(cache_utils, "unknown_pid_cache", unknown_pid_cache):
+            cache_utils.invalidate_unknown_pid_list(iter(["mock_pid_1"]))
+
+        self.assertIsNone(unknown_pid_cache.get("mock_pid_1"))
+        self.assertTrue(unknown_pid_cache.get("mock_pid_2"))
+
+    def test_disabled_cache_does_not_read_pids(self):
+        """test_disabled_cache_does_not_read_pids"""
+        pid_list = MagicMock()
+
+        with patch.object(cache_utils, "unknown_pid_cache", TTLCache(0, 60)):
+            cache_utils.invalidate_unknown_pid_list(pid_list)
+
+        pid_list.__iter__.assert_not_called()
+
+
+class TestInvalidatePidConfig(TestCase):
+    """Unit tests for `invalidate_pid_config` function."""
+
+    @patch.object(cache_utils, "transaction")
+    @patch.object(cache_utils, "pid_config_cache")
+    def test_cache_is_invalidated_now_and_on_commit(
+        self, mock_pid_config_cache, mock_transaction
+    ):
+        """test_cache_is_invalidated_now_and_on_commit"""
+        cache_utils.invalidate_pid_config()
+
+        mock_pid_config_cache.invalidate.assert_called_once()
+        mock_transaction.on_commit.assert_called_once_with(
+            mock_pid_config_cache.invalidate
+        )
+
+
+@patch.object(settings, "PID_CONFIG_CACHE_ENABLED", True)
+class TestVersionedCache(TestCase):
+    """Unit tests for `VersionedCache` class."""
+
+    def setUp(self):
+        """setUp"""
+        self.cache = VersionedCache("mock_cache")
+        self.loader = MagicMock(side_effect=lambda: ["mock_value"])
+
+    def test_value_is_loaded_once(self):
+        """test_value_is_loaded_once"""
+        self.cache.get_or_load("mock_key", self.loader)
+
+        self.assertEqual(
+            self.cache.get_or_load("mock_key", self.loader), ["mock_value"]
+        )
+        self.loader.assert_called_once()
+        self.assertEqual(self.cache.info()["hits"], 1)
+
+    def test_none_is_cached(self):
+        """test_none_is_cached"""
+        loader = MagicMock(return_value=None)
+        self.cache.get_or_load("mock_key", loader)
+
+        self.assertIsNone(self.cache.get_or_load("mock_key", loader))
+        loader.assert_called_once()
+
+    def test_invalidate_reloads_value(self):
+        """test_invalidate_reloads_value"""
+        self.cache.get_or_load("mock_key", self.loader)
+        self.cache.invalidate()
+        self.cache.get_or_load("mock_key", self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_copy_value_protects_cached_value(self):
+        """test_copy_value_protects_cached_value"""
+        self.cache.get_or_load("mock_key", self.loader, copy_value=list)
+        self.cache.get_or_load("mock_key", self.loader, list).append("new")
+
+        self.assertEqual(
+            self.cache.get_or_load("mock_key", self.loader, list),
+            ["mock_value"],
+        )
+
+    def test_disabled_cache_always_loads(self):
+        """test_disabled_cache_always_loads"""
+        with patch.object(settings, "PID_CONFIG_CACHE_ENABLED", False):
+            self.cache.get_or_load("mock_key", self.loader)
+            self.cache.get_or_load("mock_key", self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_shared_version_invalidates_other_processes(self):
+        """test_shared_version_invalidates_other_processes"""
+        other_process_cache = VersionedCache("mock_cache")
+        caches["default"].delete(self.cache.version_key)
+        self.cache.get_or_load("mock_key", self.loader)
+
+        other_process_cache.invalidate()
+        self.cache.get_or_load("mock_key", self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
+
+    @patch.object(settings, "PID_CONFIG_CACHE_ALIAS", "default")
+    def test_evicted_shared_version_invalidates(self):
+        """test_evicted_shared_version_invalidates"""
+        self.cache.get_or_load("mock_key", self.loader)
+        caches["default"].delete(self.cache.version_key)
+        self.cache.get_or_load("mock_key", self.loader)
+
+        self.assertEqual(self.loader.call_count, 2)
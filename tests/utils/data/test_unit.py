@@ -2,10 +2,11 @@
 
 from copy import deepcopy
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from core_main_app.components.template.models import Template
 from xml_utils.commons import exceptions as xml_utils_exceptions
+from xml_utils.xsd_tree.xsd_tree import XSDTree
 from core_linked_records_app.utils import data as data_utils, exceptions
 
 
@@ -17,6 +18,9 @@ class TestSetPidValueForDataForXMLData(TestCase):
         template_format = Template.XSD
         self.mock_data = MagicMock()
         self.mock_data.template.format = template_format
+        self.mock_pid_xpath = MagicMock()
+        self.mock_target_namespace = MagicMock()
+        self.mock_compiled_pid_xpath = MagicMock()
 
         self.kwargs = {
             "data": self.mock_data,
@@ -27,30 +31,20 @@ class TestSetPidValueForDataForXMLData(TestCase):
     @patch.object(data_utils, "create_tree_from_xpath")
     @patch.object(data_utils, "XSDTree")
     @patch.object(data_utils, "pid_xml_utils")
-    def test_get_xpath_with_target_namespace_called(
+    def test_get_pid_xpath_for_template_called(
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
-        """test_get_xpath_with_target_namespace_called"""
-        data_utils.set_pid_value_for_data(**self.kwargs)
-
-        mock_pid_xml_utils.get_xpath_with_target_namespace.assert_called_with(
-            mock_pid_xml_utils.get_xpath_from_dot_notation(
-                self.kwargs["pid_path"]
-            ),
-            self.kwargs["data"].template.content,
+        """test_get_pid_xpath_for_template_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
 
-    @patch.object(data_utils, "create_tree_from_xpath")
-    @patch.object(data_utils, "XSDTree")
-    @patch.object(data_utils, "pid_xml_utils")
-    def test_get_target_namespace_for_xsd_string_called(
-        self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
-    ):
-        """test_get_target_namespace_for_xsd_string_called"""
         data_utils.set_pid_value_for_data(**self.kwargs)
 
-        mock_pid_xml_utils.get_target_namespace_for_xsd_string.assert_called_with(
-            self.kwargs["data"].template.content
+        mock_pid_xml_utils.get_pid_xpath_for_template.assert_called_with(
+            self.kwargs["data"].template, self.kwargs["pid_path"]
         )
 
     @patch.object(data_utils, "create_tree_from_xpath")
@@ -60,6 +54,12 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_xsdtree_build_tree_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_data_init_content = deepcopy(self.mock_data.content)
         data_utils.set_pid_value_for_data(**self.kwargs)
 
@@ -72,21 +72,19 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_create_tree_from_xpath_called"""
-        mock_pid_xpath = MagicMock()
-        mock_target_namespace = MagicMock()
-        mock_xml_tree = MagicMock()
-        mock_pid_xml_utils.get_xpath_with_target_namespace.return_value = (
-            mock_pid_xpath
-        )
-        mock_pid_xml_utils.get_target_namespace_for_xsd_string.return_value = (
-            mock_target_namespace
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
+
+        mock_xml_tree = MagicMock()
         mock_xsd_tree.build_tree.return_value = mock_xml_tree
 
         data_utils.set_pid_value_for_data(**self.kwargs)
 
         mock_create_tree_from_xpath.assert_called_with(
-            mock_pid_xpath, mock_xml_tree, mock_target_namespace
+            self.mock_pid_xpath, mock_xml_tree, self.mock_target_namespace
         )
 
     @patch.object(data_utils, "create_tree_from_xpath")
@@ -96,24 +94,23 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_set_value_at_xpath_called"""
-        mock_pid_xpath = MagicMock()
-        mock_target_namespace = MagicMock()
-        mock_xml_tree = MagicMock()
-        mock_pid_xml_utils.get_xpath_with_target_namespace.return_value = (
-            mock_pid_xpath
-        )
-        mock_pid_xml_utils.get_target_namespace_for_xsd_string.return_value = (
-            mock_target_namespace
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
+
+        mock_xml_tree = MagicMock()
         mock_create_tree_from_xpath.return_value = mock_xml_tree
 
         data_utils.set_pid_value_for_data(**self.kwargs)
 
         mock_pid_xml_utils.set_value_at_xpath.assert_called_with(
             mock_xml_tree,
-            mock_pid_xpath,
+            self.mock_pid_xpath,
             self.kwargs["pid_value"],
-            mock_target_namespace,
+            self.mock_target_namespace,
+            compiled_xpath=self.mock_compiled_pid_xpath,
         )
 
     @patch.object(data_utils, "create_tree_from_xpath")
@@ -123,6 +120,12 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_xsdtree_to_string_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_xml_tree = MagicMock()
         mock_create_tree_from_xpath.return_value = mock_xml_tree
 
@@ -137,6 +140,12 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_convert_to_file_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         data_utils.set_pid_value_for_data(**self.kwargs)
 
         self.kwargs["data"].convert_to_file.assert_called()
@@ -148,6 +157,12 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_convert_to_dict_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         data_utils.set_pid_value_for_data(**self.kwargs)
 
         self.kwargs["data"].convert_to_dict.assert_called()
@@ -159,6 +174,12 @@ class TestSetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree, mock_create_tree_from_xpath
     ):
         """test_succesful_execution_returns_none"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         self.assertIsNone(data_utils.set_pid_value_for_data(**self.kwargs))
 
 
@@ -237,13 +258,21 @@ class TestSetPidValueForDataForJsonData(TestCase):
     @patch.object(data_utils, "pid_json_utils")
     @patch.object(data_utils, "load_json_string")
     @patch.object(data_utils, "json")
-    def test_convert_to_dict_called(
+    def test_dict_content_set_from_parsed_content(
         self, mock_json, mock_load_json_string, mock_pid_json_utils
     ):
-        """test_convert_to_dict_called"""
+        """test_dict_content_set_from_parsed_content"""
+        mock_pid_json_utils.set_value_at_dict_path.return_value = {
+            "pid": self.kwargs["pid_value"]
+        }
+
         data_utils.set_pid_value_for_data(**self.kwargs)
 
-        self.kwargs["data"].convert_to_dict.assert_called()
+        self.kwargs["data"].convert_to_dict.assert_not_called()
+        self.assertEqual(
+            self.kwargs["data"].dict_content,
+            {"pid": self.kwargs["pid_value"]},
+        )
 
     @patch.object(data_utils, "pid_json_utils")
     @patch.object(data_utils, "load_json_string")
@@ -288,34 +317,28 @@ class TestGetPidValueForDataForXMLData(TestCase):
         template_format = Template.XSD
         self.mock_data = MagicMock()
         self.mock_data.template.format = template_format
+        self.mock_pid_xpath = MagicMock()
+        self.mock_target_namespace = MagicMock()
+        self.mock_compiled_pid_xpath = MagicMock()
 
         self.kwargs = {"data": self.mock_data, "pid_path": "mock_pid_path"}
 
     @patch.object(data_utils, "XSDTree")
     @patch.object(data_utils, "pid_xml_utils")
-    def test_get_xpath_with_target_namespace_called(
+    def test_get_pid_xpath_for_template_called(
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
-        """test_get_xpath_with_target_namespace_called"""
-        data_utils.get_pid_value_for_data(**self.kwargs)
-
-        mock_pid_xml_utils.get_xpath_with_target_namespace.assert_called_with(
-            mock_pid_xml_utils.get_xpath_from_dot_notation(
-                self.kwargs["pid_path"]
-            ),
-            self.kwargs["data"].template.content,
+        """test_get_pid_xpath_for_template_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
 
-    @patch.object(data_utils, "XSDTree")
-    @patch.object(data_utils, "pid_xml_utils")
-    def test_get_target_namespace_for_xsd_string_called(
-        self, mock_pid_xml_utils, mock_xsd_tree
-    ):
-        """test_get_target_namespace_for_xsd_string_called"""
         data_utils.get_pid_value_for_data(**self.kwargs)
 
-        mock_pid_xml_utils.get_target_namespace_for_xsd_string.assert_called_with(
-            self.kwargs["data"].template.content
+        mock_pid_xml_utils.get_pid_xpath_for_template.assert_called_with(
+            self.kwargs["data"].template, self.kwargs["pid_path"]
         )
 
     @patch.object(data_utils, "XSDTree")
@@ -324,6 +347,12 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_xsd_tree_build_tree_called"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_data_init_content = self.kwargs["data"].content
         data_utils.get_pid_value_for_data(**self.kwargs)
 
@@ -335,36 +364,36 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_get_value_at_xpath_called"""
-        mock_xml_tree = MagicMock()
-        mock_pid_xpath = MagicMock()
-        mock_target_namespace = MagicMock()
-
-        mock_pid_xml_utils.get_xpath_with_target_namespace.return_value = (
-            mock_pid_xpath
-        )
-        mock_pid_xml_utils.get_target_namespace_for_xsd_string.return_value = (
-            mock_target_namespace
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
+
+        mock_xml_tree = MagicMock()
         mock_xsd_tree.build_tree.return_value = mock_xml_tree
 
         data_utils.get_pid_value_for_data(**self.kwargs)
 
         mock_pid_xml_utils.get_value_at_xpath.assert_called_with(
-            mock_xml_tree, mock_pid_xpath, mock_target_namespace
+            mock_xml_tree,
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            compiled_xpath=self.mock_compiled_pid_xpath,
         )
 
     @patch.object(data_utils, "XSDTree")
     @patch.object(data_utils, "pid_xml_utils")
-    def test_get_value_at_xpath_error_call_can_create_value_at_xpath(
+    def test_get_value_at_xpath_error_call_can_create_value_at_xpath_in_tree(
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
-        """test_get_value_at_xpath_error_call_can_create_value_at_xpath"""
-        mock_data_init_content = self.kwargs["data"].content
-        mock_pid_xpath = MagicMock()
-
-        mock_pid_xml_utils.get_xpath_with_target_namespace.return_value = (
-            mock_pid_xpath
+        """test_get_value_at_xpath_error_call_can_create_value_at_xpath_in_tree"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
         )
+
         mock_pid_xml_utils.get_value_at_xpath.side_effect = (
             xml_utils_exceptions.XPathError(
                 "mock_get_value_at_xpath_exception"
@@ -373,11 +402,12 @@ class TestGetPidValueForDataForXMLData(TestCase):
 
         data_utils.get_pid_value_for_data(**self.kwargs)
 
-        mock_pid_xml_utils.can_create_value_at_xpath.assert_called_with(
-            mock_data_init_content,
-            self.kwargs["data"].template.content,
-            mock_pid_xpath,
+        mock_pid_xml_utils.can_create_value_at_xpath_in_tree.assert_called_with(
+            mock_xsd_tree.build_tree.return_value,
+            mock_pid_xml_utils.get_xsd_tree_for_template.return_value,
+            self.mock_pid_xpath,
             "http://sample_pid.org",
+            self.mock_target_namespace,
         )
 
     @patch.object(data_utils, "XSDTree")
@@ -386,12 +416,20 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_can_create_value_at_xpath_false_raises_pid_create_error"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_pid_xml_utils.get_value_at_xpath.side_effect = (
             xml_utils_exceptions.XPathError(
                 "mock_get_value_at_xpath_exception"
             )
         )
-        mock_pid_xml_utils.can_create_value_at_xpath.return_value = False
+        mock_pid_xml_utils.can_create_value_at_xpath_in_tree.return_value = (
+            False
+        )
 
         with self.assertRaises(exceptions.PidCreateError):
             data_utils.get_pid_value_for_data(**self.kwargs)
@@ -402,12 +440,20 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_get_value_at_xpath_error_returns_none"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_pid_xml_utils.get_value_at_xpath.side_effect = (
             xml_utils_exceptions.XPathError(
                 "mock_get_value_at_xpath_exception"
             )
         )
-        mock_pid_xml_utils.can_create_value_at_xpath.return_value = True
+        mock_pid_xml_utils.can_create_value_at_xpath_in_tree.return_value = (
+            True
+        )
 
         self.assertIsNone(data_utils.get_pid_value_for_data(**self.kwargs))
 
@@ -417,6 +463,12 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_successful_executiopn_returns_pid_value"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_pid_value = "mock_pid_value"
 
         mock_pid_xml_utils.get_value_at_xpath.return_value = mock_pid_value
@@ -431,6 +483,12 @@ class TestGetPidValueForDataForXMLData(TestCase):
         self, mock_pid_xml_utils, mock_xsd_tree
     ):
         """test_pid_value_truncated_if_ending_with_slash"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_pid_value = "mock_pid_value/"
 
         mock_pid_xml_utils.get_value_at_xpath.return_value = mock_pid_value
@@ -446,6 +504,12 @@ class TestGetPidValueForDataForXMLData(TestCase):
         mock_pid_xml_utils,
     ):
         """test_raise_exception_if_pid_found_at_more_than_one_path"""
+        mock_pid_xml_utils.get_pid_xpath_for_template.return_value = (
+            self.mock_pid_xpath,
+            self.mock_target_namespace,
+            self.mock_compiled_pid_xpath,
+        )
+
         mock_pid_value_1 = "mock_pid_value_1"
         mock_pid_value_2 = "mock_pid_value_2"
 
@@ -609,3 +673,188 @@ class TestGetPidValueForDataForUnsupportedFormats(TestCase):
             data_utils.get_pid_value_for_data(**self.kwargs)
 
         mock_logger.error.assert_called()
+
+
+class TestGetDictContentForData(TestCase):
+    """Unit tests for `get_dict_content_for_data` function."""
+
+    def test_stored_dict_content_is_returned(self):
+        """test_stored_dict_content_is_returned"""
+        mock_data = MagicMock()
+        mock_data.dict_content = {"mock": "dict_content"}
+
+        self.assertEqual(
+            data_utils.get_dict_content_for_data(mock_data),
+            {"mock": "dict_content"},
+        )
+
+    def test_xml_content_is_converted(self):
+        """test_xml_content_is_converted"""
+        mock_data = MagicMock()
+        mock_data.dict_content = None
+        mock_data.template.format = Template.XSD
+        mock_data.content = "<root><pid>mock_pid</pid></root>"
+
+        self.assertEqual(
+            data_utils.get_dict_content_for_data(mock_data),
+            {"root": {"pid": "mock_pid"}},
+        )
+
+    def test_json_content_is_converted(self):
+        """test_json_content_is_converted"""
+        mock_data = MagicMock()
+        mock_data.dict_content = None
+        mock_data.template.format = Template.JSON
+        mock_data.content = '{"root": {"pid": "mock_pid"}}'
+
+        self.assertEqual(
+            data_utils.get_dict_content_for_data(mock_data),
+            {"root": {"pid": "mock_pid"}},
+        )
+
+    def test_unsupported_format_raises_invalid_pid_error(self):
+        """test_unsupported_format_raises_invalid_pid_error"""
+        mock_data = MagicMock()
+        mock_data.dict_content = None
+        mock_data.template.format = "mock_format"
+
+        with self.assertRaises(exceptions.InvalidPidError):
+            data_utils.get_dict_content_for_data(mock_data)
+
+
+class TestParsedContent(TestCase):
+    """Unit tests for `ParsedContent` class."""
+
+    def setUp(self):
+        """setUp"""
+        self.mock_data = MagicMock()
+
+    @patch.object(data_utils, "XSDTree")
+    def test_xml_content_parsed_once(self, mock_xsd_tree):
+        """test_xml_content_parsed_once"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        parsed_content.xml_tree  # pylint: disable=pointless-statement
+        parsed_content.xml_tree  # pylint: disable=pointless-statement
+
+        mock_xsd_tree.build_tree.assert_called_once_with(
+            self.mock_data.content
+        )
+        self.assertEqual(parsed_content.parse_count, 1)
+        self.assertEqual(parsed_content.avoided_parse_count, 1)
+
+    @patch.object(data_utils, "load_json_string")
+    def test_json_content_parsed_once(self, mock_load_json_string):
+        """test_json_content_parsed_once"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        parsed_content.json_content  # pylint: disable=pointless-statement
+        parsed_content.json_content  # pylint: disable=pointless-statement
+
+        mock_load_json_string.assert_called_once_with(self.mock_data.content)
+        self.assertEqual(parsed_content.avoided_parse_count, 1)
+
+    def test_record_stats_adds_counters_to_totals(self):
+        """test_record_stats_adds_counters_to_totals"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+        parsed_content.parse_count = 1
+        parsed_content.avoided_parse_count = 2
+        parsed_content.avoided_serialization_count = 3
+        initial_stats = data_utils.get_parsed_content_stats()
+
+        parsed_content.record_stats()
+
+        stats = data_utils.get_parsed_content_stats()
+        self.assertEqual(stats["parses"] - initial_stats["parses"], 1)
+        self.assertEqual(
+            stats["avoided_parses"] - initial_stats["avoided_parses"], 2
+        )
+        self.assertEqual(
+            stats["avoided_serializations"]
+            - initial_stats["avoided_serializations"],
+            3,
+        )
+
+
+class TestPidValueForDataWithParsedContent(TestCase):
+    """Unit tests for `get_pid_value_for_data` and `set_pid_value_for_data`
+    sharing a parsed content.
+    """
+
+    def setUp(self):
+        """setUp"""
+        self.mock_data = MagicMock()
+        self.mock_data.pk = None
+        self.mock_data.template.format = Template.XSD
+        self.mock_data.template.pk = None
+        self.mock_data.template.content = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="root"><xs:complexType><xs:sequence>'
+            '<xs:element name="pid" type="xs:string"/>'
+            "</xs:sequence></xs:complexType></xs:element></xs:schema>"
+        )
+        self.mock_data.content = "<root><pid>mock_pid</pid></root>"
+
+    @patch.object(data_utils.XSDTree, "build_tree", wraps=XSDTree.build_tree)
+    def test_document_parsed_once(self, mock_build_tree):
+        """test_document_parsed_once"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        data_utils.get_pid_value_for_data(
+            self.mock_data, "root.pid", parsed_content
+        )
+        data_utils.set_pid_value_for_data(
+            self.mock_data, "root.pid", "mock_new_pid", parsed_content
+        )
+
+        self.assertEqual(
+            mock_build_tree.call_args_list.count(
+                call("<root><pid>mock_pid</pid></root>")
+            ),
+            1,
+        )
+        self.assertEqual(
+            self.mock_data.content, "<root><pid>mock_new_pid</pid></root>"
+        )
+
+    @patch.object(data_utils.XSDTree, "tostring")
+    def test_unchanged_pid_is_not_serialized(self, mock_tostring):
+        """test_unchanged_pid_is_not_serialized"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        data_utils.set_pid_value_for_data(
+            self.mock_data, "root.pid", "mock_pid", parsed_content
+        )
+
+        mock_tostring.assert_not_called()
+        self.assertEqual(parsed_content.avoided_serialization_count, 1)
+        self.mock_data.convert_to_file.assert_called()
+        self.mock_data.convert_to_dict.assert_called()
+        self.assertEqual(parsed_content.avoided_parse_count, 0)
+
+    def test_dict_conversion_counted_as_parse(self):
+        """test_dict_conversion_counted_as_parse"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        data_utils.get_pid_value_for_data(
+            self.mock_data, "root.pid", parsed_content
+        )
+        data_utils.set_pid_value_for_data(
+            self.mock_data, "root.pid", "mock_new_pid", parsed_content
+        )
+
+        self.assertEqual(parsed_content.parse_count, 2)
+        self.assertEqual(parsed_content.avoided_parse_count, 1)
+
+    @patch.object(data_utils, "MONGODB_INDEXING", True)
+    def test_dict_conversion_skipped_with_mongodb_indexing(self):
+        """test_dict_conversion_skipped_with_mongodb_indexing"""
+        parsed_content = data_utils.ParsedContent(self.mock_data)
+
+        data_utils.set_pid_value_for_data(
+            self.mock_data, "root.pid", "mock_new_pid", parsed_content
+        )
+
+        self.mock_data.convert_to_file.assert_called()
+        self.mock_data.convert_to_dict.assert_not_called()
+        self.assertEqual(parsed_content.parse_count, 1)
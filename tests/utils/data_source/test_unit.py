@@ -0,0 +1,328 @@
+"""Unit tests for core_linked_records_app.utils.data_source"""
+
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from rest_framework import status
+
+from core_explore_common_app.commons.exceptions import ExploreRequestError
+from core_linked_records_app import settings
+from core_linked_records_app.utils import data_source as data_source_utils
+from tests import mocks
+
+
+def _build_data_source(name, auth_type):
+    return {
+        "name": name,
+        "query_options": {},
+        "order_by_field": "",
+        "capabilities": {"query_pid": f"{name}_url"},
+        "authentication": {
+            "auth_type": auth_type,
+            "params": {"access_token": "mock_access_token"},
+        },
+    }
+
+
+class TestSendOauth2PostRequest(TestCase):
+    """Test Send Oauth2 Post Request"""
+
+    @patch.object(data_source_utils.requests_utils, "send_post_request")
+    def test_token_and_timeout_are_sent(self, mock_send_post_request):
+        """test_token_and_timeout_are_sent"""
+        data_source_utils.send_oauth2_post_request(
+            "mock_url", {}, "mock_access_token", "UTC", timeout=5
+        )
+
+        mock_send_post_request.assert_called_with(
+            "mock_url",
+            data={},
+            headers={"TZ": "UTC", "Authorization": "Bearer mock_access_token"},
+            timeout=5,
+        )
+
+
+class TestExecuteFederatedPidQuery(TestCase):
+    """Test Execute Federated Pid Query"""
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    def test_request_timeout_is_remaining_time(
+        self, mock_send_oauth2_post_request
+    ):
+        """test_request_timeout_is_remaining_time"""
+        mock_send_oauth2_post_request.return_value = mocks.MockResponse(
+            json_data=["pid1"]
+        )
+
+        data_source_utils.execute_federated_pid_query(
+            {},
+            _build_data_source("remote", "oauth2"),
+            None,
+            time.monotonic() + 10,
+        )
+
+        timeout = mock_send_oauth2_post_request.call_args.kwargs["timeout"]
+        self.assertTrue(0 < timeout <= 10)
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    def test_passed_deadline_skips_request(
+        self, mock_send_oauth2_post_request
+    ):
+        """test_passed_deadline_skips_request"""
+        with self.assertRaises(ExploreRequestError):
+            data_source_utils.execute_federated_pid_query(
+                {},
+                _build_data_source("remote", "oauth2"),
+                None,
+                time.monotonic() - 1,
+            )
+
+        mock_send_oauth2_post_request.assert_not_called()
+
+
+class TestExecuteSessionPidQuery(TestCase):
+    """Test Execute Session Pid Query"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+        self.data_source = _build_data_source("local", "session")
+
+    @patch.object(data_source_utils, "connection")
+    @patch.object(data_source_utils, "execute_local_pid_query")
+    @patch.object(data_source_utils.query_utils, "is_local_data_source")
+    def test_local_query_is_executed_and_connection_closed(
+        self,
+        mock_is_local_data_source,
+        mock_execute_local_pid_query,
+        mock_connection,
+    ):
+        """test_local_query_is_executed_and_connection_closed"""
+        mock_is_local_data_source.return_value = True
+        mock_execute_local_pid_query.return_value = ["pid1"]
+
+        result = data_source_utils.execute_session_pid_query(
+            {}, self.data_source, self.mock_request, None, time.monotonic() + 5
+        )
+
+        self.assertEqual(result, ["pid1"])
+        mock_execute_local_pid_query.assert_called_with({}, self.mock_request)
+        mock_connection.close.assert_called()
+
+    @patch.object(data_source_utils, "connection")
+    @patch.object(data_source_utils, "execute_local_pid_query")
+    def test_passed_deadline_skips_query(
+        self, mock_execute_local_pid_query, mock_connection
+    ):
+        """test_passed_deadline_skips_query"""
+        with self.assertRaises(ExploreRequestError):
+            data_source_utils.execute_session_pid_query(
+                {},
+                self.data_source,
+                self.mock_request,
+                None,
+                time.monotonic() - 1,
+            )
+
+        mock_execute_local_pid_query.assert_not_called()
+        mock_connection.close.assert_called()
+
+
+class TestExecuteQueryPidFanOut(TestCase):
+    """Test Execute Query Pid Fan Out"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    @patch.object(data_source_utils, "execute_session_pid_query")
+    def test_pids_are_merged_without_duplicates(
+        self, mock_execute_session_pid_query, mock_send_oauth2_post_request
+    ):
+        """test_pids_are_merged_without_duplicates"""
+        query = mocks.MockQuery(
+            data_sources=[
+                _build_data_source("local", "session"),
+                _build_data_source("remote", "oauth2"),
+            ]
+        )
+        mock_execute_session_pid_query.return_value = ["pid1", "pid2", None]
+        mock_send_oauth2_post_request.return_value = mocks.MockResponse(
+            json_data=["pid2", "pid3"]
+        )
+
+        result = data_source_utils.execute_query_pid_fan_out(
+            query, self.mock_request
+        )
+
+        self.assertEqual(result["pids"], ["pid1", "pid2", "pid3"])
+        self.assertEqual(
+            [
+                (report["name"], report["status"], report["count"])
+                for report in result["data_sources"]
+            ],
+            [("local", "ok", 2), ("remote", "ok", 2)],
+        )
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    @patch.object(data_source_utils, "execute_session_pid_query")
+    def test_failures_are_reported_per_data_source(
+        self, mock_execute_session_pid_query, mock_send_oauth2_post_request
+    ):
+        """test_failures_are_reported_per_data_source"""
+        query = mocks.MockQuery(
+            data_sources=[
+                _build_data_source("local", "session"),
+                _build_data_source("remote_ok", "oauth2"),
+                _build_data_source("remote_error", "oauth2"),
+                _build_data_source("unknown", "mock_auth_type"),
+            ]
+        )
+        mock_execute_session_pid_query.side_effect = Exception(
+            "mock_exception"
+        )
+
+        def _send_oauth2_post_request(url, *args, **kwargs):
+            if url == "remote_error_url":
+                return mocks.MockResponse(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            return mocks.MockResponse(json_data={"pids": ["pid1"]})
+
+        mock_send_oauth2_post_request.side_effect = _send_oauth2_post_request
+
+        result = data_source_utils.execute_query_pid_fan_out(
+            query, self.mock_request
+        )
+
+        self.assertEqual(result["pids"], ["pid1"])
+        self.assertEqual(
+            [report["status"] for report in result["data_sources"]],
+            ["error", "ok", "error", "error"],
+        )
+        self.assertEqual(result["data_sources"][0]["error"], "mock_exception")
+
+    @patch.object(settings, "PID_QUERY_FAN_OUT_TIMEOUT", 0.1)
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    def test_slow_data_source_is_reported_as_timeout(
+        self, mock_send_oauth2_post_request
+    ):
+        """test_slow_data_source_is_reported_as_timeout"""
+        query = mocks.MockQuery(
+            data_sources=[
+                _build_data_source("remote_fast", "oauth2"),
+                _build_data_source("remote_slow", "oauth2"),
+            ]
+        )
+        release_event = threading.Event()
+
+        def _send_oauth2_post_request(url, *args, **kwargs):
+            if url == "remote_slow_url":
+                release_event.wait(5)
+            return mocks.MockResponse(json_data=["pid1"])
+
+        mock_send_oauth2_post_request.side_effect = _send_oauth2_post_request
+
+        try:
+            result = data_source_utils.execute_query_pid_fan_out(
+                query, self.mock_request
+            )
+        finally:
+            release_event.set()
+
+        self.assertEqual(result["pids"], ["pid1"])
+        self.assertEqual(
+            [report["status"] for report in result["data_sources"]],
+            ["ok", "timeout"],
+        )
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    def test_federated_data_sources_are_queried_concurrently(
+        self, mock_send_oauth2_post_request
+    ):
+        """test_federated_data_sources_are_queried_concurrently"""
+        query = mocks.MockQuery(
+            data_sources=[
+                _build_data_source(f"remote_{index}", "oauth2")
+                for index in range(3)
+            ]
+        )
+        # Each request only returns once all of them are in flight.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _send_oauth2_post_request(url, *args, **kwargs):
+            barrier.wait()
+            return mocks.MockResponse(json_data=[url])
+
+        mock_send_oauth2_post_request.side_effect = _send_oauth2_post_request
+
+        result = data_source_utils.execute_query_pid_fan_out(
+            query, self.mock_request
+        )
+
+        self.assertEqual(
+            result["pids"], ["remote_0_url", "remote_1_url", "remote_2_url"]
+        )
+
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    def test_executor_is_shared_between_requests(
+        self, mock_send_oauth2_post_request
+    ):
+        """test_executor_is_shared_between_requests"""
+        query = mocks.MockQuery(
+            data_sources=[_build_data_source("remote", "oauth2")]
+        )
+        mock_send_oauth2_post_request.return_value = mocks.MockResponse(
+            json_data=["pid1"]
+        )
+
+        with patch.object(
+            data_source_utils, "ThreadPoolExecutor"
+        ) as mock_thread_pool_executor:
+            for _ in range(2):
+                data_source_utils.execute_query_pid_fan_out(
+                    query, self.mock_request
+                )
+
+        mock_thread_pool_executor.assert_not_called()
+
+    @patch.object(settings, "PID_QUERY_FAN_OUT_TIMEOUT", 0.1)
+    @patch.object(data_source_utils, "send_oauth2_post_request")
+    @patch.object(data_source_utils, "execute_session_pid_query")
+    def test_slow_session_data_source_is_reported_as_timeout(
+        self, mock_execute_session_pid_query, mock_send_oauth2_post_request
+    ):
+        """test_slow_session_data_source_is_reported_as_timeout"""
+        query = mocks.MockQuery(
+            data_sources=[
+                _build_data_source("local", "session"),
+                _build_data_source("remote", "oauth2"),
+            ]
+        )
+        release_event = threading.Event()
+
+        def _execute_session_pid_query(*args, **kwargs):
+            release_event.wait(5)
+            return ["pid1"]
+
+        mock_execute_session_pid_query.side_effect = _execute_session_pid_query
+        mock_send_oauth2_post_request.return_value = mocks.MockResponse(
+            json_data=["pid2"]
+        )
+
+        start_time = time.monotonic()
+
+        try:
+            result = data_source_utils.execute_query_pid_fan_out(
+                query, self.mock_request
+            )
+        finally:
+            release_event.set()
+
+        self.assertLess(time.monotonic() - start_time, 5)
+        self.assertEqual(result["pids"], ["pid2"])
+        self.assertEqual(
+            [report["status"] for report in result["data_sources"]],
+            ["timeout", "ok"],
+        )
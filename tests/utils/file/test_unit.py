@@ -0,0 +1,203 @@
+"""Unit tests for `core_linked_records_app.utils.file`."""
+
+from unittest import TestCase
+from unittest.mock import Mock, PropertyMock, patch
+
+from django.core.files.base import ContentFile
+from django.test import RequestFactory
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils import file as file_utils
+from core_linked_records_app.utils.exceptions import RangeNotSatisfiableError
+
+FILE_CONTENT = b"0123456789"
+
+
+class TestGetByteRange(TestCase):
+    """Unit tests for `get_byte_range` function."""
+
+    def test_missing_header_returns_none(self):
+        """test_missing_header_returns_none"""
+        self.assertIsNone(file_utils.get_byte_range(None, 10))
+
+    def test_closed_range_returns_positions(self):
+        """test_closed_range_returns_positions"""
+        self.assertEqual(file_utils.get_byte_range("bytes=2-5", 10), (2, 5))
+
+    def test_open_range_ends_at_last_byte(self):
+        """test_open_range_ends_at_last_byte"""
+        self.assertEqual(file_utils.get_byte_range("bytes=2-", 10), (2, 9))
+
+    def test_range_after_end_is_truncated(self):
+        """test_range_after_end_is_truncated"""
+        self.assertEqual(file_utils.get_byte_range("bytes=2-50", 10), (2, 9))
+
+    def test_suffix_range_returns_last_bytes(self):
+        """test_suffix_range_returns_last_bytes"""
+        self.assertEqual(file_utils.get_byte_range("bytes=-3", 10), (7, 9))
+
+    def test_suffix_longer_than_file_returns_whole_file(self):
+        """test_suffix_longer_than_file_returns_whole_file"""
+        self.assertEqual(file_utils.get_byte_range("bytes=-30", 10), (0, 9))
+
+    def test_multiple_ranges_return_none(self):
+        """test_multiple_ranges_return_none"""
+        self.assertIsNone(file_utils.get_byte_range("bytes=0-1,4-5", 10))
+
+    def test_invalid_unit_returns_none(self):
+        """test_invalid_unit_returns_none"""
+        self.assertIsNone(file_utils.get_byte_range("items=0-1", 10))
+
+    def test_reversed_range_returns_none(self):
+        """test_reversed_range_returns_none"""
+        self.assertIsNone(file_utils.get_byte_range("bytes=5-2", 10))
+
+    def test_range_after_end_of_file_raises_error(self):
+        """test_range_after_end_of_file_raises_error"""
+        with self.assertRaises(RangeNotSatisfiableError):
+            file_utils.get_byte_range("bytes=10-", 10)
+
+    def test_empty_suffix_raises_error(self):
+        """test_empty_suffix_raises_error"""
+        with self.assertRaises(RangeNotSatisfiableError):
+            file_utils.get_byte_range("bytes=-0", 10)
+
+
+class TestIterFileRange(TestCase):
+    """Unit tests for `iter_file_range` function."""
+
+    def test_returns_range_in_chunks(self):
+        """test_returns_range_in_chunks"""
+        file = ContentFile(FILE_CONTENT)
+
+        self.assertEqual(
+            list(file_utils.iter_file_range(file, 2, 5, 2)),
+            [b"23", b"45", b"6"],
+        )
+
+    def test_file_is_closed(self):
+        """test_file_is_closed"""
+        file = ContentFile(FILE_CONTENT)
+
+        with patch.object(file, "close") as mock_close:
+            list(file_utils.iter_file_range(file, 0, 10, 4))
+
+        mock_close.assert_called_once()
+
+
+class TestGetBlobFileResponse(TestCase):
+    """Unit tests for `get_blob_file_response` function."""
+
+    def setUp(self) -> None:
+        self.request_factory = RequestFactory()
+        self.mock_blob = Mock(
+            filename="mock_file.txt",
+            blob=ContentFile(FILE_CONTENT, name="mock/mock_file.txt"),
+        )
+
+    def test_whole_file_is_streamed(self):
+        """test_whole_file_is_streamed"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/"), self.mock_blob
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), FILE_CONTENT)
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Content-Type"], "text/plain")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="mock_file.txt"',
+        )
+
+    def test_range_returns_partial_content(self):
+        """test_range_returns_partial_content"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/", HTTP_RANGE="bytes=2-5"),
+            self.mock_blob,
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"2345")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+
+    def test_unsatisfiable_range_returns_416(self):
+        """test_unsatisfiable_range_returns_416"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/", HTTP_RANGE="bytes=20-"),
+            self.mock_blob,
+        )
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_matching_if_range_returns_partial_content(self):
+        """test_matching_if_range_returns_partial_content"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get(
+                "/", HTTP_RANGE="bytes=2-5", HTTP_IF_RANGE='"mock_etag"'
+            ),
+            self.mock_blob,
+            etag='"mock_etag"',
+        )
+
+        self.assertEqual(response.status_code, 206)
+
+    def test_outdated_if_range_returns_whole_file(self):
+        """test_outdated_if_range_returns_whole_file"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get(
+                "/", HTTP_RANGE="bytes=2-5", HTTP_IF_RANGE='"old_etag"'
+            ),
+            self.mock_blob,
+            etag='"mock_etag"',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), FILE_CONTENT)
+
+    @patch.object(settings, "PID_BLOB_OFFLOAD_PREFIX", "/protected/")
+    @patch.object(settings, "PID_BLOB_OFFLOAD_MODE", "x-accel-redirect")
+    def test_x_accel_redirect_mode_delegates_transfer(self):
+        """test_x_accel_redirect_mode_delegates_transfer"""
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/"), self.mock_blob
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Accel-Redirect"], "/protected/mock/mock_file.txt"
+        )
+        self.assertEqual(response.content, b"")
+
+    @patch.object(settings, "PID_BLOB_OFFLOAD_MODE", "x-sendfile")
+    def test_x_sendfile_mode_delegates_transfer(self):
+        """test_x_sendfile_mode_delegates_transfer"""
+        self.mock_blob.blob = Mock(path="/media/mock/mock_file.txt")
+
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/"), self.mock_blob
+        )
+
+        self.assertEqual(response["X-Sendfile"], "/media/mock/mock_file.txt")
+
+    @patch.object(settings, "PID_BLOB_OFFLOAD_MODE", "x-sendfile")
+    def test_x_sendfile_mode_without_path_streams_file(self):
+        """test_x_sendfile_mode_without_path_streams_file"""
+        self.mock_blob.blob = Mock(
+            size=len(FILE_CONTENT),
+            open=Mock(return_value=ContentFile(FILE_CONTENT)),
+        )
+        type(self.mock_blob.blob).path = PropertyMock(
+            side_effect=NotImplementedError
+        )
+
+        response = file_utils.get_blob_file_response(
+            self.request_factory.get("/"), self.mock_blob
+        )
+
+        self.assertNotIn("X-Sendfile", response)
+        self.assertEqual(b"".join(response.streaming_content), FILE_CONTENT)
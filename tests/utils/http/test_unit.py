@@ -0,0 +1,245 @@
+"""Unit tests for `core_linked_records_app.utils.http`."""
+
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils import http as http_utils
+from tests import mocks
+
+
+class TestBuildEtag(TestCase):
+    """Unit tests for `build_etag` function."""
+
+    def test_same_parts_return_same_etag(self):
+        """test_same_parts_return_same_etag"""
+        self.assertEqual(
+            http_utils.build_etag("data", 1, "json"),
+            http_utils.build_etag("data", 1, "json"),
+        )
+
+    def test_different_parts_return_different_etags(self):
+        """test_different_parts_return_different_etags"""
+        self.assertNotEqual(
+            http_utils.build_etag("data", 1, "json"),
+            http_utils.build_etag("data", 1, "xml"),
+        )
+
+    def test_etag_is_quoted(self):
+        """test_etag_is_quoted"""
+        etag = http_utils.build_etag("data", 1)
+
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+
+class TestIsPublicObject(TestCase):
+    """Unit tests for `is_public_object` function."""
+
+    def setUp(self) -> None:
+        self.mock_data = mocks.MockData()
+        self.mock_data.workspace = Mock(is_public=True)
+
+    @patch.object(http_utils, "CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT", True)
+    def test_public_workspace_returns_true(self):
+        """test_public_workspace_returns_true"""
+        self.assertTrue(http_utils.is_public_object(self.mock_data))
+
+    @patch.object(http_utils, "CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT", True)
+    def test_private_workspace_returns_false(self):
+        """test_private_workspace_returns_false"""
+        self.mock_data.workspace = Mock(is_public=False)
+
+        self.assertFalse(http_utils.is_public_object(self.mock_data))
+
+    @patch.object(http_utils, "CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT", True)
+    def test_no_workspace_returns_false(self):
+        """test_no_workspace_returns_false"""
+        self.mock_data.workspace = None
+
+        self.assertFalse(http_utils.is_public_object(self.mock_data))
+
+    @patch.object(http_utils, "CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT", False)
+    def test_anonymous_access_disabled_returns_false(self):
+        """test_anonymous_access_disabled_returns_false"""
+        self.assertFalse(http_utils.is_public_object(self.mock_data))
+
+
+class TestGetDataValidators(TestCase):
+    """Unit tests for `get_data_validators` function."""
+
+    def setUp(self) -> None:
+        self.mock_data = mocks.MockData()
+        self.mock_data.checksum = None
+        self.mock_data.last_change_date = datetime(
+            2024, 1, 1, tzinfo=timezone.utc
+        )
+
+    def test_returns_last_change_timestamp(self):
+        """test_returns_last_change_timestamp"""
+        _, last_modified = http_utils.get_data_validators(self.mock_data)
+
+        self.assertEqual(
+            last_modified, int(self.mock_data.last_change_date.timestamp())
+        )
+
+    def test_change_of_data_changes_etag(self):
+        """test_change_of_data_changes_etag"""
+        etag, _ = http_utils.get_data_validators(self.mock_data)
+        self.mock_data.last_change_date = datetime(
+            2024, 1, 2, tzinfo=timezone.utc
+        )
+
+        self.assertNotEqual(
+            http_utils.get_data_validators(self.mock_data)[0], etag
+        )
+
+    def test_variant_changes_etag(self):
+        """test_variant_changes_etag"""
+        self.assertNotEqual(
+            http_utils.get_data_validators(self.mock_data, ["json"])[0],
+            http_utils.get_data_validators(self.mock_data, ["xml"])[0],
+        )
+
+    def test_missing_date_returns_no_timestamp(self):
+        """test_missing_date_returns_no_timestamp"""
+        self.mock_data.last_change_date = None
+
+        self.assertIsNone(http_utils.get_data_validators(self.mock_data)[1])
+
+
+class TestGetBlobValidators(TestCase):
+    """Unit tests for `get_blob_validators` function."""
+
+    def test_checksum_changes_etag(self):
+        """test_checksum_changes_etag"""
+        mock_blob = mocks.MockBlob(pk=1, creation_date=None)
+        mock_blob.checksum = "mock_checksum_1"
+        etag, _ = http_utils.get_blob_validators(mock_blob)
+        mock_blob.checksum = "mock_checksum_2"
+
+        self.assertNotEqual(http_utils.get_blob_validators(mock_blob)[0], etag)
+
+
+class TestGetVariantList(TestCase):
+    """Unit tests for `get_variant_list` function."""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+        self.mock_request.accepted_renderer = Mock(format="json")
+        self.mock_request.user = Mock(pk=1)
+
+    def test_public_variant_does_not_contain_user(self):
+        """test_public_variant_does_not_contain_user"""
+        self.assertEqual(
+            http_utils.get_variant_list(self.mock_request, True), ["json"]
+        )
+
+    def test_private_variant_contains_user(self):
+        """test_private_variant_contains_user"""
+        self.assertEqual(
+            http_utils.get_variant_list(self.mock_request, False),
+            ["json", 1],
+        )
+
+
+class TestSetCacheHeaders(TestCase):
+    """Unit tests for `set_cache_headers` function."""
+
+    def test_public_response_uses_public_policy(self):
+        """test_public_response_uses_public_policy"""
+        response = http_utils.set_cache_headers(
+            HttpResponse(), '"mock_etag"', 0, True
+        )
+
+        self.assertEqual(
+            response["Cache-Control"], settings.PID_PUBLIC_CACHE_CONTROL
+        )
+
+    def test_private_response_uses_private_policy(self):
+        """test_private_response_uses_private_policy"""
+        response = http_utils.set_cache_headers(
+            HttpResponse(), '"mock_etag"', 0, False
+        )
+
+        self.assertEqual(
+            response["Cache-Control"], settings.PID_PRIVATE_CACHE_CONTROL
+        )
+
+    def test_validators_are_set(self):
+        """test_validators_are_set"""
+        response = http_utils.set_cache_headers(
+            HttpResponse(), '"mock_etag"', 0, False
+        )
+
+        self.assertEqual(response["ETag"], '"mock_etag"')
+        self.assertEqual(
+            response["Last-Modified"], "Thu, 01 Jan 1970 00:00:00 GMT"
+        )
+
+    def test_missing_timestamp_does_not_set_last_modified(self):
+        """test_missing_timestamp_does_not_set_last_modified"""
+        response = http_utils.set_cache_headers(
+            HttpResponse(), '"mock_etag"', None, False
+        )
+
+        self.assertNotIn("Last-Modified", response)
+
+
+class TestGetNotModifiedResponse(TestCase):
+    """Unit tests for `get_not_modified_response` function."""
+
+    def setUp(self) -> None:
+        self.request_factory = RequestFactory()
+
+    def test_matching_etag_returns_304(self):
+        """test_matching_etag_returns_304"""
+        response = http_utils.get_not_modified_response(
+            self.request_factory.get("/", HTTP_IF_NONE_MATCH='"mock_etag"'),
+            '"mock_etag"',
+            None,
+            False,
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], '"mock_etag"')
+        self.assertEqual(
+            response["Cache-Control"], settings.PID_PRIVATE_CACHE_CONTROL
+        )
+
+    def test_different_etag_returns_none(self):
+        """test_different_etag_returns_none"""
+        self.assertIsNone(
+            http_utils.get_not_modified_response(
+                self.request_factory.get(
+                    "/", HTTP_IF_NONE_MATCH='"other_etag"'
+                ),
+                '"mock_etag"',
+                None,
+                False,
+            )
+        )
+
+    def test_unmodified_since_date_returns_304(self):
+        """test_unmodified_since_date_returns_304"""
+        response = http_utils.get_not_modified_response(
+            self.request_factory.get(
+                "/", HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 1970 00:00:10 GMT"
+            ),
+            '"mock_etag"',
+            10,
+            True,
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_unconditional_request_returns_none(self):
+        """test_unconditional_request_returns_none"""
+        self.assertIsNone(
+            http_utils.get_not_modified_response(
+                self.request_factory.get("/"), '"mock_etag"', 10, True
+            )
+        )
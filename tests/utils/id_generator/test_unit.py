@@ -0,0 +1,192 @@
+"""Unit tests for core_linked_records_app.utils.id_generator"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_linked_records_app.utils import id_generator as id_generator_utils
+from core_main_app.commons.exceptions import CoreError
+
+
+class TestEncodeBase32(TestCase):
+    """Unit tests for `encode_base32` function."""
+
+    def test_value_is_padded(self):
+        """test_value_is_padded"""
+        self.assertEqual(id_generator_utils.encode_base32(33, 4), "0011")
+
+    def test_order_is_preserved(self):
+        """test_order_is_preserved"""
+        encoded_list = [
+            id_generator_utils.encode_base32(value, 4)
+            for value in range(0, 40000, 7)
+        ]
+
+        self.assertEqual(encoded_list, sorted(encoded_list))
+
+    def test_value_too_large_raises_core_error(self):
+        """test_value_too_large_raises_core_error"""
+        with self.assertRaises(CoreError):
+            id_generator_utils.encode_base32(32**4, 4)
+
+
+class TestBuildIdGenerator(TestCase):
+    """Unit tests for `build_id_generator` function."""
+
+    def test_generator_is_built_with_args(self):
+        """test_generator_is_built_with_args"""
+        id_generator = id_generator_utils.build_id_generator(
+            {
+                "class": "core_linked_records_app.utils.id_generator."
+                "RandomIdGenerator",
+                "args": [8],
+            }
+        )
+
+        self.assertIsInstance(
+            id_generator, id_generator_utils.RandomIdGenerator
+        )
+        self.assertEqual(len(id_generator.generate()), 8)
+
+
+class TestUlidIdGenerator(TestCase):
+    """Unit tests for `UlidIdGenerator` class."""
+
+    def test_ids_are_unique_and_ordered(self):
+        """test_ids_are_unique_and_ordered"""
+        id_generator = id_generator_utils.UlidIdGenerator()
+        id_list = [id_generator.generate() for _ in range(1000)]
+
+        self.assertEqual(len(id_list[0]), 26)
+        self.assertEqual(len(set(id_list)), len(id_list))
+        self.assertEqual(id_list, sorted(id_list))
+
+    @patch.object(id_generator_utils.time, "time_ns")
+    def test_clock_going_back_keeps_order(self, mock_time_ns):
+        """test_clock_going_back_keeps_order"""
+        id_generator = id_generator_utils.UlidIdGenerator()
+        mock_time_ns.return_value = 2000000000
+        first_id = id_generator.generate()
+        mock_time_ns.return_value = 1000000000
+
+        self.assertGreater(id_generator.generate(), first_id)
+
+
+class TestSnowflakeIdGenerator(TestCase):
+    """Unit tests for `SnowflakeIdGenerator` class."""
+
+    def test_ids_are_unique_and_ordered(self):
+        """test_ids_are_unique_and_ordered"""
+        id_generator = id_generator_utils.SnowflakeIdGenerator(1)
+        id_list = [id_generator.generate() for _ in range(10000)]
+
+        self.assertEqual(len(id_list[0]), 13)
+        self.assertEqual(len(set(id_list)), len(id_list))
+        self.assertEqual(id_list, sorted(id_list))
+
+    @patch.object(id_generator_utils.time, "time_ns")
+    def test_nodes_do_not_collide(self, mock_time_ns):
+        """test_nodes_do_not_collide"""
+        mock_time_ns.return_value = 1700000000000000000
+        first_generator = id_generator_utils.SnowflakeIdGenerator(1)
+        second_generator = id_generator_utils.SnowflakeIdGenerator(2)
+
+        self.assertNotEqual(
+            first_generator.generate(), second_generator.generate()
+        )
+
+    @patch.object(id_generator_utils.time, "time_ns")
+    def test_sequence_overflow_moves_to_next_millisecond(self, mock_time_ns):
+        """test_sequence_overflow_moves_to_next_millisecond"""
+        mock_time_ns.return_value = 1700000000000000000
+        id_generator = id_generator_utils.SnowflakeIdGenerator(1)
+        id_list = [id_generator.generate() for _ in range(5000)]
+
+        self.assertEqual(len(set(id_list)), len(id_list))
+        self.assertEqual(id_list, sorted(id_list))
+
+    @patch.object(
+        id_generator_utils.local_id_sequence_system_api, "reserve_block"
+    )
+    def test_node_id_leased_once_per_process(self, mock_reserve_block):
+        """test_node_id_leased_once_per_process"""
+        mock_reserve_block.return_value = 1027
+        id_generator = id_generator_utils.SnowflakeIdGenerator()
+        id_generator.generate()
+        id_generator.generate()
+
+        mock_reserve_block.assert_called_once_with("snowflake_node", 1)
+        self.assertEqual(id_generator._leased_node_id, 3)
+
+    @patch.object(id_generator_utils.os, "getpid")
+    @patch.object(
+        id_generator_utils.local_id_sequence_system_api, "reserve_block"
+    )
+    def test_forked_process_leases_new_node_id(
+        self, mock_reserve_block, mock_getpid
+    ):
+        """test_forked_process_leases_new_node_id"""
+        mock_reserve_block.side_effect = [1, 2]
+        mock_getpid.return_value = 100
+        id_generator = id_generator_utils.SnowflakeIdGenerator()
+        id_generator.generate()
+        mock_getpid.return_value = 101
+        id_generator.generate()
+
+        self.assertEqual(mock_reserve_block.call_count, 2)
+        self.assertEqual(id_generator._leased_node_id, 2)
+
+    @patch.object(
+        id_generator_utils.local_id_sequence_system_api, "reserve_block"
+    )
+    def test_explicit_node_id_is_not_leased(self, mock_reserve_block):
+        """test_explicit_node_id_is_not_leased"""
+        id_generator_utils.SnowflakeIdGenerator(1).generate()
+
+        mock_reserve_block.assert_not_called()
+
+    def test_explicit_node_id_is_collision_free(self):
+        """test_explicit_node_id_is_collision_free"""
+        self.assertTrue(
+            id_generator_utils.SnowflakeIdGenerator(1).collision_free
+        )
+
+    def test_leased_node_id_is_not_collision_free(self):
+        """test_leased_node_id_is_not_collision_free"""
+        self.assertFalse(
+            id_generator_utils.SnowflakeIdGenerator().collision_free
+        )
+
+    def test_invalid_node_id_raises_core_error(self):
+        """test_invalid_node_id_raises_core_error"""
+        with self.assertRaises(CoreError):
+            id_generator_utils.SnowflakeIdGenerator(1024)
+
+
+class TestSequenceBlockIdGenerator(TestCase):
+    """Unit tests for `SequenceBlockIdGenerator` class."""
+
+    @patch.object(
+        id_generator_utils.local_id_sequence_system_api, "reserve_block"
+    )
+    def test_block_is_reserved_once_per_block_size(self, mock_reserve_block):
+        """test_block_is_reserved_once_per_block_size"""
+        mock_reserve_block.side_effect = [0, 100]
+        id_generator = id_generator_utils.SequenceBlockIdGenerator(
+            "mock_sequence", 3
+        )
+        id_list = [id_generator.generate() for _ in range(4)]
+
+        self.assertEqual(mock_reserve_block.call_count, 2)
+        mock_reserve_block.assert_called_with("mock_sequence", 3)
+        self.assertEqual(
+            id_list,
+            [
+                id_generator_utils.encode_base32(value, 13)
+                for value in [0, 1, 2, 100]
+            ],
+        )
+
+    def test_invalid_block_size_raises_core_error(self):
+        """test_invalid_block_size_raises_core_error"""
+        with self.assertRaises(CoreError):
+            id_generator_utils.SequenceBlockIdGenerator("mock_sequence", 0)
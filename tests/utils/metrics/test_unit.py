@@ -0,0 +1,205 @@
+"""Unit tests for `core_linked_records_app.utils.metrics`."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core_linked_records_app.utils import metrics as metrics_utils
+from core_linked_records_app.utils.metrics import (
+    InMemoryMetricsRegistry,
+    NullMetricsRegistry,
+)
+
+
+class TestInMemoryMetricsRegistry(TestCase):
+    """Unit tests for `InMemoryMetricsRegistry` class."""
+
+    def test_increment_sums_values_by_labels(self):
+        """test_increment_sums_values_by_labels"""
+        registry = InMemoryMetricsRegistry()
+        registry.increment("mock_total", {"a": "1", "b": "2"})
+        registry.increment("mock_total", {"b": "2", "a": "1"}, 2)
+        registry.increment("mock_total", {"a": "2"})
+
+        self.assertEqual(
+            registry.get_counter("mock_total", {"a": "1", "b": "2"}), 3
+        )
+        self.assertEqual(registry.get_counter("mock_total", {"a": "2"}), 1)
+        self.assertEqual(registry.get_counter("mock_total"), 0)
+
+    def test_render_counter(self):
+        """test_render_counter"""
+        registry = InMemoryMetricsRegistry()
+        registry.increment("mock_total", {"status": "201"})
+
+        self.assertEqual(
+            registry.render(),
+            '# TYPE mock_total counter\nmock_total{status="201"} 1\n',
+        )
+
+    def test_render_histogram_buckets_are_cumulative(self):
+        """test_render_histogram_buckets_are_cumulative"""
+        registry = InMemoryMetricsRegistry(buckets=[0.1, 1.0])
+        registry.observe("mock_seconds", 0.05, {"stage": "parse"})
+        registry.observe("mock_seconds", 0.5, {"stage": "parse"})
+        registry.observe("mock_seconds", 2.0, {"stage": "parse"})
+
+        self.assertEqual(
+            registry.render().splitlines(),
+            [
+                "# TYPE mock_seconds histogram",
+                'mock_seconds_bucket{stage="parse",le="0.1"} 1',
+                'mock_seconds_bucket{stage="parse",le="1.0"} 2',
+                'mock_seconds_bucket{stage="parse",le="+Inf"} 3',
+                'mock_seconds_sum{stage="parse"} 2.55',
+                'mock_seconds_count{stage="parse"} 3',
+            ],
+        )
+
+    def test_render_escapes_label_values(self):
+        """test_render_escapes_label_values"""
+        registry = InMemoryMetricsRegistry()
+        registry.increment("mock_total", {"label": 'a"b\\c\nd'})
+
+        self.assertIn(
+            'mock_total{label="a\\"b\\\\c\\nd"} 1', registry.render()
+        )
+
+    def test_timer_observes_duration_when_block_raises(self):
+        """test_timer_observes_duration_when_block_raises"""
+        registry = InMemoryMetricsRegistry()
+
+        with self.assertRaises(ValueError):
+            with registry.timer("mock_seconds"):
+                raise ValueError()
+
+        self.assertEqual(registry.get_histogram_count("mock_seconds"), 1)
+
+    def test_render_includes_collector_samples(self):
+        """test_render_includes_collector_samples"""
+        registry = InMemoryMetricsRegistry()
+        registry.register_collector(
+            lambda: [("mock_entries", "gauge", {"cache": "mock"}, 4)]
+        )
+
+        self.assertEqual(
+            registry.render(),
+            '# TYPE mock_entries gauge\nmock_entries{cache="mock"} 4\n',
+        )
+
+    def test_failing_collector_is_skipped(self):
+        """test_failing_collector_is_skipped"""
+        registry = InMemoryMetricsRegistry()
+        registry.register_collector(MagicMock(side_effect=Exception()))
+        registry.increment("mock_total")
+
+        self.assertEqual(
+            registry.render(), "# TYPE mock_total counter\nmock_total 1\n"
+        )
+
+    def test_clear_resets_values(self):
+        """test_clear_resets_values"""
+        registry = InMemoryMetricsRegistry()
+        registry.increment("mock_total")
+        registry.observe("mock_seconds", 1.0)
+        registry.clear()
+
+        self.assertEqual(registry.render(), "")
+
+
+class TestNullMetricsRegistry(TestCase):
+    """Unit tests for `NullMetricsRegistry` class."""
+
+    def test_render_returns_empty_string(self):
+        """test_render_returns_empty_string"""
+        registry = NullMetricsRegistry()
+        registry.increment("mock_total")
+        registry.observe("mock_seconds", 1.0)
+
+        with registry.timer("mock_seconds"):
+            pass
+
+        self.assertEqual(registry.render(), "")
+
+
+class TestBuildMetricsRegistry(TestCase):
+    """Unit tests for `build_metrics_registry` function."""
+
+    def test_none_config_returns_null_registry(self):
+        """test_none_config_returns_null_registry"""
+        self.assertIsInstance(
+            metrics_utils.build_metrics_registry(None), NullMetricsRegistry
+        )
+
+    def test_config_returns_registry_with_pid_stats(self):
+        """test_config_returns_registry_with_pid_stats"""
+        registry = metrics_utils.build_metrics_registry(
+            {
+                "class": "core_linked_records_app.utils.metrics."
+                "InMemoryMetricsRegistry",
+                "args": [[1.0]],
+            }
+        )
+
+        self.assertEqual(registry.buckets, (1.0,))
+        self.assertIn(
+            'pid_cache_hits_total{cache="template_xsd"}', registry.render()
+        )
+
+
+class TestInstrumentProviderOperation(TestCase):
+    """Unit tests for `instrument_provider_operation` function."""
+
+    def setUp(self):
+        self.registry = InMemoryMetricsRegistry()
+        self.provider = MagicMock(provider_name="mock_provider")
+
+    def _call(self, method):
+        with patch.object(
+            metrics_utils, "get_metrics_registry", return_value=self.registry
+        ):
+            return metrics_utils.instrument_provider_operation("create")(
+                method
+            )(self.provider, "mock_prefix")
+
+    def test_status_code_is_counted(self):
+        """test_status_code_is_counted"""
+        response = self._call(
+            lambda provider, prefix: MagicMock(status_code=201)
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            self.registry.get_counter(
+                metrics_utils.PROVIDER_REQUESTS_METRIC,
+                {
+                    "provider": "mock_provider",
+                    "operation": "create",
+                    "status": 201,
+                },
+            ),
+            1,
+        )
+        self.assertEqual(
+            self.registry.get_histogram_count(
+                metrics_utils.PROVIDER_DURATION_METRIC,
+                {"provider": "mock_provider", "operation": "create"},
+            ),
+            1,
+        )
+
+    def test_exception_is_counted_as_error(self):
+        """test_exception_is_counted_as_error"""
+        with self.assertRaises(ValueError):
+            self._call(MagicMock(side_effect=ValueError()))
+
+        self.assertEqual(
+            self.registry.get_counter(
+                metrics_utils.PROVIDER_REQUESTS_METRIC,
+                {
+                    "provider": "mock_provider",
+                    "operation": "create",
+                    "status": "error",
+                },
+            ),
+            1,
+        )
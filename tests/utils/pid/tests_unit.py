@@ -3,7 +3,9 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock, MagicMock
 
+from core_linked_records_app import settings
 from core_linked_records_app.utils import pid as pid_utils
+from core_linked_records_app.utils import providers
 from core_linked_records_app.utils.exceptions import (
     InvalidPrefixError,
     InvalidRecordError,
@@ -71,6 +73,119 @@ class TestIsValidPidValue(TestCase):
         )
 
 
+class TestIsValidRoutedPidValue(TestCase):
+    """Tests for is_valid_routed_pid_value function"""
+
+    def setUp(self) -> None:
+        self.mock_pid = "https://mock.lookup.url/mock_prefix/mockpid"
+        self.mock_pid_format = r"[a-z]+"
+
+    def test_pid_value_not_a_string_returns_false(self):
+        """test_pid_value_not_a_string_returns_false"""
+        self.assertFalse(
+            pid_utils.is_valid_routed_pid_value(
+                {"mock_key": "mock_value"}, self.mock_pid_format
+            )
+        )
+
+    @patch.object(pid_utils.ProviderManager, "find_provider_from_pid")
+    def test_pid_without_provider_returns_false(
+        self, mock_find_provider_from_pid
+    ):
+        """test_pid_without_provider_returns_false"""
+        mock_find_provider_from_pid.return_value = None
+
+        self.assertFalse(
+            pid_utils.is_valid_routed_pid_value(
+                self.mock_pid, self.mock_pid_format
+            )
+        )
+
+    @patch.object(pid_utils, "is_valid_pid_value")
+    @patch.object(pid_utils.ProviderManager, "find_provider_from_pid")
+    def test_pid_is_checked_against_its_provider(
+        self, mock_find_provider_from_pid, mock_is_valid_pid_value
+    ):
+        """test_pid_is_checked_against_its_provider"""
+        mock_find_provider_from_pid.return_value = "mock_provider"
+        mock_is_valid_pid_value.return_value = True
+
+        self.assertTrue(
+            pid_utils.is_valid_routed_pid_value(
+                self.mock_pid, self.mock_pid_format
+            )
+        )
+        mock_is_valid_pid_value.assert_called_with(
+            self.mock_pid, "mock_provider", self.mock_pid_format
+        )
+
+    def test_pid_of_non_default_provider_is_valid(self):
+        """test_pid_of_non_default_provider_is_valid"""
+        provider_config_dict = {
+            "local": {
+                "class": "core_linked_records_app.utils.providers.local.LocalIdProvider",
+                "args": [],
+            },
+            "handle": {
+                "class": "core_linked_records_app.utils.providers.handle_net.HandleNetSystem",
+                "args": [
+                    "https://hdl.handle.net",
+                    "https://mock.handle.domain",
+                    "mock_username",
+                    "mock_password",
+                ],
+                "prefixes": ["prefix.a"],
+            },
+        }
+        providers.clear_provider_registry()
+
+        try:
+            with patch.object(
+                settings, "ID_PROVIDER_SYSTEMS", provider_config_dict
+            ), patch.object(settings, "ID_PROVIDER_SYSTEM_NAME", "local"):
+                self.assertTrue(
+                    pid_utils.is_valid_routed_pid_value(
+                        "https://hdl.handle.net/prefix.a/mockpid",
+                        self.mock_pid_format,
+                    )
+                )
+                self.assertFalse(
+                    pid_utils.is_valid_routed_pid_value(
+                        "https://hdl.handle.net/prefix.b/mockpid",
+                        self.mock_pid_format,
+                    )
+                )
+        finally:
+            providers.clear_provider_registry()
+
+
+class TestGetPidValueRegex(TestCase):
+    """Unit tests for `get_pid_value_regex` function."""
+
+    def test_regex_is_compiled_once(self):
+        """test_regex_is_compiled_once"""
+        pid_utils.get_pid_value_regex.cache_clear()
+
+        first_regex = pid_utils.get_pid_value_regex(
+            "mock_url", ("mock_prefix",), r"[a-z]+"
+        )
+        second_regex = pid_utils.get_pid_value_regex(
+            "mock_url", ("mock_prefix",), r"[a-z]+"
+        )
+
+        self.assertIs(first_regex, second_regex)
+        self.assertEqual(pid_utils.get_pid_value_regex.cache_info().hits, 1)
+
+    def test_prefixes_are_alternatives(self):
+        """test_prefixes_are_alternatives"""
+        pid_value_regex = pid_utils.get_pid_value_regex(
+            "mock_url", ("prefix_a", "prefix_b"), r"[a-z]+"
+        )
+
+        self.assertIsNotNone(pid_value_regex.match("mock_url/prefix_b/pid"))
+        self.assertIsNone(pid_value_regex.match("mock_url/prefix_c/pid"))
+
+
 class TestGetPidSettingsDict(TestCase):
     """Unit tests for `get_pid_settings_dict` function."""
 
@@ -167,3 +282,17 @@ class TestSplitPrefixFromRecord(TestCase):
 
         with self.assertRaises(InvalidRecordError):
             pid_utils.split_prefix_from_record(f"{mock_prefix}/{mock_record}")
+
+    @patch.object(pid_utils, "get_provider_prefix_list")
+    def test_prefix_of_other_provider_raises_invalid_prefix_error(
+        self, mock_get_provider_prefix_list
+    ):
+        """test_prefix_of_other_provider_raises_invalid_prefix_error"""
+        mock_get_provider_prefix_list.return_value = ["mock_prefix_a"]
+
+        with self.assertRaises(InvalidPrefixError):
+            pid_utils.split_prefix_from_record(
+                "mock_prefix_b/mock_record", "mock_provider"
+            )
+
+        mock_get_provider_prefix_list.assert_called_with("mock_provider")
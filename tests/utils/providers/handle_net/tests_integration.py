@@ -0,0 +1,237 @@
+"""Integration tests for core_linked_records_app.utils.providers.handle_net,
+run against a local stub of the handle.net REST API.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from rest_framework import status
+
+from core_linked_records_app import settings
+from core_linked_records_app.utils.providers.handle_net import HandleNetSystem
+
+
+class StubHandleServer(ThreadingHTTPServer):
+    """Stub handle.net server storing handles in memory"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandleRequestHandler)
+        self.handles = {}
+        self.minted_count = 0
+        self.request_count = 0
+        self.failure_count = 0
+        self.client_port_set = set()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        """Base URL of the server"""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandleRequestHandler(BaseHTTPRequestHandler):
+    """Request handler of the stub handle.net server"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Silence the server logs"""
+
+    def _send(self, status_code, handle, response_code):
+        content = json.dumps(
+            {"responseCode": response_code, "handle": handle}
+        ).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _parse(self):
+        url = urlparse(self.path)
+        handle = url.path.split("/api/handles/", 1)[1]
+        with self.server.lock:
+            self.server.request_count += 1
+            self.server.client_port_set.add(self.client_address[1])
+            should_fail = self.server.failure_count > 0
+            if should_fail:
+                self.server.failure_count -= 1
+        return handle, parse_qs(url.query), should_fail
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Retrieve a handle"""
+        handle, _, should_fail = self._parse()
+        if should_fail:
+            self._send(status.HTTP_503_SERVICE_UNAVAILABLE, handle, 2)
+        elif handle in self.server.handles:
+            self._send(status.HTTP_200_OK, handle, 1)
+        else:
+            self._send(status.HTTP_404_NOT_FOUND, handle, 100)
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Create or update a handle"""
+        handle, query, should_fail = self._parse()
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if should_fail:
+            self._send(status.HTTP_503_SERVICE_UNAVAILABLE, handle, 2)
+            return
+
+        with self.server.lock:
+            if query.get("mintNewSuffix") == ["true"]:
+                self.server.minted_count += 1
+                handle = f"{handle}MINTED{self.server.minted_count}"
+
+            if query.get("overwrite") == ["false"] and (
+                handle in self.server.handles
+            ):
+                self._send(status.HTTP_409_CONFLICT, handle, 101)
+                return
+
+            status_code = (
+                status.HTTP_200_OK
+                if handle in self.server.handles
+                else status.HTTP_201_CREATED
+            )
+            self.server.handles[handle] = True
+
+        self._send(status_code, handle, 1)
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """Delete a handle"""
+        handle, _, should_fail = self._parse()
+        if should_fail:
+            self._send(status.HTTP_503_SERVICE_UNAVAILABLE, handle, 2)
+        elif self.server.handles.pop(handle, None):
+            self._send(status.HTTP_200_OK, handle, 1)
+        else:
+            self._send(status.HTTP_404_NOT_FOUND, handle, 100)
+
+
+class TestHandleNetSystemWithStubServer(TestCase):
+    """Test Handle Net System With Stub Server"""
+
+    def setUp(self) -> None:
+        self.server = StubHandleServer()
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.server_thread.start()
+        self.handle_system = self._build_handle_system()
+
+    @patch.object(settings, "HANDLE_NET_RETRY_BACKOFF_FACTOR", 0)
+    def _build_handle_system(self):
+        return HandleNetSystem(
+            "handle.net",
+            self.server.url,
+            self.server.url,
+            "mock_username",
+            "mock_password",
+        )
+
+    def tearDown(self) -> None:
+        self.handle_system.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_create_get_delete(self):
+        """test_create_get_delete"""
+        create_response = self.handle_system.create("mock_prefix", "record")
+        get_response = self.handle_system.get("mock_prefix/record")
+        delete_response = self.handle_system.delete("mock_prefix/record")
+
+        self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(get_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(delete_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(get_response.content)["url"],
+            f"{self.server.url}/mock_prefix/record",
+        )
+
+    def test_existing_record_returns_409(self):
+        """test_existing_record_returns_409"""
+        self.handle_system.create("mock_prefix", "record")
+        response = self.handle_system.create("mock_prefix", "record")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            json.loads(response.content)["message"],
+            self.handle_system.response_code_messages[101],
+        )
+
+    def test_requests_reuse_connection(self):
+        """test_requests_reuse_connection"""
+        for index in range(5):
+            self.handle_system.create("mock_prefix", f"record{index}")
+
+        self.assertEqual(self.server.request_count, 5)
+        self.assertEqual(len(self.server.client_port_set), 1)
+
+    def test_server_error_is_retried(self):
+        """test_server_error_is_retried"""
+        self.handle_system.create("mock_prefix", "record")
+        self.server.failure_count = 2
+
+        response = self.handle_system.get("mock_prefix/record")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.server.request_count, 4)
+
+    def test_server_error_on_mint_is_not_retried(self):
+        """test_server_error_on_mint_is_not_retried"""
+        self.server.failure_count = 1
+
+        response = self.handle_system.create("mock_prefix")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(self.server.minted_count, 0)
+
+    @patch.object(settings, "HANDLE_NET_MAX_RETRIES", 1)
+    def test_server_error_after_retries_is_returned(self):
+        """test_server_error_after_retries_is_returned"""
+        self.handle_system.session.close()
+        self.handle_system = self._build_handle_system()
+        self.server.failure_count = 5
+
+        response = self.handle_system.get("mock_prefix/record")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_create_many_mints_records(self):
+        """test_create_many_mints_records"""
+        response = self.handle_system.create_many("mock_prefix", count=10)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(self.server.handles), 10)
+        self.assertEqual(
+            len(
+                {
+                    record_content["handle"]
+                    for record_content in json.loads(response.content)[
+                        "records"
+                    ]
+                }
+            ),
+            10,
+        )
+
+    def test_create_many_with_existing_record_returns_207(self):
+        """test_create_many_with_existing_record_returns_207"""
+        self.handle_system.create("mock_prefix", "record1")
+
+        response = self.handle_system.create_many(
+            "mock_prefix", records=["record1", "record2"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(len(self.server.handles), 2)
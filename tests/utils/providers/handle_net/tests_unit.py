@@ -89,22 +89,21 @@ class TestHandleNetSystemUpdate(TestCase):
             "mock_password",
         )
 
-    @patch(
-        "core_linked_records_app.utils.providers.handle_net.send_put_request"
-    )
-    def test_send_put_request_on_record_url(self, mock_send_put_request):
+    def test_send_put_request_on_record_url(self):
         """test_send_put_request_on_record_url"""
         mock_record = "mock_record"
         mock_put_response = {"handle": "mock_handle", "responseCode": 000}
-        mock_send_put_request.return_value = MockResponse(
-            content=json.dumps(mock_put_response)
-        )
 
-        self.mock_handle_system.update(mock_record)
-        mock_send_put_request.assert_called_with(
+        with patch.object(self.mock_handle_system.session, "put") as mock_put:
+            mock_put.return_value = MockResponse(
+                content=json.dumps(mock_put_response)
+            )
+            self.mock_handle_system.update(mock_record)
+
+        mock_put.assert_called_with(
             f"{self.mock_handle_system.provider_registration_url}/"
             f"{self.mock_handle_system.registration_api}/{mock_record}?overwrite=true",
-            self.mock_handle_system._generate_record_data(
+            data=self.mock_handle_system._generate_record_data(
                 mock_record, include_handle=True
             ),
             headers={
@@ -141,3 +140,47 @@ class TestHandleNetSystemDelete(TestCase):
         """test_returns_dict_with_url_key"""
 
         pass
+
+
+class TestHandleNetSystemCreateMany(TestCase):
+    """Test Handle Net System Create Many"""
+
+    def setUp(self) -> None:
+        self.mock_handle_system = HandleNetSystem(
+            "mock_provider_name",
+            "mock_provider_lookup_url",
+            "mock_provider_registration_url",
+            "mock_username",
+            "mock_password",
+        )
+
+    @patch.object(HandleNetSystem, "create")
+    def test_create_called_for_each_record(self, mock_create):
+        """test_create_called_for_each_record"""
+        mock_create.return_value = MockResponse(
+            status_code=201, content=json.dumps({"handle": "mock_handle"})
+        )
+
+        self.mock_handle_system.create_many(
+            "mock_prefix", records=["mock_record_1", "mock_record_2"]
+        )
+
+        self.assertEqual(mock_create.call_count, 2)
+
+    @patch.object(HandleNetSystem, "create")
+    def test_failed_creation_returns_207(self, mock_create):
+        """test_failed_creation_returns_207"""
+        mock_create.side_effect = [
+            MockResponse(
+                status_code=201, content=json.dumps({"handle": "mock_1"})
+            ),
+            MockResponse(
+                status_code=409, content=json.dumps({"handle": "mock_2"})
+            ),
+        ]
+
+        response = self.mock_handle_system.create_many(
+            "mock_prefix", records=["mock_1", "mock_2"]
+        )
+
+        self.assertEqual(response.status_code, 207)
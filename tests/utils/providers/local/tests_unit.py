@@ -6,8 +6,11 @@ from unittest.mock import patch
 
 from rest_framework import status
 
+from core_linked_records_app import settings
+from core_linked_records_app.utils.id_generator import RandomIdGenerator
 from core_linked_records_app.utils.providers.local import LocalIdProvider
 from core_main_app.commons import exceptions
+from core_main_app.commons.exceptions import CoreError
 from tests.mocks import MockResponse, MockLocalId
 
 
@@ -208,6 +211,222 @@ class TestLocalIdProviderCreate(TestCase):
         )
 
 
+class TestLocalIdProviderCreateMany(TestCase):
+    """Test Local Id Provider Create Many"""
+
+    def setUp(self) -> None:
+        self.provider = LocalIdProvider("mock_provider")
+        self.prefix = "mock_prefix"
+
+    def test_count_and_records_raises_core_error(self):
+        """test_count_and_records_raises_core_error"""
+        with self.assertRaises(CoreError):
+            self.provider.create_many(self.prefix, 1, ["mock_record"])
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    @patch(
+        "core_linked_records_app.utils.providers.local.LocalIdProvider._generate_id"
+    )
+    def test_count_checks_collisions_with_single_query(
+        self,
+        mock_generate_id,
+        mock_get_record_name_list_by_name_list,
+        mock_insert_many,
+    ):
+        """test_count_checks_collisions_with_single_query"""
+        mock_generate_id.side_effect = ["A", "B", "C"]
+        mock_get_record_name_list_by_name_list.return_value = []
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        response = self.provider.create_many(self.prefix, count=3)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(mock_get_record_name_list_by_name_list.call_count, 1)
+        self.assertEqual(mock_insert_many.call_count, 1)
+        self.assertEqual(len(json.loads(response.content)["records"]), 3)
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    @patch(
+        "core_linked_records_app.utils.providers.local.LocalIdProvider._generate_id"
+    )
+    def test_count_regenerates_only_colliding_records(
+        self,
+        mock_generate_id,
+        mock_get_record_name_list_by_name_list,
+        mock_insert_many,
+    ):
+        """test_count_regenerates_only_colliding_records"""
+        mock_generate_id.side_effect = ["A", "B", "C"]
+        mock_get_record_name_list_by_name_list.side_effect = [
+            [f"{self.prefix}/B"],
+            [],
+        ]
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        response = self.provider.create_many(self.prefix, count=2)
+
+        self.assertEqual(mock_generate_id.call_count, 3)
+        mock_get_record_name_list_by_name_list.assert_called_with(
+            [f"{self.prefix}/C"]
+        )
+        self.assertEqual(
+            [
+                record_content["record"]
+                for record_content in json.loads(response.content)["records"]
+            ],
+            [f"{self.prefix}/A", f"{self.prefix}/C"],
+        )
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    @patch(
+        "core_linked_records_app.utils.providers.local.LocalIdProvider._generate_id"
+    )
+    def test_count_regenerates_records_inserted_concurrently(
+        self,
+        mock_generate_id,
+        mock_get_record_name_list_by_name_list,
+        mock_insert_many,
+    ):
+        """test_count_regenerates_records_inserted_concurrently"""
+        mock_generate_id.side_effect = ["A", "B", "C"]
+        mock_get_record_name_list_by_name_list.return_value = []
+        # Record B is inserted by another writer after the check.
+        mock_insert_many.side_effect = lambda local_id_list: [
+            local_id
+            for local_id in local_id_list
+            if local_id.record_name != f"{self.prefix}/B"
+        ]
+
+        response = self.provider.create_many(self.prefix, count=2)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [
+                record_content["record"]
+                for record_content in json.loads(response.content)["records"]
+            ],
+            [f"{self.prefix}/A", f"{self.prefix}/C"],
+        )
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    def test_records_inserted_concurrently_are_reported_as_existing(
+        self, mock_get_record_name_list_by_name_list, mock_insert_many
+    ):
+        """test_records_inserted_concurrently_are_reported_as_existing"""
+        mock_get_record_name_list_by_name_list.return_value = []
+        # Record mock_record_1 is inserted by another writer after the check.
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list[1:]
+
+        response = self.provider.create_many(
+            self.prefix, records=["mock_record_1", "mock_record_2"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(
+            [
+                record_content["message"]
+                for record_content in json.loads(response.content)["records"]
+            ],
+            [
+                self.provider.messages["already_exist"],
+                self.provider.messages["success"],
+            ],
+        )
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    def test_existing_records_returns_207(
+        self, mock_get_record_name_list_by_name_list, mock_insert_many
+    ):
+        """test_existing_records_returns_207"""
+        mock_get_record_name_list_by_name_list.return_value = [
+            f"{self.prefix}/mock_record_1"
+        ]
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        response = self.provider.create_many(
+            self.prefix, records=["mock_record_1", "mock_record_2"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    def test_existing_records_are_not_inserted(
+        self, mock_get_record_name_list_by_name_list, mock_insert_many
+    ):
+        """test_existing_records_are_not_inserted"""
+        mock_get_record_name_list_by_name_list.return_value = [
+            f"{self.prefix}/mock_record_1"
+        ]
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        self.provider.create_many(
+            self.prefix, records=["mock_record_1", "mock_record_2"]
+        )
+
+        self.assertEqual(
+            [
+                local_id.record_name
+                for local_id in mock_insert_many.call_args.args[0]
+            ],
+            [f"{self.prefix}/mock_record_2"],
+        )
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    def test_records_returns_correct_content(
+        self, mock_get_record_name_list_by_name_list, mock_insert_many
+    ):
+        """test_records_returns_correct_content"""
+        mock_get_record_name_list_by_name_list.return_value = [
+            f"{self.prefix}/mock_record_1"
+        ]
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        response = self.provider.create_many(
+            self.prefix, records=["mock_record_1", "mock_record_2"]
+        )
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "records": [
+                    {
+                        "record": f"{self.prefix}/mock_record_1",
+                        "url": f"{self.provider.provider_lookup_url}/"
+                        f"{self.prefix}/mock_record_1",
+                        "message": self.provider.messages["already_exist"],
+                    },
+                    {
+                        "record": f"{self.prefix}/mock_record_2",
+                        "url": f"{self.provider.provider_lookup_url}/"
+                        f"{self.prefix}/mock_record_2",
+                        "message": self.provider.messages["success"],
+                    },
+                ]
+            },
+        )
+
+
 class TestLocalIdProviderUpdate(TestCase):
     """Test Local Id Provider Update"""
 
@@ -312,3 +531,135 @@ class TestLocalIdProviderDelete(TestCase):
                 "url": f"{self.provider.provider_lookup_url}/{self.record}",
             },
         )
+
+
+class TestLocalIdProviderIdGenerator(TestCase):
+    """Test Local Id Provider Id Generator"""
+
+    def setUp(self) -> None:
+        self.prefix = "mock_prefix"
+        self.sequence_provider = LocalIdProvider(
+            "mock_provider",
+            {
+                "class": "core_linked_records_app.utils.id_generator."
+                "SequenceBlockIdGenerator",
+                "args": ["mock_sequence", 10],
+            },
+        )
+
+    def test_default_generator_is_random(self):
+        """test_default_generator_is_random"""
+        self.assertIsInstance(
+            LocalIdProvider("mock_provider").id_generator, RandomIdGenerator
+        )
+
+    @patch.object(settings, "PID_FORMAT", r"[0-9]+")
+    def test_id_not_matching_pid_format_raises_core_error(self):
+        """test_id_not_matching_pid_format_raises_core_error"""
+        provider = LocalIdProvider("mock_provider")
+
+        with patch.object(
+            provider.id_generator, "generate", return_value="ABC"
+        ):
+            with self.assertRaises(CoreError):
+                provider.create(self.prefix)
+
+    @patch("core_linked_records_app.system.local_id.api.insert")
+    @patch(
+        "core_linked_records_app.system.local_id_sequence.api.reserve_block"
+    )
+    @patch(
+        "core_linked_records_app.utils.providers.local.LocalIdProvider.is_id_already_used"
+    )
+    def test_collision_free_create_skips_existence_check(
+        self, mock_is_id_already_used, mock_reserve_block, mock_localid_insert
+    ):
+        """test_collision_free_create_skips_existence_check"""
+        mock_reserve_block.return_value = 0
+        mock_localid_insert.return_value = None
+
+        response = self.sequence_provider.create(self.prefix)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            json.loads(response.content)["record"],
+            f"{self.prefix}/0000000000000",
+        )
+        mock_is_id_already_used.assert_not_called()
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id.api.get_record_name_list_by_name_list"
+    )
+    @patch(
+        "core_linked_records_app.system.local_id_sequence.api.reserve_block"
+    )
+    def test_collision_free_create_many_skips_existence_check(
+        self,
+        mock_reserve_block,
+        mock_get_record_name_list_by_name_list,
+        mock_insert_many,
+    ):
+        """test_collision_free_create_many_skips_existence_check"""
+        mock_reserve_block.return_value = 0
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list
+
+        response = self.sequence_provider.create_many(self.prefix, count=3)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(json.loads(response.content)["records"]), 3)
+        mock_get_record_name_list_by_name_list.assert_not_called()
+        self.assertEqual(mock_insert_many.call_count, 1)
+
+    @patch("core_linked_records_app.system.local_id.api.insert")
+    @patch(
+        "core_linked_records_app.system.local_id_sequence.api.reserve_block"
+    )
+    def test_collision_free_create_regenerates_conflicting_record(
+        self, mock_reserve_block, mock_localid_insert
+    ):
+        """test_collision_free_create_regenerates_conflicting_record"""
+        mock_reserve_block.return_value = 0
+        mock_localid_insert.side_effect = [
+            exceptions.NotUniqueError("mock_error"),
+            None,
+        ]
+
+        response = self.sequence_provider.create(self.prefix)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            json.loads(response.content)["record"],
+            f"{self.prefix}/0000000000001",
+        )
+        self.assertEqual(mock_localid_insert.call_count, 2)
+
+    @patch("core_linked_records_app.system.local_id.api.insert_many")
+    @patch(
+        "core_linked_records_app.system.local_id_sequence.api.reserve_block"
+    )
+    def test_collision_free_create_many_regenerates_conflicting_records(
+        self, mock_reserve_block, mock_insert_many
+    ):
+        """test_collision_free_create_many_regenerates_conflicting_records"""
+        mock_reserve_block.return_value = 0
+        inserted_list_iterator = iter([slice(1, None), slice(None)])
+        mock_insert_many.side_effect = lambda local_id_list: local_id_list[
+            next(inserted_list_iterator)
+        ]
+
+        response = self.sequence_provider.create_many(self.prefix, count=3)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [
+                record["record"]
+                for record in json.loads(response.content)["records"]
+            ],
+            [
+                f"{self.prefix}/0000000000001",
+                f"{self.prefix}/0000000000002",
+                f"{self.prefix}/0000000000003",
+            ],
+        )
+        self.assertEqual(mock_insert_many.call_count, 2)
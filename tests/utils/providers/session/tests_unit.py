@@ -0,0 +1,60 @@
+"""Unit tests for core_linked_records_app.utils.providers.session"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from core_linked_records_app.utils.providers import session
+
+
+class TestProviderSessionRequest(TestCase):
+    """Test Provider Session Request"""
+
+    @patch.object(requests.Session, "request")
+    def test_default_timeout_is_used(self, mock_request):
+        """test_default_timeout_is_used"""
+        provider_session = session.ProviderSession(timeout=5)
+        provider_session.request("GET", "http://mock-url")
+
+        mock_request.assert_called_with("GET", "http://mock-url", timeout=5)
+
+    @patch.object(requests.Session, "request")
+    def test_given_timeout_is_kept(self, mock_request):
+        """test_given_timeout_is_kept"""
+        provider_session = session.ProviderSession(timeout=5)
+        provider_session.request("GET", "http://mock-url", timeout=1)
+
+        mock_request.assert_called_with("GET", "http://mock-url", timeout=1)
+
+
+class TestBuildProviderSession(TestCase):
+    """Test Build Provider Session"""
+
+    def test_adapter_pool_size(self):
+        """test_adapter_pool_size"""
+        provider_session = session.build_provider_session(4)
+        adapter = provider_session.get_adapter("https://mock-url")
+
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_adapter_retries_on_server_errors(self):
+        """test_adapter_retries_on_server_errors"""
+        provider_session = session.build_provider_session(
+            4, max_retries=2, backoff_factor=0.1
+        )
+        retry = provider_session.get_adapter("http://mock-url").max_retries
+
+        self.assertEqual(retry.total, 2)
+        self.assertEqual(retry.backoff_factor, 0.1)
+        self.assertEqual(
+            tuple(retry.status_forcelist), session.RETRY_STATUS_CODES
+        )
+
+    def test_adapter_does_not_retry_put_requests(self):
+        """test_adapter_does_not_retry_put_requests"""
+        provider_session = session.build_provider_session(4, max_retries=2)
+        retry = provider_session.get_adapter("http://mock-url").max_retries
+
+        self.assertIn("GET", retry.allowed_methods)
+        self.assertNotIn("PUT", retry.allowed_methods)
@@ -1,9 +1,15 @@
 """Unit tests for core_linked_records_app.utils.providers.__init__."""
 
+import json
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+from rest_framework import status
+
+from core_linked_records_app import settings
 from core_linked_records_app.utils import providers
+from core_linked_records_app.utils.exceptions import InvalidProviderError
+from core_linked_records_app.utils.providers.handle_net import HandleNetSystem
 from core_main_app.commons.exceptions import CoreError
 from tests.mocks import MockResponse
 
@@ -11,17 +17,42 @@ from tests.mocks import MockResponse
 class TestDeleteRecordFromProvider(TestCase):
     """Unit tests for `delete_record_from_provider` function."""
 
+    def setUp(self) -> None:
+        self.mock_pid = "https://mock.lookup.url/mock_prefix/mock_record"
+        self.mock_provider = Mock()
+        self.mock_provider.provider_lookup_url = "https://mock.lookup.url"
+
     @patch.object(providers, "ProviderManager")
-    def test_provider_delete_is_called(self, mock_provider_manager):
-        """test_provider_delete_is_called"""
-        mock_provider = Mock()
-        mock_record = "mock_record"
+    def test_provider_of_pid_delete_is_called(self, mock_provider_manager):
+        """test_provider_of_pid_delete_is_called"""
+        mock_provider_manager().find_provider_from_pid.return_value = (
+            "mock_provider"
+        )
+        mock_provider_manager().get.return_value = self.mock_provider
+        self.mock_provider.delete.return_value = MockResponse()
+
+        providers.delete_record_from_provider(self.mock_pid)
+
+        mock_provider_manager().find_provider_from_pid.assert_called_with(
+            self.mock_pid
+        )
+        mock_provider_manager().get.assert_called_with("mock_provider")
+        self.mock_provider.delete.assert_called_with("mock_prefix/mock_record")
+
+    @patch.object(providers, "logger")
+    @patch.object(providers, "ProviderManager")
+    def test_unknown_provider_raises_core_error(
+        self,
+        mock_provider_manager,
+        mock_logger,  # noqa, pylint: disable=unused-argument
+    ):
+        """test_unknown_provider_raises_core_error"""
+        mock_provider_manager().find_provider_from_pid.return_value = None
 
-        mock_provider_manager().get.return_value = mock_provider
-        mock_provider.delete.return_value = MockResponse()
+        with self.assertRaises(CoreError):
+            providers.delete_record_from_provider(self.mock_pid)
 
-        providers.delete_record_from_provider(mock_record)
-        mock_provider.delete.assert_called_with(mock_record)
+        self.mock_provider.delete.assert_not_called()
 
     @patch.object(providers, "logger")
     @patch.object(providers, "ProviderManager")
@@ -31,11 +62,310 @@ class TestDeleteRecordFromProvider(TestCase):
         mock_logger,  # noqa, pylint: disable=unused-argument
     ):
         """test_provider_delete_failure_is_logged"""
-        mock_provider = Mock()
-        mock_provider.delete.return_value = MockResponse(status_code=500)
-        mock_record = "mock_record"
+        self.mock_provider.delete.return_value = MockResponse(status_code=500)
+        mock_provider_manager().get.return_value = self.mock_provider
+
+        with self.assertRaises(CoreError):
+            providers.delete_record_from_provider(self.mock_pid)
+
 
-        mock_provider_manager().get.return_value = mock_provider
+class TestGetRecordListForBulkCreate(TestCase):
+    """Unit tests for `get_record_list_for_bulk_create` function."""
 
+    def test_no_parameter_raises_core_error(self):
+        """test_no_parameter_raises_core_error"""
         with self.assertRaises(CoreError):
-            providers.delete_record_from_provider(mock_record)
+            providers.get_record_list_for_bulk_create()
+
+    def test_both_parameters_raises_core_error(self):
+        """test_both_parameters_raises_core_error"""
+        with self.assertRaises(CoreError):
+            providers.get_record_list_for_bulk_create(1, ["mock_record"])
+
+    def test_invalid_count_raises_core_error(self):
+        """test_invalid_count_raises_core_error"""
+        for count in [0, -1, "1", True]:
+            with self.assertRaises(CoreError):
+                providers.get_record_list_for_bulk_create(count=count)
+
+    def test_count_returns_list_of_none(self):
+        """test_count_returns_list_of_none"""
+        self.assertEqual(
+            providers.get_record_list_for_bulk_create(count=2), [None, None]
+        )
+
+    def test_records_returns_records(self):
+        """test_records_returns_records"""
+        self.assertEqual(
+            providers.get_record_list_for_bulk_create(records=["mock_record"]),
+            ["mock_record"],
+        )
+
+
+class TestAbstractIdProviderCreateMany(TestCase):
+    """Unit tests for `AbstractIdProvider.create_many` method."""
+
+    @staticmethod
+    def _create_response(status_code, record):
+        response = MockResponse(status_code=status_code)
+        response.content = json.dumps({"record": record})
+        return response
+
+    def test_create_called_for_each_record(self):
+        """test_create_called_for_each_record"""
+        mock_provider = Mock()
+        mock_provider.create.return_value = self._create_response(
+            status.HTTP_201_CREATED, "mock_record"
+        )
+
+        providers.AbstractIdProvider.create_many(
+            mock_provider, "mock_prefix", count=3
+        )
+
+        self.assertEqual(mock_provider.create.call_count, 3)
+
+    def test_all_created_returns_201(self):
+        """test_all_created_returns_201"""
+        mock_provider = Mock()
+        mock_provider.create.return_value = self._create_response(
+            status.HTTP_201_CREATED, "mock_record"
+        )
+
+        response = providers.AbstractIdProvider.create_many(
+            mock_provider, "mock_prefix", records=["mock_record"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            json.loads(response.content),
+            {"records": [{"record": "mock_record"}]},
+        )
+
+    def test_conflict_returns_207(self):
+        """test_conflict_returns_207"""
+        mock_provider = Mock()
+        mock_provider.create.side_effect = [
+            self._create_response(status.HTTP_201_CREATED, "mock_record_1"),
+            self._create_response(status.HTTP_409_CONFLICT, "mock_record_2"),
+        ]
+
+        response = providers.AbstractIdProvider.create_many(
+            mock_provider,
+            "mock_prefix",
+            records=["mock_record_1", "mock_record_2"],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+
+
+class TestGetProviderInstance(TestCase):
+    """Unit tests for `get_provider_instance` function."""
+
+    def setUp(self) -> None:
+        providers.clear_provider_registry()
+        self.provider_config = {
+            "class": "core_linked_records_app.utils.providers.local.LocalIdProvider",
+            "args": [],
+        }
+
+    def tearDown(self) -> None:
+        providers.clear_provider_registry()
+
+    @patch.object(providers, "build_provider_instance")
+    def test_provider_is_built_once(self, mock_build_provider_instance):
+        """test_provider_is_built_once"""
+        first_provider = providers.get_provider_instance(
+            "mock_provider", self.provider_config
+        )
+        second_provider = providers.get_provider_instance(
+            "mock_provider", self.provider_config
+        )
+
+        self.assertIs(first_provider, second_provider)
+        mock_build_provider_instance.assert_called_once()
+
+    @patch.object(providers, "build_provider_instance")
+    def test_other_config_builds_other_provider(
+        self, mock_build_provider_instance
+    ):
+        """test_other_config_builds_other_provider"""
+        mock_build_provider_instance.side_effect = lambda *args: Mock()
+
+        first_provider = providers.get_provider_instance(
+            "mock_provider", self.provider_config
+        )
+        second_provider = providers.get_provider_instance(
+            "mock_provider",
+            {**self.provider_config, "args": ["mock_lookup_url"]},
+        )
+
+        self.assertIsNot(first_provider, second_provider)
+
+    @patch.object(providers, "build_provider_instance")
+    def test_server_uri_change_builds_other_provider(
+        self, mock_build_provider_instance
+    ):
+        """test_server_uri_change_builds_other_provider"""
+        mock_build_provider_instance.side_effect = lambda *args: Mock()
+
+        first_provider = providers.get_provider_instance(
+            "mock_provider", self.provider_config
+        )
+
+        with patch.object(settings, "SERVER_URI", "http://mock_server"):
+            second_provider = providers.get_provider_instance(
+                "mock_provider", self.provider_config
+            )
+
+        self.assertIsNot(first_provider, second_provider)
+
+    @patch.object(providers, "build_provider_instance")
+    def test_setting_changed_clears_registry(
+        self, mock_build_provider_instance
+    ):
+        """test_setting_changed_clears_registry"""
+        providers.get_provider_instance("mock_provider", self.provider_config)
+
+        providers.clear_provider_registry_on_setting_changed(
+            setting="ID_PROVIDER_SYSTEM_CONFIG"
+        )
+        providers.get_provider_instance("mock_provider", self.provider_config)
+
+        self.assertEqual(mock_build_provider_instance.call_count, 2)
+
+    @patch.object(providers, "build_provider_instance")
+    def test_unrelated_setting_changed_keeps_registry(
+        self, mock_build_provider_instance
+    ):
+        """test_unrelated_setting_changed_keeps_registry"""
+        providers.get_provider_instance("mock_provider", self.provider_config)
+
+        providers.clear_provider_registry_on_setting_changed(
+            setting="MOCK_SETTING"
+        )
+        providers.get_provider_instance("mock_provider", self.provider_config)
+
+        mock_build_provider_instance.assert_called_once()
+
+    def test_provider_manager_uses_registry(self):
+        """test_provider_manager_uses_registry"""
+        self.assertIs(
+            providers.ProviderManager().get(),
+            providers.ProviderManager().get(),
+        )
+
+
+class TestProviderRouting(TestCase):
+    """Unit tests for the routing of PIDs to their provider."""
+
+    def setUp(self) -> None:
+        providers.clear_provider_registry()
+        handle_config = {
+            "class": "core_linked_records_app.utils.providers.handle_net.HandleNetSystem",
+            "args": [
+                "https://hdl.handle.net",
+                "https://mock.handle.domain",
+                "mock_username",
+                "mock_password",
+            ],
+        }
+        self.provider_config_dict = {
+            "local": {
+                "class": "core_linked_records_app.utils.providers.local.LocalIdProvider",
+                "args": [],
+            },
+            "handle_a": {**handle_config, "prefixes": ["prefix.a"]},
+            "handle_b": {**handle_config, "prefixes": ["prefix.b"]},
+        }
+
+    def tearDown(self) -> None:
+        providers.clear_provider_registry()
+
+    def _find_provider_from_pid(self, pid):
+        with patch.object(
+            settings, "ID_PROVIDER_SYSTEMS", self.provider_config_dict
+        ), patch.object(settings, "ID_PROVIDER_SYSTEM_NAME", "local"):
+            return providers.ProviderManager().find_provider_from_pid(pid)
+
+    def test_pid_is_routed_by_prefix(self):
+        """test_pid_is_routed_by_prefix"""
+        self.assertEqual(
+            self._find_provider_from_pid(
+                "https://hdl.handle.net/prefix.b/record"
+            ),
+            "handle_b",
+        )
+        self.assertEqual(
+            self._find_provider_from_pid(
+                "https://hdl.handle.net/prefix.a/record"
+            ),
+            "handle_a",
+        )
+
+    def test_pid_is_routed_by_lookup_url(self):
+        """test_pid_is_routed_by_lookup_url"""
+        local_lookup_url = (
+            providers.ProviderManager().get("local").provider_lookup_url
+        )
+
+        self.assertEqual(
+            self._find_provider_from_pid(f"{local_lookup_url}/cdcs/record"),
+            "local",
+        )
+
+    @patch.object(HandleNetSystem, "delete")
+    def test_delete_is_sent_to_provider_of_prefix(self, mock_delete):
+        """test_delete_is_sent_to_provider_of_prefix"""
+        mock_delete.return_value = MockResponse()
+
+        with patch.object(
+            settings, "ID_PROVIDER_SYSTEMS", self.provider_config_dict
+        ), patch.object(settings, "ID_PROVIDER_SYSTEM_NAME", "local"):
+            providers.delete_record_from_provider(
+                "https://hdl.handle.net/prefix.b/record"
+            )
+
+        mock_delete.assert_called_once_with("prefix.b/record")
+
+    def test_unknown_pid_returns_none(self):
+        """test_unknown_pid_returns_none"""
+        self.assertIsNone(
+            self._find_provider_from_pid("https://unknown.org/prefix/record")
+        )
+
+    def test_get_returns_named_provider(self):
+        """test_get_returns_named_provider"""
+        with patch.object(
+            settings, "ID_PROVIDER_SYSTEMS", self.provider_config_dict
+        ):
+            provider_manager = providers.ProviderManager()
+
+            self.assertEqual(
+                provider_manager.get("handle_a").provider_lookup_url,
+                "https://hdl.handle.net",
+            )
+            self.assertNotEqual(
+                provider_manager.get("local").provider_lookup_url,
+                "https://hdl.handle.net",
+            )
+
+    def test_get_unknown_provider_raises_invalid_provider_error(self):
+        """test_get_unknown_provider_raises_invalid_provider_error"""
+        with patch.object(
+            settings, "ID_PROVIDER_SYSTEMS", self.provider_config_dict
+        ):
+            with self.assertRaises(InvalidProviderError):
+                providers.ProviderManager().get("mock_unknown_provider")
+
+    def test_provider_prefixes_default_to_all_prefixes(self):
+        """test_provider_prefixes_default_to_all_prefixes"""
+        with patch.object(
+            settings, "ID_PROVIDER_SYSTEMS", self.provider_config_dict
+        ):
+            self.assertEqual(
+                providers.get_provider_prefix_list("local"),
+                settings.ID_PROVIDER_PREFIXES,
+            )
+            self.assertEqual(
+                providers.get_provider_prefix_list("handle_a"), ["prefix.a"]
+            )
@@ -1,10 +1,13 @@
 """Unit tests for core_linked_records_app.rest.query.views"""
 
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock, PropertyMock
+
+from django.db.models import QuerySet
 
 from core_linked_records_app.components.pid_path import api as pid_path_api
 from core_linked_records_app.utils import query as query_utils
+from core_linked_records_app.utils.exceptions import InvalidCursorError
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.exceptions import ApiError, CoreError
 from core_main_app.components.data import api as data_api
@@ -136,7 +139,7 @@ class TestExecuteLocalQuery(TestCase):
 
         self.assertEqual(result, [])
 
-    @patch.object(query_utils, "is_valid_pid_value")
+    @patch.object(query_utils, "is_valid_routed_pid_value")
     @patch.object(query_utils, "get_value_from_dot_notation")
     @patch.object(pid_path_api, "get_by_template")
     @patch.object(data_api, "execute_json_query")
@@ -145,7 +148,7 @@ class TestExecuteLocalQuery(TestCase):
         mock_execute_query,
         mock_get_by_template,
         mock_get_value_from_dot_notation,
-        mock_is_valid_pid_value,
+        mock_is_valid_routed_pid_value,
     ):
         """test_returns_data_with_valid_pid"""
 
@@ -155,8 +158,8 @@ class TestExecuteLocalQuery(TestCase):
         mock_get_value_from_dot_notation.return_value = mock_data_pid
         # Return True every time the call count is odd (3 times for a list of 5
         # elements, at index 0, 2 and 4).
-        mock_is_valid_pid_value.side_effect = (
-            lambda p, n, f: mock_is_valid_pid_value.call_count % 2
+        mock_is_valid_routed_pid_value.side_effect = (
+            lambda p, f: mock_is_valid_routed_pid_value.call_count % 2
         )
         expected_result = [mock_data_pid for _ in range(5) if _ % 2 == 0]
 
@@ -166,6 +169,275 @@ class TestExecuteLocalQuery(TestCase):
 
         self.assertEqual(result, expected_result)
 
+    @patch.object(pid_path_api, "get_by_template")
+    @patch.object(data_api, "execute_json_query")
+    def test_template_is_loaded_once_per_template(
+        self, mock_execute_query, mock_get_by_template
+    ):
+        """test_template_is_loaded_once_per_template"""
+        mock_template = PropertyMock(return_value=mocks.MockTemplate())
+        mock_data_list = [mocks.MockData(template_id=1) for _ in range(5)]
+        for mock_data in mock_data_list:
+            type(mock_data).template = mock_template
+        mock_execute_query.return_value = mock_data_list
+        mock_get_by_template.return_value = [mocks.MockPidPath()]
+
+        list(
+            query_utils.iterate_local_query_document_pids(
+                "mock_query", self.mock_request
+            )
+        )
+
+        mock_template.assert_called_once_with()
+        self.assertEqual(mock_get_by_template.call_count, 1)
+
+
+class TestIterateQueryResult(TestCase):
+    """Test Iterate Query Result"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+
+    def test_list_is_iterated_as_is(self):
+        """test_list_is_iterated_as_is"""
+        document_iterator, pid_value_alias_dict = (
+            query_utils.iterate_query_result(
+                [1, 2], "mock", ["id"], ["mock_id"], self.mock_request
+            )
+        )
+
+        self.assertEqual(list(document_iterator), [1, 2])
+        self.assertEqual(pid_value_alias_dict, {})
+
+    @patch.object(query_utils, "get_pid_path_list")
+    def test_queryset_is_streamed_with_projection(
+        self, mock_get_pid_path_list
+    ):
+        """test_queryset_is_streamed_with_projection"""
+        mock_queryset = MagicMock(spec=QuerySet)
+        mock_get_pid_path_list.return_value = ["a.b", "c"]
+
+        _, pid_value_alias_dict = query_utils.iterate_query_result(
+            mock_queryset, "template", ["id"], ["mock_id"], self.mock_request
+        )
+
+        self.assertEqual(
+            pid_value_alias_dict, {"a.b": "pid_value_0", "c": "pid_value_1"}
+        )
+        mock_queryset.select_related.assert_called_with("template")
+        mock_only = mock_queryset.select_related.return_value.only
+        mock_only.assert_called_with("id")
+        self.assertEqual(
+            set(mock_only.return_value.annotate.call_args[1].keys()),
+            {"pid_value_0", "pid_value_1"},
+        )
+        mock_only.return_value.annotate.return_value.iterator.assert_called_once()
+
+    @patch.object(query_utils, "get_pid_path_list")
+    def test_mongo_queryset_is_projected_on_pid_paths(
+        self, mock_get_pid_path_list
+    ):
+        """test_mongo_queryset_is_projected_on_pid_paths"""
+        mock_queryset = MagicMock()
+        mock_get_pid_path_list.return_value = ["a.b"]
+
+        query_utils.iterate_query_result(
+            mock_queryset, "template", ["id"], ["mock_id"], self.mock_request
+        )
+
+        mock_queryset.only.assert_called_with("mock_id", "dict_content.a.b")
+
+    def test_list_page_is_ordered_by_pk(self):
+        """test_list_page_is_ordered_by_pk"""
+        document_list = [Mock(pk=pk) for pk in [4, 1, 3, 2]]
+
+        document_iterator, _ = query_utils.iterate_query_result(
+            document_list,
+            "mock",
+            ["id"],
+            ["mock_id"],
+            self.mock_request,
+            1,
+            2,
+        )
+
+        self.assertEqual(
+            [document.pk for document in document_iterator], [2, 3]
+        )
+
+    @patch.object(query_utils, "get_pid_path_list")
+    def test_queryset_page_is_filtered_by_pk(self, mock_get_pid_path_list):
+        """test_queryset_page_is_filtered_by_pk"""
+        mock_queryset = MagicMock(spec=QuerySet)
+        mock_get_pid_path_list.return_value = ["a.b"]
+
+        query_utils.iterate_query_result(
+            mock_queryset,
+            "template",
+            ["id"],
+            ["mock_id"],
+            self.mock_request,
+            42,
+            10,
+        )
+
+        mock_annotate = (
+            mock_queryset.select_related.return_value.only.return_value.annotate
+        )
+        mock_annotate.return_value.order_by.assert_called_with("pk")
+        mock_annotate.return_value.order_by.return_value.filter.assert_called_with(
+            pk__gt=42
+        )
+
+
+class TestPidQueryCursor(TestCase):
+    """Test Pid Query Cursor"""
+
+    def test_encoded_cursor_is_decoded(self):
+        """test_encoded_cursor_is_decoded"""
+        cursor = query_utils.encode_pid_query_cursor(42)
+
+        self.assertEqual(query_utils.decode_pid_query_cursor(cursor), 42)
+
+    def test_none_cursor_is_first_page(self):
+        """test_none_cursor_is_first_page"""
+        self.assertIsNone(query_utils.decode_pid_query_cursor(None))
+
+    def test_invalid_cursor_raises_invalid_cursor_error(self):
+        """test_invalid_cursor_raises_invalid_cursor_error"""
+        for cursor in [
+            "mock_invalid_cursor",
+            "é",
+            query_utils.encode_pid_query_cursor(True),
+            query_utils.encode_pid_query_cursor("1"),
+        ]:
+            with self.assertRaises(InvalidCursorError):
+                query_utils.decode_pid_query_cursor(cursor)
+
+
+class TestGetQueryPidPage(TestCase):
+    """Test Get Query Pid Page"""
+
+    def setUp(self) -> None:
+        self.mock_request = mocks.MockRequest()
+        self.pid_list = ["pid0", None, "pid2", "pid3", "pid4"]
+
+    def _iterate_document_pids(self, raw_query, request, after_pk, limit):
+        return iter(
+            [
+                (pk, pid)
+                for pk, pid in enumerate(self.pid_list)
+                if after_pk is None or pk > after_pk
+            ][:limit]
+        )
+
+    def test_first_page_returns_next_cursor(self):
+        """test_first_page_returns_next_cursor"""
+        result = query_utils.get_query_pid_page(
+            self._iterate_document_pids, {}, self.mock_request, None, 2
+        )
+
+        self.assertEqual(result["pids"], ["pid0"])
+        self.assertEqual(
+            query_utils.decode_pid_query_cursor(result["next"]), 1
+        )
+
+    def test_pages_cover_all_pids(self):
+        """test_pages_cover_all_pids"""
+        pid_list = []
+        cursor = None
+
+        while True:
+            result = query_utils.get_query_pid_page(
+                self._iterate_document_pids, {}, self.mock_request, cursor, 2
+            )
+            pid_list += result["pids"]
+            cursor = result["next"]
+
+            if cursor is None:
+                break
+
+        self.assertEqual(pid_list, ["pid0", "pid2", "pid3", "pid4"])
+
+    def test_last_full_page_has_no_next_cursor(self):
+        """test_last_full_page_has_no_next_cursor"""
+        result = query_utils.get_query_pid_page(
+            self._iterate_document_pids,
+            {},
+            self.mock_request,
+            query_utils.encode_pid_query_cursor(2),
+            2,
+        )
+
+        self.assertEqual(result, {"pids": ["pid3", "pid4"], "next": None})
+
+
+class TestGetPidValue(TestCase):
+    """Test Get Pid Value"""
+
+    def test_annotated_value_is_returned(self):
+        """test_annotated_value_is_returned"""
+        mock_document = Mock(pid_value_0="mock_pid")
+
+        self.assertEqual(
+            query_utils.get_pid_value(
+                mock_document, "a.b", {"a.b": "pid_value_0"}
+            ),
+            "mock_pid",
+        )
+        mock_document.get_dict_content.assert_not_called()
+
+    def test_value_is_read_from_content_without_annotation(self):
+        """test_value_is_read_from_content_without_annotation"""
+        mock_document = Mock()
+        mock_document.get_dict_content.return_value = {"a": {"b": "mock_pid"}}
+
+        self.assertEqual(
+            query_utils.get_pid_value(mock_document, "a.b", {}), "mock_pid"
+        )
+
+
+class TestGetTemplatePidPathList(TestCase):
+    """Test Get Template Pid Path List"""
+
+    @patch.object(pid_path_api, "get_by_template")
+    def test_paths_are_retrieved_once_per_template(self, mock_get_by_template):
+        """test_paths_are_retrieved_once_per_template"""
+        mock_template = Mock(pk=1)
+        mock_load_template = Mock(return_value=mock_template)
+        mock_get_by_template.return_value = [mocks.MockPidPath()]
+        pid_path_list_dict = {}
+
+        for _ in range(3):
+            result = query_utils.get_template_pid_path_list(
+                1, mock_load_template, pid_path_list_dict, "mock_user"
+            )
+
+        self.assertEqual(result, ["mock.path"])
+        mock_load_template.assert_called_once_with()
+        mock_get_by_template.assert_called_once_with(
+            mock_template, "mock_user"
+        )
+
+    @patch.object(pid_path_api, "get_by_template")
+    def test_no_template_returns_default_path(self, mock_get_by_template):
+        """test_no_template_returns_default_path"""
+        mock_load_template = Mock(return_value=None)
+
+        self.assertEqual(
+            query_utils.get_template_pid_path_list(
+                None, mock_load_template, {}, "mock_user"
+            ),
+            [query_utils.settings.PID_PATH],
+        )
+        self.assertEqual(
+            query_utils.get_template_pid_path_list(
+                1, mock_load_template, {}, "mock_user"
+            ),
+            [query_utils.settings.PID_PATH],
+        )
+        mock_get_by_template.assert_not_called()
+
 
 class TestExecuteLocalPidQuery(TestCase):
     @patch.object(query_utils, "execute_pid_query")
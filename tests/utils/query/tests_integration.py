@@ -0,0 +1,128 @@
+"""Integration tests for core_linked_records_app.utils.query"""
+
+from os.path import join
+
+from django.db import connection
+from django.http import HttpRequest
+from django.test.utils import CaptureQueriesContext
+
+from core_linked_records_app.components.pid_path.models import PidPath
+from core_linked_records_app.settings import (
+    ID_PROVIDER_PREFIX_DEFAULT,
+    ID_PROVIDER_SYSTEM_NAME,
+)
+from core_linked_records_app.utils import query as query_utils
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from tests.fixtures import DataFixtures, MediaRootIntegrationTestCase
+from tests.test_settings import SERVER_URI
+
+
+class TestExecuteLocalQuery(MediaRootIntegrationTestCase):
+    """Integration tests for `execute_local_query` function."""
+
+    fixture = DataFixtures()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """setUp"""
+        super().setUp()
+        self.user = create_mock_user(1, is_superuser=True)
+        self.mock_request = HttpRequest()
+        self.mock_request.user = self.user
+        self.fixture.auto_set_pid(False)
+        PidPath(path="mock.pid", template=self.fixture.template).save()
+        self.record_count = 0
+
+    def _insert_records(self, count):
+        for _ in range(count):
+            self.record_count += 1
+            self.fixture.insert_record(
+                f"record_{self.record_count}",
+                join(
+                    SERVER_URI,
+                    "rest",
+                    ID_PROVIDER_SYSTEM_NAME,
+                    ID_PROVIDER_PREFIX_DEFAULT,
+                    f"pid{self.record_count}",
+                ),
+                self.user,
+            )
+
+    def test_query_count_does_not_depend_on_result_count(self):
+        """test_query_count_does_not_depend_on_result_count"""
+        self._insert_records(2)
+
+        with CaptureQueriesContext(connection) as small_queries:
+            small_result = query_utils.execute_local_query(
+                {}, self.mock_request
+            )
+
+        self._insert_records(10)
+
+        with CaptureQueriesContext(connection) as large_queries:
+            large_result = query_utils.execute_local_query(
+                {}, self.mock_request
+            )
+
+        self.assertEqual(len(small_result), 2)
+        self.assertTrue(
+            all(pid.startswith(SERVER_URI) for pid in large_result)
+        )
+        self.assertEqual(len(large_result), 12)
+        self.assertEqual(len(small_queries), len(large_queries))
+
+    def test_pages_cover_all_pids(self):
+        """test_pages_cover_all_pids"""
+        self._insert_records(7)
+        pid_list = []
+        cursor = None
+
+        while True:
+            result = query_utils.get_query_pid_page(
+                query_utils.iterate_local_query_document_pids,
+                {},
+                self.mock_request,
+                cursor,
+                3,
+            )
+            self.assertLessEqual(len(result["pids"]), 3)
+            pid_list += result["pids"]
+            cursor = result["next"]
+
+            if cursor is None:
+                break
+
+        self.assertEqual(
+            sorted(pid_list),
+            sorted(query_utils.execute_local_query({}, self.mock_request)),
+        )
+        self.assertEqual(len(set(pid_list)), 7)
+
+    def test_pages_cover_pids_inserted_while_paging(self):
+        """test_pages_cover_pids_inserted_while_paging"""
+        self._insert_records(7)
+        pid_list = []
+        cursor = None
+
+        while True:
+            result = query_utils.get_query_pid_page(
+                query_utils.iterate_local_query_document_pids,
+                {},
+                self.mock_request,
+                cursor,
+                3,
+            )
+            pid_list += result["pids"]
+            cursor = result["next"]
+
+            if cursor is None:
+                break
+
+            if self.record_count < 10:
+                self._insert_records(2)
+
+        self.assertEqual(len(pid_list), self.record_count)
+        self.assertEqual(len(set(pid_list)), self.record_count)
+        self.assertEqual(
+            sorted(pid_list),
+            sorted(query_utils.execute_local_query({}, self.mock_request)),
+        )
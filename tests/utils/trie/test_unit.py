@@ -0,0 +1,49 @@
+"""Unit tests for core_linked_records_app.utils.trie"""
+
+from unittest import TestCase
+
+from core_linked_records_app.utils.trie import PrefixTrie
+
+
+class TestPrefixTrie(TestCase):
+    """Unit tests for `PrefixTrie` class."""
+
+    def setUp(self) -> None:
+        self.trie = PrefixTrie()
+        self.trie.setdefault("https://hdl.handle.net", "handle")
+        self.trie.setdefault("https://hdl.handle.net/prefix.a/", "handle_a")
+        self.trie.setdefault("https://hdl.handle.net/prefix.b/", "handle_b")
+
+    def test_longest_prefix_is_found(self):
+        """test_longest_prefix_is_found"""
+        self.assertEqual(
+            self.trie.find_longest_prefix(
+                "https://hdl.handle.net/prefix.b/record"
+            ),
+            "handle_b",
+        )
+
+    def test_shorter_prefix_is_found(self):
+        """test_shorter_prefix_is_found"""
+        self.assertEqual(
+            self.trie.find_longest_prefix(
+                "https://hdl.handle.net/prefix.c/record"
+            ),
+            "handle",
+        )
+
+    def test_no_prefix_returns_default(self):
+        """test_no_prefix_returns_default"""
+        self.assertIsNone(self.trie.find_longest_prefix("https://other"))
+        self.assertEqual(
+            self.trie.find_longest_prefix("", "mock_default"), "mock_default"
+        )
+
+    def test_setdefault_keeps_existing_value(self):
+        """test_setdefault_keeps_existing_value"""
+        result = self.trie.setdefault("https://hdl.handle.net", "other")
+
+        self.assertEqual(result, "handle")
+        self.assertEqual(
+            self.trie.find_longest_prefix("https://hdl.handle.net/"), "handle"
+        )
@@ -4,6 +4,7 @@ from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 from core_linked_records_app.utils import xml as linked_records_xml_utils
 from xml_utils.commons import exceptions as xml_utils_exceptions
+from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 
 class TestGetValueAtXPath(TestCase):
@@ -321,3 +322,201 @@ class TestSetValueAtXPath(TestCase):
                 ),
             ]
         )
+
+
+class TestGetPidXpathForTemplate(TestCase):
+    """Unit tests for `get_pid_xpath_for_template` function."""
+
+    def setUp(self):
+        """setUp"""
+        linked_records_xml_utils.template_xsd_cache.clear()
+        self.mock_template = MagicMock()
+        self.mock_template.pk = 1
+        self.mock_template.hash = "mock_hash"
+        self.mock_template.content = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" '
+            'xmlns:mock="http://mock.org" targetNamespace="http://mock.org">'
+            '<xs:element name="root"/></xs:schema>'
+        )
+
+    def tearDown(self):
+        """tearDown"""
+        linked_records_xml_utils.template_xsd_cache.clear()
+
+    def test_returns_xpath_namespace_and_compiled_xpath(self):
+        """test_returns_xpath_namespace_and_compiled_xpath"""
+        xpath, target_namespace, compiled_xpath = (
+            linked_records_xml_utils.get_pid_xpath_for_template(
+                self.mock_template, "root.pid"
+            )
+        )
+
+        self.assertEqual(xpath, "/mock:root/mock:pid")
+        self.assertEqual(target_namespace, {"mock": "http://mock.org"})
+        self.assertEqual(compiled_xpath.path, xpath)
+
+    @patch.object(
+        linked_records_xml_utils, "get_target_namespace_for_xsd_string"
+    )
+    def test_target_namespace_parsed_once_per_template(
+        self, mock_get_target_namespace_for_xsd_string
+    ):
+        """test_target_namespace_parsed_once_per_template"""
+        mock_get_target_namespace_for_xsd_string.return_value = None
+
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.@pid"
+        )
+
+        mock_get_target_namespace_for_xsd_string.assert_called_once_with(
+            self.mock_template.content
+        )
+        self.assertEqual(
+            linked_records_xml_utils.get_template_xsd_cache_info()["hits"], 1
+        )
+
+    def test_compiled_xpath_is_reused(self):
+        """test_compiled_xpath_is_reused"""
+        _, _, compiled_xpath_1 = (
+            linked_records_xml_utils.get_pid_xpath_for_template(
+                self.mock_template, "root.pid"
+            )
+        )
+        _, _, compiled_xpath_2 = (
+            linked_records_xml_utils.get_pid_xpath_for_template(
+                self.mock_template, "root.pid"
+            )
+        )
+
+        self.assertIs(compiled_xpath_1, compiled_xpath_2)
+
+    @patch.object(
+        linked_records_xml_utils, "get_target_namespace_for_xsd_string"
+    )
+    def test_changed_template_hash_is_a_miss(
+        self, mock_get_target_namespace_for_xsd_string
+    ):
+        """test_changed_template_hash_is_a_miss"""
+        mock_get_target_namespace_for_xsd_string.return_value = None
+
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+        self.mock_template.hash = "mock_new_hash"
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+
+        self.assertEqual(
+            mock_get_target_namespace_for_xsd_string.call_count, 2
+        )
+
+    @patch.object(
+        linked_records_xml_utils, "get_target_namespace_for_xsd_string"
+    )
+    def test_invalidated_template_is_parsed_again(
+        self, mock_get_target_namespace_for_xsd_string
+    ):
+        """test_invalidated_template_is_parsed_again"""
+        mock_get_target_namespace_for_xsd_string.return_value = None
+
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+        linked_records_xml_utils.invalidate_template_xsd_cache(
+            self.mock_template.pk
+        )
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+
+        self.assertEqual(
+            mock_get_target_namespace_for_xsd_string.call_count, 2
+        )
+
+    def test_unsaved_template_is_not_cached(self):
+        """test_unsaved_template_is_not_cached"""
+        self.mock_template.pk = None
+
+        linked_records_xml_utils.get_pid_xpath_for_template(
+            self.mock_template, "root.pid"
+        )
+
+        self.assertEqual(
+            linked_records_xml_utils.get_template_xsd_cache_info()["size"], 0
+        )
+
+
+class TestCanCreateValueAtXpathInTree(TestCase):
+    """Unit tests for `can_create_value_at_xpath_in_tree` function."""
+
+    def setUp(self):
+        """setUp"""
+        self.xsd_tree = XSDTree.build_tree(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="root"><xs:complexType><xs:sequence>'
+            '<xs:element name="pid" type="xs:string"/>'
+            "</xs:sequence></xs:complexType></xs:element></xs:schema>"
+        )
+
+    def test_valid_value_returns_true(self):
+        """test_valid_value_returns_true"""
+        xml_tree = XSDTree.build_tree("<root></root>")
+
+        self.assertTrue(
+            linked_records_xml_utils.can_create_value_at_xpath_in_tree(
+                xml_tree, self.xsd_tree, "/root/pid", "mock_pid", None
+            )
+        )
+
+    def test_invalid_value_returns_false(self):
+        """test_invalid_value_returns_false"""
+        xml_tree = XSDTree.build_tree("<root></root>")
+
+        self.assertFalse(
+            linked_records_xml_utils.can_create_value_at_xpath_in_tree(
+                xml_tree, self.xsd_tree, "/root/@pid", "mock_pid", None
+            )
+        )
+
+    def test_tree_is_not_modified(self):
+        """test_tree_is_not_modified"""
+        xml_tree = XSDTree.build_tree("<root></root>")
+
+        linked_records_xml_utils.can_create_value_at_xpath_in_tree(
+            xml_tree, self.xsd_tree, "/root/pid", "mock_pid", None
+        )
+
+        self.assertEqual(XSDTree.tostring(xml_tree), "<root/>")
+
+
+class TestGetXsdTreeForTemplate(TestCase):
+    """Unit tests for `get_xsd_tree_for_template` function."""
+
+    def setUp(self):
+        """setUp"""
+        linked_records_xml_utils.template_xsd_cache.clear()
+        self.mock_template = MagicMock()
+        self.mock_template.pk = 1
+        self.mock_template.content = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="root"/></xs:schema>'
+        )
+
+    def tearDown(self):
+        """tearDown"""
+        linked_records_xml_utils.template_xsd_cache.clear()
+
+    def test_xsd_parsed_once_per_template(self):
+        """test_xsd_parsed_once_per_template"""
+        xsd_tree_1 = linked_records_xml_utils.get_xsd_tree_for_template(
+            self.mock_template
+        )
+        xsd_tree_2 = linked_records_xml_utils.get_xsd_tree_for_template(
+            self.mock_template
+        )
+
+        self.assertIs(xsd_tree_1, xsd_tree_2)